@@ -129,6 +129,7 @@ export interface ReindexProjectResponse {
   total_documents: number;
   indexed_documents: number;
   failed_documents: number;
+  skipped_documents: number;
 }
 
 export interface OrganizationSectionResponse {
@@ -31,8 +31,9 @@ target_metadata = Base.metadata
 
 _MANAGED_RAW_SQL_INDEXES = {
     "ix_conversations_project_user_created_at_desc",
-    "ix_document_chunks_content_fts",
     "ix_document_chunks_content_trgm",
+    "ix_document_chunks_embedding_bit_hnsw",
+    "ix_document_chunks_embedding_halfvec_hnsw",
     "ix_document_chunks_embedding_hnsw",
     "ix_document_chunks_metadata_json",
     "ix_messages_conversation_created_at",
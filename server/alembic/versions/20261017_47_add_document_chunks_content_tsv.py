@@ -0,0 +1,120 @@
+"""add stored content_tsv column with GIN index on document_chunks
+
+Revision ID: 20261017_47
+Revises: 20260629_46
+Create Date: 2026-10-17
+
+The hybrid retrieval query used to call to_tsvector(<language>, content) on
+every candidate row, while the only full-text index was built on the 'simple'
+configuration and therefore never matched the configured language.
+
+Fresh schemas (Base.metadata.create_all) declare content_tsv as a
+GENERATED ALWAYS ... STORED column. On an existing table, adding a stored
+generated column rewrites the whole table under an ACCESS EXCLUSIVE lock, so
+this migration instead:
+  1. adds a nullable tsvector column (metadata-only, instant),
+  2. keeps it in sync with a BEFORE INSERT/UPDATE trigger,
+  3. backfills existing rows in small committed batches, paged by primary key,
+  4. builds the GIN index CONCURRENTLY,
+  5. drops the unused 'simple' expression index.
+
+The text search configuration is read from RETRIEVAL_FULLTEXT_LANGUAGE
+(default: french) and must match the one used at query time.
+"""
+
+import os
+import re
+import uuid
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "20261017_47"
+down_revision: str | None = "20260629_46"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+
+def _fulltext_language() -> str:
+    language = os.environ.get("RETRIEVAL_FULLTEXT_LANGUAGE") or "french"
+    if not re.fullmatch(r"[a-z_]+", language):
+        raise ValueError(f"Invalid full-text search configuration: {language!r}")
+    return language
+
+
+def upgrade() -> None:
+    language = _fulltext_language()
+
+    op.add_column("document_chunks", sa.Column("content_tsv", postgresql.TSVECTOR(), nullable=True))
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION document_chunks_content_tsv_refresh() RETURNS trigger AS $$
+        BEGIN
+            NEW.content_tsv := to_tsvector('{language}'::regconfig, NEW.content);
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER trg_document_chunks_content_tsv "
+        "BEFORE INSERT OR UPDATE OF content ON document_chunks "
+        "FOR EACH ROW EXECUTE FUNCTION document_chunks_content_tsv_refresh()"
+    )
+
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        # Batches are paged by primary key: a "content_tsv IS NULL LIMIT n" probe
+        # has no index to use and rescans the already backfilled rows each time.
+        last_id = uuid.UUID(int=0)
+        while True:
+            batch_end = bind.execute(
+                sa.text(
+                    """
+                    SELECT max(id) FROM (
+                        SELECT id FROM document_chunks
+                        WHERE id > :last_id
+                        ORDER BY id
+                        LIMIT :batch_size
+                    ) batch
+                    """
+                ),
+                {"last_id": last_id, "batch_size": BACKFILL_BATCH_SIZE},
+            ).scalar_one()
+            if batch_end is None:
+                break
+            bind.execute(
+                sa.text(
+                    f"""
+                    UPDATE document_chunks
+                    SET content_tsv = to_tsvector('{language}'::regconfig, content)
+                    WHERE id > :last_id AND id <= :batch_end
+                      AND content_tsv IS NULL
+                    """
+                ),
+                {"last_id": last_id, "batch_end": batch_end},
+            )
+            last_id = batch_end
+
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_document_chunks_content_tsv "
+            "ON document_chunks USING GIN (content_tsv)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_document_chunks_content_fts")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_document_chunks_content_fts "
+            "ON document_chunks USING GIN (to_tsvector('simple', content))"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_document_chunks_content_tsv")
+    op.execute("DROP TRIGGER IF EXISTS trg_document_chunks_content_tsv ON document_chunks")
+    op.execute("DROP FUNCTION IF EXISTS document_chunks_content_tsv_refresh()")
+    op.drop_column("document_chunks", "content_tsv")
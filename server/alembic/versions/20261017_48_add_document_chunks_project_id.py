@@ -0,0 +1,83 @@
+"""add denormalized project_id on document_chunks
+
+Revision ID: 20261017_48
+Revises: 20261017_47
+Create Date: 2026-10-17
+
+Retrieval used to join documents only to filter on documents.project_id, and
+the global HNSW index walked candidates of every tenant before discarding
+them. Chunks now carry their project_id so both retrieval channels filter on
+document_chunks directly (combined with hnsw.iterative_scan at query time).
+
+To avoid long locks on large tables the column is added nullable, backfilled
+in committed batches, and NOT NULL is enforced through a validated CHECK
+constraint so that SET NOT NULL does not need a full table scan.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "20261017_48"
+down_revision: str | None = "20261017_47"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+
+def upgrade() -> None:
+    op.add_column(
+        "document_chunks",
+        sa.Column("project_id", postgresql.UUID(as_uuid=True), nullable=True),
+    )
+    op.execute(
+        "ALTER TABLE document_chunks "
+        "ADD CONSTRAINT document_chunks_project_id_fkey "
+        "FOREIGN KEY (project_id) REFERENCES projects (id) ON DELETE CASCADE NOT VALID"
+    )
+
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        while True:
+            result = bind.execute(
+                sa.text(
+                    """
+                    UPDATE document_chunks c
+                    SET project_id = d.project_id
+                    FROM documents d
+                    WHERE d.id = c.document_id
+                      AND c.id IN (
+                          SELECT id FROM document_chunks
+                          WHERE project_id IS NULL
+                          LIMIT :batch_size
+                      )
+                    """
+                ),
+                {"batch_size": BACKFILL_BATCH_SIZE},
+            )
+            if result.rowcount == 0:
+                break
+
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_document_chunks_project_id "
+            "ON document_chunks (project_id)"
+        )
+
+    op.execute("ALTER TABLE document_chunks VALIDATE CONSTRAINT document_chunks_project_id_fkey")
+    op.execute(
+        "ALTER TABLE document_chunks "
+        "ADD CONSTRAINT ck_document_chunks_project_id_not_null CHECK (project_id IS NOT NULL) NOT VALID"
+    )
+    op.execute("ALTER TABLE document_chunks VALIDATE CONSTRAINT ck_document_chunks_project_id_not_null")
+    op.alter_column("document_chunks", "project_id", nullable=False)
+    op.execute("ALTER TABLE document_chunks DROP CONSTRAINT ck_document_chunks_project_id_not_null")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_document_chunks_project_id", table_name="document_chunks")
+    op.drop_constraint("document_chunks_project_id_fkey", "document_chunks", type_="foreignkey")
+    op.drop_column("document_chunks", "project_id")
@@ -0,0 +1,33 @@
+"""add HNSW search settings to agent_configurations
+
+Revision ID: 20261017_49
+Revises: 20261017_48
+Create Date: 2026-10-17
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261017_49"
+down_revision: str | None = "20261017_48"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "agent_configurations",
+        sa.Column("retrieval_hnsw_ef_search", sa.Integer(), nullable=True),
+    )
+    op.add_column(
+        "agent_configurations",
+        sa.Column("retrieval_hnsw_iterative_scan", sa.String(16), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("agent_configurations", "retrieval_hnsw_iterative_scan")
+    op.drop_column("agent_configurations", "retrieval_hnsw_ef_search")
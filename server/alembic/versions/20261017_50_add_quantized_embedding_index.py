@@ -0,0 +1,78 @@
+"""add opt-in halfvec / binary-quantized HNSW index on document_chunks.embedding
+
+Revision ID: 20261017_50
+Revises: 20261017_49
+Create Date: 2026-10-17
+
+The full-precision HNSW index (vector_cosine_ops) is as large as the embeddings
+themselves, which prevents multi-million-chunk tenants from keeping it in RAM.
+When RETRIEVAL_VECTOR_INDEX is set to:
+  - halfvec: an HNSW expression index on embedding::halfvec(<dim>) replaces it
+    (half the size),
+  - bit: an HNSW expression index on binary_quantize(embedding)::bit(<dim>)
+    with bit_hamming_ops replaces it (1/32 of the size).
+The embedding column itself stays full precision: retrieval over-fetches from
+the compact index and re-scores candidates against it, so the table (heap and
+TOAST) does not shrink, only the index that has to stay in RAM.
+
+With the default (vector) this migration is a no-op. To switch mode on an
+existing database, downgrade to 20261017_49 and upgrade again with the new
+RETRIEVAL_VECTOR_INDEX. Indexes are built CONCURRENTLY; EMBEDDING_DIMENSION
+must match the document_chunks.embedding column.
+"""
+
+import os
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "20261017_50"
+down_revision: str | None = "20261017_49"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_QUANTIZED_INDEXES = {
+    "halfvec": (
+        "ix_document_chunks_embedding_halfvec_hnsw",
+        "(embedding::halfvec({dimension})) halfvec_cosine_ops",
+    ),
+    "bit": (
+        "ix_document_chunks_embedding_bit_hnsw",
+        "(binary_quantize(embedding)::bit({dimension})) bit_hamming_ops",
+    ),
+}
+
+
+def _vector_index() -> str:
+    vector_index = os.environ.get("RETRIEVAL_VECTOR_INDEX") or "vector"
+    if vector_index != "vector" and vector_index not in _QUANTIZED_INDEXES:
+        raise ValueError(f"Unsupported retrieval vector index: {vector_index!r}")
+    return vector_index
+
+
+def _embedding_dimension() -> int:
+    return int(os.environ.get("EMBEDDING_DIMENSION") or "1536")
+
+
+def upgrade() -> None:
+    vector_index = _vector_index()
+    if vector_index == "vector":
+        return
+
+    index_name, expression = _QUANTIZED_INDEXES[vector_index]
+    with op.get_context().autocommit_block():
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} "
+            f"ON document_chunks USING hnsw ({expression.format(dimension=_embedding_dimension())})"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_document_chunks_embedding_hnsw")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_document_chunks_embedding_hnsw "
+            "ON document_chunks USING hnsw (embedding vector_cosine_ops)"
+        )
+        for index_name, _ in _QUANTIZED_INDEXES.values():
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
@@ -0,0 +1,44 @@
+"""add query_embedding_cache table
+
+Revision ID: 20261017_51
+Revises: 20261017_50
+Create Date: 2026-10-17
+
+Shared tier of the query embedding cache so that an embedding computed by one
+uvicorn worker is reused by the others.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from pgvector.sqlalchemy import Vector
+
+from alembic import op
+
+revision: str = "20261017_51"
+down_revision: str | None = "20261017_50"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "query_embedding_cache",
+        sa.Column("cache_key", sa.String(length=64), nullable=False),
+        sa.Column("backend", sa.String(length=32), nullable=False),
+        sa.Column("model", sa.String(length=128), nullable=False),
+        sa.Column("embedding", Vector(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("cache_key"),
+    )
+    op.create_index(
+        "ix_query_embedding_cache_expires_at",
+        "query_embedding_cache",
+        ["expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_query_embedding_cache_expires_at", table_name="query_embedding_cache")
+    op.drop_table("query_embedding_cache")
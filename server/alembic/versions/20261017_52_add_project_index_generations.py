@@ -0,0 +1,36 @@
+"""add project_index_generations table
+
+Revision ID: 20261017_52
+Revises: 20261017_51
+Create Date: 2026-10-17
+
+Per-project counter bumped whenever the chunks of a project change. Retrieval
+results are cached under the current generation, so bumping it invalidates
+every cached entry of the project on all workers at once.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "20261017_52"
+down_revision: str | None = "20261017_51"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "project_index_generations",
+        sa.Column("project_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("generation", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("project_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("project_index_generations")
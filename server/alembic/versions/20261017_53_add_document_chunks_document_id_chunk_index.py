@@ -0,0 +1,32 @@
+"""add (document_id, chunk_index) index on document_chunks
+
+Revision ID: 20261017_53
+Revises: 20261017_52
+Create Date: 2026-10-17
+
+The hybrid retrieval statement now fetches the context window of every hit
+through a LATERAL range lookup on (document_id, chunk_index) instead of one
+query per document. The index is built CONCURRENTLY.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "20261017_53"
+down_revision: str | None = "20261017_52"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_document_chunks_document_id_chunk_index "
+            "ON document_chunks (document_id, chunk_index)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_document_chunks_document_id_chunk_index")
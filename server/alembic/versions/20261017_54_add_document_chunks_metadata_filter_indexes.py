@@ -0,0 +1,45 @@
+"""add expression indexes for retrieval metadata filters on document_chunks
+
+Revision ID: 20261017_54
+Revises: 20261017_53
+Create Date: 2026-10-17
+
+Retrieval metadata filters compare metadata_json->>'document_type',
+'language', 'source_type' and 'processing_strategy' inside one project, and
+test metadata_json->'tags' with ?|. Each scalar key gets a
+(project_id, expression) btree index. Tags get a GIN index, since jsonb_ops
+serves ?|. They let the retrieval service count the filtered rows cheaply and
+scan them exactly when the filter is selective. Indexes are built
+CONCURRENTLY.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "20261017_54"
+down_revision: str | None = "20261017_53"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_SCALAR_FILTER_KEYS = ("document_type", "language", "source_type", "processing_strategy")
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for key in _SCALAR_FILTER_KEYS:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_document_chunks_project_id_{key} "
+                f"ON document_chunks (project_id, (metadata_json->>'{key}'))"
+            )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_document_chunks_metadata_tags "
+            "ON document_chunks USING gin ((metadata_json->'tags'))"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_document_chunks_metadata_tags")
+        for key in reversed(_SCALAR_FILTER_KEYS):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_document_chunks_project_id_{key}")
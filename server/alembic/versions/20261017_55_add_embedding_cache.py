@@ -0,0 +1,45 @@
+"""add embedding_cache table
+
+Revision ID: 20261017_55
+Revises: 20261017_54
+Create Date: 2026-10-17
+
+Content-addressed cache of document embeddings: one row per (namespace,
+sha256 of the text), where the namespace hashes the embedding backend,
+model, dimension and document prefix. Reindexing only embeds texts that are
+not in it.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from pgvector.sqlalchemy import Vector
+
+from alembic import op
+
+revision: str = "20261017_55"
+down_revision: str | None = "20261017_54"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "embedding_cache",
+        sa.Column("namespace", sa.String(length=64), nullable=False),
+        sa.Column("text_hash", sa.String(length=64), nullable=False),
+        sa.Column("embedding", Vector(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("namespace", "text_hash"),
+    )
+    op.create_index(
+        "ix_embedding_cache_expires_at",
+        "embedding_cache",
+        ["expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_embedding_cache_expires_at", table_name="embedding_cache")
+    op.drop_table("embedding_cache")
@@ -0,0 +1,55 @@
+"""add ingestion_jobs table
+
+Revision ID: 20261017_56
+Revises: 20261017_55
+Create Date: 2026-10-17
+
+Durable queue behind PROCESSING_MODE=async: one row per uploaded document
+waiting for the indexing pipeline. Workers claim queued rows (or running rows
+whose lease expired) with FOR UPDATE SKIP LOCKED, ordered by available_at.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "20261017_56"
+down_revision: str | None = "20261017_55"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ingestion_jobs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("document_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("project_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("available_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("locked_by", sa.String(length=255), nullable=True),
+        sa.Column("locked_until", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["document_id"], ["documents.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_ingestion_jobs_document_id", "ingestion_jobs", ["document_id"], unique=False)
+    op.create_index(
+        "ix_ingestion_jobs_status_available_at",
+        "ingestion_jobs",
+        ["status", "available_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ingestion_jobs_status_available_at", table_name="ingestion_jobs")
+    op.drop_index("ix_ingestion_jobs_document_id", table_name="ingestion_jobs")
+    op.drop_table("ingestion_jobs")
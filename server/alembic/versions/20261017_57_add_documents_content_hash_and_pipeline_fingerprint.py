@@ -0,0 +1,32 @@
+"""add content_hash and pipeline_fingerprint to documents
+
+Revision ID: 20261017_57
+Revises: 20261017_56
+Create Date: 2026-10-17
+
+content_hash is the sha256 of the indexed file, pipeline_fingerprint a hash
+of the indexing configuration that shaped its chunks and embeddings. A
+project reindex skips documents for which both are unchanged. Existing rows
+stay NULL and are indexed again on their next reindex.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261017_57"
+down_revision: str | None = "20261017_56"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("documents", sa.Column("content_hash", sa.String(length=64), nullable=True))
+    op.add_column("documents", sa.Column("pipeline_fingerprint", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("documents", "pipeline_fingerprint")
+    op.drop_column("documents", "content_hash")
@@ -1,7 +1,12 @@
 SUPPORTED_EMBEDDING_BACKENDS: frozenset[str] = frozenset({"openai", "gemini", "ollama", "inmemory"})
 SUPPORTED_LLM_BACKENDS: frozenset[str] = frozenset({"openai", "gemini", "anthropic", "ollama", "inmemory"})
 SUPPORTED_RETRIEVAL_STRATEGIES: frozenset[str] = frozenset({"vector", "fulltext", "hybrid"})
+SUPPORTED_RETRIEVAL_FUSION_MODES: frozenset[str] = frozenset({"weighted", "rrf"})
 SUPPORTED_RERANKER_BACKENDS: frozenset[str] = frozenset({"none", "cross_encoder", "inmemory", "mmr"})
+SUPPORTED_HNSW_ITERATIVE_SCAN_MODES: frozenset[str] = frozenset({"off", "strict_order", "relaxed_order"})
+MAX_HNSW_EF_SEARCH = 1000
+SUPPORTED_VECTOR_INDEX_MODES: frozenset[str] = frozenset({"vector", "halfvec", "bit"})
+SUPPORTED_CHANNEL_EXECUTION_MODES: frozenset[str] = frozenset({"single_statement", "concurrent"})
 SUPPORTED_CHUNKING_STRATEGIES: frozenset[str] = frozenset(
     {"auto", "fixed_window", "paragraph", "heading_section", "semantic"}
 )
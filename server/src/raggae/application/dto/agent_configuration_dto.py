@@ -25,6 +25,8 @@ class AgentConfigurationDTO:
     retrieval_strategy: str | None
     retrieval_top_k: int | None
     retrieval_min_score: float | None
+    retrieval_hnsw_ef_search: int | None
+    retrieval_hnsw_iterative_scan: str | None
     # Reranking
     reranking_enabled: bool | None
     reranker_backend: str | None
@@ -50,6 +52,8 @@ class AgentConfigurationDTO:
             retrieval_strategy=entity.retrieval_strategy,
             retrieval_top_k=entity.retrieval_top_k,
             retrieval_min_score=entity.retrieval_min_score,
+            retrieval_hnsw_ef_search=entity.retrieval_hnsw_ef_search,
+            retrieval_hnsw_iterative_scan=entity.retrieval_hnsw_iterative_scan,
             reranking_enabled=entity.reranking_enabled,
             reranker_backend=entity.reranker_backend,
             reranker_model=entity.reranker_model,
@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
+from raggae.application.dto.document_chunk_view_dto import DocumentChunkViewDTO
 from raggae.domain.entities.document_chunk import DocumentChunk
 
 
@@ -31,3 +32,16 @@ class DocumentChunkDTO:
             chunk_level=chunk.chunk_level.value,
             parent_chunk_id=chunk.parent_chunk_id,
         )
+
+    @classmethod
+    def from_view(cls, view: DocumentChunkViewDTO) -> "DocumentChunkDTO":
+        return cls(
+            id=view.id,
+            document_id=view.document_id,
+            chunk_index=view.chunk_index,
+            content=view.content,
+            created_at=view.created_at,
+            metadata_json=view.metadata_json,
+            chunk_level=view.chunk_level,
+            parent_chunk_id=view.parent_chunk_id,
+        )
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class DocumentChunkViewDTO:
+    """Read-only projection of a document chunk, without its embedding vector."""
+
+    id: UUID
+    document_id: UUID
+    chunk_index: int
+    content: str
+    created_at: datetime
+    metadata_json: dict[str, Any] | None = None
+    chunk_level: str = "standard"
+    parent_chunk_id: UUID | None = None
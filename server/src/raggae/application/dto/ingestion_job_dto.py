@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class IngestionJobDTO:
+    """Document indexing job leased from the ingestion queue."""
+
+    id: UUID
+    document_id: UUID
+    project_id: UUID
+    user_id: UUID
+    attempts: int
@@ -10,3 +10,4 @@ class ReindexProjectResultDTO:
     total_documents: int
     indexed_documents: int
     failed_documents: int
+    skipped_documents: int = 0
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
 from uuid import UUID
 
@@ -16,3 +18,6 @@ class RetrievedChunkDTO:
     fulltext_score: float | None = None
     chunk_level: str | None = None
     parent_chunk_id: UUID | None = None
+    # Context prefetched by the retrieval service; None when it was not fetched.
+    parent_content: str | None = None
+    context_neighbors: list[RetrievedChunkDTO] | None = None
@@ -1,6 +1,7 @@
 from typing import Protocol
 from uuid import UUID
 
+from raggae.application.dto.document_chunk_view_dto import DocumentChunkViewDTO
 from raggae.domain.entities.document_chunk import DocumentChunk
 
 
@@ -17,6 +18,22 @@ class DocumentChunkRepository(Protocol):
 
     async def find_by_id(self, chunk_id: UUID) -> DocumentChunk | None: ...
 
+    # Embedding-free reads, for callers that only need content and position.
+
+    async def find_views_by_document_id(self, document_id: UUID) -> list[DocumentChunkViewDTO]: ...
+
+    async def find_views_by_ids(self, chunk_ids: set[UUID]) -> list[DocumentChunkViewDTO]: ...
+
+    async def find_views_by_document_indices(
+        self, indices_by_document: dict[UUID, set[int]]
+    ) -> list[DocumentChunkViewDTO]: ...
+
     async def delete_by_document_id(self, document_id: UUID) -> None: ...
 
     async def replace_document_chunks(self, document_id: UUID, chunks: list[DocumentChunk]) -> None: ...
+
+    # Atomically inserts or updates ``chunks`` and deletes ``removed_ids`` of a document.
+
+    async def upsert_document_chunks(
+        self, document_id: UUID, chunks: list[DocumentChunk], removed_ids: set[UUID]
+    ) -> None: ...
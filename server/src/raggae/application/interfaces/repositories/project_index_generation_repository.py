@@ -0,0 +1,14 @@
+from typing import Protocol
+from uuid import UUID
+
+
+class ProjectIndexGenerationRepository(Protocol):
+    """Interface for the per-project index generation counter.
+
+    The generation is bumped every time the chunks of a project change, so that
+    anything derived from them (e.g. cached retrieval results) can be versioned.
+    """
+
+    async def get_generation(self, project_id: UUID) -> int: ...
+
+    async def bump(self, project_id: UUID) -> int: ...
@@ -17,4 +17,7 @@ class ChunkRetrievalService(Protocol):
         min_score: float = 0.0,
         strategy: str = "hybrid",
         metadata_filters: dict[str, object] | None = None,
+        hnsw_ef_search: int | None = None,
+        hnsw_iterative_scan: str | None = None,
+        context_window_size: int = 0,
     ) -> list[RetrievedChunkDTO]: ...
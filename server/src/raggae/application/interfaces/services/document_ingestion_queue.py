@@ -0,0 +1,25 @@
+from typing import Protocol
+from uuid import UUID
+
+from raggae.application.dto.ingestion_job_dto import IngestionJobDTO
+
+
+class DocumentIngestionQueue(Protocol):
+    """Interface for the durable queue of documents waiting to be indexed.
+
+    A claimed job is leased to one worker for ``lease_seconds`` and counts as
+    an attempt; a worker that stops heartbeating loses its lease and the job
+    can be claimed again by another worker.
+    """
+
+    async def enqueue(self, document_id: UUID, project_id: UUID, user_id: UUID) -> UUID: ...
+
+    async def claim(self, worker_id: str, lease_seconds: float) -> IngestionJobDTO | None: ...
+
+    async def heartbeat(self, job_id: UUID, worker_id: str, lease_seconds: float) -> bool: ...
+
+    async def complete(self, job_id: UUID, worker_id: str) -> None: ...
+
+    async def retry(self, job_id: UUID, worker_id: str, error: str, delay_seconds: float) -> None: ...
+
+    async def fail(self, job_id: UUID, worker_id: str, error: str) -> None: ...
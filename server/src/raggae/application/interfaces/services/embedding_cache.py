@@ -0,0 +1,9 @@
+from typing import Protocol
+
+
+class EmbeddingCache(Protocol):
+    """Cache of text embeddings keyed by an embedding namespace and the sha256 of each text."""
+
+    async def get_many(self, namespace: str, text_hashes: list[str]) -> dict[str, list[float]]: ...
+
+    async def set_many(self, namespace: str, embeddings: dict[str, list[float]]) -> None: ...
@@ -1,3 +1,4 @@
+from contextlib import AbstractAsyncContextManager
 from typing import Protocol
 
 from raggae.application.interfaces.services.embedding_service import EmbeddingService
@@ -12,3 +13,21 @@ class ProjectEmbeddingServiceResolver(Protocol):
         model: str | None,
         encrypted_api_key: str | None,
     ) -> EmbeddingService: ...
+
+    def resolve_query_service(
+        self,
+        backend: str | None,
+        model: str | None,
+        encrypted_api_key: str | None,
+    ) -> EmbeddingService:
+        """Like :meth:`resolve`, without the document embedding cache (queries are cached apart)."""
+        ...
+
+    def lease(
+        self,
+        backend: str | None,
+        model: str | None,
+        encrypted_api_key: str | None,
+    ) -> AbstractAsyncContextManager[EmbeddingService]:
+        """Like :meth:`resolve`, for a caller holding the service across many calls."""
+        ...
@@ -0,0 +1,9 @@
+from typing import Protocol
+
+
+class QueryEmbeddingCache(Protocol):
+    """Cache of query embeddings keyed by embedding backend, model and query text."""
+
+    async def get(self, backend: str, model: str, query: str) -> list[float] | None: ...
+
+    async def set(self, backend: str, model: str, query: str, embedding: list[float]) -> None: ...
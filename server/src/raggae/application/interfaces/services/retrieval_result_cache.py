@@ -0,0 +1,13 @@
+from typing import Protocol
+
+from raggae.application.dto.query_relevant_chunks_result_dto import (
+    QueryRelevantChunksResultDTO,
+)
+
+
+class RetrievalResultCache(Protocol):
+    """Cache of retrieval results keyed by an opaque, generation-versioned key."""
+
+    async def get(self, key: str) -> QueryRelevantChunksResultDTO | None: ...
+
+    async def set(self, key: str, result: QueryRelevantChunksResultDTO) -> None: ...
@@ -1,12 +1,17 @@
+import asyncio
 import logging
 import re
+from contextlib import AbstractAsyncContextManager, nullcontext
 from dataclasses import replace
 from datetime import UTC, datetime
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from raggae.application.interfaces.repositories.document_chunk_repository import (
     DocumentChunkRepository,
 )
+from raggae.application.interfaces.repositories.project_index_generation_repository import (
+    ProjectIndexGenerationRepository,
+)
 from raggae.application.interfaces.services.chunking_strategy_selector import (
     ChunkingStrategySelector,
 )
@@ -32,6 +37,10 @@ from raggae.application.services.chunking_strategy_selector import (
 from raggae.application.services.parent_child_chunking_service import (
     ParentChildChunkingService,
 )
+from raggae.application.services.pipeline_fingerprint import (
+    compute_chunk_hash,
+    compute_content_hash,
+)
 from raggae.application.services.slide_chunker import SlideChunker
 from raggae.domain.entities.document import Document
 from raggae.domain.entities.document_chunk import DocumentChunk
@@ -45,7 +54,14 @@ logger = logging.getLogger(__name__)
 
 
 class DocumentIndexingService:
-    """Reusable service that runs the full indexing pipeline on a document."""
+    """Reusable service that runs the full indexing pipeline on a document.
+
+    With ``diff_chunks``, re-indexing a document under an unchanged pipeline
+    fingerprint compares the new chunks with the stored ones by
+    :func:`compute_chunk_hash`: matching chunks keep their row, id and
+    embedding, only the others are embedded, and only the chunks that
+    disappeared are deleted.
+    """
 
     def __init__(
         self,
@@ -63,6 +79,8 @@ class DocumentIndexingService:
         parent_child_chunking_service: ParentChildChunkingService | None = None,
         slide_chunker: SlideChunker | None = None,
         tabular_chunker: TextChunkerService | None = None,
+        project_index_generation_repository: ProjectIndexGenerationRepository | None = None,
+        diff_chunks: bool = False,
     ) -> None:
         self._document_chunk_repository = document_chunk_repository
         self._document_text_extractor = document_text_extractor
@@ -82,6 +100,8 @@ class DocumentIndexingService:
         self._parent_child_chunking_service = parent_child_chunking_service
         self._slide_chunker = slide_chunker
         self._tabular_chunker = tabular_chunker
+        self._project_index_generation_repository = project_index_generation_repository
+        self._diff_chunks = diff_chunks
 
     async def run_pipeline(
         self,
@@ -91,25 +111,44 @@ class DocumentIndexingService:
         embedding_service: EmbeddingService | None = None,
         parent_child_chunking: bool = False,
         chunking_strategy: ChunkingStrategy | None = None,
+        pipeline_fingerprint: str | None = None,
+        extraction_limiter: asyncio.Semaphore | None = None,
     ) -> Document:
+        """Index ``file_content`` and return the document stamped with its content hash and fingerprint.
+
+        ``extraction_limiter`` bounds the CPU-bound stage (extraction, sanitizing,
+        structure analysis, keywords) when several documents are indexed at once.
+        """
         effective_embedding_service = embedding_service or self._embedding_service
-        document, sanitized_text, strategy = await self._prepare_document_for_chunking(
-            document=document,
-            project=project,
-            file_content=file_content,
-            chunking_strategy=chunking_strategy,
+        # Stored embeddings are only reusable when produced by the same pipeline.
+        reuse_chunks = (
+            self._diff_chunks
+            and pipeline_fingerprint is not None
+            and document.pipeline_fingerprint == pipeline_fingerprint
         )
+        document = replace(
+            document,
+            content_hash=compute_content_hash(file_content),
+            pipeline_fingerprint=pipeline_fingerprint,
+        )
+        limiter: AbstractAsyncContextManager[object] = (
+            extraction_limiter if extraction_limiter is not None else nullcontext()
+        )
+        async with limiter:
+            document, sanitized_text, strategy = await self._prepare_document_for_chunking(
+                document=document,
+                project=project,
+                file_content=file_content,
+                chunking_strategy=chunking_strategy,
+            )
 
         extension = (
             document.file_name.rsplit(".", maxsplit=1)[-1].lower() if "." in document.file_name else ""
         )
         if extension == "pptx" and self._slide_chunker is not None:
-            slide_based_chunks = await self._build_slide_chunks(
-                text=sanitized_text,
-                document=document,
-                embedding_service=effective_embedding_service,
-            )
-            await self._document_chunk_repository.replace_document_chunks(document.id, slide_based_chunks)
+            slide_based_chunks = self._build_slide_chunks(text=sanitized_text, document=document)
+            await self._store_chunks(document, slide_based_chunks, effective_embedding_service, reuse_chunks)
+            await self._bump_index_generation(document)
             return document
 
         if strategy == ChunkingStrategy.TABULAR and self._tabular_chunker is not None:
@@ -137,25 +176,100 @@ class DocumentIndexingService:
             )
 
             if use_parent_child:
-                document_chunks = await self._build_parent_child_chunks(
+                document_chunks = self._build_parent_child_chunks(
                     chunks=chunks,
                     document=document,
                     strategy=strategy,
                     llamaindex_splitter=llamaindex_splitter,
-                    embedding_service=effective_embedding_service,
                 )
             else:
-                document_chunks = await self._build_standard_chunks(
+                document_chunks = self._build_standard_chunks(
                     chunks=chunks,
                     document=document,
                     strategy=strategy,
                     llamaindex_splitter=llamaindex_splitter,
-                    embedding_service=effective_embedding_service,
                 )
-        await self._document_chunk_repository.replace_document_chunks(document.id, document_chunks)
+        await self._store_chunks(document, document_chunks, effective_embedding_service, reuse_chunks)
+        await self._bump_index_generation(document)
 
         return document
 
+    async def _store_chunks(
+        self,
+        document: Document,
+        chunks: list[DocumentChunk],
+        embedding_service: EmbeddingService,
+        reuse_existing: bool,
+    ) -> None:
+        """Embed ``chunks`` (built without embeddings) and persist them as the document's chunks.
+
+        Parent chunks are not searched by vector and get a zero embedding.
+        """
+        existing = (
+            await self._document_chunk_repository.find_by_document_id(document.id) if reuse_existing else []
+        )
+        matches = _match_existing_chunks(chunks, existing)
+        to_embed = [
+            index
+            for index, chunk in enumerate(chunks)
+            if chunk.chunk_level != ChunkLevel.PARENT and matches[index] is None
+        ]
+        embeddings = (
+            await embedding_service.embed_texts([chunks[index].content for index in to_embed])
+            if to_embed
+            else []
+        )
+        embedding_by_index = dict(zip(to_embed, embeddings, strict=True))
+        known_embeddings = embeddings or [match.embedding for match in matches if match is not None]
+        zero_embedding = [0.0] * (len(known_embeddings[0]) if known_embeddings else 0)
+
+        stored_ids: dict[UUID, UUID] = {}
+        stored: list[DocumentChunk] = []
+        for index, (chunk, match) in enumerate(zip(chunks, matches, strict=True)):
+            parent_chunk_id = (
+                stored_ids.get(chunk.parent_chunk_id, chunk.parent_chunk_id)
+                if chunk.parent_chunk_id is not None
+                else None
+            )
+            if match is not None:
+                stored_chunk = replace(match, chunk_index=chunk.chunk_index, parent_chunk_id=parent_chunk_id)
+            else:
+                embedding = (
+                    zero_embedding if chunk.chunk_level == ChunkLevel.PARENT else embedding_by_index[index]
+                )
+                stored_chunk = replace(chunk, embedding=embedding, parent_chunk_id=parent_chunk_id)
+            stored_ids[chunk.id] = stored_chunk.id
+            stored.append(stored_chunk)
+
+        if not reuse_existing:
+            await self._document_chunk_repository.replace_document_chunks(document.id, stored)
+            return
+
+        existing_by_id = {chunk.id: chunk for chunk in existing}
+        upserted = [
+            chunk
+            for chunk in stored
+            if (previous := existing_by_id.get(chunk.id)) is None
+            or previous.chunk_index != chunk.chunk_index
+            or previous.parent_chunk_id != chunk.parent_chunk_id
+        ]
+        removed_ids = set(existing_by_id) - {chunk.id for chunk in stored}
+        logger.info(
+            "document_chunks_diffed",
+            extra={
+                "document_id": str(document.id),
+                "reused": sum(match is not None for match in matches),
+                "embedded": len(to_embed),
+                "removed": len(removed_ids),
+            },
+        )
+        if upserted or removed_ids:
+            await self._document_chunk_repository.upsert_document_chunks(document.id, upserted, removed_ids)
+
+    async def _bump_index_generation(self, document: Document) -> None:
+        if self._project_index_generation_repository is not None:
+            await self._project_index_generation_repository.bump(document.project_id)
+
     async def _prepare_document_for_chunking(
         self,
         document: Document,
@@ -197,18 +311,8 @@ class DocumentIndexingService:
 
         return replace(document, processing_strategy=strategy), sanitized_text, strategy
 
-    async def _build_slide_chunks(
-        self,
-        text: str,
-        document: Document,
-        embedding_service: EmbeddingService,
-    ) -> list[DocumentChunk]:
+    def _build_slide_chunks(self, text: str, document: Document) -> list[DocumentChunk]:
         slide_chunks = self._slide_chunker.chunk(text)  # type: ignore[union-attr]
-        if not slide_chunks:
-            return []
-
-        contents = [sc.content for sc in slide_chunks]
-        embeddings = await embedding_service.embed_texts(contents)
         now = datetime.now(UTC)
         return [
             DocumentChunk(
@@ -216,7 +320,7 @@ class DocumentIndexingService:
                 document_id=document.id,
                 chunk_index=sc.chunk_index,
                 content=sc.content,
-                embedding=embeddings[i],
+                embedding=[],
                 created_at=now,
                 metadata_json={
                     "metadata_version": 1,
@@ -224,31 +328,25 @@ class DocumentIndexingService:
                     "slide_title": sc.slide_title,
                 },
             )
-            for i, sc in enumerate(slide_chunks)
+            for sc in slide_chunks
         ]
 
-    async def _build_standard_chunks(
+    def _build_standard_chunks(
         self,
         chunks: list[str],
         document: Document,
         strategy: ChunkingStrategy,
         llamaindex_splitter: str | None,
-        embedding_service: EmbeddingService,
     ) -> list[DocumentChunk]:
         chunk_payloads = [self._build_chunk_payload(chunk_text) for chunk_text in chunks]
         indexed_payloads = [payload for payload in chunk_payloads if str(payload["content"]).strip()]
-        if not indexed_payloads:
-            return []
-
-        chunk_contents = [str(payload["content"]) for payload in indexed_payloads]
-        embeddings = await embedding_service.embed_texts(chunk_contents)
         return [
             DocumentChunk(
                 id=uuid4(),
                 document_id=document.id,
                 chunk_index=index,
                 content=str(payload["content"]),
-                embedding=embeddings[index],
+                embedding=[],
                 created_at=datetime.now(UTC),
                 metadata_json=self._build_metadata(
                     strategy=strategy,
@@ -259,13 +357,12 @@ class DocumentIndexingService:
             for index, payload in enumerate(indexed_payloads)
         ]
 
-    async def _build_parent_child_chunks(
+    def _build_parent_child_chunks(
         self,
         chunks: list[str],
         document: Document,
         strategy: ChunkingStrategy,
         llamaindex_splitter: str | None,
-        embedding_service: EmbeddingService,
     ) -> list[DocumentChunk]:
         assert self._parent_child_chunking_service is not None
         cleaned_chunks: list[str] = []
@@ -282,21 +379,8 @@ class DocumentIndexingService:
         )
 
         all_document_chunks: list[DocumentChunk] = []
-        all_child_texts: list[str] = []
-        parent_child_map: list[tuple[int, int, int]] = []  # (parent_idx, child_start, child_end)
-
-        for parent_idx, (_, children) in enumerate(parent_children):
-            start = len(all_child_texts)
-            all_child_texts.extend(children)
-            end = len(all_child_texts)
-            parent_child_map.append((parent_idx, start, end))
-
-        embeddings = await embedding_service.embed_texts(all_child_texts)
-        embedding_dim = len(embeddings[0]) if embeddings else 0
-        zero_embedding = [0.0] * embedding_dim
-
         chunk_index = 0
-        for parent_idx, (parent_text, _) in enumerate(parent_children):
+        for parent_text, children in parent_children:
             parent_id = uuid4()
             now = datetime.now(UTC)
             metadata = self._build_metadata(
@@ -310,7 +394,7 @@ class DocumentIndexingService:
                 document_id=document.id,
                 chunk_index=chunk_index,
                 content=parent_text,
-                embedding=zero_embedding,
+                embedding=[],
                 created_at=now,
                 metadata_json=metadata,
                 chunk_level=ChunkLevel.PARENT,
@@ -318,14 +402,13 @@ class DocumentIndexingService:
             all_document_chunks.append(parent_chunk)
             chunk_index += 1
 
-            _, child_start, child_end = parent_child_map[parent_idx]
-            for emb_idx in range(child_start, child_end):
+            for child_text in children:
                 child_chunk = DocumentChunk(
                     id=uuid4(),
                     document_id=document.id,
                     chunk_index=chunk_index,
-                    content=all_child_texts[emb_idx],
-                    embedding=embeddings[emb_idx],
+                    content=child_text,
+                    embedding=[],
                     created_at=now,
                     metadata_json=metadata,
                     chunk_level=ChunkLevel.CHILD,
@@ -409,3 +492,29 @@ class DocumentIndexingService:
         except Exception:
             logger.warning("keyword_extraction_failed", exc_info=True)
             return document
+
+
+def _match_existing_chunks(
+    chunks: list[DocumentChunk], existing: list[DocumentChunk]
+) -> list[DocumentChunk | None]:
+    """Pair each new chunk with an unclaimed stored chunk of the same hash, if any."""
+    if not existing:
+        return [None] * len(chunks)
+    available: dict[str, list[DocumentChunk]] = {}
+    for chunk, chunk_hash in zip(existing, _chunk_hashes(existing), strict=True):
+        available.setdefault(chunk_hash, []).append(chunk)
+    return [
+        candidates.pop(0) if (candidates := available.get(chunk_hash)) else None
+        for chunk_hash in _chunk_hashes(chunks)
+    ]
+
+
+def _chunk_hashes(chunks: list[DocumentChunk]) -> list[str]:
+    hashes_by_id: dict[UUID, str] = {}
+    # Parents are hashed first so children can include their parent's hash.
+    for chunk in sorted(chunks, key=lambda chunk: chunk.parent_chunk_id is not None):
+        parent_hash = hashes_by_id.get(chunk.parent_chunk_id) if chunk.parent_chunk_id is not None else None
+        hashes_by_id[chunk.id] = compute_chunk_hash(
+            chunk.content, chunk.metadata_json, chunk.chunk_level, parent_hash
+        )
+    return [hashes_by_id[chunk.id] for chunk in chunks]
@@ -0,0 +1,127 @@
+import asyncio
+import contextlib
+import logging
+import os
+import socket
+from uuid import uuid4
+
+from raggae.application.dto.ingestion_job_dto import IngestionJobDTO
+from raggae.application.interfaces.services.document_ingestion_queue import DocumentIngestionQueue
+from raggae.application.services.retry_backoff import backoff_delay
+from raggae.application.use_cases.document.index_queued_document import (
+    PERMANENT_INGESTION_ERRORS,
+    IndexQueuedDocument,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class DocumentIngestionWorker:
+    """Claims ingestion jobs one at a time and runs them through :class:`IndexQueuedDocument`.
+
+    While a job runs its lease is renewed every third of ``lease_seconds``.
+    Transient failures are retried with exponential backoff until
+    ``max_attempts``; permanent failures and the last attempt fail the job and
+    its document. A job whose previous holders all died (lease expired past
+    ``max_attempts``) is failed without running the pipeline again.
+    """
+
+    def __init__(
+        self,
+        queue: DocumentIngestionQueue,
+        index_queued_document: IndexQueuedDocument,
+        worker_id: str | None = None,
+        lease_seconds: float = 300.0,
+        poll_interval_seconds: float = 2.0,
+        max_attempts: int = 5,
+        retry_base_delay_seconds: float = 10.0,
+        retry_max_delay_seconds: float = 600.0,
+    ) -> None:
+        self._queue = queue
+        self._index_queued_document = index_queued_document
+        self._worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self._lease_seconds = lease_seconds
+        self._poll_interval_seconds = poll_interval_seconds
+        self._max_attempts = max(1, max_attempts)
+        self._retry_base_delay = retry_base_delay_seconds
+        self._retry_max_delay = retry_max_delay_seconds
+        self.processed = 0
+        self.retried = 0
+        self.failed = 0
+
+    @property
+    def worker_id(self) -> str:
+        return self._worker_id
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """Process jobs until ``stop`` is set, polling when the queue is empty."""
+        logger.info("ingestion_worker_started", extra={"worker_id": self._worker_id})
+        while not stop.is_set():
+            try:
+                claimed = await self.run_once()
+            except Exception:
+                logger.exception("ingestion_worker_poll_failed", extra={"worker_id": self._worker_id})
+                claimed = False
+            if not claimed:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(stop.wait(), timeout=self._poll_interval_seconds)
+        logger.info("ingestion_worker_stopped", extra={"worker_id": self._worker_id})
+
+    async def run_once(self) -> bool:
+        """Claim and process one job; ``False`` when none is available."""
+        job = await self._queue.claim(self._worker_id, self._lease_seconds)
+        if job is None:
+            return False
+        heartbeat = asyncio.create_task(self._heartbeat(job))
+        try:
+            await self._process(job)
+        finally:
+            heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await heartbeat
+        return True
+
+    async def _process(self, job: IngestionJobDTO) -> None:
+        log_extra = {"job_id": str(job.id), "document_id": str(job.document_id), "attempt": job.attempts}
+        if job.attempts > self._max_attempts:
+            error = f"Indexing abandoned after {self._max_attempts} attempts"
+            await self._index_queued_document.fail(job, error)
+            await self._queue.fail(job.id, self._worker_id, error)
+            self.failed += 1
+            logger.error("ingestion_job_abandoned", extra=log_extra)
+            return
+
+        final_attempt = job.attempts >= self._max_attempts
+        try:
+            await self._index_queued_document.execute(job, final_attempt=final_attempt)
+        except Exception as exc:
+            if final_attempt or isinstance(exc, PERMANENT_INGESTION_ERRORS):
+                await self._queue.fail(job.id, self._worker_id, str(exc))
+                self.failed += 1
+                logger.error("ingestion_job_failed", extra={**log_extra, "error": str(exc)})
+                return
+            delay = backoff_delay(job.attempts - 1, self._retry_base_delay, self._retry_max_delay)
+            await self._queue.retry(job.id, self._worker_id, str(exc), delay)
+            self.retried += 1
+            logger.warning(
+                "ingestion_job_retry_scheduled",
+                extra={**log_extra, "error": str(exc), "delay_seconds": round(delay, 2)},
+            )
+            return
+
+        await self._queue.complete(job.id, self._worker_id)
+        self.processed += 1
+        logger.info("ingestion_job_completed", extra=log_extra)
+
+    async def _heartbeat(self, job: IngestionJobDTO) -> None:
+        interval = self._lease_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                renewed = await self._queue.heartbeat(job.id, self._worker_id, self._lease_seconds)
+            except Exception:
+                logger.warning("ingestion_job_heartbeat_failed", extra={"job_id": str(job.id)}, exc_info=True)
+                continue
+            if not renewed:
+                logger.warning("ingestion_job_lease_lost", extra={"job_id": str(job.id)})
+                return
@@ -0,0 +1,62 @@
+import hashlib
+import json
+
+from raggae.domain.value_objects.chunk_level import ChunkLevel
+from raggae.domain.value_objects.chunking_strategy import ChunkingStrategy
+from raggae.infrastructure.config.settings import settings
+
+
+def compute_content_hash(file_content: bytes) -> str:
+    return hashlib.sha256(file_content).hexdigest()
+
+
+def compute_pipeline_fingerprint(
+    chunking_strategy: ChunkingStrategy | None,
+    parent_child_chunking: bool,
+    embedding_backend: str | None,
+    embedding_model: str | None,
+) -> str:
+    """Hash of the indexing configuration that shapes a document's chunks and embeddings.
+
+    Unset backend and model resolve to the global defaults the same way the
+    embedding service resolver does, so a project following the defaults
+    gets a new fingerprint when they change. The chunker settings cover the
+    window size and overlap, and the default embedding model the semantic
+    chunker splits with.
+    """
+    backend = embedding_backend or settings.default_embedding_provider
+    model = embedding_model or (
+        settings.default_embedding_model if backend == settings.default_embedding_provider else ""
+    )
+    payload = {
+        "chunking_strategy": (chunking_strategy or ChunkingStrategy.AUTO).value,
+        "parent_child_chunking": parent_child_chunking,
+        "embedding_backend": backend,
+        "embedding_model": model,
+        "embedding_dimension": settings.embedding_dimension,
+        "chunker_backend": settings.text_chunker_backend,
+        "chunk_size": settings.chunk_size,
+        "chunk_overlap": settings.chunk_overlap,
+        "semantic_chunker_embedding": [settings.default_embedding_provider, settings.default_embedding_model],
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def compute_chunk_hash(
+    content: str,
+    metadata_json: dict[str, object] | None,
+    chunk_level: ChunkLevel,
+    parent_hash: str | None = None,
+) -> str:
+    """Hash identifying a chunk by what it embeds and stores, not by its position.
+
+    A child chunk includes the hash of its parent so it only matches an
+    existing child of an identical parent.
+    """
+    payload = {
+        "content": content,
+        "metadata": metadata_json,
+        "chunk_level": chunk_level.value,
+        "parent": parent_hash,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
@@ -0,0 +1,18 @@
+import random
+
+
+def backoff_delay(
+    attempt: int,
+    base_delay: float,
+    max_delay: float,
+    retry_after: float | None = None,
+) -> float:
+    """Seconds to wait before retry ``attempt`` (0-based).
+
+    Exponential backoff with full jitter, capped at ``max_delay``; a provider
+    ``Retry-After`` takes precedence when it asks for longer.
+    """
+    delay = random.uniform(0.0, min(max_delay, base_delay * 2**attempt))
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, max_delay))
+    return delay
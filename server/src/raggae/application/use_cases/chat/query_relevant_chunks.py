@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from collections import defaultdict
 from time import perf_counter
 from uuid import UUID
@@ -14,13 +16,18 @@ from raggae.application.interfaces.repositories.document_chunk_repository import
 from raggae.application.interfaces.repositories.organization_member_repository import (
     OrganizationMemberRepository,
 )
+from raggae.application.interfaces.repositories.project_index_generation_repository import (
+    ProjectIndexGenerationRepository,
+)
 from raggae.application.interfaces.repositories.project_repository import ProjectRepository
 from raggae.application.interfaces.services.chunk_retrieval_service import ChunkRetrievalService
 from raggae.application.interfaces.services.embedding_service import EmbeddingService
 from raggae.application.interfaces.services.project_embedding_service_resolver import (
     ProjectEmbeddingServiceResolver,
 )
+from raggae.application.interfaces.services.query_embedding_cache import QueryEmbeddingCache
 from raggae.application.interfaces.services.reranker_service import RerankerService
+from raggae.application.interfaces.services.retrieval_result_cache import RetrievalResultCache
 from raggae.domain.exceptions.project_exceptions import ProjectNotFoundError
 from raggae.domain.value_objects.organization_member_role import OrganizationMemberRole
 
@@ -40,6 +47,11 @@ class QueryRelevantChunks:
         document_chunk_repository: DocumentChunkRepository | None = None,
         context_window_size: int = 0,
         organization_member_repository: OrganizationMemberRepository | None = None,
+        query_embedding_cache: QueryEmbeddingCache | None = None,
+        embedding_backend: str = "",
+        embedding_model: str = "",
+        retrieval_result_cache: RetrievalResultCache | None = None,
+        project_index_generation_repository: ProjectIndexGenerationRepository | None = None,
     ) -> None:
         self._project_repository = project_repository
         self._embedding_service = embedding_service
@@ -51,6 +63,11 @@ class QueryRelevantChunks:
         self._document_chunk_repository = document_chunk_repository
         self._context_window_size = context_window_size
         self._organization_member_repository = organization_member_repository
+        self._query_embedding_cache = query_embedding_cache
+        self._embedding_backend = embedding_backend
+        self._embedding_model = embedding_model
+        self._retrieval_result_cache = retrieval_result_cache
+        self._project_index_generation_repository = project_index_generation_repository
 
     async def execute(
         self,
@@ -64,6 +81,8 @@ class QueryRelevantChunks:
         reranker_candidate_multiplier: int | None = None,
         metadata_filters: dict[str, object] | None = None,
         offset: int = 0,
+        hnsw_ef_search: int | None = None,
+        hnsw_iterative_scan: str | None = None,
     ) -> QueryRelevantChunksResultDTO:
         started_at = perf_counter()
         project = await self._project_repository.find_by_id(project_id)
@@ -82,12 +101,6 @@ class QueryRelevantChunks:
                 if not project.is_published:
                     raise ProjectNotFoundError(f"Project {project_id} not found")
 
-        embedding_service = (
-            self._project_embedding_service_resolver.resolve(backend=None, model=None, encrypted_api_key=None)
-            if self._project_embedding_service_resolver is not None
-            else self._embedding_service
-        )
-        query_embedding = (await embedding_service.embed_texts([query]))[0]
         strategy_used = _resolve_strategy(strategy, query)
         effective_min_score = self._min_score if min_score is None else min_score
         effective_reranker_service = self._reranker_service if reranker_service is None else reranker_service
@@ -97,6 +110,45 @@ class QueryRelevantChunks:
             else reranker_candidate_multiplier
         )
 
+        cache_key: str | None = None
+        if self._retrieval_result_cache is not None and self._project_index_generation_repository is not None:
+            # The generation is read before retrieval: if the chunks change meanwhile,
+            # the result is stored under a generation that is never looked up again.
+            generation = await self._project_index_generation_repository.get_generation(project_id)
+            cache_key = _retrieval_cache_key(
+                project_id=str(project_id),
+                generation=generation,
+                query=query,
+                strategy=strategy_used,
+                limit=limit,
+                offset=offset,
+                min_score=effective_min_score,
+                metadata_filters=metadata_filters or {},
+                reranker=_reranker_identity(effective_reranker_service),
+                reranker_candidate_multiplier=effective_reranker_candidate_multiplier,
+                hnsw_ef_search=hnsw_ef_search,
+                hnsw_iterative_scan=hnsw_iterative_scan,
+                context_window_size=self._context_window_size,
+                embedding_backend=self._embedding_backend,
+                embedding_model=self._embedding_model,
+            )
+            cached = await self._retrieval_result_cache.get(cache_key)
+            if cached is not None:
+                return QueryRelevantChunksResultDTO(
+                    chunks=list(cached.chunks),
+                    strategy_used=cached.strategy_used,
+                    execution_time_ms=(perf_counter() - started_at) * 1000.0,
+                )
+
+        embedding_service = (
+            self._project_embedding_service_resolver.resolve_query_service(
+                backend=None, model=None, encrypted_api_key=None
+            )
+            if self._project_embedding_service_resolver is not None
+            else self._embedding_service
+        )
+        query_embedding = await self._embed_query(embedding_service, query)
+
         fetch_limit = limit * effective_reranker_candidate_multiplier if effective_reranker_service else limit
 
         chunks = await self._chunk_retrieval_service.retrieve_chunks(
@@ -108,6 +160,9 @@ class QueryRelevantChunks:
             min_score=effective_min_score,
             strategy=strategy_used,
             metadata_filters=metadata_filters,
+            hnsw_ef_search=hnsw_ef_search,
+            hnsw_iterative_scan=hnsw_iterative_scan,
+            context_window_size=self._context_window_size if self._document_chunk_repository else 0,
         )
 
         if effective_reranker_service is not None:
@@ -123,11 +178,34 @@ class QueryRelevantChunks:
         chunks = await self._expand_context_window(chunks)
         chunks = await self._resolve_parent_context(chunks)
 
-        return QueryRelevantChunksResultDTO(
+        result = QueryRelevantChunksResultDTO(
             chunks=chunks,
             strategy_used=strategy_used,
             execution_time_ms=(perf_counter() - started_at) * 1000.0,
         )
+        if cache_key is not None and self._retrieval_result_cache is not None:
+            await self._retrieval_result_cache.set(
+                cache_key,
+                QueryRelevantChunksResultDTO(
+                    chunks=list(chunks),
+                    strategy_used=strategy_used,
+                    execution_time_ms=result.execution_time_ms,
+                ),
+            )
+        return result
+
+    async def _embed_query(self, embedding_service: EmbeddingService, query: str) -> list[float]:
+        if self._query_embedding_cache is None:
+            return (await embedding_service.embed_texts([query]))[0]
+
+        cached = await self._query_embedding_cache.get(self._embedding_backend, self._embedding_model, query)
+        if cached is not None:
+            return cached
+        query_embedding = (await embedding_service.embed_texts([query]))[0]
+        await self._query_embedding_cache.set(
+            self._embedding_backend, self._embedding_model, query, query_embedding
+        )
+        return query_embedding
 
     async def _expand_context_window(self, chunks: list[RetrievedChunkDTO]) -> list[RetrievedChunkDTO]:
         if self._context_window_size <= 0 or self._document_chunk_repository is None:
@@ -162,11 +240,18 @@ class QueryRelevantChunks:
             if missing:
                 doc_needed[doc_id] = missing
 
-        # Fetch missing neighbor chunks
+        # Fetch missing neighbor chunks, unless the retrieval service already returned them
         neighbor_dtos: list[RetrievedChunkDTO] = []
+        indices_to_fetch: dict[UUID, set[int]] = {}
         for doc_id, missing_indices in doc_needed.items():
-            neighbor_chunks = await self._document_chunk_repository.find_by_document_id_and_indices(
-                document_id=doc_id, indices=missing_indices
+            prefetched = _prefetched_neighbors(chunks, doc_id)
+            if prefetched is not None:
+                neighbor_dtos.extend(prefetched[idx] for idx in sorted(missing_indices) if idx in prefetched)
+            else:
+                indices_to_fetch[doc_id] = missing_indices
+        if indices_to_fetch:
+            neighbor_chunks = await self._document_chunk_repository.find_views_by_document_indices(
+                indices_to_fetch
             )
             for nc in neighbor_chunks:
                 neighbor_dtos.append(
@@ -195,6 +280,16 @@ class QueryRelevantChunks:
         parent_cache: dict[UUID, str | None] = {}
         seen_parent_ids: set[UUID] = set()
 
+        # Load every parent not prefetched by the retrieval service in one query
+        for chunk in chunks:
+            if chunk.chunk_level == "child" and chunk.parent_chunk_id is not None:
+                if parent_cache.get(chunk.parent_chunk_id) is None:
+                    parent_cache[chunk.parent_chunk_id] = chunk.parent_content
+        missing_parent_ids = {parent_id for parent_id, content in parent_cache.items() if content is None}
+        if missing_parent_ids:
+            parents = await self._document_chunk_repository.find_views_by_ids(missing_parent_ids)
+            parent_cache.update({parent.id: parent.content for parent in parents})
+
         for chunk in chunks:
             if chunk.chunk_level == "child" and chunk.parent_chunk_id is not None:
                 parent_id = chunk.parent_chunk_id
@@ -204,10 +299,6 @@ class QueryRelevantChunks:
                     continue
                 seen_parent_ids.add(parent_id)
 
-                if parent_id not in parent_cache:
-                    parent = await self._document_chunk_repository.find_by_id(parent_id)
-                    parent_cache[parent_id] = parent.content if parent else None
-
                 parent_content = parent_cache[parent_id]
                 if parent_content is not None:
                     resolved.append(replace(chunk, content=parent_content))
@@ -219,6 +310,43 @@ class QueryRelevantChunks:
         return resolved
 
 
+def _prefetched_neighbors(
+    chunks: list[RetrievedChunkDTO], document_id: UUID
+) -> dict[int, RetrievedChunkDTO] | None:
+    """Neighbors of a document's hits returned by the retrieval service, by chunk index.
+
+    Returns None as soon as one hit of the document comes without prefetched
+    neighbors, so that the caller falls back to the repository.
+    """
+    neighbors: dict[int, RetrievedChunkDTO] = {}
+    for chunk in chunks:
+        if chunk.document_id != document_id or chunk.chunk_index is None or chunk.chunk_level == "child":
+            continue
+        if chunk.context_neighbors is None:
+            return None
+        for neighbor in chunk.context_neighbors:
+            if neighbor.chunk_index is not None:
+                neighbors.setdefault(neighbor.chunk_index, neighbor)
+    return neighbors
+
+
+def _retrieval_cache_key(**parts: object) -> str:
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _reranker_identity(reranker_service: RerankerService | None) -> str | None:
+    """Identify a reranker by its type and primitive configuration (model name, lambda...)."""
+    if reranker_service is None:
+        return None
+    config = {
+        name: value
+        for name, value in sorted(getattr(reranker_service, "__dict__", {}).items())
+        if isinstance(value, str | int | float | bool)
+    }
+    return f"{type(reranker_service).__qualname__}:{json.dumps(config, sort_keys=True)}"
+
+
 def _resolve_strategy(strategy: str, query_text: str) -> str:
     if strategy != "auto":
         return strategy
@@ -212,6 +212,7 @@ class SendMessage:
             current_message=message,
             current_user_message_id=current_user_message_id,
         )
+        resolved_config = await self._resolve_config(project=project, user_id=user_id)
         retrieval_result = await self._query_relevant_chunks_use_case.execute(
             project_id=project_id,
             user_id=user_id,
@@ -223,6 +224,8 @@ class SendMessage:
             reranker_service=effective_reranker_service,
             reranker_candidate_multiplier=None,
             metadata_filters=retrieval_filters,
+            hnsw_ef_search=resolved_config.retrieval_hnsw_ef_search if resolved_config else None,
+            hnsw_iterative_scan=resolved_config.retrieval_hnsw_iterative_scan if resolved_config else None,
         )
         relevant_chunks = self._select_useful_chunks(
             self._filter_relevant_chunks(retrieval_result.chunks),
@@ -340,7 +343,6 @@ class SendMessage:
                 user_id=user_id,
                 provider=effective_llm_provider,
             )
-        resolved_config = await self._resolve_config(project=project, user_id=user_id)
         llm_service = await self._resolve_llm_service(
             resolved_config=resolved_config, project=project, user_id=user_id
         )
@@ -487,6 +489,7 @@ class SendMessage:
             current_message=message,
             current_user_message_id=current_user_message_id,
         )
+        resolved_config = await self._resolve_config(project=project, user_id=user_id)
         retrieval_result = await self._query_relevant_chunks_use_case.execute(
             project_id=project_id,
             user_id=user_id,
@@ -498,6 +501,8 @@ class SendMessage:
             reranker_service=effective_reranker_service,
             reranker_candidate_multiplier=None,
             metadata_filters=retrieval_filters,
+            hnsw_ef_search=resolved_config.retrieval_hnsw_ef_search if resolved_config else None,
+            hnsw_iterative_scan=resolved_config.retrieval_hnsw_iterative_scan if resolved_config else None,
         )
         relevant_chunks = self._select_useful_chunks(
             self._filter_relevant_chunks(retrieval_result.chunks),
@@ -557,7 +562,6 @@ class SendMessage:
                 user_id=user_id,
                 provider=effective_llm_provider,
             )
-        resolved_config = await self._resolve_config(project=project, user_id=user_id)
         llm_service = await self._resolve_llm_service(
             resolved_config=resolved_config, project=project, user_id=user_id
         )
@@ -7,6 +7,9 @@ from raggae.application.interfaces.repositories.document_repository import Docum
 from raggae.application.interfaces.repositories.organization_member_repository import (
     OrganizationMemberRepository,
 )
+from raggae.application.interfaces.repositories.project_index_generation_repository import (
+    ProjectIndexGenerationRepository,
+)
 from raggae.application.interfaces.repositories.project_repository import ProjectRepository
 from raggae.application.interfaces.services.file_storage_service import FileStorageService
 from raggae.domain.exceptions.document_exceptions import DocumentNotFoundError
@@ -24,12 +27,14 @@ class DeleteDocument:
         project_repository: ProjectRepository,
         file_storage_service: FileStorageService,
         organization_member_repository: OrganizationMemberRepository | None = None,
+        project_index_generation_repository: ProjectIndexGenerationRepository | None = None,
     ) -> None:
         self._document_repository = document_repository
         self._document_chunk_repository = document_chunk_repository
         self._project_repository = project_repository
         self._file_storage_service = file_storage_service
         self._organization_member_repository = organization_member_repository
+        self._project_index_generation_repository = project_index_generation_repository
 
     async def execute(self, project_id: UUID, document_id: UUID, user_id: UUID) -> None:
         project = await self._project_repository.find_by_id(project_id)
@@ -54,4 +59,6 @@ class DeleteDocument:
 
         await self._file_storage_service.delete_file(document.storage_key)
         await self._document_chunk_repository.delete_by_document_id(document.id)
+        if self._project_index_generation_repository is not None:
+            await self._project_index_generation_repository.bump(project_id)
         await self._document_repository.delete(document_id)
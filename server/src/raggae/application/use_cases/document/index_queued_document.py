@@ -0,0 +1,130 @@
+from raggae.application.dto.document_dto import DocumentDTO
+from raggae.application.dto.ingestion_job_dto import IngestionJobDTO
+from raggae.application.interfaces.repositories.document_repository import DocumentRepository
+from raggae.application.interfaces.repositories.project_repository import ProjectRepository
+from raggae.application.interfaces.services.file_storage_service import FileStorageService
+from raggae.application.interfaces.services.project_embedding_service_resolver import (
+    ProjectEmbeddingServiceResolver,
+)
+from raggae.application.services.agent_configuration_resolver import (
+    AgentConfigurationResolver,
+)
+from raggae.application.services.document_indexing_service import DocumentIndexingService
+from raggae.application.services.pipeline_fingerprint import compute_pipeline_fingerprint
+from raggae.domain.entities.document import Document
+from raggae.domain.exceptions.document_exceptions import DocumentExtractionError
+from raggae.domain.value_objects.chunking_strategy import ChunkingStrategy
+from raggae.domain.value_objects.document_status import DocumentStatus
+from raggae.infrastructure.config.settings import settings
+
+# Failures that another attempt cannot fix.
+PERMANENT_INGESTION_ERRORS: tuple[type[Exception], ...] = (DocumentExtractionError, FileNotFoundError)
+
+
+class IndexQueuedDocument:
+    """Use Case: Run the indexing pipeline on a document claimed from the ingestion queue.
+
+    The document is moved to ``PROCESSING`` and then to ``INDEXED``. A
+    permanent failure, or any failure on the ``final_attempt``, moves it to
+    ``ERROR``; other failures leave it ``PROCESSING`` for the next attempt.
+    Failures are always re-raised for the worker to settle the job.
+    """
+
+    def __init__(
+        self,
+        document_repository: DocumentRepository,
+        project_repository: ProjectRepository,
+        file_storage_service: FileStorageService,
+        document_indexing_service: DocumentIndexingService,
+        project_embedding_service_resolver: ProjectEmbeddingServiceResolver | None = None,
+        agent_configuration_resolver: AgentConfigurationResolver | None = None,
+    ) -> None:
+        self._document_repository = document_repository
+        self._project_repository = project_repository
+        self._file_storage_service = file_storage_service
+        self._document_indexing_service = document_indexing_service
+        self._project_embedding_service_resolver = project_embedding_service_resolver
+        self._agent_configuration_resolver = agent_configuration_resolver
+
+    async def execute(self, job: IngestionJobDTO, final_attempt: bool = False) -> DocumentDTO | None:
+        """Index the job's document; ``None`` when it was deleted since it was queued."""
+        project = await self._project_repository.find_by_id(job.project_id)
+        document = await self._document_repository.find_by_id(job.document_id)
+        if project is None or document is None or document.project_id != project.id:
+            return None
+
+        if document.status != DocumentStatus.PROCESSING:
+            document = document.transition_to(DocumentStatus.PROCESSING)
+            await self._document_repository.save(document)
+
+        try:
+            resolved = (
+                await self._agent_configuration_resolver.resolve(project=project, user_id=job.user_id)
+                if self._agent_configuration_resolver is not None
+                else None
+            )
+            parent_child_chunking = (
+                resolved.parent_child_chunking
+                if resolved and resolved.parent_child_chunking is not None
+                else settings.default_parent_child_chunking
+            )
+            chunking_strategy = None
+            if resolved and resolved.chunking_strategy:
+                try:
+                    chunking_strategy = ChunkingStrategy(resolved.chunking_strategy)
+                except ValueError:
+                    pass
+
+            embedding_service = None
+            if self._project_embedding_service_resolver is not None:
+                encrypted_api_key = (
+                    await self._agent_configuration_resolver.fetch_encrypted_api_key(
+                        credential_id=resolved.embedding_api_key_credential_id,
+                        project=project,
+                        user_id=job.user_id,
+                    )
+                    if resolved is not None and self._agent_configuration_resolver is not None
+                    else None
+                )
+                embedding_service = self._project_embedding_service_resolver.resolve(
+                    backend=resolved.embedding_backend if resolved else None,
+                    model=resolved.embedding_model if resolved else None,
+                    encrypted_api_key=encrypted_api_key,
+                )
+
+            file_content, _ = await self._file_storage_service.download_file(document.storage_key)
+            document = await self._document_indexing_service.run_pipeline(
+                document=document,
+                project=project,
+                file_content=file_content,
+                embedding_service=embedding_service,
+                parent_child_chunking=parent_child_chunking,
+                chunking_strategy=chunking_strategy,
+                pipeline_fingerprint=compute_pipeline_fingerprint(
+                    chunking_strategy=chunking_strategy,
+                    parent_child_chunking=parent_child_chunking,
+                    embedding_backend=resolved.embedding_backend if resolved else None,
+                    embedding_model=resolved.embedding_model if resolved else None,
+                ),
+            )
+        except Exception as exc:
+            if final_attempt or isinstance(exc, PERMANENT_INGESTION_ERRORS):
+                await self._mark_error(document, str(exc))
+            raise
+
+        document = document.transition_to(DocumentStatus.INDEXED)
+        await self._document_repository.save(document)
+        return DocumentDTO.from_entity(document)
+
+    async def fail(self, job: IngestionJobDTO, error_message: str) -> None:
+        """Move the job's document to ``ERROR`` without running the pipeline."""
+        document = await self._document_repository.find_by_id(job.document_id)
+        if document is not None:
+            await self._mark_error(document, error_message)
+
+    async def _mark_error(self, document: Document, error_message: str) -> None:
+        if document.status != DocumentStatus.PROCESSING:
+            document = document.transition_to(DocumentStatus.PROCESSING)
+        await self._document_repository.save(
+            document.transition_to(DocumentStatus.ERROR, error_message=error_message)
+        )
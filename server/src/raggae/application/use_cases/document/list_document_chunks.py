@@ -56,9 +56,9 @@ class ListDocumentChunks:
         if document is None or document.project_id != project_id:
             raise DocumentNotFoundError(f"Document {document_id} not found")
 
-        chunks = await self._document_chunk_repository.find_by_document_id(document_id)
+        chunks = await self._document_chunk_repository.find_views_by_document_id(document_id)
         return DocumentChunksDTO(
             document_id=document.id,
             processing_strategy=document.processing_strategy,
-            chunks=[DocumentChunkDTO.from_entity(chunk) for chunk in chunks],
+            chunks=[DocumentChunkDTO.from_view(chunk) for chunk in chunks],
         )
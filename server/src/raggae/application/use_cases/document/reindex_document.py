@@ -14,6 +14,7 @@ from raggae.application.services.agent_configuration_resolver import (
     AgentConfigurationResolver,
 )
 from raggae.application.services.document_indexing_service import DocumentIndexingService
+from raggae.application.services.pipeline_fingerprint import compute_pipeline_fingerprint
 from raggae.domain.entities import Project
 from raggae.domain.exceptions.document_exceptions import (
     DocumentExtractionError,
@@ -118,6 +119,12 @@ class ReindexDocument:
                 embedding_service=embedding_service,
                 parent_child_chunking=parent_child_chunking,
                 chunking_strategy=chunking_strategy,
+                pipeline_fingerprint=compute_pipeline_fingerprint(
+                    chunking_strategy=chunking_strategy,
+                    parent_child_chunking=parent_child_chunking,
+                    embedding_backend=resolved.embedding_backend if resolved else None,
+                    embedding_model=resolved.embedding_model if resolved else None,
+                ),
             )
             document = document.transition_to(DocumentStatus.INDEXED)
         except (DocumentExtractionError, EmbeddingGenerationError, FileNotFoundError) as exc:
@@ -12,6 +12,7 @@ from raggae.application.interfaces.repositories.organization_member_repository i
     OrganizationMemberRepository,
 )
 from raggae.application.interfaces.repositories.project_repository import ProjectRepository
+from raggae.application.interfaces.services.document_ingestion_queue import DocumentIngestionQueue
 from raggae.application.interfaces.services.file_storage_service import FileStorageService
 from raggae.application.interfaces.services.project_embedding_service_resolver import (
     ProjectEmbeddingServiceResolver,
@@ -20,6 +21,7 @@ from raggae.application.services.agent_configuration_resolver import (
     AgentConfigurationResolver,
 )
 from raggae.application.services.document_indexing_service import DocumentIndexingService
+from raggae.application.services.pipeline_fingerprint import compute_pipeline_fingerprint
 from raggae.domain.entities.document import Document
 from raggae.domain.entities.project import Project
 from raggae.domain.exceptions.document_exceptions import (
@@ -90,6 +92,7 @@ class UploadDocument:
         max_documents_per_project: int | None = None,
         organization_member_repository: OrganizationMemberRepository | None = None,
         agent_configuration_resolver: AgentConfigurationResolver | None = None,
+        document_ingestion_queue: DocumentIngestionQueue | None = None,
     ) -> None:
         self._document_repository = document_repository
         self._project_repository = project_repository
@@ -104,6 +107,7 @@ class UploadDocument:
         self._max_documents_per_project = max_documents_per_project
         self._organization_member_repository = organization_member_repository
         self._agent_configuration_resolver = agent_configuration_resolver
+        self._document_ingestion_queue = document_ingestion_queue
 
     async def execute(
         self,
@@ -282,6 +286,21 @@ class UploadDocument:
             status=DocumentStatus.UPLOADED,
         )
         await self._document_repository.save(document)
+        if self._processing_mode == "async" and self._document_ingestion_queue is not None:
+            # Indexed by a worker; the document stays UPLOADED until it is claimed.
+            try:
+                await self._document_ingestion_queue.enqueue(
+                    document_id=document.id, project_id=project_id, user_id=user_id
+                )
+            except Exception as exc:
+                # The document is already saved; without a job it would stay UPLOADED
+                # forever, so surface it as ERROR where a reindex can retry it.
+                logger.exception("Ingestion enqueue failed for document %s", document.id)
+                document = document.transition_to(DocumentStatus.PROCESSING).transition_to(
+                    DocumentStatus.ERROR, error_message=f"Ingestion could not be queued: {exc}"
+                )
+                await self._document_repository.save(document)
+            return DocumentDTO.from_entity(document)
         try:
             if self._processing_mode == "sync" and self._document_indexing_service is not None:
                 document = document.transition_to(DocumentStatus.PROCESSING)
@@ -316,6 +335,12 @@ class UploadDocument:
                     embedding_service=embedding_service,
                     parent_child_chunking=parent_child_chunking,
                     chunking_strategy=chunking_strategy,
+                    pipeline_fingerprint=compute_pipeline_fingerprint(
+                        chunking_strategy=chunking_strategy,
+                        parent_child_chunking=parent_child_chunking,
+                        embedding_backend=resolved.embedding_backend if resolved else None,
+                        embedding_model=resolved.embedding_model if resolved else None,
+                    ),
                 )
                 document = document.transition_to(DocumentStatus.INDEXED)
                 await self._document_repository.save(document)
@@ -1,8 +1,10 @@
 from uuid import UUID, uuid4
 
 from raggae.application.constants import (
+    MAX_HNSW_EF_SEARCH,
     SUPPORTED_CHUNKING_STRATEGIES,
     SUPPORTED_EMBEDDING_BACKENDS,
+    SUPPORTED_HNSW_ITERATIVE_SCAN_MODES,
     SUPPORTED_LLM_BACKENDS,
     SUPPORTED_RERANKER_BACKENDS,
     SUPPORTED_RETRIEVAL_STRATEGIES,
@@ -24,6 +26,7 @@ from raggae.domain.exceptions.organization_exceptions import (
 )
 from raggae.domain.exceptions.project_exceptions import (
     InvalidProjectEmbeddingBackendError,
+    InvalidProjectHnswSearchSettingsError,
     InvalidProjectLLMBackendError,
     InvalidProjectRerankerBackendError,
     InvalidProjectRetrievalStrategyError,
@@ -60,6 +63,8 @@ class UpsertOrgAgentConfiguration:
         retrieval_strategy: str | None = None,
         retrieval_top_k: int | None = None,
         retrieval_min_score: float | None = None,
+        retrieval_hnsw_ef_search: int | None = None,
+        retrieval_hnsw_iterative_scan: str | None = None,
         reranking_enabled: bool | None = None,
         reranker_backend: str | None = None,
         reranker_model: str | None = None,
@@ -91,6 +96,17 @@ class UpsertOrgAgentConfiguration:
             )
         if reranker_backend is not None and reranker_backend not in SUPPORTED_RERANKER_BACKENDS:
             raise InvalidProjectRerankerBackendError(f"Unsupported reranker backend: {reranker_backend}")
+        if retrieval_hnsw_ef_search is not None and not 1 <= retrieval_hnsw_ef_search <= MAX_HNSW_EF_SEARCH:
+            raise InvalidProjectHnswSearchSettingsError(
+                f"HNSW ef_search must be between 1 and {MAX_HNSW_EF_SEARCH}: {retrieval_hnsw_ef_search}"
+            )
+        if (
+            retrieval_hnsw_iterative_scan is not None
+            and retrieval_hnsw_iterative_scan not in SUPPORTED_HNSW_ITERATIVE_SCAN_MODES
+        ):
+            raise InvalidProjectHnswSearchSettingsError(
+                f"Unsupported HNSW iterative scan mode: {retrieval_hnsw_iterative_scan}"
+            )
 
         existing = await self._agent_configuration_repository.find_by_owner(
             organization_id, AgentConfigurationType.ORGA
@@ -110,6 +126,8 @@ class UpsertOrgAgentConfiguration:
             retrieval_strategy=retrieval_strategy,
             retrieval_top_k=retrieval_top_k,
             retrieval_min_score=retrieval_min_score,
+            retrieval_hnsw_ef_search=retrieval_hnsw_ef_search,
+            retrieval_hnsw_iterative_scan=retrieval_hnsw_iterative_scan,
             reranking_enabled=reranking_enabled,
             reranker_backend=reranker_backend,
             reranker_model=reranker_model,
@@ -1,8 +1,15 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from contextlib import AsyncExitStack
 from uuid import UUID
 
 from raggae.application.dto.reindex_project_result_dto import ReindexProjectResultDTO
 from raggae.application.interfaces.repositories.document_repository import DocumentRepository
+from raggae.application.interfaces.repositories.project_index_generation_repository import (
+    ProjectIndexGenerationRepository,
+)
 from raggae.application.interfaces.repositories.project_repository import ProjectRepository
+from raggae.application.interfaces.services.embedding_service import EmbeddingService
 from raggae.application.interfaces.services.file_storage_service import FileStorageService
 from raggae.application.interfaces.services.project_embedding_service_resolver import (
     ProjectEmbeddingServiceResolver,
@@ -11,6 +18,11 @@ from raggae.application.services.agent_configuration_resolver import (
     AgentConfigurationResolver,
 )
 from raggae.application.services.document_indexing_service import DocumentIndexingService
+from raggae.application.services.pipeline_fingerprint import (
+    compute_content_hash,
+    compute_pipeline_fingerprint,
+)
+from raggae.domain.entities.document import Document
 from raggae.domain.entities.project import Project
 from raggae.domain.exceptions.document_exceptions import (
     DocumentExtractionError,
@@ -25,9 +37,53 @@ from raggae.domain.value_objects.document_status import DocumentStatus
 from raggae.domain.value_objects.resolved_agent_configuration import ResolvedAgentConfiguration
 from raggae.infrastructure.config.settings import settings
 
+_INDEXED = "indexed"
+_FAILED = "failed"
+_SKIPPED = "skipped"
+
+
+class _ReindexProgress:
+    """Project reindex progress, saved every ``batch_size`` completed documents."""
+
+    def __init__(self, project: Project, project_repository: ProjectRepository, batch_size: int) -> None:
+        self.project = project
+        self._project_repository = project_repository
+        self._batch_size = max(1, batch_size)
+        self._unsaved = 0
+        self._lock = asyncio.Lock()
+
+    async def advance(self) -> None:
+        async with self._lock:
+            self._unsaved += 1
+            if self._unsaved >= self._batch_size:
+                await self._flush()
+
+    async def finish(self) -> None:
+        async with self._lock:
+            self.project = self.project.advance_reindex(self._unsaved).finish_reindex()
+            self._unsaved = 0
+            await self._project_repository.save(self.project)
+
+    async def _flush(self) -> None:
+        self.project = self.project.advance_reindex(self._unsaved)
+        self._unsaved = 0
+        await self._project_repository.save(self.project)
+
 
 class ReindexProject:
-    """Use Case: Reindex all documents of a project."""
+    """Use Case: Reindex all documents of a project.
+
+    Indexed documents whose file content hash and pipeline fingerprint are
+    both unchanged since their last indexing are skipped, unless ``force``.
+
+    Up to ``max_documents_in_flight`` documents are processed concurrently,
+    with at most ``max_concurrent_downloads`` file downloads and
+    ``max_concurrent_extractions`` CPU-bound extractions at a time. The
+    embedding service is resolved once per run and shared by every document,
+    so its ``max_concurrency`` bounds the embedding requests of the whole run.
+    Project progress is saved every ``progress_batch_size`` documents, and
+    the reindex is finished even when an unexpected error aborts the run.
+    """
 
     def __init__(
         self,
@@ -37,6 +93,11 @@ class ReindexProject:
         document_indexing_service: DocumentIndexingService,
         project_embedding_service_resolver: ProjectEmbeddingServiceResolver | None = None,
         agent_configuration_resolver: AgentConfigurationResolver | None = None,
+        project_index_generation_repository: ProjectIndexGenerationRepository | None = None,
+        max_documents_in_flight: int = 1,
+        max_concurrent_downloads: int = 1,
+        max_concurrent_extractions: int = 1,
+        progress_batch_size: int = 1,
     ) -> None:
         self._project_repository = project_repository
         self._document_repository = document_repository
@@ -44,8 +105,13 @@ class ReindexProject:
         self._document_indexing_service = document_indexing_service
         self._project_embedding_service_resolver = project_embedding_service_resolver
         self._agent_configuration_resolver = agent_configuration_resolver
+        self._project_index_generation_repository = project_index_generation_repository
+        self._max_documents_in_flight = max(1, max_documents_in_flight)
+        self._max_concurrent_downloads = max(1, max_concurrent_downloads)
+        self._max_concurrent_extractions = max(1, max_concurrent_extractions)
+        self._progress_batch_size = max(1, progress_batch_size)
 
-    async def execute(self, project_id: UUID, user_id: UUID) -> ReindexProjectResultDTO:
+    async def execute(self, project_id: UUID, user_id: UUID, force: bool = False) -> ReindexProjectResultDTO:
         project = await self._project_repository.find_by_id(project_id)
         if project is None or project.user_id != user_id:
             raise ProjectNotFoundError(f"Project {project_id} not found")
@@ -64,60 +130,164 @@ class ReindexProject:
                 chunking_strategy = ChunkingStrategy(resolved.chunking_strategy)
             except ValueError:
                 pass
+        pipeline_fingerprint = compute_pipeline_fingerprint(
+            chunking_strategy=chunking_strategy,
+            parent_child_chunking=parent_child_chunking,
+            embedding_backend=resolved.embedding_backend if resolved else None,
+            embedding_model=resolved.embedding_model if resolved else None,
+        )
 
         documents = await self._document_repository.find_by_project_id(project_id)
-        project = project.start_reindex(total_documents=len(documents))
-        await self._project_repository.save(project)
+        started_project = project.start_reindex(total_documents=len(documents))
+        await self._project_repository.save(started_project)
 
-        indexed_documents = 0
-        failed_documents = 0
-        for document in documents:
-            try:
-                if document.status != DocumentStatus.PROCESSING:
-                    document = document.transition_to(DocumentStatus.PROCESSING)
-                    await self._document_repository.save(document)
+        progress = _ReindexProgress(started_project, self._project_repository, self._progress_batch_size)
+        downloads = asyncio.Semaphore(self._max_concurrent_downloads)
+        extractions = asyncio.Semaphore(self._max_concurrent_extractions)
+        # Resolved once, by the first document that needs it, and leased for the
+        # whole run so the client pool does not close it under the workers.
+        embedding_service_leases = AsyncExitStack()
+        embedding_service_task: asyncio.Future[EmbeddingService | None] | None = None
+
+        def get_embedding_service() -> asyncio.Future[EmbeddingService | None]:
+            nonlocal embedding_service_task
+            if embedding_service_task is None:
+                embedding_service_task = asyncio.ensure_future(
+                    self._resolve_embedding_service(
+                        resolved, started_project, user_id, embedding_service_leases
+                    )
+                )
+            return embedding_service_task
 
+        async def download(document: Document) -> bytes:
+            async with downloads:
                 file_content, _ = await self._file_storage_service.download_file(document.storage_key)
+            return file_content
 
-                embedding_service = None
-                if self._project_embedding_service_resolver is not None:
-                    encrypted_api_key = (
-                        await self._resolve_embedding_api_key(resolved, project, user_id)
-                        if resolved
-                        else None
-                    )
-                    embedding_service = self._project_embedding_service_resolver.resolve(
-                        backend=resolved.embedding_backend if resolved else None,
-                        model=resolved.embedding_model if resolved else None,
-                        encrypted_api_key=encrypted_api_key,
-                    )
+        outcomes: list[str] = []
+        pending = iter(documents)
 
-                document = await self._document_indexing_service.run_pipeline(
+        async def worker() -> None:
+            # Workers share ``pending``: each takes the next document as soon as it is free.
+            for document in pending:
+                outcome = await self._reindex_document(
                     document=document,
-                    project=project,
-                    file_content=file_content,
-                    embedding_service=embedding_service,
+                    project=started_project,
+                    force=force,
+                    pipeline_fingerprint=pipeline_fingerprint,
                     parent_child_chunking=parent_child_chunking,
                     chunking_strategy=chunking_strategy,
+                    download=download,
+                    get_embedding_service=get_embedding_service,
+                    extractions=extractions,
                 )
-                document = document.transition_to(DocumentStatus.INDEXED)
-                indexed_documents += 1
-            except (DocumentExtractionError, EmbeddingGenerationError, FileNotFoundError) as exc:
-                document = document.transition_to(DocumentStatus.ERROR, error_message=str(exc))
-                failed_documents += 1
+                outcomes.append(outcome)
+                await progress.advance()
 
-            await self._document_repository.save(document)
-            project = project.advance_reindex()
-            await self._project_repository.save(project)
+        workers = [
+            asyncio.create_task(worker()) for _ in range(min(self._max_documents_in_flight, len(documents)))
+        ]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+        finally:
+            if embedding_service_task is not None and not embedding_service_task.done():
+                embedding_service_task.cancel()
+            await embedding_service_leases.aclose()
+            await progress.finish()
+            # Nothing changed when every document was skipped: keep cached retrieval results valid.
+            all_skipped = bool(documents) and outcomes.count(_SKIPPED) == len(documents)
+            if self._project_index_generation_repository is not None and not all_skipped:
+                await self._project_index_generation_repository.bump(project_id)
 
-        project = project.finish_reindex()
-        await self._project_repository.save(project)
+        skipped_documents = outcomes.count(_SKIPPED)
 
         return ReindexProjectResultDTO(
             project_id=project_id,
             total_documents=len(documents),
-            indexed_documents=indexed_documents,
-            failed_documents=failed_documents,
+            indexed_documents=outcomes.count(_INDEXED),
+            failed_documents=outcomes.count(_FAILED),
+            skipped_documents=skipped_documents,
+        )
+
+    async def _reindex_document(
+        self,
+        document: Document,
+        project: Project,
+        force: bool,
+        pipeline_fingerprint: str,
+        parent_child_chunking: bool,
+        chunking_strategy: ChunkingStrategy | None,
+        download: Callable[[Document], Awaitable[bytes]],
+        get_embedding_service: Callable[[], Awaitable[EmbeddingService | None]],
+        extractions: asyncio.Semaphore,
+    ) -> str:
+        try:
+            file_content: bytes | None = None
+            if not force and self._may_be_up_to_date(document, pipeline_fingerprint):
+                file_content = await download(document)
+                if document.content_hash == compute_content_hash(file_content):
+                    return _SKIPPED
+
+            if document.status != DocumentStatus.PROCESSING:
+                document = document.transition_to(DocumentStatus.PROCESSING)
+                await self._document_repository.save(document)
+
+            if file_content is None:
+                file_content = await download(document)
+
+            document = await self._document_indexing_service.run_pipeline(
+                document=document,
+                project=project,
+                file_content=file_content,
+                embedding_service=await get_embedding_service(),
+                parent_child_chunking=parent_child_chunking,
+                chunking_strategy=chunking_strategy,
+                pipeline_fingerprint=pipeline_fingerprint,
+                extraction_limiter=extractions,
+            )
+            document = document.transition_to(DocumentStatus.INDEXED)
+            outcome = _INDEXED
+        except (DocumentExtractionError, EmbeddingGenerationError, FileNotFoundError) as exc:
+            if document.status != DocumentStatus.PROCESSING:
+                document = document.transition_to(DocumentStatus.PROCESSING)
+            document = document.transition_to(DocumentStatus.ERROR, error_message=str(exc))
+            outcome = _FAILED
+
+        await self._document_repository.save(document)
+        return outcome
+
+    async def _resolve_embedding_service(
+        self,
+        resolved: ResolvedAgentConfiguration | None,
+        project: Project,
+        user_id: UUID,
+        leases: AsyncExitStack,
+    ) -> EmbeddingService | None:
+        if self._project_embedding_service_resolver is None:
+            return None
+        encrypted_api_key = (
+            await self._resolve_embedding_api_key(resolved, project, user_id) if resolved else None
+        )
+        return await leases.enter_async_context(
+            self._project_embedding_service_resolver.lease(
+                backend=resolved.embedding_backend if resolved else None,
+                model=resolved.embedding_model if resolved else None,
+                encrypted_api_key=encrypted_api_key,
+            )
+        )
+
+    @staticmethod
+    def _may_be_up_to_date(document: Document, pipeline_fingerprint: str) -> bool:
+        """Whether only the file content hash is left to compare before skipping ``document``."""
+        return (
+            document.status == DocumentStatus.INDEXED
+            and document.content_hash is not None
+            and document.pipeline_fingerprint == pipeline_fingerprint
         )
 
     async def _resolve_config(self, project: Project, user_id: UUID) -> ResolvedAgentConfiguration | None:
@@ -27,6 +27,8 @@ class AgentConfiguration:
     retrieval_strategy: str | None = None
     retrieval_top_k: int | None = None
     retrieval_min_score: float | None = None
+    retrieval_hnsw_ef_search: int | None = None
+    retrieval_hnsw_iterative_scan: str | None = None
     # Reranking
     reranking_enabled: bool | None = None
     reranker_backend: str | None = None
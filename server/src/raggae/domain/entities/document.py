@@ -36,6 +36,8 @@ class Document:
     authors: list[str] | None = None
     document_date: date | None = None
     title: str | None = None
+    content_hash: str | None = None
+    pipeline_fingerprint: str | None = None
 
     def transition_to(
         self,
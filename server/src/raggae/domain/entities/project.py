@@ -48,11 +48,11 @@ class Project:
         total = max(0, total_documents)
         return replace(self, reindex_status="in_progress", reindex_progress=0, reindex_total=total)
 
-    def advance_reindex(self) -> "Project":
-        """Advance reindex progress by one document."""
+    def advance_reindex(self, count: int = 1) -> "Project":
+        """Advance reindex progress by ``count`` documents."""
         if not self.is_reindexing():
             return self
-        progress = min(self.reindex_progress + 1, max(0, self.reindex_total))
+        progress = min(self.reindex_progress + max(0, count), max(0, self.reindex_total))
         return replace(self, reindex_progress=progress)
 
     def finish_reindex(self) -> "Project":
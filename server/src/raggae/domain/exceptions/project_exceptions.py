@@ -42,6 +42,10 @@ class InvalidProjectRetrievalStrategyError(ValueError):
     """Raised when project retrieval strategy is unsupported."""
 
 
+class InvalidProjectHnswSearchSettingsError(ValueError):
+    """Raised when project HNSW search settings are out of range."""
+
+
 class InvalidProjectRetrievalTopKError(ValueError):
     """Raised when project retrieval top-k is unsupported."""
 
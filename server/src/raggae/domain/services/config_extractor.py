@@ -34,6 +34,8 @@ class ConfigExtractor:
             retrieval_strategy=pick("retrieval_strategy"),  # type: ignore[arg-type]
             retrieval_top_k=pick("retrieval_top_k"),  # type: ignore[arg-type]
             retrieval_min_score=pick("retrieval_min_score"),  # type: ignore[arg-type]
+            retrieval_hnsw_ef_search=pick("retrieval_hnsw_ef_search"),  # type: ignore[arg-type]
+            retrieval_hnsw_iterative_scan=pick("retrieval_hnsw_iterative_scan"),  # type: ignore[arg-type]
             reranking_enabled=pick("reranking_enabled"),  # type: ignore[arg-type]
             reranker_backend=pick("reranker_backend"),  # type: ignore[arg-type]
             reranker_model=pick("reranker_model"),  # type: ignore[arg-type]
@@ -0,0 +1,11 @@
+import hashlib
+
+
+def embedding_cache_namespace(backend: str, model: str, dimension: int, prefix: str) -> str:
+    """Everything besides the text that changes the embedding of a text."""
+    payload = "\x00".join((backend, model, str(dimension), prefix))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
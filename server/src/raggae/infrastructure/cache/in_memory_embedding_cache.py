@@ -0,0 +1,37 @@
+from collections import OrderedDict
+from time import monotonic
+
+
+class InMemoryEmbeddingCache:
+    """Bounded LRU + TTL cache of text embeddings, local to the process."""
+
+    def __init__(self, max_entries: int = 100_000, ttl_seconds: float = 2_592_000.0) -> None:
+        self._max_entries = max(1, max_entries)
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[str, str], tuple[list[float], float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    async def get_many(self, namespace: str, text_hashes: list[str]) -> dict[str, list[float]]:
+        now = monotonic()
+        found: dict[str, list[float]] = {}
+        for text_hash in text_hashes:
+            key = (namespace, text_hash)
+            entry = self._entries.get(key)
+            if entry is not None and now < entry[1]:
+                self._entries.move_to_end(key)
+                found[text_hash] = entry[0]
+            elif entry is not None:
+                del self._entries[key]
+        self.hits += len(found)
+        self.misses += len(text_hashes) - len(found)
+        return found
+
+    async def set_many(self, namespace: str, embeddings: dict[str, list[float]]) -> None:
+        expires_at = monotonic() + self._ttl_seconds
+        for text_hash, embedding in embeddings.items():
+            key = (namespace, text_hash)
+            self._entries[key] = (embedding, expires_at)
+            self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
@@ -0,0 +1,60 @@
+from collections import OrderedDict
+from time import monotonic
+
+from raggae.application.interfaces.services.query_embedding_cache import QueryEmbeddingCache
+from raggae.infrastructure.cache.query_embedding_cache_key import query_embedding_cache_key
+
+
+class InMemoryQueryEmbeddingCache:
+    """Bounded LRU + TTL cache of query embeddings, local to the process.
+
+    When ``shared_cache`` is provided (e.g. the PostgreSQL tier), local misses
+    fall through to it and its hits are promoted into the local LRU, so a
+    question embedded by one worker is reused by the others.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600.0,
+        shared_cache: QueryEmbeddingCache | None = None,
+    ) -> None:
+        self._max_entries = max(1, max_entries)
+        self._ttl_seconds = ttl_seconds
+        self._shared_cache = shared_cache
+        self._entries: OrderedDict[str, tuple[list[float], float]] = OrderedDict()
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    async def get(self, backend: str, model: str, query: str) -> list[float] | None:
+        key = query_embedding_cache_key(backend, model, query)
+        entry = self._entries.get(key)
+        if entry is not None:
+            embedding, expires_at = entry
+            if monotonic() < expires_at:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return embedding
+            del self._entries[key]
+
+        if self._shared_cache is not None:
+            shared = await self._shared_cache.get(backend, model, query)
+            if shared is not None:
+                self._store(key, shared)
+                self.shared_hits += 1
+                return shared
+
+        self.misses += 1
+        return None
+
+    async def set(self, backend: str, model: str, query: str, embedding: list[float]) -> None:
+        self._store(query_embedding_cache_key(backend, model, query), embedding)
+        if self._shared_cache is not None:
+            await self._shared_cache.set(backend, model, query, embedding)
+
+    def _store(self, key: str, embedding: list[float]) -> None:
+        self._entries[key] = (embedding, monotonic() + self._ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
@@ -0,0 +1,40 @@
+from collections import OrderedDict
+from time import monotonic
+
+from raggae.application.dto.query_relevant_chunks_result_dto import (
+    QueryRelevantChunksResultDTO,
+)
+
+
+class InMemoryRetrievalResultCache:
+    """Bounded LRU + TTL cache of retrieval results, local to the process.
+
+    Keys embed the project index generation, so entries of a project whose
+    chunks changed are simply never looked up again and age out of the LRU;
+    the TTL only bounds how long unused entries keep memory.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 300.0) -> None:
+        self._max_entries = max(1, max_entries)
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[QueryRelevantChunksResultDTO, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> QueryRelevantChunksResultDTO | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            result, expires_at = entry
+            if monotonic() < expires_at:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, result: QueryRelevantChunksResultDTO) -> None:
+        self._entries[key] = (result, monotonic() + self._ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
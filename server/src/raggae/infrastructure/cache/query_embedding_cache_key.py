@@ -0,0 +1,11 @@
+import hashlib
+
+
+def normalize_query(query: str) -> str:
+    """Collapse whitespace and case so trivially different phrasings share an entry."""
+    return " ".join(query.split()).casefold()
+
+
+def query_embedding_cache_key(backend: str, model: str, query: str) -> str:
+    payload = "\x00".join((backend, model, normalize_query(query)))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
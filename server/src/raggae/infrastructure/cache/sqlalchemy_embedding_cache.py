@@ -0,0 +1,73 @@
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from raggae.infrastructure.database.models.embedding_cache_model import EmbeddingCacheModel
+
+# Bounds the IN list of one lookup and the VALUES list of one upsert.
+_BATCH_SIZE = 500
+
+
+class SQLAlchemyEmbeddingCache:
+    """Text embedding cache persisted in PostgreSQL and shared by every worker.
+
+    Entries expire ``ttl_seconds`` after their last write; expired rows are
+    ignored on read and purged every ``purge_every`` writes. The table has no
+    size bound (``EMBEDDING_CACHE_MAX_ENTRIES`` only sizes the in-memory
+    cache): its growth is limited by the TTL alone.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        ttl_seconds: float = 2_592_000.0,
+        purge_every: int = 100,
+    ) -> None:
+        self._session_factory = session_factory
+        self._ttl_seconds = ttl_seconds
+        self._purge_every = max(1, purge_every)
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+
+    async def get_many(self, namespace: str, text_hashes: list[str]) -> dict[str, list[float]]:
+        found: dict[str, list[float]] = {}
+        now = datetime.now(UTC)
+        async with self._session_factory() as session:
+            for start in range(0, len(text_hashes), _BATCH_SIZE):
+                stmt = select(EmbeddingCacheModel.text_hash, EmbeddingCacheModel.embedding).where(
+                    EmbeddingCacheModel.namespace == namespace,
+                    EmbeddingCacheModel.text_hash.in_(text_hashes[start : start + _BATCH_SIZE]),
+                    EmbeddingCacheModel.expires_at > now,
+                )
+                for text_hash, embedding in (await session.execute(stmt)).all():
+                    found[text_hash] = [float(value) for value in embedding]
+        self.hits += len(found)
+        self.misses += len(text_hashes) - len(found)
+        return found
+
+    async def set_many(self, namespace: str, embeddings: dict[str, list[float]]) -> None:
+        if not embeddings:
+            return
+        now = datetime.now(UTC)
+        expires_at = now + timedelta(seconds=self._ttl_seconds)
+        rows = [
+            {"namespace": namespace, "text_hash": text_hash, "embedding": embedding, "expires_at": expires_at}
+            for text_hash, embedding in embeddings.items()
+        ]
+        self._writes += 1
+        async with self._session_factory() as session:
+            for start in range(0, len(rows), _BATCH_SIZE):
+                stmt = insert(EmbeddingCacheModel).values(rows[start : start + _BATCH_SIZE])
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[EmbeddingCacheModel.namespace, EmbeddingCacheModel.text_hash],
+                    set_={"embedding": stmt.excluded.embedding, "expires_at": stmt.excluded.expires_at},
+                )
+                await session.execute(stmt)
+            if self._writes % self._purge_every == 0:
+                await session.execute(
+                    delete(EmbeddingCacheModel).where(EmbeddingCacheModel.expires_at <= now)
+                )
+            await session.commit()
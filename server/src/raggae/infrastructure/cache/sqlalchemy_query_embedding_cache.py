@@ -0,0 +1,59 @@
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from raggae.infrastructure.cache.query_embedding_cache_key import query_embedding_cache_key
+from raggae.infrastructure.database.models.query_embedding_cache_model import QueryEmbeddingCacheModel
+
+
+class SQLAlchemyQueryEmbeddingCache:
+    """Query embedding cache shared between workers through a PostgreSQL table.
+
+    Meant as the second tier behind :class:`InMemoryQueryEmbeddingCache`.
+    Expired rows are ignored on read and purged every ``purge_every`` writes.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        ttl_seconds: float = 3600.0,
+        purge_every: int = 100,
+    ) -> None:
+        self._session_factory = session_factory
+        self._ttl_seconds = ttl_seconds
+        self._purge_every = max(1, purge_every)
+        self._writes = 0
+
+    async def get(self, backend: str, model: str, query: str) -> list[float] | None:
+        async with self._session_factory() as session:
+            stmt = select(QueryEmbeddingCacheModel.embedding).where(
+                QueryEmbeddingCacheModel.cache_key == query_embedding_cache_key(backend, model, query),
+                QueryEmbeddingCacheModel.expires_at > datetime.now(UTC),
+            )
+            embedding = (await session.execute(stmt)).scalar_one_or_none()
+            return [float(value) for value in embedding] if embedding is not None else None
+
+    async def set(self, backend: str, model: str, query: str, embedding: list[float]) -> None:
+        now = datetime.now(UTC)
+        expires_at = now + timedelta(seconds=self._ttl_seconds)
+        stmt = insert(QueryEmbeddingCacheModel).values(
+            cache_key=query_embedding_cache_key(backend, model, query),
+            backend=backend,
+            model=model,
+            embedding=embedding,
+            expires_at=expires_at,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[QueryEmbeddingCacheModel.cache_key],
+            set_={"embedding": stmt.excluded.embedding, "expires_at": stmt.excluded.expires_at},
+        )
+        self._writes += 1
+        async with self._session_factory() as session:
+            await session.execute(stmt)
+            if self._writes % self._purge_every == 0:
+                await session.execute(
+                    delete(QueryEmbeddingCacheModel).where(QueryEmbeddingCacheModel.expires_at <= now)
+                )
+            await session.commit()
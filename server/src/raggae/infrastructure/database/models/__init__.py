@@ -2,6 +2,8 @@ from raggae.infrastructure.database.models.base import Base
 from raggae.infrastructure.database.models.conversation_model import ConversationModel
 from raggae.infrastructure.database.models.document_chunk_model import DocumentChunkModel
 from raggae.infrastructure.database.models.document_model import DocumentModel
+from raggae.infrastructure.database.models.embedding_cache_model import EmbeddingCacheModel
+from raggae.infrastructure.database.models.ingestion_job_model import IngestionJobModel
 from raggae.infrastructure.database.models.message_model import MessageModel
 from raggae.infrastructure.database.models.org_mcp_server_model import OrgMcpServerModel
 from raggae.infrastructure.database.models.organization_invitation_model import (
@@ -11,11 +13,15 @@ from raggae.infrastructure.database.models.organization_member_model import (
     OrganizationMemberModel,
 )
 from raggae.infrastructure.database.models.organization_model import OrganizationModel
+from raggae.infrastructure.database.models.project_index_generation_model import (
+    ProjectIndexGenerationModel,
+)
 from raggae.infrastructure.database.models.project_mcp_activation_model import (
     ProjectMcpActivationModel,
 )
 from raggae.infrastructure.database.models.project_model import ProjectModel
 from raggae.infrastructure.database.models.project_snapshot_model import ProjectSnapshotModel
+from raggae.infrastructure.database.models.query_embedding_cache_model import QueryEmbeddingCacheModel
 from raggae.infrastructure.database.models.user_model import UserModel
 from raggae.infrastructure.database.models.user_model_provider_credential_model import (
     UserModelProviderCredentialModel,
@@ -26,14 +32,18 @@ __all__ = [
     "ConversationModel",
     "DocumentChunkModel",
     "DocumentModel",
+    "EmbeddingCacheModel",
+    "IngestionJobModel",
     "MessageModel",
     "OrgMcpServerModel",
     "OrganizationInvitationModel",
     "OrganizationMemberModel",
     "OrganizationModel",
     "ProjectMcpActivationModel",
+    "ProjectIndexGenerationModel",
     "ProjectModel",
     "ProjectSnapshotModel",
+    "QueryEmbeddingCacheModel",
     "UserModel",
     "UserModelProviderCredentialModel",
 ]
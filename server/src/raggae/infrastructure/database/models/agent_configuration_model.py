@@ -28,6 +28,8 @@ class AgentConfigurationModel(Base):
     retrieval_strategy: Mapped[str | None] = mapped_column(String(16), nullable=True)
     retrieval_top_k: Mapped[int | None] = mapped_column(Integer(), nullable=True)
     retrieval_min_score: Mapped[float | None] = mapped_column(Float(), nullable=True)
+    retrieval_hnsw_ef_search: Mapped[int | None] = mapped_column(Integer(), nullable=True)
+    retrieval_hnsw_iterative_scan: Mapped[str | None] = mapped_column(String(16), nullable=True)
     # Reranking
     reranking_enabled: Mapped[bool | None] = mapped_column(Boolean(), nullable=True)
     reranker_backend: Mapped[str | None] = mapped_column(String(32), nullable=True)
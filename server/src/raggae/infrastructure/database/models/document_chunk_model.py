@@ -1,14 +1,14 @@
 from datetime import datetime
 from uuid import UUID
 
-from pgvector.sqlalchemy import Vector
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Computed, DateTime, ForeignKey, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from raggae.infrastructure.config.settings import settings
 from raggae.infrastructure.database.models.base import Base
+from raggae.infrastructure.database.pgvector_codec import BinaryVector
 
 
 class DocumentChunkModel(Base):
@@ -21,10 +21,25 @@ class DocumentChunkModel(Base):
         index=True,
         nullable=False,
     )
+    project_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        index=True,
+        nullable=False,
+    )
     chunk_index: Mapped[int] = mapped_column(Integer(), nullable=False)
     content: Mapped[str] = mapped_column(Text(), nullable=False)
-    embedding: Mapped[list[float]] = mapped_column(Vector(settings.embedding_dimension), nullable=False)
+    embedding: Mapped[list[float]] = mapped_column(BinaryVector(settings.embedding_dimension), nullable=False)
     metadata_json: Mapped[dict[str, object] | None] = mapped_column(JSONB, nullable=True)
+    content_tsv: Mapped[str | None] = mapped_column(
+        TSVECTOR(),
+        Computed(
+            f"to_tsvector('{settings.retrieval_fulltext_language}'::regconfig, content)",
+            persisted=True,
+        ),
+        nullable=True,
+        deferred=True,
+    )
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     chunk_level: Mapped[str] = mapped_column(String(16), nullable=False, server_default="standard")
     parent_chunk_id: Mapped[UUID | None] = mapped_column(
@@ -33,3 +48,21 @@ class DocumentChunkModel(Base):
         index=True,
         nullable=True,
     )
+
+    __table_args__ = (
+        Index(
+            "ix_document_chunks_content_tsv",
+            "content_tsv",
+            postgresql_using="gin",
+        ),
+        Index("ix_document_chunks_document_id_chunk_index", "document_id", "chunk_index"),
+        *(
+            Index(f"ix_document_chunks_project_id_{key}", "project_id", text(f"(metadata_json->>'{key}')"))
+            for key in ("document_type", "language", "source_type", "processing_strategy")
+        ),
+        Index(
+            "ix_document_chunks_metadata_tags",
+            text("(metadata_json->'tags')"),
+            postgresql_using="gin",
+        ),
+    )
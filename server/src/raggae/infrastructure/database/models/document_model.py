@@ -33,3 +33,5 @@ class DocumentModel(Base):
     authors: Mapped[list[str] | None] = mapped_column(JSONB, nullable=True)
     document_date: Mapped[date | None] = mapped_column(Date(), nullable=True)
     title: Mapped[str | None] = mapped_column(String(512), nullable=True)
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    pipeline_fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
@@ -0,0 +1,16 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from raggae.infrastructure.database.models.base import Base
+from raggae.infrastructure.database.pgvector_codec import BinaryVector
+
+
+class EmbeddingCacheModel(Base):
+    __tablename__ = "embedding_cache"
+
+    namespace: Mapped[str] = mapped_column(String(64), primary_key=True)
+    text_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    embedding: Mapped[list[float]] = mapped_column(BinaryVector(), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True, nullable=False)
@@ -0,0 +1,60 @@
+"""Binary transport for pgvector values over asyncpg.
+
+By default a ``vector`` travels as its text form (``"[0.1,0.2,...]"``): a
+1536-dimension embedding becomes a ~20 KB decimal string that PostgreSQL
+parses back on every statement. :func:`register_pgvector_codec` installs
+pgvector's binary asyncpg codec on every pooled connection, and
+:class:`BinaryVector` hands :class:`pgvector.Vector` values to that codec
+instead of formatting text.
+"""
+
+import logging
+from typing import Any
+
+from pgvector import Vector
+from pgvector.asyncpg import register_vector
+from pgvector.sqlalchemy import VECTOR
+from sqlalchemy import Dialect, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+
+class BinaryVector(VECTOR):
+    """``vector`` column bound as :class:`pgvector.Vector` (requires :func:`register_pgvector_codec`)."""
+
+    cache_ok = True
+
+    def bind_processor(self, dialect: Dialect) -> Any:
+        return to_pgvector
+
+
+def to_pgvector(values: Any) -> Vector | None:
+    """Wrap a list or NumPy array so the binary codec encodes it as float4 bytes."""
+    if values is None or isinstance(values, Vector):
+        return values
+    return Vector(values)
+
+
+def register_pgvector_codec(engine: AsyncEngine) -> None:
+    """Register the binary ``vector`` codec on each new connection of ``engine``.
+
+    A connection on which the codec cannot be registered (the ``vector``
+    extension does not exist yet) fails to connect instead of joining the pool.
+    """
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection: Any, _connection_record: Any) -> None:
+        dbapi_connection.run_async(_register_vector)
+
+
+async def _register_vector(connection: Any) -> None:
+    try:
+        await register_vector(connection)
+    except ValueError as exc:
+        # Without the codec every ``vector`` bind of this connection fails, and
+        # a pooled connection would keep failing after the first migration
+        # creates the extension. Raising makes the pool close it; the next
+        # checkout opens a new connection and registers the codec again.
+        logger.warning("pgvector codec not registered, discarding connection: %s", exc)
+        raise
@@ -1,38 +1,106 @@
 from uuid import UUID
 
+from raggae.application.dto.document_chunk_view_dto import DocumentChunkViewDTO
 from raggae.domain.entities.document_chunk import DocumentChunk
+from raggae.infrastructure.services.in_memory_vector_index import InMemoryVectorIndex
 
 
 class InMemoryDocumentChunkRepository:
-    """In-memory document chunk repository for testing."""
+    """In-memory document chunk repository for testing.
 
-    def __init__(self) -> None:
+    When given a ``vector_index``, the segments of the documents touched by a
+    write are rebuilt right away so that retrieval never scans stale chunks.
+    Chunk ids are also kept per document, in insertion order, so that a write
+    or a document lookup only touches the chunks of that document.
+    """
+
+    def __init__(self, vector_index: InMemoryVectorIndex | None = None) -> None:
         self._chunks: dict[UUID, DocumentChunk] = {}
+        self._chunk_ids_by_document: dict[UUID, dict[UUID, None]] = {}
+        self._vector_index = vector_index
 
     async def save_many(self, chunks: list[DocumentChunk]) -> None:
+        touched: set[UUID] = set()
         for chunk in chunks:
-            self._chunks[chunk.id] = chunk
+            touched.update(self._store(chunk))
+        if self._vector_index is not None:
+            for document_id in touched:
+                self._vector_index.index_document(document_id, self._document_chunks(document_id))
 
     async def find_by_id(self, chunk_id: UUID) -> DocumentChunk | None:
         return self._chunks.get(chunk_id)
 
     async def find_by_document_id(self, document_id: UUID) -> list[DocumentChunk]:
-        return [chunk for chunk in self._chunks.values() if chunk.document_id == document_id]
+        return self._document_chunks(document_id)
 
     async def find_by_document_id_and_indices(
         self, document_id: UUID, indices: set[int]
     ) -> list[DocumentChunk]:
+        return [chunk for chunk in self._document_chunks(document_id) if chunk.chunk_index in indices]
+
+    async def find_views_by_document_id(self, document_id: UUID) -> list[DocumentChunkViewDTO]:
+        return [_to_view(chunk) for chunk in await self.find_by_document_id(document_id)]
+
+    async def find_views_by_ids(self, chunk_ids: set[UUID]) -> list[DocumentChunkViewDTO]:
+        return [_to_view(self._chunks[chunk_id]) for chunk_id in chunk_ids if chunk_id in self._chunks]
+
+    async def find_views_by_document_indices(
+        self, indices_by_document: dict[UUID, set[int]]
+    ) -> list[DocumentChunkViewDTO]:
         return [
-            chunk
-            for chunk in self._chunks.values()
-            if chunk.document_id == document_id and chunk.chunk_index in indices
+            _to_view(chunk)
+            for document_id, indices in indices_by_document.items()
+            for chunk in self._document_chunks(document_id)
+            if chunk.chunk_index in indices
         ]
 
     async def delete_by_document_id(self, document_id: UUID) -> None:
-        chunk_ids = [chunk_id for chunk_id, chunk in self._chunks.items() if chunk.document_id == document_id]
-        for chunk_id in chunk_ids:
+        for chunk_id in self._chunk_ids_by_document.pop(document_id, {}):
             self._chunks.pop(chunk_id, None)
+        if self._vector_index is not None:
+            self._vector_index.remove_document(document_id)
 
     async def replace_document_chunks(self, document_id: UUID, chunks: list[DocumentChunk]) -> None:
         await self.delete_by_document_id(document_id)
         await self.save_many(chunks)
+
+    async def upsert_document_chunks(
+        self, document_id: UUID, chunks: list[DocumentChunk], removed_ids: set[UUID]
+    ) -> None:
+        for chunk_id in removed_ids:
+            chunk = self._chunks.get(chunk_id)
+            if chunk is not None and chunk.document_id == document_id:
+                del self._chunks[chunk_id]
+                del self._chunk_ids_by_document[document_id][chunk_id]
+        touched = {document_id}
+        for chunk in chunks:
+            touched.update(self._store(chunk))
+        if self._vector_index is not None:
+            for touched_id in touched:
+                self._vector_index.index_document(touched_id, self._document_chunks(touched_id))
+
+    def _store(self, chunk: DocumentChunk) -> set[UUID]:
+        """Save ``chunk`` and return the documents whose chunks changed."""
+        previous = self._chunks.get(chunk.id)
+        self._chunks[chunk.id] = chunk
+        self._chunk_ids_by_document.setdefault(chunk.document_id, {})[chunk.id] = None
+        if previous is None or previous.document_id == chunk.document_id:
+            return {chunk.document_id}
+        del self._chunk_ids_by_document[previous.document_id][chunk.id]
+        return {chunk.document_id, previous.document_id}
+
+    def _document_chunks(self, document_id: UUID) -> list[DocumentChunk]:
+        return [self._chunks[chunk_id] for chunk_id in self._chunk_ids_by_document.get(document_id, {})]
+
+
+def _to_view(chunk: DocumentChunk) -> DocumentChunkViewDTO:
+    return DocumentChunkViewDTO(
+        id=chunk.id,
+        document_id=chunk.document_id,
+        chunk_index=chunk.chunk_index,
+        content=chunk.content,
+        created_at=chunk.created_at,
+        metadata_json=chunk.metadata_json,
+        chunk_level=chunk.chunk_level.value,
+        parent_chunk_id=chunk.parent_chunk_id,
+    )
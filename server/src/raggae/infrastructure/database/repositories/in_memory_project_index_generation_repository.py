@@ -0,0 +1,16 @@
+from uuid import UUID
+
+
+class InMemoryProjectIndexGenerationRepository:
+    """In-memory project index generation repository for testing."""
+
+    def __init__(self) -> None:
+        self._generations: dict[UUID, int] = {}
+
+    async def get_generation(self, project_id: UUID) -> int:
+        return self._generations.get(project_id, 0)
+
+    async def bump(self, project_id: UUID) -> int:
+        generation = self._generations.get(project_id, 0) + 1
+        self._generations[project_id] = generation
+        return generation
@@ -64,6 +64,8 @@ class SQLAlchemyAgentConfigurationRepository:
             model.retrieval_strategy = config.retrieval_strategy
             model.retrieval_top_k = config.retrieval_top_k
             model.retrieval_min_score = config.retrieval_min_score
+            model.retrieval_hnsw_ef_search = config.retrieval_hnsw_ef_search
+            model.retrieval_hnsw_iterative_scan = config.retrieval_hnsw_iterative_scan
             model.reranking_enabled = config.reranking_enabled
             model.reranker_backend = config.reranker_backend
             model.reranker_model = config.reranker_model
@@ -98,6 +100,8 @@ class SQLAlchemyAgentConfigurationRepository:
             retrieval_strategy=model.retrieval_strategy,
             retrieval_top_k=model.retrieval_top_k,
             retrieval_min_score=model.retrieval_min_score,
+            retrieval_hnsw_ef_search=model.retrieval_hnsw_ef_search,
+            retrieval_hnsw_iterative_scan=model.retrieval_hnsw_iterative_scan,
             reranking_enabled=model.reranking_enabled,
             reranker_backend=model.reranker_backend,
             reranker_model=model.reranker_model,
@@ -119,6 +123,8 @@ class SQLAlchemyAgentConfigurationRepository:
             retrieval_strategy=settings.retrieval_default_strategy,
             retrieval_top_k=settings.retrieval_default_chunk_limit,
             retrieval_min_score=settings.retrieval_min_score,
+            retrieval_hnsw_ef_search=settings.retrieval_hnsw_ef_search,
+            retrieval_hnsw_iterative_scan=settings.retrieval_hnsw_iterative_scan,
             reranker_backend=settings.reranker_backend,
             reranker_model=settings.reranker_model,
             reranker_candidate_multiplier=settings.reranker_candidate_multiplier,
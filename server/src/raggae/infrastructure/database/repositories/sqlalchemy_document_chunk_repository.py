@@ -1,11 +1,51 @@
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import Row, delete, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from raggae.application.dto.document_chunk_view_dto import DocumentChunkViewDTO
 from raggae.domain.entities.document_chunk import DocumentChunk
 from raggae.domain.value_objects.chunk_level import ChunkLevel
 from raggae.infrastructure.database.models.document_chunk_model import DocumentChunkModel
+from raggae.infrastructure.database.models.document_model import DocumentModel
+
+# Rows per upsert statement, well under the 32767 bind parameters of a query.
+_UPSERT_BATCH_SIZE = 1000
+
+
+async def _project_ids_by_document_id(session: AsyncSession, document_ids: set[UUID]) -> dict[UUID, UUID]:
+    """Resolve the owning project of each document (chunks carry it denormalized)."""
+    result = await session.execute(
+        select(DocumentModel.id, DocumentModel.project_id).where(DocumentModel.id.in_(document_ids))
+    )
+    return dict(result.tuples().all())
+
+
+# Every column but the embedding (and the deferred content_tsv).
+_VIEW_COLUMNS = (
+    DocumentChunkModel.id,
+    DocumentChunkModel.document_id,
+    DocumentChunkModel.chunk_index,
+    DocumentChunkModel.content,
+    DocumentChunkModel.created_at,
+    DocumentChunkModel.metadata_json,
+    DocumentChunkModel.chunk_level,
+    DocumentChunkModel.parent_chunk_id,
+)
+
+
+def _to_view(row: Row) -> DocumentChunkViewDTO:  # type: ignore[type-arg]
+    return DocumentChunkViewDTO(
+        id=row.id,
+        document_id=row.document_id,
+        chunk_index=row.chunk_index,
+        content=row.content,
+        created_at=row.created_at,
+        metadata_json=row.metadata_json,
+        chunk_level=row.chunk_level,
+        parent_chunk_id=row.parent_chunk_id,
+    )
 
 
 class SQLAlchemyDocumentChunkRepository:
@@ -19,10 +59,12 @@ class SQLAlchemyDocumentChunkRepository:
             return
 
         async with self._session_factory() as session:
+            project_ids = await _project_ids_by_document_id(session, {chunk.document_id for chunk in chunks})
             models = [
                 DocumentChunkModel(
                     id=chunk.id,
                     document_id=chunk.document_id,
+                    project_id=project_ids[chunk.document_id],
                     chunk_index=chunk.chunk_index,
                     content=chunk.content,
                     embedding=chunk.embedding,
@@ -109,6 +151,40 @@ class SQLAlchemyDocumentChunkRepository:
                 for model in models
             ]
 
+    async def find_views_by_document_id(self, document_id: UUID) -> list[DocumentChunkViewDTO]:
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(*_VIEW_COLUMNS)
+                .where(DocumentChunkModel.document_id == document_id)
+                .order_by(DocumentChunkModel.chunk_index)
+            )
+            return [_to_view(row) for row in result.all()]
+
+    async def find_views_by_ids(self, chunk_ids: set[UUID]) -> list[DocumentChunkViewDTO]:
+        if not chunk_ids:
+            return []
+        async with self._session_factory() as session:
+            result = await session.execute(select(*_VIEW_COLUMNS).where(DocumentChunkModel.id.in_(chunk_ids)))
+            return [_to_view(row) for row in result.all()]
+
+    async def find_views_by_document_indices(
+        self, indices_by_document: dict[UUID, set[int]]
+    ) -> list[DocumentChunkViewDTO]:
+        keys = [
+            (document_id, chunk_index)
+            for document_id, indices in indices_by_document.items()
+            for chunk_index in indices
+        ]
+        if not keys:
+            return []
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(*_VIEW_COLUMNS)
+                .where(tuple_(DocumentChunkModel.document_id, DocumentChunkModel.chunk_index).in_(keys))
+                .order_by(DocumentChunkModel.document_id, DocumentChunkModel.chunk_index)
+            )
+            return [_to_view(row) for row in result.all()]
+
     async def delete_by_document_id(self, document_id: UUID) -> None:
         async with self._session_factory() as session:
             await session.execute(
@@ -122,10 +198,12 @@ class SQLAlchemyDocumentChunkRepository:
                 delete(DocumentChunkModel).where(DocumentChunkModel.document_id == document_id)
             )
             if chunks:
+                project_ids = await _project_ids_by_document_id(session, {document_id})
                 models = [
                     DocumentChunkModel(
                         id=chunk.id,
                         document_id=chunk.document_id,
+                        project_id=project_ids[document_id],
                         chunk_index=chunk.chunk_index,
                         content=chunk.content,
                         embedding=chunk.embedding,
@@ -138,3 +216,45 @@ class SQLAlchemyDocumentChunkRepository:
                 ]
                 session.add_all(models)
             await session.commit()
+
+    async def upsert_document_chunks(
+        self, document_id: UUID, chunks: list[DocumentChunk], removed_ids: set[UUID]
+    ) -> None:
+        async with self._session_factory() as session:
+            if removed_ids:
+                # Children of a removed parent cascade; the ones kept are re-inserted below.
+                await session.execute(
+                    delete(DocumentChunkModel).where(
+                        DocumentChunkModel.document_id == document_id,
+                        DocumentChunkModel.id.in_(removed_ids),
+                    )
+                )
+            if chunks:
+                project_ids = await _project_ids_by_document_id(session, {document_id})
+                rows = [
+                    {
+                        "id": chunk.id,
+                        "document_id": chunk.document_id,
+                        "project_id": project_ids[document_id],
+                        "chunk_index": chunk.chunk_index,
+                        "content": chunk.content,
+                        "embedding": chunk.embedding,
+                        "metadata_json": chunk.metadata_json,
+                        "created_at": chunk.created_at,
+                        "chunk_level": chunk.chunk_level.value,
+                        "parent_chunk_id": chunk.parent_chunk_id,
+                    }
+                    for chunk in chunks
+                ]
+                for start in range(0, len(rows), _UPSERT_BATCH_SIZE):
+                    stmt = insert(DocumentChunkModel).values(rows[start : start + _UPSERT_BATCH_SIZE])
+                    # Kept chunks only move: content, metadata and embedding are unchanged.
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=[DocumentChunkModel.id],
+                        set_={
+                            "chunk_index": stmt.excluded.chunk_index,
+                            "parent_chunk_id": stmt.excluded.parent_chunk_id,
+                        },
+                    )
+                    await session.execute(stmt)
+            await session.commit()
@@ -29,6 +29,8 @@ def _to_entity(model: DocumentModel) -> Document:
         authors=model.authors,
         document_date=model.document_date,
         title=model.title,
+        content_hash=model.content_hash,
+        pipeline_fingerprint=model.pipeline_fingerprint,
     )
 
 
@@ -63,6 +65,8 @@ class SQLAlchemyDocumentRepository:
                     authors=document.authors,
                     document_date=document.document_date,
                     title=document.title,
+                    content_hash=document.content_hash,
+                    pipeline_fingerprint=document.pipeline_fingerprint,
                 )
                 session.add(model)
             else:
@@ -82,6 +86,8 @@ class SQLAlchemyDocumentRepository:
                 model.authors = document.authors
                 model.document_date = document.document_date
                 model.title = document.title
+                model.content_hash = document.content_hash
+                model.pipeline_fingerprint = document.pipeline_fingerprint
             await session.commit()
 
     async def find_by_id(self, document_id: UUID) -> Document | None:
@@ -0,0 +1,40 @@
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from raggae.infrastructure.database.models.project_index_generation_model import (
+    ProjectIndexGenerationModel,
+)
+
+
+class SQLAlchemyProjectIndexGenerationRepository:
+    """PostgreSQL project index generation repository using SQLAlchemy async sessions.
+
+    The counter lives in its own table rather than on ``projects`` so that a
+    stale ``ProjectRepository.save`` can never roll it back, and is incremented
+    atomically so that every worker observes the same generation.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+
+    async def get_generation(self, project_id: UUID) -> int:
+        async with self._session_factory() as session:
+            stmt = select(ProjectIndexGenerationModel.generation).where(
+                ProjectIndexGenerationModel.project_id == project_id
+            )
+            generation = (await session.execute(stmt)).scalar_one_or_none()
+            return generation or 0
+
+    async def bump(self, project_id: UUID) -> int:
+        insert_stmt = insert(ProjectIndexGenerationModel).values(project_id=project_id, generation=1)
+        stmt = insert_stmt.on_conflict_do_update(
+            index_elements=[ProjectIndexGenerationModel.project_id],
+            set_={"generation": ProjectIndexGenerationModel.generation + 1},
+        ).returning(ProjectIndexGenerationModel.generation)
+        async with self._session_factory() as session:
+            generation = (await session.execute(stmt)).scalar_one()
+            await session.commit()
+            return int(generation)
@@ -6,8 +6,17 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from raggae.infrastructure.config.settings import settings
+from raggae.infrastructure.database.pgvector_codec import register_pgvector_codec
 
-engine: AsyncEngine = create_async_engine(settings.database_url, echo=False, future=True)
+# asyncpg prepares each distinct SQL text server-side and keeps it in a
+# per-connection LRU; it must hold every retrieval statement variant.
+engine: AsyncEngine = create_async_engine(
+    settings.database_url,
+    echo=False,
+    future=True,
+    connect_args={"prepared_statement_cache_size": settings.database_prepared_statement_cache_size},
+)
+register_pgvector_codec(engine)
 SessionFactory: async_sessionmaker[AsyncSession] = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -36,6 +36,9 @@ class AnthropicLLMService:
         self._model = model
         self._max_tokens = max_tokens
 
+    async def aclose(self) -> None:
+        await self._client.close()
+
     async def generate_answer(self, prompt: str) -> str:
         started_at = perf_counter()
         logger.info(
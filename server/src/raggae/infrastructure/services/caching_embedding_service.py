@@ -0,0 +1,40 @@
+from raggae.application.interfaces.services.embedding_cache import EmbeddingCache
+from raggae.application.interfaces.services.embedding_service import EmbeddingService
+from raggae.infrastructure.cache.embedding_cache_key import text_hash
+
+
+class CachingEmbeddingService:
+    """Wraps any EmbeddingService with a content-addressed embedding cache.
+
+    Texts are looked up by the sha256 of their content within ``namespace``
+    (see :func:`embedding_cache_namespace`); only the misses, deduplicated,
+    are sent to the delegate, and their embeddings are stored for the next
+    call. Results are returned in input order.
+    """
+
+    def __init__(self, delegate: EmbeddingService, cache: EmbeddingCache, namespace: str) -> None:
+        self._delegate = delegate
+        self._cache = cache
+        self._namespace = namespace
+
+    @property
+    def delegate(self) -> EmbeddingService:
+        return self._delegate
+
+    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        if not texts:
+            return []
+        hashes = [text_hash(text) for text in texts]
+        unique_hashes = list(dict.fromkeys(hashes))
+        embeddings = await self._cache.get_many(self._namespace, unique_hashes)
+
+        missing: dict[str, str] = {}
+        for digest, text in zip(hashes, texts, strict=True):
+            if digest not in embeddings:
+                missing.setdefault(digest, text)
+        if missing:
+            computed = await self._delegate.embed_texts(list(missing.values()))
+            fresh = dict(zip(missing, computed, strict=True))
+            await self._cache.set_many(self._namespace, fresh)
+            embeddings.update(fresh)
+        return [embeddings[digest] for digest in hashes]
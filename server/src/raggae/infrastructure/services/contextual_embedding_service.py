@@ -26,6 +26,10 @@ class ContextualEmbeddingService:
         self._document_prefix = document_prefix
         self._query_prefix = query_prefix
 
+    @property
+    def document_prefix(self) -> str:
+        return self._document_prefix
+
     async def embed_texts(self, texts: list[str]) -> list[list[float]]:
         """Embed texts with the document prefix."""
         prefixed = [f"{self._document_prefix}{t}" for t in texts]
@@ -1,72 +1,159 @@
+import asyncio
 import logging
 
 import httpx
 
+from raggae.application.services.retry_backoff import backoff_delay
 from raggae.domain.exceptions.document_exceptions import EmbeddingGenerationError
+from raggae.infrastructure.services.retry_backoff import parse_retry_after
 
 logger = logging.getLogger(__name__)
 
+# batchEmbedContents rejects more than 100 requests per call.
+_MAX_BATCH_SIZE = 100
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
 
 class GeminiEmbeddingService:
-    """Embedding service implementation backed by Gemini REST API."""
+    """Embedding service implementation backed by Gemini REST API.
+
+    Texts are sent through ``batchEmbedContents``, ``batch_size`` (at most 100)
+    per call and ``max_concurrency`` calls at a time across all callers of
+    the instance; embeddings are returned in input order. 429 and 5xx
+    responses are retried with exponential backoff (honouring
+    ``Retry-After``); a batch rejected for its payload size is split in two
+    and each half sent again.
+    """
 
-    def __init__(self, api_key: str, model: str, expected_dimension: int | None = None) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        expected_dimension: int | None = None,
+        batch_size: int = _MAX_BATCH_SIZE,
+        max_concurrency: int = 4,
+        max_retries: int = 4,
+        retry_base_delay_seconds: float = 1.0,
+        retry_max_delay_seconds: float = 30.0,
+    ) -> None:
         self._api_key = api_key
         self._model = model
         self._expected_dimension = expected_dimension
+        self._batch_size = min(max(1, batch_size), _MAX_BATCH_SIZE)
+        self._max_concurrency = max(1, max_concurrency)
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        self._max_retries = max(0, max_retries)
+        self._retry_base_delay = retry_base_delay_seconds
+        self._retry_max_delay = retry_max_delay_seconds
         self._client = httpx.AsyncClient(timeout=120.0)
 
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
     async def embed_texts(self, texts: list[str]) -> list[list[float]]:
         if not texts:
             return []
 
-        embeddings: list[list[float]] = []
-        for text in texts:
-            embedding = await self._embed_single(text)
-            embeddings.append(embedding)
-        return embeddings
+        batches = [
+            texts[start : start + self._batch_size] for start in range(0, len(texts), self._batch_size)
+        ]
+
+        async def embed(batch: list[str]) -> list[list[float]]:
+            async with self._semaphore:
+                return await self._embed_batch(batch)
+
+        results = await asyncio.gather(*(embed(batch) for batch in batches))
+        return [embedding for batch_embeddings in results for embedding in batch_embeddings]
+
+    async def _embed_batch(self, texts: list[str]) -> list[list[float]]:
+        attempt = 0
+        while True:
+            try:
+                return await self._post_batch(texts)
+            except httpx.HTTPStatusError as exc:
+                status_code = exc.response.status_code
+                if _is_payload_error(exc.response) and len(texts) > 1:
+                    half = len(texts) // 2
+                    logger.warning(
+                        "Gemini embedding batch rejected (status=%s, size=%s), splitting",
+                        status_code,
+                        len(texts),
+                    )
+                    return await self._embed_batch(texts[:half]) + await self._embed_batch(texts[half:])
+                if status_code in _RETRYABLE_STATUS_CODES and attempt < self._max_retries:
+                    await self._wait_before_retry(
+                        attempt, parse_retry_after(exc.response.headers.get("retry-after"))
+                    )
+                    attempt += 1
+                    continue
+                logger.error(
+                    "Gemini embedding request failed (status=%s, body=%s)",
+                    status_code,
+                    exc.response.text,
+                )
+                raise EmbeddingGenerationError(
+                    f"Failed to generate embeddings: status={status_code}"
+                ) from exc
+            except httpx.TransportError as exc:
+                if attempt < self._max_retries:
+                    await self._wait_before_retry(attempt, None)
+                    attempt += 1
+                    continue
+                logger.exception("Gemini embedding request failed")
+                raise EmbeddingGenerationError(f"Failed to generate embeddings: {exc}") from exc
+            except EmbeddingGenerationError:
+                raise
+            except Exception as exc:  # pragma: no cover - provider dependent
+                logger.exception("Gemini embedding request failed")
+                raise EmbeddingGenerationError(f"Failed to generate embeddings: {exc}") from exc
 
-    async def _embed_single(self, text: str) -> list[float]:
+    async def _post_batch(self, texts: list[str]) -> list[list[float]]:
         logger.debug(
-            "Gemini embedding request (model=%s, expected_dim=%s, text_len=%s)",
+            "Gemini batch embedding request (model=%s, expected_dim=%s, batch_size=%s)",
             self._model,
             self._expected_dimension,
-            len(text),
+            len(texts),
         )
-        payload: dict[str, object] = {
-            "content": {
-                "parts": [{"text": text}],
+        requests: list[dict[str, object]] = []
+        for text in texts:
+            request: dict[str, object] = {
+                "model": f"models/{self._model}",
+                "content": {"parts": [{"text": text}]},
             }
-        }
-        if self._expected_dimension is not None:
-            payload["outputDimensionality"] = self._expected_dimension
-
-        try:
-            response = await self._client.post(
-                (
-                    "https://generativelanguage.googleapis.com/v1beta/"
-                    f"models/{self._model}:embedContent?key={self._api_key}"
-                ),
-                json=payload,
+            if self._expected_dimension is not None:
+                request["outputDimensionality"] = self._expected_dimension
+            requests.append(request)
+
+        response = await self._client.post(
+            (
+                "https://generativelanguage.googleapis.com/v1beta/"
+                f"models/{self._model}:batchEmbedContents?key={self._api_key}"
+            ),
+            json={"requests": requests},
+        )
+        response.raise_for_status()
+        embeddings = [list(item["values"]) for item in response.json()["embeddings"]]
+        if len(embeddings) != len(texts):
+            raise EmbeddingGenerationError(
+                f"Gemini returned {len(embeddings)} embeddings for {len(texts)} texts"
             )
-            response.raise_for_status()
-            embedding = list(response.json()["embedding"]["values"])
+        for embedding in embeddings:
             if self._expected_dimension is not None and len(embedding) != self._expected_dimension:
                 raise EmbeddingGenerationError(
                     f"Invalid embedding dimension: expected {self._expected_dimension}, got {len(embedding)}"
                 )
-            return embedding
-        except httpx.HTTPStatusError as exc:
-            logger.error(
-                "Gemini embedding request failed (status=%s, body=%s)",
-                exc.response.status_code,
-                exc.response.text,
-            )
-            raise EmbeddingGenerationError(
-                f"Failed to generate embeddings: status={exc.response.status_code}"
-            ) from exc
-        except EmbeddingGenerationError:
-            raise
-        except Exception as exc:  # pragma: no cover - provider dependent
-            logger.exception("Gemini embedding request failed")
-            raise EmbeddingGenerationError(f"Failed to generate embeddings: {exc}") from exc
+        return embeddings
+
+    async def _wait_before_retry(self, attempt: int, retry_after: float | None) -> None:
+        delay = backoff_delay(attempt, self._retry_base_delay, self._retry_max_delay, retry_after)
+        logger.warning("Gemini embedding request throttled or failed, retrying in %.2fs", delay)
+        await asyncio.sleep(delay)
+
+
+def _is_payload_error(response: httpx.Response) -> bool:
+    if response.status_code == 413:
+        return True
+    if response.status_code != 400:
+        return False
+    body = response.text.lower()
+    return "payload" in body or "at most" in body
@@ -18,6 +18,9 @@ class GeminiLLMService:
         self._model = model
         self._client = httpx.AsyncClient(timeout=120.0)
 
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
     async def generate_answer(self, prompt: str) -> str:
         started_at = perf_counter()
         logger.info(
@@ -1,16 +1,31 @@
+from collections.abc import Sequence
 from uuid import UUID
 
+import numpy as np
+
 from raggae.application.dto.retrieved_chunk_dto import RetrievedChunkDTO
 from raggae.application.interfaces.repositories.document_chunk_repository import (
     DocumentChunkRepository,
 )
 from raggae.application.interfaces.repositories.document_repository import DocumentRepository
-from raggae.domain.value_objects.chunk_level import ChunkLevel
-from raggae.infrastructure.services.math_utils import cosine_similarity as _cosine_similarity
+from raggae.domain.entities.document import Document
+from raggae.infrastructure.services.in_memory_vector_index import InMemoryVectorIndex
 
 
 class InMemoryChunkRetrievalService:
-    """In-memory chunk retrieval based on hybrid vector and lexical scoring."""
+    """In-memory chunk retrieval based on hybrid vector and lexical scoring.
+
+    ``fusion`` mirrors :class:`SQLAlchemyChunkRetrievalService`: ``"weighted"``
+    sums the weighted channel scores, ``"rrf"`` merges both rankings with
+    Reciprocal Rank Fusion (only chunks with a lexical match are ranked by the
+    lexical channel).
+
+    Chunks are scored from an :class:`InMemoryVectorIndex` with one
+    matrix-vector product; the lexical channel is Okapi BM25 over the index
+    postings, scaled by the best candidate as the SQL service scales
+    ``ts_rank_cd``. When no index shared with the chunk repository is
+    given, a transient one is built from the repository on every query.
+    """
 
     def __init__(
         self,
@@ -18,11 +33,17 @@ class InMemoryChunkRetrievalService:
         document_chunk_repository: DocumentChunkRepository,
         vector_weight: float = 0.6,
         fulltext_weight: float = 0.4,
+        fusion: str = "weighted",
+        rrf_k: int = 60,
+        vector_index: InMemoryVectorIndex | None = None,
     ) -> None:
         self._document_repository = document_repository
         self._document_chunk_repository = document_chunk_repository
         self._vector_weight = vector_weight
         self._fulltext_weight = fulltext_weight
+        self._fusion = fusion
+        self._rrf_k = max(1, rrf_k)
+        self._vector_index = vector_index
 
     async def retrieve_chunks(
         self,
@@ -34,44 +55,79 @@ class InMemoryChunkRetrievalService:
         min_score: float = 0.0,
         strategy: str = "hybrid",
         metadata_filters: dict[str, object] | None = None,
+        hnsw_ef_search: int | None = None,
+        hnsw_iterative_scan: str | None = None,
+        context_window_size: int = 0,
     ) -> list[RetrievedChunkDTO]:
+        # Exact scan: no ANN index to tune. Context is left to the caller's repository fallback.
+        del hnsw_ef_search, hnsw_iterative_scan, context_window_size
         if limit <= 0:
             return []
 
         project_documents = await self._document_repository.find_by_project_id(project_id)
-        retrieval_results: list[RetrievedChunkDTO] = []
-        query_terms = _tokenize(query_text)
+        file_names = {document.id: document.file_name for document in project_documents}
+        index = self._vector_index or await self._build_transient_index(project_documents)
+        matrix = index.project_matrix(project_id, file_names, len(query_embedding))
+
+        candidates = matrix.searchable.copy()
+        if metadata_filters:
+            candidates &= matrix.metadata_mask(metadata_filters)
+        rows = np.flatnonzero(candidates)
+
         resolved_strategy = _resolve_strategy(strategy, query_text)
         vector_weight, fulltext_weight = self._weights_for_strategy(resolved_strategy)
-
-        for document in project_documents:
-            chunks = await self._document_chunk_repository.find_by_document_id(document.id)
-            for chunk in chunks:
-                if chunk.chunk_level == ChunkLevel.PARENT:
-                    continue
-                if not _matches_filters(chunk.metadata_json, metadata_filters):
-                    continue
-                vector_score = _cosine_similarity(query_embedding, chunk.embedding)
-                fulltext_score = _lexical_overlap_score(query_terms, chunk.content)
-                score = vector_weight * vector_score + fulltext_weight * fulltext_score
-                retrieval_results.append(
-                    RetrievedChunkDTO(
-                        chunk_id=chunk.id,
-                        document_id=chunk.document_id,
-                        content=chunk.content,
-                        score=score,
-                        chunk_index=chunk.chunk_index,
-                        document_file_name=document.file_name,
-                        vector_score=vector_score,
-                        fulltext_score=fulltext_score,
-                        chunk_level=chunk.chunk_level.value,
-                        parent_chunk_id=chunk.parent_chunk_id,
-                    )
+        vector_scores = matrix.vector_scores(query_embedding)[rows].astype(np.float64)
+        fulltext_scores = _normalized_lexical_scores(matrix.bm25_scores(_tokenize(query_text))[rows])
+        if self._fusion == "rrf":
+            scores = self._rrf_scores(vector_scores, fulltext_scores, vector_weight, fulltext_weight)
+        else:
+            scores = vector_weight * vector_scores + fulltext_weight * fulltext_scores
+
+        kept = np.flatnonzero(scores >= min_score)
+        page = _top_positions(scores[kept], offset + limit)[offset:]
+        results: list[RetrievedChunkDTO] = []
+        for position in kept[page]:
+            chunk = matrix.chunks[rows[position]]
+            results.append(
+                RetrievedChunkDTO(
+                    chunk_id=chunk.id,
+                    document_id=chunk.document_id,
+                    content=chunk.content,
+                    score=float(scores[position]),
+                    chunk_index=chunk.chunk_index,
+                    document_file_name=file_names.get(chunk.document_id),
+                    vector_score=float(vector_scores[position]),
+                    fulltext_score=float(fulltext_scores[position]),
+                    chunk_level=chunk.chunk_level.value,
+                    parent_chunk_id=chunk.parent_chunk_id,
                 )
-
-        filtered_results = [chunk for chunk in retrieval_results if chunk.score >= min_score]
-        filtered_results.sort(key=lambda chunk: chunk.score, reverse=True)
-        return filtered_results[offset : offset + limit]
+            )
+        return results
+
+    async def _build_transient_index(self, documents: Sequence[Document]) -> InMemoryVectorIndex:
+        index = InMemoryVectorIndex()
+        for document in documents:
+            index.index_document(
+                document.id, await self._document_chunk_repository.find_by_document_id(document.id)
+            )
+        return index
+
+    def _rrf_scores(
+        self,
+        vector_scores: np.ndarray,
+        fulltext_scores: np.ndarray,
+        vector_weight: float,
+        fulltext_weight: float,
+    ) -> np.ndarray:
+        fused = np.zeros(len(vector_scores), dtype=np.float64)
+        vector_ranking = np.argsort(-vector_scores, kind="stable")
+        fused[vector_ranking] += vector_weight / (self._rrf_k + np.arange(1, len(vector_ranking) + 1))
+        matched = np.flatnonzero(fulltext_scores)
+        fulltext_ranking = matched[np.argsort(-fulltext_scores[matched], kind="stable")]
+        fused[fulltext_ranking] += fulltext_weight / (self._rrf_k + np.arange(1, len(fulltext_ranking) + 1))
+        scale = (self._rrf_k + 1) / max(vector_weight + fulltext_weight, 1e-9)
+        scaled: np.ndarray = fused * scale
+        return scaled
 
     def _weights_for_strategy(self, strategy: str) -> tuple[float, float]:
         if strategy == "vector":
@@ -85,43 +141,21 @@ def _tokenize(text: str) -> set[str]:
     return {part.strip().lower() for part in text.split() if part.strip()}
 
 
-def _lexical_overlap_score(query_terms: set[str], content: str) -> float:
-    """BM25-inspired lexical scoring.
+def _normalized_lexical_scores(scores: np.ndarray) -> np.ndarray:
+    """Scale BM25 scores by the best candidate, like ``ts_rank_cd`` in the SQL service."""
+    peak = float(scores.max()) if len(scores) else 0.0
+    normalized: np.ndarray = scores / peak if peak > 0.0 else scores
+    return normalized
 
-    Uses term frequency saturation and document length normalisation
-    instead of simple overlap ratio.
-    """
-    if not query_terms:
-        return 0.0
-    content_tokens = content.lower().split()
-    if not content_tokens:
-        return 0.0
-
-    # Build term frequency map
-    tf_map: dict[str, int] = {}
-    for token in content_tokens:
-        t = token.strip()
-        if t:
-            tf_map[t] = tf_map.get(t, 0) + 1
-
-    doc_len = len(content_tokens)
-    # BM25 parameters
-    k1 = 1.2
-    b = 0.75
-    avg_dl = 200.0  # assumed average document length for normalisation
-
-    score = 0.0
-    for term in query_terms:
-        tf = tf_map.get(term, 0)
-        if tf == 0:
-            continue
-        # BM25 TF saturation + length normalisation
-        numerator = tf * (k1 + 1)
-        denominator = tf + k1 * (1 - b + b * doc_len / avg_dl)
-        score += numerator / denominator
-
-    # Normalise by number of query terms to keep in [0, ~1] range
-    return score / len(query_terms) if query_terms else 0.0
+
+def _top_positions(scores: np.ndarray, count: int) -> np.ndarray:
+    """Positions of the ``count`` best scores, best first (ties keep position order)."""
+    if count < len(scores):
+        positions = np.argpartition(-scores, count - 1)[:count]
+    else:
+        positions = np.arange(len(scores))
+    ordered: np.ndarray = positions[np.lexsort((positions, -scores[positions]))]
+    return ordered
 
 
 def _resolve_strategy(strategy: str, query_text: str) -> str:
@@ -135,24 +169,3 @@ def _resolve_strategy(strategy: str, query_text: str) -> str:
     if has_quotes or (is_technical and is_short):
         return "fulltext"
     return "hybrid"
-
-
-def _matches_filters(
-    metadata: dict[str, object] | None,
-    filters: dict[str, object] | None,
-) -> bool:
-    if not filters:
-        return True
-    payload = metadata or {}
-    for key, expected in filters.items():
-        current = payload.get(key)
-        if isinstance(expected, list):
-            if isinstance(current, list):
-                if not any(item in current for item in expected):
-                    return False
-            elif current not in expected:
-                return False
-            continue
-        if current != expected:
-            return False
-    return True
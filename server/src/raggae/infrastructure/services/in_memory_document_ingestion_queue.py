@@ -0,0 +1,122 @@
+import asyncio
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+from raggae.application.dto.ingestion_job_dto import IngestionJobDTO
+
+
+@dataclass(frozen=True)
+class _Job:
+    job: IngestionJobDTO
+    status: str
+    available_at: datetime
+    locked_by: str | None = None
+    locked_until: datetime | None = None
+    last_error: str | None = None
+
+
+class InMemoryDocumentIngestionQueue:
+    """In-memory ingestion queue for the in-memory backend and tests.
+
+    Jobs live in the API process, so its worker must run in that process too.
+    Jobs settled as done or failed are dropped, so the queue only holds
+    queued and running jobs.
+    """
+
+    def __init__(self) -> None:
+        self._jobs: dict[UUID, _Job] = {}
+        self._lock = asyncio.Lock()
+
+    async def enqueue(self, document_id: UUID, project_id: UUID, user_id: UUID) -> UUID:
+        job_id = uuid4()
+        job = IngestionJobDTO(
+            id=job_id, document_id=document_id, project_id=project_id, user_id=user_id, attempts=0
+        )
+        async with self._lock:
+            self._jobs[job_id] = _Job(job=job, status="queued", available_at=datetime.now(UTC))
+        return job_id
+
+    async def claim(self, worker_id: str, lease_seconds: float) -> IngestionJobDTO | None:
+        now = datetime.now(UTC)
+        async with self._lock:
+            claimable = [
+                entry
+                for entry in self._jobs.values()
+                if (entry.status == "queued" and entry.available_at <= now)
+                or (entry.status == "running" and entry.locked_until is not None and entry.locked_until < now)
+            ]
+            if not claimable:
+                return None
+            entry = min(claimable, key=lambda candidate: candidate.available_at)
+            job = replace(entry.job, attempts=entry.job.attempts + 1)
+            self._jobs[job.id] = replace(
+                entry,
+                job=job,
+                status="running",
+                locked_by=worker_id,
+                locked_until=now + timedelta(seconds=lease_seconds),
+            )
+            return job
+
+    async def heartbeat(self, job_id: UUID, worker_id: str, lease_seconds: float) -> bool:
+        async with self._lock:
+            entry = self._held(job_id, worker_id)
+            if entry is None:
+                return False
+            self._jobs[job_id] = replace(
+                entry, locked_until=datetime.now(UTC) + timedelta(seconds=lease_seconds)
+            )
+            return True
+
+    async def complete(self, job_id: UUID, worker_id: str) -> None:
+        await self._drop(job_id, worker_id)
+
+    async def retry(self, job_id: UUID, worker_id: str, error: str, delay_seconds: float) -> None:
+        await self._settle(
+            job_id,
+            worker_id,
+            status="queued",
+            error=error,
+            available_at=datetime.now(UTC) + timedelta(seconds=delay_seconds),
+        )
+
+    async def fail(self, job_id: UUID, worker_id: str, error: str) -> None:
+        await self._drop(job_id, worker_id)
+
+    def status_of(self, job_id: UUID) -> str | None:
+        """Status of a queued or running job; ``None`` once it is settled or unknown."""
+        entry = self._jobs.get(job_id)
+        return entry.status if entry is not None else None
+
+    async def _settle(
+        self,
+        job_id: UUID,
+        worker_id: str,
+        status: str,
+        error: str | None = None,
+        available_at: datetime | None = None,
+    ) -> None:
+        async with self._lock:
+            entry = self._held(job_id, worker_id)
+            if entry is None:
+                return
+            self._jobs[job_id] = replace(
+                entry,
+                status=status,
+                available_at=available_at or entry.available_at,
+                locked_by=None,
+                locked_until=None,
+                last_error=error if error is not None else entry.last_error,
+            )
+
+    async def _drop(self, job_id: UUID, worker_id: str) -> None:
+        async with self._lock:
+            if self._held(job_id, worker_id) is not None:
+                del self._jobs[job_id]
+
+    def _held(self, job_id: UUID, worker_id: str) -> _Job | None:
+        entry = self._jobs.get(job_id)
+        if entry is None or entry.status != "running" or entry.locked_by != worker_id:
+            return None
+        return entry
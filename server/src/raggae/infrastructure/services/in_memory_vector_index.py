@@ -0,0 +1,389 @@
+"""NumPy-backed index used by :class:`InMemoryChunkRetrievalService`."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from uuid import UUID
+
+import numpy as np
+
+from raggae.domain.entities.document_chunk import DocumentChunk
+from raggae.domain.value_objects.chunk_level import ChunkLevel
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+Postings = tuple[np.ndarray, np.ndarray]  # (row positions, term frequencies)
+
+
+def tokenize(text: str) -> list[str]:
+    return text.lower().split()
+
+
+@dataclass(frozen=True)
+class MetadataValues:
+    """Rows of one metadata key, indexed by value, so filters combine row arrays.
+
+    ``scalars`` maps hashable values (``None`` included) to rows, ``items``
+    maps the hashable items of list values to rows, ``keyed`` lists the rows
+    that have the key at all, and ``opaque`` the rows whose value cannot be
+    hashed (objects, lists of objects), which are compared one by one.
+    """
+
+    scalars: dict[object, np.ndarray]
+    items: dict[object, np.ndarray]
+    keyed: np.ndarray
+    opaque: np.ndarray
+
+    @classmethod
+    def build(cls, values: Sequence[tuple[int, object]]) -> MetadataValues:
+        scalars: dict[object, list[int]] = {}
+        items: dict[object, list[int]] = {}
+        opaque: list[int] = []
+        for row, value in values:
+            try:
+                if isinstance(value, list):
+                    for item in set(value):
+                        items.setdefault(item, []).append(row)
+                else:
+                    scalars.setdefault(value, []).append(row)
+            except TypeError:
+                opaque.append(row)
+        return cls(
+            scalars={value: np.array(rows, dtype=np.int64) for value, rows in scalars.items()},
+            items={item: np.array(rows, dtype=np.int64) for item, rows in items.items()},
+            keyed=np.array([row for row, _ in values], dtype=np.int64),
+            opaque=np.array(sorted(set(opaque)), dtype=np.int64),
+        )
+
+    @classmethod
+    def merge(cls, parts: Sequence[tuple[MetadataValues, int]]) -> MetadataValues:
+        """Concatenate per-segment values, shifting each part's rows by its offset."""
+        scalars: dict[object, list[np.ndarray]] = {}
+        items: dict[object, list[np.ndarray]] = {}
+        for part, offset in parts:
+            for value, rows in part.scalars.items():
+                scalars.setdefault(value, []).append(rows + offset)
+            for item, rows in part.items.items():
+                items.setdefault(item, []).append(rows + offset)
+        return cls(
+            scalars={value: np.concatenate(rows) for value, rows in scalars.items()},
+            items={item: np.concatenate(rows) for item, rows in items.items()},
+            keyed=_concatenate_rows([part.keyed + offset for part, offset in parts]),
+            opaque=_concatenate_rows([part.opaque + offset for part, offset in parts]),
+        )
+
+
+_NO_METADATA = MetadataValues(
+    scalars={}, items={}, keyed=np.zeros(0, dtype=np.int64), opaque=np.zeros(0, dtype=np.int64)
+)
+
+
+@dataclass(frozen=True)
+class DocumentSegment:
+    """Searchable chunks of one document, with their precomputed statistics.
+
+    ``embeddings`` holds L2-normalized float32 rows; a chunk whose embedding is
+    empty, zero-norm or of another dimension than the document's gets a zero
+    row, and therefore a vector score of 0. ``postings`` is the inverted index
+    of the searchable chunks (parents are left out), by local row, and
+    ``metadata`` the value index of each ``metadata_json`` key.
+    """
+
+    chunks: tuple[DocumentChunk, ...]
+    embeddings: np.ndarray
+    postings: dict[str, Postings]
+    lengths: np.ndarray
+    searchable: np.ndarray
+    metadata: dict[str, MetadataValues] = field(default_factory=dict)
+
+    @property
+    def dimension(self) -> int:
+        return int(self.embeddings.shape[1])
+
+    @classmethod
+    def build(cls, chunks: Sequence[DocumentChunk]) -> DocumentSegment:
+        dimensions = Counter(len(chunk.embedding) for chunk in chunks if chunk.embedding)
+        dimension = dimensions.most_common(1)[0][0] if dimensions else 0
+        embeddings = np.zeros((len(chunks), dimension), dtype=np.float32)
+        for row, chunk in enumerate(chunks):
+            if len(chunk.embedding) == dimension:
+                embeddings[row] = chunk.embedding
+        _normalize_rows(embeddings)
+
+        searchable = [chunk.chunk_level != ChunkLevel.PARENT for chunk in chunks]
+        tokens = [tokenize(chunk.content) for chunk in chunks]
+        rows_by_term: dict[str, list[int]] = {}
+        frequencies_by_term: dict[str, list[int]] = {}
+        for row, chunk_tokens in enumerate(tokens):
+            if not searchable[row]:
+                continue
+            for term, frequency in Counter(chunk_tokens).items():
+                rows_by_term.setdefault(term, []).append(row)
+                frequencies_by_term.setdefault(term, []).append(frequency)
+        values_by_key: dict[str, list[tuple[int, object]]] = {}
+        for row, chunk in enumerate(chunks):
+            for key, value in (chunk.metadata_json or {}).items():
+                values_by_key.setdefault(key, []).append((row, value))
+        return cls(
+            chunks=tuple(chunks),
+            embeddings=embeddings,
+            postings={
+                term: (np.array(rows, dtype=np.int64), np.array(frequencies_by_term[term], dtype=np.float32))
+                for term, rows in rows_by_term.items()
+            },
+            lengths=np.array([len(chunk_tokens) for chunk_tokens in tokens], dtype=np.float32),
+            searchable=np.array(searchable, dtype=bool),
+            metadata={key: MetadataValues.build(values) for key, values in values_by_key.items()},
+        )
+
+
+class ProjectMatrix:
+    """Segments of a project laid out in growable contiguous arrays.
+
+    A document added or re-indexed is appended after the existing rows; the
+    rows of a replaced or removed document stay in place, masked out of
+    ``searchable``, until they exceed ``compact_ratio`` of the matrix and it
+    is laid out again. Term postings and metadata value indexes stay in their
+    segments and are merged on first use of a term or key, then extended
+    with the segments appended since, so a query only touches its own terms
+    and filter keys.
+    """
+
+    def __init__(self, dimension: int, compact_ratio: float = 0.5) -> None:
+        self.dimension = dimension
+        self._compact_ratio = compact_ratio
+        self._reset(capacity=0)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def embeddings(self) -> np.ndarray:
+        return self._embeddings[: self._size]
+
+    @property
+    def lengths(self) -> np.ndarray:
+        return self._lengths[: self._size]
+
+    @property
+    def searchable(self) -> np.ndarray:
+        """Rows of current, non-parent chunks."""
+        return self._searchable[: self._size]
+
+    @property
+    def average_length(self) -> float:
+        return self._searchable_length / self.searchable_count if self.searchable_count else 0.0
+
+    def sync(self, segments: Mapping[UUID, DocumentSegment]) -> None:
+        """Lay out exactly ``segments``, appending new or changed ones and masking the rest."""
+        for document_id, (segment, _) in list(self._placements.items()):
+            if segments.get(document_id) is not segment:
+                self._retire(document_id)
+        if self._dead_rows and self._dead_rows > self._compact_ratio * self._size:
+            self._reset(capacity=self._size - self._dead_rows)
+        for document_id, segment in segments.items():
+            if document_id not in self._placements:
+                self._append(document_id, segment)
+
+    def postings(self, term: str) -> Postings:
+        """Rows (current or masked) containing ``term`` and their frequencies."""
+        cached = self._postings.get(term)
+        if cached is None or cached[2] < len(self._appended):
+            rows: list[np.ndarray] = [cached[0]] if cached is not None else []
+            frequencies: list[np.ndarray] = [cached[1]] if cached is not None else []
+            for segment, offset in self._appended[cached[2] if cached is not None else 0 :]:
+                posting = segment.postings.get(term)
+                if posting is not None:
+                    rows.append(posting[0] + offset)
+                    frequencies.append(posting[1])
+            cached = (
+                _concatenate_rows(rows),
+                np.concatenate(frequencies) if frequencies else np.zeros(0, dtype=np.float32),
+                len(self._appended),
+            )
+            self._postings[term] = cached
+        return cached[0], cached[1]
+
+    def bm25_scores(self, query_terms: Iterable[str]) -> np.ndarray:
+        """Okapi BM25 of every row, with the project's own length and IDF statistics."""
+        scores = np.zeros(len(self), dtype=np.float64)
+        for term in set(query_terms):
+            rows, frequencies = self.postings(term)
+            live = self.searchable[rows]
+            rows, frequencies = rows[live], frequencies[live]
+            if not len(rows):
+                continue
+            df = len(rows)
+            idf = np.log(1.0 + (self.searchable_count - df + 0.5) / (df + 0.5))
+            length_norm = 1 - BM25_B + BM25_B * self.lengths[rows] / self.average_length
+            scores[rows] += idf * frequencies * (BM25_K1 + 1) / (frequencies + BM25_K1 * length_norm)
+        return scores
+
+    def vector_scores(self, query_embedding: Sequence[float]) -> np.ndarray:
+        if len(query_embedding) != self.dimension:
+            return np.zeros(len(self), dtype=np.float32)
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+        if norm == 0.0:
+            return np.zeros(len(self), dtype=np.float32)
+        scores: np.ndarray = self.embeddings @ (query / norm)
+        return scores
+
+    def metadata_mask(self, filters: Mapping[str, object]) -> np.ndarray:
+        """Rows whose ``metadata_json`` matches every filter.
+
+        A list filter matches a value in the list, or a list value sharing an
+        item with it; any other filter matches an equal value. A missing key
+        reads as ``None``.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        for key, expected in filters.items():
+            mask &= self._key_mask(key, expected)
+        return mask
+
+    def _key_mask(self, key: str, expected: object) -> np.ndarray:
+        values = self._metadata_values(key)
+        candidates = expected if isinstance(expected, list) else [expected]
+        matched = np.zeros(len(self), dtype=bool)
+        try:
+            for candidate in candidates:
+                matched[values.scalars.get(candidate, _NO_ROWS)] = True
+                if isinstance(expected, list):
+                    matched[values.items.get(candidate, _NO_ROWS)] = True
+        except TypeError:
+            # An unhashable filter value: compare every row.
+            rows = np.arange(len(self))
+        else:
+            if any(candidate is None for candidate in candidates):
+                unkeyed = np.ones(len(self), dtype=bool)
+                unkeyed[values.keyed] = False
+                matched |= unkeyed
+            rows = values.opaque
+        for row in rows:
+            matched[row] = matches_metadata_value((self.chunks[row].metadata_json or {}).get(key), expected)
+        return matched
+
+    def _metadata_values(self, key: str) -> MetadataValues:
+        cached = self._metadata.get(key)
+        if cached is None or cached[1] < len(self._appended):
+            parts = [(cached[0], 0)] if cached is not None else []
+            parts += [
+                (segment.metadata[key], offset)
+                for segment, offset in self._appended[cached[1] if cached is not None else 0 :]
+                if key in segment.metadata
+            ]
+            cached = (MetadataValues.merge(parts) if parts else _NO_METADATA, len(self._appended))
+            self._metadata[key] = cached
+        return cached[0]
+
+    def _reset(self, capacity: int) -> None:
+        placements = getattr(self, "_placements", {})
+        self.chunks: list[DocumentChunk] = []
+        self.searchable_count = 0
+        self._size = 0
+        self._dead_rows = 0
+        self._searchable_length = 0.0
+        self._embeddings = np.zeros((capacity, self.dimension), dtype=np.float32)
+        self._lengths = np.zeros(capacity, dtype=np.float32)
+        self._searchable = np.zeros(capacity, dtype=bool)
+        self._placements: dict[UUID, tuple[DocumentSegment, int]] = {}
+        self._appended: list[tuple[DocumentSegment, int]] = []
+        self._postings: dict[str, tuple[np.ndarray, np.ndarray, int]] = {}
+        self._metadata: dict[str, tuple[MetadataValues, int]] = {}
+        for document_id, (segment, _) in placements.items():
+            self._append(document_id, segment)
+
+    def _append(self, document_id: UUID, segment: DocumentSegment) -> None:
+        start, end = self._size, self._size + len(segment.chunks)
+        if end > len(self._embeddings):
+            self._grow(max(end, 2 * len(self._embeddings)))
+        # Segments embedded with another model than the query score 0 on the vector channel.
+        if segment.dimension == self.dimension:
+            self._embeddings[start:end] = segment.embeddings
+        self._lengths[start:end] = segment.lengths
+        self._searchable[start:end] = segment.searchable
+        self.chunks.extend(segment.chunks)
+        self._size = end
+        self.searchable_count += int(segment.searchable.sum())
+        self._searchable_length += float(segment.lengths[segment.searchable].sum())
+        self._placements[document_id] = (segment, start)
+        self._appended.append((segment, start))
+
+    def _retire(self, document_id: UUID) -> None:
+        segment, start = self._placements.pop(document_id)
+        self._searchable[start : start + len(segment.chunks)] = False
+        self._dead_rows += len(segment.chunks)
+        self.searchable_count -= int(segment.searchable.sum())
+        self._searchable_length -= float(segment.lengths[segment.searchable].sum())
+
+    def _grow(self, capacity: int) -> None:
+        embeddings = np.zeros((capacity, self.dimension), dtype=np.float32)
+        embeddings[: self._size] = self._embeddings[: self._size]
+        lengths = np.zeros(capacity, dtype=np.float32)
+        lengths[: self._size] = self._lengths[: self._size]
+        searchable = np.zeros(capacity, dtype=bool)
+        searchable[: self._size] = self._searchable[: self._size]
+        self._embeddings, self._lengths, self._searchable = embeddings, lengths, searchable
+
+
+class InMemoryVectorIndex:
+    """Per-document segments of normalized embeddings and token statistics.
+
+    Kept up to date by :class:`InMemoryDocumentChunkRepository` as chunks are
+    saved, replaced or deleted. Each project matrix is kept and brought up to
+    date with the documents changed since the previous query.
+    """
+
+    def __init__(self) -> None:
+        self._segments: dict[UUID, DocumentSegment] = {}
+        self._project_matrices: dict[UUID, ProjectMatrix] = {}
+
+    def index_document(self, document_id: UUID, chunks: Sequence[DocumentChunk]) -> None:
+        if chunks:
+            self._segments[document_id] = DocumentSegment.build(chunks)
+        else:
+            self._segments.pop(document_id, None)
+
+    def remove_document(self, document_id: UUID) -> None:
+        self._segments.pop(document_id, None)
+
+    def segment(self, document_id: UUID) -> DocumentSegment | None:
+        return self._segments.get(document_id)
+
+    def project_matrix(self, project_id: UUID, document_ids: Iterable[UUID], dimension: int) -> ProjectMatrix:
+        matrix = self._project_matrices.get(project_id)
+        if matrix is None or matrix.dimension != dimension:
+            matrix = ProjectMatrix(dimension)
+            self._project_matrices[project_id] = matrix
+        matrix.sync(
+            {
+                document_id: self._segments[document_id]
+                for document_id in document_ids
+                if document_id in self._segments
+            }
+        )
+        return matrix
+
+
+def matches_metadata_value(current: object, expected: object) -> bool:
+    """Whether a ``metadata_json`` value matches one filter (see :meth:`ProjectMatrix.metadata_mask`)."""
+    if isinstance(expected, list):
+        if isinstance(current, list):
+            return any(item in current for item in expected)
+        return current in expected
+    return current == expected
+
+
+_NO_ROWS = np.zeros(0, dtype=np.int64)
+
+
+def _concatenate_rows(parts: Sequence[np.ndarray]) -> np.ndarray:
+    return np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64)
+
+
+def _normalize_rows(matrix: np.ndarray) -> None:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
@@ -0,0 +1,383 @@
+"""Disk-backed IVF-flat vector index used by :class:`LocalIndexChunkRetrievalService`."""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import logging
+import os
+import shutil
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from uuid import UUID, uuid4
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_MANIFEST = "manifest.json"
+_LOCK = ".lock"
+_FORMAT_VERSION = 1
+_TMP_SUFFIX = ".tmp"
+_KMEANS_ITERATIONS = 10
+_KMEANS_SAMPLE_PER_LIST = 256
+_ASSIGN_BATCH_SIZE = 65_536
+
+
+def uuids_to_keys(ids: list[UUID]) -> np.ndarray:
+    """Chunk ids as a fixed-width bytes array, the key type stored on disk."""
+    return np.array([chunk_id.bytes for chunk_id in ids], dtype="S16")
+
+
+def keys_to_uuids(keys: np.ndarray) -> list[UUID]:
+    # NumPy strips trailing NUL bytes from ``S`` items.
+    return [UUID(bytes=bytes(key).ljust(16, b"\0")) for key in keys]
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    normalized: np.ndarray = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+    return normalized
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    if k < len(scores):
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(len(scores))
+    ordered: np.ndarray = candidates[np.argsort(-scores[candidates], kind="stable")]
+    return ordered
+
+
+def _train_centroids(vectors: np.ndarray, nlist: int, rng: np.random.Generator) -> np.ndarray:
+    """Spherical k-means on a sample of the (normalized) vectors."""
+    sample_size = min(len(vectors), nlist * _KMEANS_SAMPLE_PER_LIST)
+    sample = vectors[rng.choice(len(vectors), size=sample_size, replace=False)]
+    centroids = sample[rng.choice(len(sample), size=nlist, replace=False)].copy()
+    for _ in range(_KMEANS_ITERATIONS):
+        assignments = np.argmax(sample @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignments, sample)
+        filled = np.bincount(assignments, minlength=nlist) > 0
+        centroids[filled] = _normalize(sums[filled])
+    return centroids
+
+
+def _assign(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    assignments = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), _ASSIGN_BATCH_SIZE):
+        batch = vectors[start : start + _ASSIGN_BATCH_SIZE]
+        assignments[start : start + len(batch)] = np.argmax(batch @ centroids.T, axis=1)
+    return assignments
+
+
+@dataclass(frozen=True)
+class LocalAnnIndex:
+    """One project's index: IVF-flat base lists plus an exhaustively scanned delta.
+
+    ``vectors`` are L2-normalized and grouped by inverted list (list ``i`` spans
+    rows ``offsets[i]:offsets[i + 1]``), so probing a list reads one contiguous
+    slice of the memory-mapped file. Chunks appended since the last full build
+    live in ``tail_vectors``; chunks deleted since then are listed in
+    ``deleted_keys`` and filtered out of the results.
+    """
+
+    generation: int
+    dimension: int
+    centroids: np.ndarray
+    offsets: np.ndarray
+    vectors: np.ndarray
+    keys: np.ndarray
+    tail_vectors: np.ndarray
+    tail_keys: np.ndarray
+    deleted_keys: np.ndarray
+
+    @property
+    def live_count(self) -> int:
+        return len(self.keys) + len(self.tail_keys) - len(self.deleted_keys)
+
+    @property
+    def delta_count(self) -> int:
+        return len(self.tail_keys) + len(self.deleted_keys)
+
+    def live_keys(self) -> np.ndarray:
+        keys = np.concatenate([np.asarray(self.keys), np.asarray(self.tail_keys)])
+        if len(self.deleted_keys):
+            keys = keys[~np.isin(keys, self.deleted_keys)]
+        return keys
+
+    def search(self, query: list[float], k: int, nprobe: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return the keys and cosine similarities of the ``k`` nearest live chunks."""
+        if k <= 0 or len(query) != self.dimension:
+            return np.zeros(0, dtype="S16"), np.zeros(0, dtype=np.float32)
+        normalized_query = _normalize(np.asarray(query, dtype=np.float32))
+        # Deleted chunks are dropped after scoring: fetch enough to still fill k.
+        fetch = k + len(self.deleted_keys)
+
+        key_parts: list[np.ndarray] = []
+        score_parts: list[np.ndarray] = []
+        if len(self.centroids):
+            probed = _top_k(self.centroids @ normalized_query, min(nprobe, len(self.centroids)))
+            for list_id in probed:
+                start, end = int(self.offsets[list_id]), int(self.offsets[list_id + 1])
+                if start == end:
+                    continue
+                key_parts.append(self.keys[start:end])
+                score_parts.append(self.vectors[start:end] @ normalized_query)
+        if len(self.tail_keys):
+            key_parts.append(self.tail_keys)
+            score_parts.append(self.tail_vectors @ normalized_query)
+        if not key_parts:
+            return np.zeros(0, dtype="S16"), np.zeros(0, dtype=np.float32)
+
+        keys = np.concatenate(key_parts)
+        scores = np.concatenate(score_parts)
+        best = _top_k(scores, fetch)
+        keys, scores = keys[best], scores[best]
+        if len(self.deleted_keys):
+            live = ~np.isin(keys, self.deleted_keys)
+            keys, scores = keys[live], scores[live]
+        return keys[:k], scores[:k]
+
+
+class LocalAnnIndexStore:
+    """Per-project :class:`LocalAnnIndex` snapshots in memory-mapped ``.npy`` files.
+
+    Layout under ``root/<project_id>/``: immutable ``base-*`` (IVF lists) and
+    ``delta-*`` (appended / deleted chunks) directories, and ``manifest.json``
+    naming the current ones. Directories are written under a ``.tmp`` name,
+    fsynced and renamed before the manifest is atomically replaced, so a crash
+    leaves either the previous snapshot or no snapshot. Writers of a project
+    hold an exclusive ``flock`` so that several worker processes can share
+    the directory. :meth:`recover` cleans
+    what a crash left behind; projects without a valid snapshot are rebuilt
+    from the database by the retrieval service.
+
+    The open snapshot of each project is cached with the ``stat`` signature of
+    its manifest, so :meth:`load` only reads the manifest and the delta files
+    again after another writer replaced them.
+    """
+
+    def __init__(self, root: str | Path, nlist: int | None = None, seed: int = 0) -> None:
+        self._root = Path(root)
+        self._nlist = nlist
+        self._seed = seed
+        self._loaded: dict[UUID, tuple[tuple[int, int, int], LocalAnnIndex]] = {}
+
+    def recover(self) -> None:
+        """Remove partial writes and snapshots whose manifest or files are unusable."""
+        if not self._root.exists():
+            return
+        for project_dir in self._root.iterdir():
+            if not project_dir.is_dir():
+                continue
+            with self._write_lock(project_dir):
+                for entry in project_dir.iterdir():
+                    if entry.name.endswith(_TMP_SUFFIX):
+                        _remove(entry)
+                manifest = self._read_manifest(project_dir)
+                if manifest is None or self._open(manifest, project_dir) is None:
+                    if (project_dir / _MANIFEST).exists():
+                        logger.warning(
+                            "Discarding unusable local ANN index",
+                            extra={"event": "local_index_discarded", "project_dir": str(project_dir)},
+                        )
+                    _remove(project_dir / _MANIFEST)
+                    manifest = {}
+                self._remove_unreferenced(project_dir, manifest)
+        self._loaded.clear()
+
+    def load(self, project_id: UUID) -> LocalAnnIndex | None:
+        project_dir = self._project_dir(project_id)
+        signature = _manifest_signature(project_dir)
+        cached = self._loaded.get(project_id)
+        if signature is not None and cached is not None and cached[0] == signature:
+            return cached[1]
+        self._loaded.pop(project_id, None)
+        manifest = self._read_manifest(project_dir)
+        if signature is None or manifest is None:
+            return None
+        index = self._open(manifest, project_dir)
+        if index is None:
+            return None
+        self._loaded[project_id] = (signature, index)
+        return index
+
+    def build(
+        self, project_id: UUID, generation: int, keys: np.ndarray, vectors: np.ndarray
+    ) -> LocalAnnIndex:
+        """Write a fresh IVF-flat snapshot of all live chunks of the project.
+
+        ``vectors`` is a ``(len(keys), dimension)`` array; ``nlist`` defaults to
+        the square root of the chunk count.
+        """
+        vectors = _normalize(vectors)
+        dimension = int(vectors.shape[1])
+        nlist = min(self._nlist or max(1, int(np.sqrt(len(keys)))), len(keys))
+        if nlist:
+            centroids = _train_centroids(vectors, nlist, np.random.default_rng(self._seed))
+            assignments = _assign(vectors, centroids)
+            order = np.argsort(assignments, kind="stable")
+            offsets = np.concatenate([[0], np.cumsum(np.bincount(assignments, minlength=nlist))])
+        else:
+            centroids = np.zeros((0, dimension), dtype=np.float32)
+            order = np.zeros(0, dtype=np.int64)
+            offsets = np.zeros(1, dtype=np.int64)
+
+        project_dir = self._project_dir(project_id)
+        with self._write_lock(project_dir):
+            base = self._write_dir(
+                project_dir,
+                "base",
+                {"centroids": centroids, "offsets": offsets, "vectors": vectors[order], "keys": keys[order]},
+            )
+            return self._commit(
+                project_id,
+                {"format": _FORMAT_VERSION, "generation": generation, "dimension": dimension, "base": base},
+            )
+
+    def append(
+        self,
+        project_id: UUID,
+        index: LocalAnnIndex,
+        generation: int,
+        added_keys: np.ndarray,
+        added_vectors: np.ndarray,
+        deleted_keys: np.ndarray,
+    ) -> LocalAnnIndex:
+        """Record chunks added and removed since ``index`` without rebuilding the IVF lists."""
+        project_dir = self._project_dir(project_id)
+        deleted_tail = np.isin(index.tail_keys, deleted_keys)
+        tail_keys = np.concatenate([np.asarray(index.tail_keys)[~deleted_tail], added_keys])
+        tail_vectors = np.concatenate(
+            [
+                np.asarray(index.tail_vectors)[~deleted_tail],
+                _normalize(added_vectors.reshape(len(added_keys), index.dimension)),
+            ]
+        )
+        deleted_base = np.union1d(index.deleted_keys, deleted_keys[~np.isin(deleted_keys, index.tail_keys)])
+        with self._write_lock(project_dir):
+            manifest = self._read_manifest(project_dir)
+            if manifest is None or manifest.get("generation") != index.generation:
+                # Another process replaced the snapshot ``index`` was read from.
+                raise FileNotFoundError(f"Local ANN index for project {project_id} changed concurrently")
+            delta = self._write_dir(
+                project_dir,
+                "delta",
+                {"tail_vectors": tail_vectors, "tail_keys": tail_keys, "deleted_keys": deleted_base},
+            )
+            return self._commit(project_id, {**manifest, "generation": generation, "delta": delta})
+
+    def _project_dir(self, project_id: UUID) -> Path:
+        return self._root / str(project_id)
+
+    @contextmanager
+    def _write_lock(self, project_dir: Path) -> Iterator[None]:
+        project_dir.mkdir(parents=True, exist_ok=True)
+        with open(project_dir / _LOCK, "a") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _write_dir(self, project_dir: Path, prefix: str, arrays: dict[str, np.ndarray]) -> str:
+        name = f"{prefix}-{uuid4().hex}"
+        tmp_dir = project_dir / f"{name}{_TMP_SUFFIX}"
+        tmp_dir.mkdir(parents=True)
+        for array_name, array in arrays.items():
+            path = tmp_dir / f"{array_name}.npy"
+            with open(path, "wb") as fh:
+                np.save(fh, array, allow_pickle=False)
+                fh.flush()
+                os.fsync(fh.fileno())
+        os.replace(tmp_dir, project_dir / name)
+        _fsync_dir(project_dir)
+        return name
+
+    def _commit(self, project_id: UUID, manifest: dict[str, object]) -> LocalAnnIndex:
+        project_dir = self._project_dir(project_id)
+        tmp_path = project_dir / f"{_MANIFEST}{_TMP_SUFFIX}"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(manifest, fh)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp_path, project_dir / _MANIFEST)
+        _fsync_dir(project_dir)
+        self._remove_unreferenced(project_dir, manifest)
+        index = self._open(manifest, project_dir)
+        signature = _manifest_signature(project_dir)
+        if index is None or signature is None:
+            raise OSError(f"Local ANN index for project {project_id} could not be reopened")
+        self._loaded[project_id] = (signature, index)
+        return index
+
+    def _read_manifest(self, project_dir: Path) -> dict[str, object] | None:
+        try:
+            with open(project_dir / _MANIFEST, encoding="utf-8") as fh:
+                manifest = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(manifest, dict) or manifest.get("format") != _FORMAT_VERSION:
+            return None
+        return manifest
+
+    def _open(self, manifest: dict[str, object], project_dir: Path) -> LocalAnnIndex | None:
+        try:
+            base_dir = project_dir / str(manifest["base"])
+            dimension = int(str(manifest["dimension"]))
+            arrays = {
+                name: np.load(base_dir / f"{name}.npy", mmap_mode="r", allow_pickle=False)
+                for name in ("centroids", "offsets", "vectors", "keys")
+            }
+            delta = manifest.get("delta")
+            if delta:
+                delta_dir = project_dir / str(delta)
+                for name in ("tail_vectors", "tail_keys", "deleted_keys"):
+                    arrays[name] = np.load(delta_dir / f"{name}.npy", allow_pickle=False)
+            else:
+                arrays["tail_vectors"] = np.zeros((0, dimension), dtype=np.float32)
+                arrays["tail_keys"] = np.zeros(0, dtype="S16")
+                arrays["deleted_keys"] = np.zeros(0, dtype="S16")
+            index = LocalAnnIndex(generation=int(str(manifest["generation"])), dimension=dimension, **arrays)
+        except (KeyError, OSError, ValueError):
+            return None
+        if len(index.offsets) != len(index.centroids) + 1 or int(index.offsets[-1]) != len(index.keys):
+            return None
+        return index
+
+    def _remove_unreferenced(self, project_dir: Path, manifest: dict[str, object]) -> None:
+        referenced = {manifest.get("base"), manifest.get("delta")}
+        for entry in project_dir.iterdir():
+            if entry.is_dir() and entry.name not in referenced and not entry.name.endswith(_TMP_SUFFIX):
+                _remove(entry)
+
+
+def _manifest_signature(project_dir: Path) -> tuple[int, int, int] | None:
+    # The manifest is always replaced by a rename, so its inode changes with every commit.
+    try:
+        stat = os.stat(project_dir / _MANIFEST)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _fsync_dir(path: Path) -> None:
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:  # pragma: no cover - platforms without directory file descriptors
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _remove(path: Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        path.unlink(missing_ok=True)
@@ -0,0 +1,268 @@
+import asyncio
+import logging
+from dataclasses import replace
+from typing import Protocol
+from uuid import UUID
+
+import numpy as np
+
+from raggae.application.dto.retrieved_chunk_dto import RetrievedChunkDTO
+from raggae.application.interfaces.repositories.project_index_generation_repository import (
+    ProjectIndexGenerationRepository,
+)
+from raggae.application.interfaces.services.chunk_retrieval_service import ChunkRetrievalService
+from raggae.infrastructure.services.local_ann_index import (
+    LocalAnnIndex,
+    LocalAnnIndexStore,
+    keys_to_uuids,
+    uuids_to_keys,
+)
+from raggae.infrastructure.services.retrieval_fusion import fuse_scores, select_page
+from raggae.infrastructure.services.sqlalchemy_chunk_retrieval_service import _resolve_strategy
+
+logger = logging.getLogger(__name__)
+
+
+class LocalIndexSource(Protocol):
+    async def list_chunk_ids(self, project_id: UUID) -> list[UUID]: ...
+
+    async def load_embeddings(
+        self, project_id: UUID, chunk_ids: list[UUID] | None = None
+    ) -> tuple[list[UUID], np.ndarray]: ...
+
+    async def load_chunks(self, chunk_ids: list[UUID]) -> list[RetrievedChunkDTO]: ...
+
+    async def fulltext_candidates(
+        self, project_id: UUID, query_text: str, candidate_limit: int
+    ) -> list[RetrievedChunkDTO]: ...
+
+
+class LocalIndexChunkRetrievalService:
+    """Chunk retrieval on per-project IVF-flat indexes memory-mapped from local disk.
+
+    PostgreSQL stays the system of record. The vector channel searches a
+    :class:`LocalAnnIndex` probing ``nprobe`` inverted lists; the full-text
+    channel still reads ``content_tsv`` through ``source``. An index is tagged
+    with the project index generation it was built for. A newer generation
+    (bumped by ``DocumentIndexingService``, ``DeleteDocument`` and
+    ``ReindexProject`` after they write chunks) schedules a background
+    refresh, from the bump itself through :meth:`schedule_refresh` or from
+    the first query that sees it: the chunks added and removed since are
+    appended to the index, or the index is rebuilt from the database once
+    pending changes exceed ``rebuild_ratio`` of the project. Queries keep
+    searching the previous snapshot until the refreshed one is published; a
+    project without any snapshot yet is delegated to ``fallback``.
+
+    ``fusion`` mirrors :class:`SQLAlchemyChunkRetrievalService`. Queries with
+    metadata filters, or with an embedding of another dimension than the
+    index, are delegated to ``fallback`` too. Parent content and context
+    neighbors are not prefetched; the caller's repository fallback loads them.
+    """
+
+    def __init__(
+        self,
+        source: LocalIndexSource,
+        store: LocalAnnIndexStore,
+        project_index_generation_repository: ProjectIndexGenerationRepository,
+        fallback: ChunkRetrievalService,
+        vector_weight: float = 0.6,
+        fulltext_weight: float = 0.4,
+        candidate_multiplier: int = 5,
+        fusion: str = "weighted",
+        rrf_k: int = 60,
+        nprobe: int = 8,
+        rebuild_ratio: float = 0.2,
+    ) -> None:
+        self._source = source
+        self._store = store
+        self._project_index_generation_repository = project_index_generation_repository
+        self._fallback = fallback
+        self._vector_weight = vector_weight
+        self._fulltext_weight = fulltext_weight
+        self._candidate_multiplier = max(1, candidate_multiplier)
+        self._fusion = fusion
+        self._rrf_k = max(1, rrf_k)
+        self._nprobe = max(1, nprobe)
+        self._rebuild_ratio = rebuild_ratio
+        self._refresh_locks: dict[UUID, asyncio.Lock] = {}
+        self._refreshes: dict[UUID, asyncio.Task[None]] = {}
+        self._stale: set[UUID] = set()
+
+    async def retrieve_chunks(
+        self,
+        project_id: UUID,
+        query_text: str,
+        query_embedding: list[float],
+        limit: int,
+        offset: int = 0,
+        min_score: float = 0.0,
+        strategy: str = "hybrid",
+        metadata_filters: dict[str, object] | None = None,
+        hnsw_ef_search: int | None = None,
+        hnsw_iterative_scan: str | None = None,
+        context_window_size: int = 0,
+    ) -> list[RetrievedChunkDTO]:
+        if limit <= 0:
+            return []
+        candidate_limit = limit * self._candidate_multiplier
+        resolved_strategy = _resolve_strategy(strategy, query_text)
+        vector_weight, fulltext_weight = self._weights_for_strategy(resolved_strategy)
+        index: LocalAnnIndex | None = None
+        if vector_weight > 0 and not metadata_filters:
+            index = await self.current_index(project_id)
+        if metadata_filters or (vector_weight > 0 and not _is_searchable(index, len(query_embedding))):
+            return await self._fallback.retrieve_chunks(
+                project_id=project_id,
+                query_text=query_text,
+                query_embedding=query_embedding,
+                limit=limit,
+                offset=offset,
+                min_score=min_score,
+                strategy=strategy,
+                metadata_filters=metadata_filters,
+                hnsw_ef_search=hnsw_ef_search,
+                hnsw_iterative_scan=hnsw_iterative_scan,
+                context_window_size=context_window_size,
+            )
+
+        vector_scores: dict[UUID, float] = {}
+        if index is not None:
+            keys, scores = index.search(query_embedding, candidate_limit, self._nprobe)
+            vector_scores = dict(zip(keys_to_uuids(keys), scores.tolist(), strict=True))
+
+        fulltext_chunks: dict[UUID, RetrievedChunkDTO] = {}
+        if fulltext_weight > 0:
+            for chunk in await self._source.fulltext_candidates(project_id, query_text, candidate_limit):
+                fulltext_chunks[chunk.chunk_id] = chunk
+        fulltext_scores = {
+            chunk_id: chunk.fulltext_score or 0.0 for chunk_id, chunk in fulltext_chunks.items()
+        }
+
+        fused = fuse_scores(
+            self._fusion, vector_scores, fulltext_scores, vector_weight, fulltext_weight, self._rrf_k
+        )
+        page = select_page(fused, min_score=min_score, limit=limit, offset=offset)
+
+        missing = [chunk_id for chunk_id, *_ in page if chunk_id not in fulltext_chunks]
+        chunks = {chunk.chunk_id: chunk for chunk in await self._source.load_chunks(missing)}
+        chunks.update(fulltext_chunks)
+        # Chunks deleted since the index was refreshed are dropped here.
+        return [
+            replace(chunks[chunk_id], score=score, vector_score=vector_score, fulltext_score=fulltext_score)
+            for chunk_id, score, vector_score, fulltext_score in page
+            if chunk_id in chunks
+        ]
+
+    async def current_index(self, project_id: UUID) -> LocalAnnIndex | None:
+        """Return the published project index, scheduling a refresh when it is behind.
+
+        Never waits for a refresh: a stale snapshot is returned as is, and
+        ``None`` until the first snapshot of the project is published.
+        """
+        generation = await self._project_index_generation_repository.get_generation(project_id)
+        index = self._store.load(project_id)
+        if (index is None or index.generation != generation) and project_id not in self._refreshes:
+            self.schedule_refresh(project_id)
+        return index
+
+    def schedule_refresh(self, project_id: UUID) -> asyncio.Task[None]:
+        """Refresh the project index in the background; a no-op when one is already running.
+
+        Called after the project index generation is bumped. A bump during a
+        running refresh makes that refresh run once more when it finishes.
+        """
+        task = self._refreshes.get(project_id)
+        if task is not None:
+            self._stale.add(project_id)
+            return task
+        task = asyncio.create_task(self._refresh_in_background(project_id))
+        self._refreshes[project_id] = task
+        return task
+
+    async def refresh(self, project_id: UUID) -> LocalAnnIndex:
+        """Bring the project index to the current project index generation and publish it."""
+        async with self._refresh_locks.setdefault(project_id, asyncio.Lock()):
+            generation = await self._project_index_generation_repository.get_generation(project_id)
+            index = await asyncio.to_thread(self._store.load, project_id)
+            if index is not None and index.generation == generation:
+                return index
+            if index is not None:
+                appended = await self._append_changes(project_id, index, generation)
+                if appended is not None:
+                    return appended
+            ids, vectors = await self._source.load_embeddings(project_id)
+            return await asyncio.to_thread(
+                self._store.build, project_id, generation, uuids_to_keys(ids), vectors
+            )
+
+    async def _refresh_in_background(self, project_id: UUID) -> None:
+        try:
+            while True:
+                self._stale.discard(project_id)
+                await self.refresh(project_id)
+                if project_id not in self._stale:
+                    return
+        except Exception:
+            logger.exception(
+                "local_index_refresh_failed",
+                extra={"event": "local_index_refresh_failed", "project_id": str(project_id)},
+            )
+        finally:
+            self._stale.discard(project_id)
+            self._refreshes.pop(project_id, None)
+
+    async def _append_changes(
+        self, project_id: UUID, index: LocalAnnIndex, generation: int
+    ) -> LocalAnnIndex | None:
+        """Append chunks added / removed since ``index``; None when a full rebuild is due."""
+        database_keys = uuids_to_keys(await self._source.list_chunk_ids(project_id))
+        live_keys = index.live_keys()
+        added_keys = np.setdiff1d(database_keys, live_keys)
+        deleted_keys = np.setdiff1d(live_keys, database_keys)
+        pending = index.delta_count + len(added_keys) + len(deleted_keys)
+        if pending > self._rebuild_ratio * max(len(database_keys), 1):
+            return None
+        ids, vectors = await self._source.load_embeddings(project_id, keys_to_uuids(added_keys))
+        if ids and vectors.shape[1] != index.dimension:
+            return None
+        try:
+            return await asyncio.to_thread(
+                self._store.append, project_id, index, generation, uuids_to_keys(ids), vectors, deleted_keys
+            )
+        except FileNotFoundError:
+            return None
+
+    def _weights_for_strategy(self, strategy: str) -> tuple[float, float]:
+        if strategy == "vector":
+            return 1.0, 0.0
+        if strategy == "fulltext":
+            return 0.0, 1.0
+        return self._vector_weight, self._fulltext_weight
+
+
+class RefreshingProjectIndexGenerationRepository:
+    """Bumps the project index generation, then schedules the local index refresh.
+
+    Wraps the repository handed to the writers of chunks, so that a project
+    index is refreshed as soon as its chunks change rather than by the next query.
+    """
+
+    def __init__(
+        self,
+        inner: ProjectIndexGenerationRepository,
+        retrieval_service: LocalIndexChunkRetrievalService,
+    ) -> None:
+        self._inner = inner
+        self._retrieval_service = retrieval_service
+
+    async def get_generation(self, project_id: UUID) -> int:
+        return await self._inner.get_generation(project_id)
+
+    async def bump(self, project_id: UUID) -> int:
+        generation = await self._inner.bump(project_id)
+        self._retrieval_service.schedule_refresh(project_id)
+        return generation
+
+
+def _is_searchable(index: LocalAnnIndex | None, dimension: int) -> bool:
+    return index is not None and (not index.live_count or index.dimension == dimension)
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from collections.abc import Callable
 from io import BytesIO
@@ -16,7 +17,11 @@ logger = logging.getLogger(__name__)
 
 
 class MultiFormatDocumentTextExtractor:
-    """Extract text from txt/md/pdf/docx/pptx/csv/xlsx/xls files with basic normalization."""
+    """Extract text from txt/md/pdf/docx/pptx/csv/xlsx/xls files with basic normalization.
+
+    PDF, DOCX and PPTX parsing runs in a worker thread so that documents
+    indexed concurrently do not stall the event loop.
+    """
 
     def __init__(self, pdf_table_extractor: "PdfTableExtractor | None" = None) -> None:
         from raggae.infrastructure.services.pdf_table_extractor import PdfTableExtractor as _PTE
@@ -31,13 +36,13 @@ class MultiFormatDocumentTextExtractor:
         if extension in {"txt", "md"}:
             text = self._decode_text(content)
         elif extension == "pdf":
-            text = self._extract_pdf(content)
+            text = await asyncio.to_thread(self._extract_pdf, content)
         elif extension == "docx":
-            text = self._extract_docx(content)
+            text = await asyncio.to_thread(self._extract_docx, content)
         elif extension == "doc":
             raise DocumentExtractionError("DOC extraction is not supported in sync mode yet. Use DOCX.")
         elif extension == "pptx":
-            text = self._extract_pptx(content)
+            text = await asyncio.to_thread(self._extract_pptx, content)
         elif extension == "ppt":
             raise DocumentExtractionError(
                 "PPT (legacy binary format) is not supported. Convert to PPTX first."
@@ -1,3 +1,5 @@
+import asyncio
+
 import httpx
 
 from raggae.domain.exceptions.document_exceptions import EmbeddingGenerationError
@@ -5,10 +7,19 @@ from raggae.domain.exceptions.document_exceptions import EmbeddingGenerationErro
 # Conservative default: nomic-embed-text has 8192 token context.
 # Dense French text can use ~2.5 tokens/char, so 2500 chars is safe.
 _DEFAULT_MAX_CHARS = 2500
+_DEFAULT_BATCH_SIZE = 32
+_DEFAULT_MAX_CONCURRENCY = 4
 
 
 class OllamaEmbeddingService:
-    """Embedding service implementation backed by Ollama HTTP API."""
+    """Embedding service implementation backed by Ollama HTTP API.
+
+    Texts are truncated to ``max_chars_per_text`` and sent ``batch_size`` at a
+    time as the list ``input`` of ``/api/embed``; at most ``max_concurrency``
+    batches are in flight across all concurrent calls on the instance, which
+    the provider client pool shares between callers. Embeddings are returned
+    in input order.
+    """
 
     def __init__(
         self,
@@ -16,37 +27,52 @@ class OllamaEmbeddingService:
         model: str,
         max_chars_per_text: int = _DEFAULT_MAX_CHARS,
         expected_dimension: int | None = None,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
     ) -> None:
         self._base_url = base_url.rstrip("/")
         self._model = model
         self._max_chars = max_chars_per_text
         self._expected_dimension = expected_dimension
+        self._batch_size = max(1, batch_size)
+        self._max_concurrency = max(1, max_concurrency)
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
         self._client = httpx.AsyncClient(timeout=120.0)
 
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
     async def embed_texts(self, texts: list[str]) -> list[list[float]]:
         if not texts:
             return []
-        results: list[list[float]] = []
-        for text in texts:
-            embedding = await self._embed_single(text)
-            results.append(embedding)
-        return results
-
-    async def _embed_single(self, text: str) -> list[float]:
-        truncated = text[: self._max_chars] if len(text) > self._max_chars else text
+        truncated = [text[: self._max_chars] for text in texts]
+        batches = [
+            truncated[start : start + self._batch_size]
+            for start in range(0, len(truncated), self._batch_size)
+        ]
+
+        async def embed(batch: list[str]) -> list[list[float]]:
+            async with self._semaphore:
+                return await self._embed_batch(batch)
+
+        results = await asyncio.gather(*(embed(batch) for batch in batches))
+        return [embedding for batch_embeddings in results for embedding in batch_embeddings]
+
+    async def _embed_batch(self, texts: list[str]) -> list[list[float]]:
         try:
             response = await self._client.post(
                 f"{self._base_url}/api/embed",
-                json={"model": self._model, "input": truncated},
+                json={"model": self._model, "input": texts},
             )
             response.raise_for_status()
             payload = response.json()
-            embedding = list(payload["embeddings"][0])
-            if self._expected_dimension is not None and len(embedding) != self._expected_dimension:
+            embeddings = [list(embedding) for embedding in payload["embeddings"]]
+            if len(embeddings) != len(texts):
                 raise EmbeddingGenerationError(
-                    f"Invalid embedding dimension: expected {self._expected_dimension}, got {len(embedding)}"
+                    f"Ollama embed returned {len(embeddings)} embeddings for {len(texts)} texts"
                 )
-            return embedding
+            self._validate_dimensions(embeddings)
+            return embeddings
         except httpx.HTTPStatusError as exc:
             body = exc.response.text if exc.response is not None else ""
             raise EmbeddingGenerationError(
@@ -56,3 +82,12 @@ class OllamaEmbeddingService:
             raise
         except Exception as exc:
             raise EmbeddingGenerationError(f"Failed to generate embeddings: {exc}") from exc
+
+    def _validate_dimensions(self, embeddings: list[list[float]]) -> None:
+        if self._expected_dimension is None:
+            return
+        for embedding in embeddings:
+            if len(embedding) != self._expected_dimension:
+                raise EmbeddingGenerationError(
+                    f"Invalid embedding dimension: expected {self._expected_dimension}, got {len(embedding)}"
+                )
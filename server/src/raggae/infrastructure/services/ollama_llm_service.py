@@ -25,6 +25,9 @@ class OllamaLLMService:
         self._keep_alive = keep_alive
         self._client = httpx.AsyncClient(timeout=timeout_seconds)
 
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
     async def generate_answer(self, prompt: str) -> str:
         started_at = perf_counter()
         logger.info(
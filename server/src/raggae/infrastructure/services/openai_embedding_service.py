@@ -1,31 +1,150 @@
-from openai import AsyncOpenAI
+import asyncio
+import logging
+from time import monotonic, perf_counter
 
+from openai import APIConnectionError, APIStatusError, AsyncOpenAI
+
+from raggae.application.services.retry_backoff import backoff_delay
 from raggae.domain.exceptions.document_exceptions import EmbeddingGenerationError
+from raggae.infrastructure.services.retry_backoff import parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+# Provider limits of one embeddings request.
+_MAX_INPUTS_PER_REQUEST = 2048
+_MAX_TOKENS_PER_REQUEST = 300_000
 
 
 class OpenAIEmbeddingService:
-    """Embedding service implementation backed by OpenAI."""
+    """Embedding service implementation backed by OpenAI.
+
+    Texts are split into requests of at most ``batch_size`` inputs and
+    ``max_batch_tokens`` estimated tokens (UTF-8 bytes / 3, an overestimate
+    for cl100k-style tokenizers), sent ``max_concurrency`` at a time across
+    all concurrent calls on the instance and reassembled in input order. Rate limits (429), 5xx responses and
+    connection errors are retried with exponential backoff; a rate limit also
+    pauses every other batch of the call until its delay has passed, so
+    concurrent batches back off together instead of hammering the quota.
 
-    def __init__(self, api_key: str, model: str, expected_dimension: int | None = None) -> None:
-        self._client = AsyncOpenAI(api_key=api_key)
+    Each request is logged with its size, latency and token usage, and summed
+    into ``requests``, ``retries``, ``prompt_tokens`` and ``request_seconds``.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        expected_dimension: int | None = None,
+        batch_size: int = 512,
+        max_batch_tokens: int = 250_000,
+        max_concurrency: int = 4,
+        max_retries: int = 5,
+        retry_base_delay_seconds: float = 1.0,
+        retry_max_delay_seconds: float = 60.0,
+    ) -> None:
+        # Retries are handled here, across the batches of a call.
+        self._client = AsyncOpenAI(api_key=api_key, max_retries=0)
         self._model = model
         self._expected_dimension = expected_dimension
+        self._batch_size = min(max(1, batch_size), _MAX_INPUTS_PER_REQUEST)
+        self._max_batch_tokens = min(max(1, max_batch_tokens), _MAX_TOKENS_PER_REQUEST)
+        self._max_concurrency = max(1, max_concurrency)
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        self._max_retries = max(0, max_retries)
+        self._retry_base_delay = retry_base_delay_seconds
+        self._retry_max_delay = retry_max_delay_seconds
+        self._throttled_until = 0.0
+        self.requests = 0
+        self.retries = 0
+        self.prompt_tokens = 0
+        self.request_seconds = 0.0
+
+    async def aclose(self) -> None:
+        await self._client.close()
 
     async def embed_texts(self, texts: list[str]) -> list[list[float]]:
         if not texts:
             return []
-        try:
-            response = await self._client.embeddings.create(
-                model=self._model,
-                input=texts,
+
+        async def embed(batch: list[str]) -> list[list[float]]:
+            async with self._semaphore:
+                return await self._embed_batch(batch)
+
+        results = await asyncio.gather(*(embed(batch) for batch in self._split_batches(texts)))
+        return [embedding for batch_embeddings in results for embedding in batch_embeddings]
+
+    def _split_batches(self, texts: list[str]) -> list[list[str]]:
+        batches: list[list[str]] = []
+        batch: list[str] = []
+        batch_tokens = 0
+        for text in texts:
+            tokens = _estimate_tokens(text)
+            if batch and (len(batch) >= self._batch_size or batch_tokens + tokens > self._max_batch_tokens):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += tokens
+        batches.append(batch)
+        return batches
+
+    async def _embed_batch(self, texts: list[str]) -> list[list[float]]:
+        attempt = 0
+        while True:
+            await self._wait_for_throttle()
+            start = perf_counter()
+            try:
+                response = await self._client.embeddings.create(model=self._model, input=texts)
+            except (APIStatusError, APIConnectionError) as exc:
+                status_code = exc.status_code if isinstance(exc, APIStatusError) else None
+                retryable = status_code is None or status_code == 429 or status_code >= 500
+                if retryable and attempt < self._max_retries:
+                    retry_after = (
+                        parse_retry_after(exc.response.headers.get("retry-after"))
+                        if isinstance(exc, APIStatusError)
+                        else None
+                    )
+                    delay = backoff_delay(attempt, self._retry_base_delay, self._retry_max_delay, retry_after)
+                    if status_code == 429:
+                        self._throttled_until = max(self._throttled_until, monotonic() + delay)
+                    logger.warning(
+                        "OpenAI embedding request failed (status=%s, batch_size=%s), retrying in %.2fs",
+                        status_code,
+                        len(texts),
+                        delay,
+                    )
+                    self.retries += 1
+                    attempt += 1
+                    await asyncio.sleep(delay)
+                    continue
+                raise EmbeddingGenerationError(f"Failed to generate embeddings: {exc}") from exc
+            except Exception as exc:  # pragma: no cover - provider dependent
+                raise EmbeddingGenerationError(f"Failed to generate embeddings: {exc}") from exc
+
+            elapsed = perf_counter() - start
+            usage = getattr(response, "usage", None)
+            prompt_tokens = int(getattr(usage, "prompt_tokens", 0) or 0)
+            self.requests += 1
+            self.prompt_tokens += prompt_tokens
+            self.request_seconds += elapsed
+            logger.info(
+                "OpenAI embedding batch (model=%s, batch_size=%s, prompt_tokens=%s, latency_ms=%.1f)",
+                self._model,
+                len(texts),
+                prompt_tokens,
+                elapsed * 1000,
             )
             embeddings = [item.embedding for item in response.data]
+            if len(embeddings) != len(texts):
+                raise EmbeddingGenerationError(
+                    f"OpenAI returned {len(embeddings)} embeddings for {len(texts)} texts"
+                )
             self._validate_dimensions(embeddings)
             return embeddings
-        except EmbeddingGenerationError:
-            raise
-        except Exception as exc:  # pragma: no cover - provider dependent
-            raise EmbeddingGenerationError(f"Failed to generate embeddings: {exc}") from exc
+
+    async def _wait_for_throttle(self) -> None:
+        delay = self._throttled_until - monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
 
     def _validate_dimensions(self, embeddings: list[list[float]]) -> None:
         if self._expected_dimension is None:
@@ -35,3 +154,7 @@ class OpenAIEmbeddingService:
                 raise EmbeddingGenerationError(
                     f"Invalid embedding dimension: expected {self._expected_dimension}, got {len(embedding)}"
                 )
+
+
+def _estimate_tokens(text: str) -> int:
+    return len(text.encode("utf-8")) // 3 + 1
@@ -29,6 +29,9 @@ class OpenAILLMService:
         self._client = AsyncOpenAI(api_key=api_key)
         self._model = model
 
+    async def aclose(self) -> None:
+        await self._client.close()
+
     async def generate_answer(self, prompt: str) -> str:
         started_at = perf_counter()
         logger.info(
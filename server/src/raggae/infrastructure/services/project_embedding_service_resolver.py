@@ -1,8 +1,14 @@
+from collections.abc import AsyncIterator
+from contextlib import AbstractContextManager, asynccontextmanager, nullcontext
+
+from raggae.application.interfaces.services.embedding_cache import EmbeddingCache
 from raggae.application.interfaces.services.embedding_service import EmbeddingService
 from raggae.application.interfaces.services.provider_api_key_crypto_service import (
     ProviderApiKeyCryptoService,
 )
+from raggae.infrastructure.cache.embedding_cache_key import embedding_cache_namespace
 from raggae.infrastructure.config.settings import Settings
+from raggae.infrastructure.services.caching_embedding_service import CachingEmbeddingService
 from raggae.infrastructure.services.contextual_embedding_service import (
     ContextualEmbeddingService,
 )
@@ -10,20 +16,35 @@ from raggae.infrastructure.services.gemini_embedding_service import GeminiEmbedd
 from raggae.infrastructure.services.in_memory_embedding_service import InMemoryEmbeddingService
 from raggae.infrastructure.services.ollama_embedding_service import OllamaEmbeddingService
 from raggae.infrastructure.services.openai_embedding_service import OpenAIEmbeddingService
+from raggae.infrastructure.services.provider_client_pool import ProviderClientPool
 
 
 class ProjectEmbeddingServiceResolver:
-    """Resolve embedding service from resolved config with global fallback."""
+    """Resolve embedding service from resolved config with global fallback.
+
+    When an ``embedding_cache`` is given, provider-backed services are wrapped
+    in a :class:`CachingEmbeddingService` scoped to their backend, model,
+    dimension and document prefix, so unchanged texts are never re-embedded.
+    :meth:`resolve_query_service` leaves that cache out: queries have their
+    own cache and should not fill the document embedding table.
+    Provider services come from ``client_pool`` so their HTTP clients are
+    reused across resolutions; :meth:`lease` keeps the pooled client open for
+    callers that hold the service for a long time.
+    """
 
     def __init__(
         self,
         settings: Settings,
         provider_api_key_crypto_service: ProviderApiKeyCryptoService,
         default_embedding_service: EmbeddingService | None = None,
+        embedding_cache: EmbeddingCache | None = None,
+        client_pool: ProviderClientPool | None = None,
     ) -> None:
         self._settings = settings
         self._provider_api_key_crypto_service = provider_api_key_crypto_service
         self._default_embedding_service = default_embedding_service
+        self._embedding_cache = embedding_cache
+        self._client_pool = client_pool if client_pool is not None else ProviderClientPool()
 
     def resolve(
         self,
@@ -31,17 +52,66 @@ class ProjectEmbeddingServiceResolver:
         model: str | None,
         encrypted_api_key: str | None,
     ) -> EmbeddingService:
+        service, _ = self._resolve(backend, model, encrypted_api_key)
+        return service
+
+    def resolve_query_service(
+        self,
+        backend: str | None,
+        model: str | None,
+        encrypted_api_key: str | None,
+    ) -> EmbeddingService:
+        service, _ = self._resolve(backend, model, encrypted_api_key, document_cache=False)
+        return service
+
+    @asynccontextmanager
+    async def lease(
+        self,
+        backend: str | None,
+        model: str | None,
+        encrypted_api_key: str | None,
+    ) -> AsyncIterator[EmbeddingService]:
+        """Resolve the service and keep its pooled client open until the block exits."""
+        service, pooled = self._resolve(backend, model, encrypted_api_key)
+        hold: AbstractContextManager[None] = (
+            self._client_pool.leased(pooled) if pooled is not None else nullcontext()
+        )
+        with hold:
+            yield service
+
+    def _resolve(
+        self,
+        backend: str | None,
+        model: str | None,
+        encrypted_api_key: str | None,
+        document_cache: bool = True,
+    ) -> tuple[EmbeddingService, object | None]:
+        """The effective service and the pooled provider service it wraps, if any."""
         effective_backend = backend or self._settings.default_embedding_provider
+        cache = self._embedding_cache if document_cache else None
 
         if effective_backend == "openai":
             api_key = self._resolve_api_key(
                 encrypted_api_key, self._resolve_default_api_key(effective_backend)
             )
             effective_model = model or self._resolve_default_model(effective_backend)
-            return OpenAIEmbeddingService(
-                api_key=api_key,
-                model=effective_model,
-                expected_dimension=self._settings.embedding_dimension,
+            openai_service = self._client_pool.get(
+                "embedding",
+                effective_backend,
+                effective_model,
+                api_key,
+                lambda: OpenAIEmbeddingService(
+                    api_key=api_key,
+                    model=effective_model,
+                    expected_dimension=self._settings.embedding_dimension,
+                    batch_size=self._settings.openai_embedding_batch_size,
+                    max_batch_tokens=self._settings.openai_embedding_max_batch_tokens,
+                    max_concurrency=self._settings.openai_embedding_max_concurrency,
+                ),
+            )
+            return (
+                self._with_cache(openai_service, cache, effective_backend, effective_model, prefix=""),
+                openai_service,
             )
 
         if effective_backend == "gemini":
@@ -49,31 +119,77 @@ class ProjectEmbeddingServiceResolver:
                 encrypted_api_key, self._resolve_default_api_key(effective_backend)
             )
             effective_model = model or self._resolve_default_model(effective_backend)
-            return GeminiEmbeddingService(
-                api_key=api_key,
-                model=effective_model,
-                expected_dimension=self._settings.embedding_dimension,
+            gemini_service = self._client_pool.get(
+                "embedding",
+                effective_backend,
+                effective_model,
+                api_key,
+                lambda: GeminiEmbeddingService(
+                    api_key=api_key,
+                    model=effective_model,
+                    expected_dimension=self._settings.embedding_dimension,
+                    batch_size=self._settings.gemini_embedding_batch_size,
+                    max_concurrency=self._settings.gemini_embedding_max_concurrency,
+                ),
+            )
+            return (
+                self._with_cache(gemini_service, cache, effective_backend, effective_model, prefix=""),
+                gemini_service,
             )
 
         if effective_backend == "ollama":
             effective_model = model or self._resolve_default_model(effective_backend)
-            ollama_service = OllamaEmbeddingService(
-                base_url=self._settings.ollama_base_url,
-                model=effective_model,
-                expected_dimension=self._settings.embedding_dimension,
+            ollama_service = self._client_pool.get(
+                "embedding",
+                effective_backend,
+                effective_model,
+                "",
+                lambda: OllamaEmbeddingService(
+                    base_url=self._settings.ollama_base_url,
+                    model=effective_model,
+                    expected_dimension=self._settings.embedding_dimension,
+                    batch_size=self._settings.ollama_embedding_batch_size,
+                    max_concurrency=self._settings.ollama_embedding_max_concurrency,
+                ),
+            )
+            contextual_service = ContextualEmbeddingService(delegate=ollama_service)
+            return (
+                self._with_cache(
+                    contextual_service,
+                    cache,
+                    effective_backend,
+                    effective_model,
+                    prefix=contextual_service.document_prefix,
+                ),
+                ollama_service,
             )
-            return ContextualEmbeddingService(delegate=ollama_service)
 
         return (
             self._default_embedding_service
             if self._default_embedding_service is not None
             else InMemoryEmbeddingService(dimension=self._settings.embedding_dimension)
+        ), None
+
+    def _with_cache(
+        self,
+        embedding_service: EmbeddingService,
+        cache: EmbeddingCache | None,
+        backend: str,
+        model: str,
+        prefix: str,
+    ) -> EmbeddingService:
+        if cache is None:
+            return embedding_service
+        return CachingEmbeddingService(
+            delegate=embedding_service,
+            cache=cache,
+            namespace=embedding_cache_namespace(backend, model, self._settings.embedding_dimension, prefix),
         )
 
     def _resolve_api_key(self, encrypted_api_key: str | None, fallback_api_key: str) -> str:
         if encrypted_api_key is None or encrypted_api_key.strip() == "":
             return fallback_api_key
-        return self._provider_api_key_crypto_service.decrypt(encrypted_api_key)
+        return self._client_pool.decrypt(encrypted_api_key, self._provider_api_key_crypto_service.decrypt)
 
     def _resolve_default_api_key(self, backend: str) -> str:
         if backend == self._settings.default_embedding_provider:
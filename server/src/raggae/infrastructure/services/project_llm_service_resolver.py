@@ -8,20 +8,27 @@ from raggae.infrastructure.services.gemini_llm_service import GeminiLLMService
 from raggae.infrastructure.services.in_memory_llm_service import InMemoryLLMService
 from raggae.infrastructure.services.ollama_llm_service import OllamaLLMService
 from raggae.infrastructure.services.openai_llm_service import OpenAILLMService
+from raggae.infrastructure.services.provider_client_pool import ProviderClientPool
 
 
 class ProjectLLMServiceResolver:
-    """Resolve LLM service from resolved config with global fallback."""
+    """Resolve LLM service from resolved config with global fallback.
+
+    Provider services come from ``client_pool`` so their HTTP clients are
+    reused across resolutions.
+    """
 
     def __init__(
         self,
         settings: Settings,
         provider_api_key_crypto_service: ProviderApiKeyCryptoService,
         default_llm_service: LLMService | None = None,
+        client_pool: ProviderClientPool | None = None,
     ) -> None:
         self._settings = settings
         self._provider_api_key_crypto_service = provider_api_key_crypto_service
         self._default_llm_service = default_llm_service
+        self._client_pool = client_pool if client_pool is not None else ProviderClientPool()
 
     def resolve(
         self,
@@ -36,29 +43,53 @@ class ProjectLLMServiceResolver:
                 encrypted_api_key, self._resolve_default_api_key(effective_backend)
             )
             effective_model = model or self._resolve_default_model(effective_backend)
-            return OpenAILLMService(api_key=api_key, model=effective_model)
+            return self._client_pool.get(
+                "llm",
+                effective_backend,
+                effective_model,
+                api_key,
+                lambda: OpenAILLMService(api_key=api_key, model=effective_model),
+            )
 
         if effective_backend == "gemini":
             api_key = self._resolve_api_key(
                 encrypted_api_key, self._resolve_default_api_key(effective_backend)
             )
             effective_model = model or self._resolve_default_model(effective_backend)
-            return GeminiLLMService(api_key=api_key, model=effective_model)
+            return self._client_pool.get(
+                "llm",
+                effective_backend,
+                effective_model,
+                api_key,
+                lambda: GeminiLLMService(api_key=api_key, model=effective_model),
+            )
 
         if effective_backend == "anthropic":
             api_key = self._resolve_api_key(
                 encrypted_api_key, self._resolve_default_api_key(effective_backend)
             )
             effective_model = model or self._resolve_default_model(effective_backend)
-            return AnthropicLLMService(api_key=api_key, model=effective_model)
+            return self._client_pool.get(
+                "llm",
+                effective_backend,
+                effective_model,
+                api_key,
+                lambda: AnthropicLLMService(api_key=api_key, model=effective_model),
+            )
 
         if effective_backend == "ollama":
             effective_model = model or self._resolve_default_model(effective_backend)
-            return OllamaLLMService(
-                base_url=self._settings.ollama_base_url,
-                model=effective_model,
-                timeout_seconds=self._settings.llm_request_timeout_seconds,
-                keep_alive=self._settings.ollama_keep_alive,
+            return self._client_pool.get(
+                "llm",
+                effective_backend,
+                effective_model,
+                "",
+                lambda: OllamaLLMService(
+                    base_url=self._settings.ollama_base_url,
+                    model=effective_model,
+                    timeout_seconds=self._settings.llm_request_timeout_seconds,
+                    keep_alive=self._settings.ollama_keep_alive,
+                ),
             )
 
         return self._default_llm_service if self._default_llm_service is not None else InMemoryLLMService()
@@ -66,7 +97,7 @@ class ProjectLLMServiceResolver:
     def _resolve_api_key(self, encrypted_api_key: str | None, fallback_api_key: str) -> str:
         if encrypted_api_key is None or encrypted_api_key.strip() == "":
             return fallback_api_key
-        return self._provider_api_key_crypto_service.decrypt(encrypted_api_key)
+        return self._client_pool.decrypt(encrypted_api_key, self._provider_api_key_crypto_service.decrypt)
 
     def _resolve_default_api_key(self, backend: str) -> str:
         if backend == self._settings.default_llm_provider:
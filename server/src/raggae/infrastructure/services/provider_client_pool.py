@@ -0,0 +1,151 @@
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any, TypeVar, cast
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ProviderClientPool:
+    """Bounded LRU of provider-backed services, reused across resolutions.
+
+    Services are keyed by (kind, backend, model, sha256 of the API key), so a
+    chat turn or an upload reuses the HTTP client (and its open TLS
+    connections) built for the same credentials instead of creating one per
+    call. Evicted services are closed through their ``aclose`` coroutine after
+    ``close_delay_seconds``, leaving requests already using them time to
+    finish. A caller holding a service longer than that (a project reindex)
+    takes a :meth:`leased` hold on it: an evicted service is only closed once
+    its last lease is released. Decrypted API keys are memoized by their ciphertext so the Fernet
+    decryption runs once per stored credential.
+
+    ``hits``, ``misses``, ``evictions`` and ``closed`` count pool activity;
+    :meth:`stats` returns them with the current ``size``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 64,
+        close_delay_seconds: float = 300.0,
+        max_decrypted_keys: int = 256,
+    ) -> None:
+        self._max_entries = max(1, max_entries)
+        self._close_delay_seconds = close_delay_seconds
+        self._max_decrypted_keys = max(1, max_decrypted_keys)
+        self._services: OrderedDict[tuple[str, str, str, str], object] = OrderedDict()
+        self._decrypted_keys: OrderedDict[str, str] = OrderedDict()
+        self._closing: dict[asyncio.Task[None], object] = {}
+        # id(service) -> (service, lease count); evicted services whose delayed
+        # close came while leased wait in ``_retired`` for their last release.
+        self._leases: dict[int, tuple[object, int]] = {}
+        self._retired: dict[int, object] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.closed = 0
+
+    @property
+    def size(self) -> int:
+        return len(self._services)
+
+    def get(self, kind: str, backend: str, model: str, api_key: str, factory: Callable[[], T]) -> T:
+        key = (kind, backend, model, hashlib.sha256(api_key.encode("utf-8")).hexdigest())
+        service = self._services.get(key)
+        if service is not None:
+            self._services.move_to_end(key)
+            self.hits += 1
+            return cast(T, service)
+        self.misses += 1
+        created = factory()
+        self._services[key] = created
+        while len(self._services) > self._max_entries:
+            _, evicted = self._services.popitem(last=False)
+            self.evictions += 1
+            self._schedule_close(evicted, self._close_delay_seconds)
+        return created
+
+    @contextmanager
+    def leased(self, service: object) -> Iterator[None]:
+        """Keep ``service`` open, even if evicted, until the block exits."""
+        key = id(service)
+        _, count = self._leases.get(key, (service, 0))
+        self._leases[key] = (service, count + 1)
+        try:
+            yield
+        finally:
+            _, count = self._leases[key]
+            if count > 1:
+                self._leases[key] = (service, count - 1)
+            else:
+                del self._leases[key]
+                retired = self._retired.pop(key, None)
+                if retired is not None:
+                    self._schedule_close(retired, 0.0)
+
+    def decrypt(self, encrypted_api_key: str, decrypt: Callable[[str], str]) -> str:
+        api_key = self._decrypted_keys.get(encrypted_api_key)
+        if api_key is not None:
+            self._decrypted_keys.move_to_end(encrypted_api_key)
+            return api_key
+        api_key = decrypt(encrypted_api_key)
+        self._decrypted_keys[encrypted_api_key] = api_key
+        while len(self._decrypted_keys) > self._max_decrypted_keys:
+            self._decrypted_keys.popitem(last=False)
+        return api_key
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "closed": self.closed,
+        }
+
+    async def aclose(self) -> None:
+        """Close every pooled service, including those waiting for their delayed close."""
+        services = list(self._services.values()) + list(self._retired.values())
+        self._services.clear()
+        self._retired.clear()
+        self._decrypted_keys.clear()
+        pending = list(self._closing.items())
+        for task, _ in pending:
+            task.cancel()
+        await asyncio.gather(*(task for task, _ in pending), return_exceptions=True)
+        services.extend(service for task, service in pending if task.cancelled())
+        for service in services:
+            await self._close(service)
+
+    def _schedule_close(self, service: object, delay: float) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Resolved outside of an event loop: nothing can await the close,
+            # the client is released when garbage collected.
+            return
+        task = loop.create_task(self._close_later(service, delay))
+        self._closing[task] = service
+        task.add_done_callback(lambda done: self._closing.pop(done, None))
+
+    async def _close_later(self, service: object, delay: float) -> None:
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if id(service) in self._leases:
+            self._retired[id(service)] = service
+            return
+        await self._close(service)
+
+    async def _close(self, service: object) -> None:
+        aclose: Any = getattr(service, "aclose", None)
+        if aclose is None:
+            return
+        try:
+            await aclose()
+            self.closed += 1
+        except Exception:  # pragma: no cover - provider dependent
+            logger.warning("Failed to close pooled provider client", exc_info=True)
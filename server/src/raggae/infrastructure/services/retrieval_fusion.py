@@ -0,0 +1,75 @@
+"""Vector / full-text score fusion for retrieval paths that merge channels in Python.
+
+Mirrors the ``weighted`` and ``rrf`` fusion SQL of
+:class:`SQLAlchemyChunkRetrievalService`. Channel scores are given as
+``{chunk_id: score}`` over the candidates of each channel.
+"""
+
+from uuid import UUID
+
+# (chunk_id, final_score, vector_score, fulltext_score)
+FusedScore = tuple[UUID, float, float, float]
+
+
+def fuse_scores(
+    fusion: str,
+    vector_scores: dict[UUID, float],
+    fulltext_scores: dict[UUID, float],
+    vector_weight: float,
+    fulltext_weight: float,
+    rrf_k: int,
+) -> list[FusedScore]:
+    if fusion == "rrf":
+        return rrf_fusion(vector_scores, fulltext_scores, vector_weight, fulltext_weight, rrf_k)
+    return weighted_fusion(vector_scores, fulltext_scores, vector_weight, fulltext_weight)
+
+
+def weighted_fusion(
+    vector_scores: dict[UUID, float],
+    fulltext_scores: dict[UUID, float],
+    vector_weight: float,
+    fulltext_weight: float,
+) -> list[FusedScore]:
+    """Divide each channel by its maximum over the candidates, then sum with the weights.
+
+    The reported channel scores are the normalized ones.
+    """
+    max_vector = max(vector_scores.values(), default=0.0)
+    max_fulltext = max(fulltext_scores.values(), default=0.0)
+    fused: list[FusedScore] = []
+    for chunk_id in vector_scores.keys() | fulltext_scores.keys():
+        vector_score = vector_scores.get(chunk_id, 0.0) / max_vector if max_vector else 0.0
+        fulltext_score = fulltext_scores.get(chunk_id, 0.0) / max_fulltext if max_fulltext else 0.0
+        score = vector_score * vector_weight + fulltext_score * fulltext_weight
+        fused.append((chunk_id, score, vector_score, fulltext_score))
+    return fused
+
+
+def rrf_fusion(
+    vector_scores: dict[UUID, float],
+    fulltext_scores: dict[UUID, float],
+    vector_weight: float,
+    fulltext_weight: float,
+    rrf_k: int,
+) -> list[FusedScore]:
+    """Reciprocal Rank Fusion scaled so that a chunk ranked first by every weighted channel scores 1.0.
+
+    Ties within a channel are ranked by chunk id; the raw channel scores are reported.
+    """
+    rrf_k = max(1, rrf_k)
+    fused: dict[UUID, float] = {}
+    for scores, weight in ((vector_scores, vector_weight), (fulltext_scores, fulltext_weight)):
+        ranking = sorted(scores, key=lambda chunk_id: (-scores[chunk_id], chunk_id))
+        for rank, chunk_id in enumerate(ranking, start=1):
+            fused[chunk_id] = fused.get(chunk_id, 0.0) + weight / (rrf_k + rank)
+    scale = (rrf_k + 1) / max(vector_weight + fulltext_weight, 1e-9)
+    return [
+        (chunk_id, score * scale, vector_scores.get(chunk_id, 0.0), fulltext_scores.get(chunk_id, 0.0))
+        for chunk_id, score in fused.items()
+    ]
+
+
+def select_page(fused: list[FusedScore], min_score: float, limit: int, offset: int) -> list[FusedScore]:
+    """Drop scores below ``min_score`` and return one page, best first (ties by chunk id)."""
+    kept = sorted((item for item in fused if item[1] >= min_score), key=lambda item: (-item[1], item[0]))
+    return kept[offset : offset + limit]
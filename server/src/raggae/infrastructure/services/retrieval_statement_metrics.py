@@ -0,0 +1,92 @@
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import Engine, TextClause, event, text
+from sqlalchemy.engine.interfaces import CacheStats
+
+_EXECUTION_OPTION = "retrieval_statement"
+_STARTED_AT = "retrieval_statement_started_at"
+_CURSOR_STARTED_AT = "retrieval_statement_cursor_started_at"
+
+
+def retrieval_statement(sql: str) -> TextClause:
+    """``text(sql)`` tagged so that :class:`RetrievalStatementMetrics` times its execution."""
+    return text(sql).execution_options(**{_EXECUTION_OPTION: True})
+
+
+class RetrievalStatementMetrics:
+    """Compile and execute timing of the retrieval statements run on an engine.
+
+    Statements are rendered on every call: SQLAlchemy caches the compilation
+    of a ``text()`` construct by its SQL string, and asyncpg prepares each SQL
+    text once per connection (``DATABASE_PREPARED_STATEMENT_CACHE_SIZE``), so
+    a variant of the retrieval statement is compiled and planned once either
+    way. Once :meth:`instrument` hooks the engine, the statements built by
+    :func:`retrieval_statement` report ``compiled_cache_hits`` /
+    ``compiled_cache_misses`` from SQLAlchemy's compiled cache,
+    ``compile_seconds`` (from the execute call until the driver cursor runs)
+    and ``execute_seconds`` (inside the driver cursor, which includes
+    asyncpg's prepare when its per-connection statement cache misses).
+    asyncpg does not report that cache's hits.
+    """
+
+    def __init__(self) -> None:
+        self.compiled_cache_hits = 0
+        self.compiled_cache_misses = 0
+        self.compile_seconds = 0.0
+        self.execute_seconds = 0.0
+
+    def instrument(self, engine: Engine) -> None:
+        """Time compilation and execution of retrieval statements on ``engine``."""
+        event.listen(engine, "before_execute", self._before_execute)
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "compiled_cache_hits": self.compiled_cache_hits,
+            "compiled_cache_misses": self.compiled_cache_misses,
+            "compile_seconds": round(self.compile_seconds, 6),
+            "execute_seconds": round(self.execute_seconds, 6),
+        }
+
+    def _before_execute(self, connection: Any, *_args: Any) -> None:
+        connection.info[_STARTED_AT] = perf_counter()
+
+    def _before_cursor_execute(
+        self,
+        connection: Any,
+        _cursor: Any,
+        _statement: str,
+        _parameters: Any,
+        context: Any,
+        _executemany: bool,
+    ) -> None:
+        started_at = connection.info.pop(_STARTED_AT, None)
+        if not _is_retrieval_statement(context):
+            return
+        now = perf_counter()
+        if started_at is not None:
+            self.compile_seconds += now - started_at
+        if context.cache_hit == CacheStats.CACHE_HIT:
+            self.compiled_cache_hits += 1
+        else:
+            self.compiled_cache_misses += 1
+        connection.info[_CURSOR_STARTED_AT] = now
+
+    def _after_cursor_execute(
+        self,
+        connection: Any,
+        _cursor: Any,
+        _statement: str,
+        _parameters: Any,
+        context: Any,
+        _executemany: bool,
+    ) -> None:
+        started_at = connection.info.pop(_CURSOR_STARTED_AT, None)
+        if started_at is not None and _is_retrieval_statement(context):
+            self.execute_seconds += perf_counter() - started_at
+
+
+def _is_retrieval_statement(context: Any) -> bool:
+    return context is not None and bool(context.execution_options.get(_EXECUTION_OPTION))
@@ -1,13 +1,67 @@
+import asyncio
+import json
+from collections.abc import Mapping
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import text
+from sqlalchemy import RowMapping, TextClause, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from raggae.application.constants import MAX_HNSW_EF_SEARCH
 from raggae.application.dto.retrieved_chunk_dto import RetrievedChunkDTO
+from raggae.infrastructure.database.pgvector_codec import to_pgvector
+from raggae.infrastructure.services.retrieval_fusion import fuse_scores, select_page
+from raggae.infrastructure.services.retrieval_statement_metrics import retrieval_statement
 
 
 class SQLAlchemyChunkRetrievalService:
-    """PostgreSQL chunk retrieval using hybrid vector and full-text scoring."""
+    """PostgreSQL chunk retrieval using hybrid vector and full-text scoring.
+
+    Full-text matching relies on the stored ``document_chunks.content_tsv``
+    column, so ``fulltext_language`` must be the text search configuration the
+    column was generated with (``RETRIEVAL_FULLTEXT_LANGUAGE``). Both channels
+    filter on the denormalized ``document_chunks.project_id``; ``documents`` is
+    only joined for the final page of results.
+
+    ``fusion`` selects how the two candidate lists are merged:
+
+    - ``"weighted"``: each channel score is divided by its maximum over the
+      candidates, then the normalized scores are summed with the strategy
+      weights.
+    - ``"rrf"``: Reciprocal Rank Fusion. ``weight / (rrf_k + rank)`` is summed
+      over channels and scaled so that a chunk ranked first by every weighted
+      channel scores 1.0. ``vector_score`` and ``fulltext_score`` then hold the
+      raw channel scores (cosine similarity and ``ts_rank_cd``).
+
+    ``vector_index`` must match the HNSW index built by the migrations
+    (``RETRIEVAL_VECTOR_INDEX``). With ``"halfvec"`` or ``"bit"`` the vector
+    channel walks the compact expression index for
+    ``candidate_limit * quantized_rescore_multiplier`` candidates and re-scores
+    them against the full-precision ``embedding`` column. Only the index
+    shrinks: the column keeps 4 bytes per dimension in the table, so disk
+    usage and cold re-scoring reads stay those of the ``"vector"`` mode.
+
+    The same statement also attaches the context of the returned page, so a
+    retrieval is a single round trip: ``parent_content`` for child chunks and,
+    when ``context_window_size`` is positive, ``context_neighbors`` (chunks of
+    the same document within that many indices, embeddings never loaded).
+
+    With ``channel_execution="concurrent"`` the vector and full-text candidate
+    queries run on two pooled connections with ``asyncio.gather`` and are fused
+    in Python (same scores as the SQL fusion); a third statement loads the
+    context of the page. Each retrieval then holds two connections at once.
+
+    With metadata filters, the vector channel first collects at most
+    ``filtered_exact_scan_threshold`` + 1 matching chunk ids through the
+    metadata expression indexes, in the same statement: when at most the
+    threshold match (0 disables the probe), it ranks exactly those rows;
+    otherwise it walks the HNSW index, which would have discarded most of
+    its candidates on a selective filter.
+
+    Statements are built with :func:`retrieval_statement`, so that an
+    instrumented :class:`RetrievalStatementMetrics` reports their compile /
+    execute time.
+    """
 
     def __init__(
         self,
@@ -16,12 +70,30 @@ class SQLAlchemyChunkRetrievalService:
         fulltext_weight: float = 0.4,
         candidate_multiplier: int = 5,
         fulltext_language: str = "french",
+        hnsw_ef_search: int = 40,
+        hnsw_iterative_scan: str = "relaxed_order",
+        hnsw_filtered_ef_search_multiplier: int = 2,
+        fusion: str = "weighted",
+        rrf_k: int = 60,
+        vector_index: str = "vector",
+        quantized_rescore_multiplier: int = 4,
+        channel_execution: str = "single_statement",
+        filtered_exact_scan_threshold: int = 2000,
     ) -> None:
         self._session_factory = session_factory
         self._vector_weight = vector_weight
         self._fulltext_weight = fulltext_weight
         self._candidate_multiplier = max(1, candidate_multiplier)
         self._fulltext_language = fulltext_language
+        self._hnsw_ef_search = hnsw_ef_search
+        self._hnsw_iterative_scan = hnsw_iterative_scan
+        self._hnsw_filtered_ef_search_multiplier = max(1, hnsw_filtered_ef_search_multiplier)
+        self._fusion = fusion
+        self._rrf_k = max(1, rrf_k)
+        self._vector_index = vector_index
+        self._quantized_rescore_multiplier = max(1, quantized_rescore_multiplier)
+        self._channel_execution = channel_execution
+        self._filtered_exact_scan_threshold = filtered_exact_scan_threshold
 
     async def retrieve_chunks(
         self,
@@ -33,186 +105,175 @@ class SQLAlchemyChunkRetrievalService:
         min_score: float = 0.0,
         strategy: str = "hybrid",
         metadata_filters: dict[str, object] | None = None,
+        hnsw_ef_search: int | None = None,
+        hnsw_iterative_scan: str | None = None,
+        context_window_size: int = 0,
     ) -> list[RetrievedChunkDTO]:
         if limit <= 0:
             return []
 
-        vector_literal = _to_pgvector_literal(query_embedding)
+        query_vector = to_pgvector(query_embedding)
         candidate_limit = limit * self._candidate_multiplier
+        ann_candidate_limit = (
+            candidate_limit
+            if self._vector_index == "vector"
+            else candidate_limit * self._quantized_rescore_multiplier
+        )
         resolved_strategy = _resolve_strategy(strategy, query_text)
         vector_weight, fulltext_weight = self._weights_for_strategy(resolved_strategy)
         metadata_where, metadata_params = _build_metadata_filters(metadata_filters)
-        sql = text(
-            """
-            WITH fulltext_query AS (
-                SELECT CAST(
-                    regexp_replace(
-                        CAST(
-                            plainto_tsquery(
-                                CAST(:fulltext_language AS regconfig),
-                                :query_text
-                            ) AS text
-                        ),
-                        ' & ', ' | ', 'g'
-                    ) AS tsquery
-                ) AS q
-            ),
-            vector_search AS (
-                SELECT
-                    c.id AS chunk_id,
-                    c.document_id AS document_id,
-                    d.file_name AS document_file_name,
-                    c.content AS content,
-                    c.chunk_index AS chunk_index,
-                    c.chunk_level AS chunk_level,
-                    c.parent_chunk_id AS parent_chunk_id,
-                    1 - (c.embedding <=> CAST(:query_embedding AS vector))
-                        AS vector_score
-                FROM document_chunks c
-                JOIN documents d ON d.id = c.document_id
-                WHERE d.project_id = :project_id
-                  AND (c.chunk_level IS NULL OR c.chunk_level IN ('standard', 'child'))
-                  {metadata_where}
-                ORDER BY c.embedding <=> CAST(:query_embedding AS vector) ASC
-                LIMIT :candidate_limit
-            ),
-            fulltext_search AS (
-                SELECT
-                    c.id AS chunk_id,
-                    ts_rank_cd(
-                        to_tsvector(
-                            CAST(:fulltext_language AS regconfig),
-                            c.content
-                        ),
-                        fq.q
-                    ) AS fulltext_score
-                FROM document_chunks c
-                JOIN documents d ON d.id = c.document_id
-                CROSS JOIN fulltext_query fq
-                WHERE d.project_id = :project_id
-                  AND (c.chunk_level IS NULL OR c.chunk_level IN ('standard', 'child'))
-                  {metadata_where}
-                  AND to_tsvector(
-                      CAST(:fulltext_language AS regconfig), c.content
-                  ) @@ fq.q
-                ORDER BY fulltext_score DESC
-                LIMIT :candidate_limit
-            ),
-            combined AS (
-                SELECT
-                    v.chunk_id,
-                    v.document_id,
-                    v.document_file_name,
-                    v.content,
-                    v.chunk_index,
-                    v.chunk_level,
-                    v.parent_chunk_id,
-                    v.vector_score,
-                    COALESCE(f.fulltext_score, 0.0) AS fulltext_score
-                FROM vector_search v
-                LEFT JOIN fulltext_search f ON f.chunk_id = v.chunk_id
-                UNION ALL
-                SELECT
-                    f.chunk_id,
-                    c.document_id,
-                    d.file_name AS document_file_name,
-                    c.content,
-                    c.chunk_index,
-                    c.chunk_level,
-                    c.parent_chunk_id,
-                    0.0 AS vector_score,
-                    f.fulltext_score
-                FROM fulltext_search f
-                JOIN document_chunks c ON c.id = f.chunk_id
-                JOIN documents d ON d.id = c.document_id
-                LEFT JOIN vector_search v ON v.chunk_id = f.chunk_id
-                WHERE v.chunk_id IS NULL
-            ),
-            maxima AS (
-                SELECT
-                    MAX(vector_score) AS max_vector_score,
-                    MAX(fulltext_score) AS max_fulltext_score
-                FROM combined
-            ),
-            scored AS (
-                SELECT
-                    c.chunk_id,
-                    c.document_id,
-                    c.document_file_name,
-                    c.content,
-                    c.chunk_index,
-                    c.chunk_level,
-                    c.parent_chunk_id,
-                    COALESCE(
-                        c.vector_score / NULLIF(m.max_vector_score, 0),
-                        0.0
-                    ) AS normalized_vector_score,
-                    COALESCE(
-                        c.fulltext_score / NULLIF(m.max_fulltext_score, 0),
-                        0.0
-                    ) AS normalized_fulltext_score
-                FROM combined c
-                CROSS JOIN maxima m
+        ef_search, iterative_scan = self._hnsw_search_settings(
+            candidate_limit=ann_candidate_limit,
+            has_metadata_filters=bool(metadata_params),
+            ef_search=hnsw_ef_search,
+            iterative_scan=hnsw_iterative_scan,
+        )
+        filter_probe = bool(metadata_params) and self._filtered_exact_scan_threshold > 0
+        vector_search_sql = _vector_search_sql(self._vector_index, len(query_embedding), filter_probe)
+        params: dict[str, object] = {
+            "project_id": project_id,
+            "query_text": query_text,
+            "query_embedding": query_vector,
+            "candidate_limit": candidate_limit,
+            "ann_candidate_limit": ann_candidate_limit,
+            "fulltext_language": self._fulltext_language,
+            **metadata_params,
+        }
+        if filter_probe:
+            params["exact_scan_threshold"] = self._filtered_exact_scan_threshold
+            params["exact_scan_row_limit"] = self._filtered_exact_scan_threshold + 1
+        if self._channel_execution == "concurrent":
+            vector_sql = retrieval_statement(
+                _channel_sql(vector_search_sql, "vector_search").replace("{metadata_where}", metadata_where)
             )
-            SELECT
-                chunk_id,
-                document_id,
-                document_file_name,
-                content,
-                chunk_index,
-                chunk_level,
-                parent_chunk_id,
-                normalized_vector_score AS vector_score,
-                normalized_fulltext_score AS fulltext_score,
-                (
-                    (normalized_vector_score * :vector_weight)
-                    + (normalized_fulltext_score * :fulltext_weight)
-                ) AS final_score
-            FROM scored
-            WHERE (
-                (normalized_vector_score * :vector_weight)
-                + (normalized_fulltext_score * :fulltext_weight)
-            ) >= :min_score
-            ORDER BY final_score DESC
-            LIMIT :limit
-            OFFSET :offset
-            """.replace("{metadata_where}", metadata_where)
+            fulltext_sql = retrieval_statement(
+                _channel_sql(_FULLTEXT_QUERY_SQL + _FULLTEXT_SEARCH_SQL, "fulltext_search").replace(
+                    "{metadata_where}", metadata_where
+                )
+            )
+            return await self._retrieve_with_concurrent_channels(
+                params=params,
+                vector_sql=vector_sql,
+                fulltext_sql=fulltext_sql,
+                vector_weight=vector_weight,
+                fulltext_weight=fulltext_weight,
+                ef_search=ef_search,
+                iterative_scan=iterative_scan,
+                limit=limit,
+                offset=offset,
+                min_score=min_score,
+                context_window_size=context_window_size,
+            )
+
+        fusion_sql = _RRF_FUSION_SQL if self._fusion == "rrf" else _WEIGHTED_FUSION_SQL
+        sql = retrieval_statement(
+            (_CANDIDATES_SQL + fusion_sql + _PAGE_WITH_CONTEXT_SQL)
+            .replace("{vector_search}", vector_search_sql)
+            .replace("{metadata_where}", metadata_where)
         )
 
         async with self._session_factory() as session:
-            rows = (
-                await session.execute(
-                    sql,
-                    {
-                        "project_id": project_id,
-                        "query_text": query_text,
-                        "query_embedding": vector_literal,
-                        "candidate_limit": candidate_limit,
-                        "vector_weight": vector_weight,
-                        "fulltext_weight": fulltext_weight,
-                        "fulltext_language": self._fulltext_language,
-                        "limit": limit,
-                        "offset": offset,
-                        "min_score": min_score,
-                        **metadata_params,
-                    },
-                )
-            ).mappings()
-            return [
-                RetrievedChunkDTO(
-                    chunk_id=row["chunk_id"],
-                    document_id=row["document_id"],
-                    content=row["content"],
-                    score=float(row["final_score"]),
-                    chunk_index=row["chunk_index"],
-                    document_file_name=row["document_file_name"],
-                    vector_score=float(row["vector_score"]),
-                    fulltext_score=float(row["fulltext_score"]),
-                    chunk_level=row["chunk_level"],
-                    parent_chunk_id=row["parent_chunk_id"],
-                )
-                for row in rows
-            ]
+            await _set_hnsw_search_settings(session, ef_search, iterative_scan)
+            result = await session.execute(
+                sql,
+                {
+                    **params,
+                    "vector_weight": vector_weight,
+                    "fulltext_weight": fulltext_weight,
+                    "rrf_k": self._rrf_k,
+                    "rrf_scale": (self._rrf_k + 1) / max(vector_weight + fulltext_weight, 1e-9),
+                    "limit": limit,
+                    "offset": offset,
+                    "min_score": min_score,
+                    "context_window_size": max(0, context_window_size),
+                },
+            )
+            return [_to_retrieved_chunk(row, context_window_size) for row in result.mappings()]
+
+    async def _retrieve_with_concurrent_channels(
+        self,
+        params: dict[str, object],
+        vector_sql: TextClause,
+        fulltext_sql: TextClause,
+        vector_weight: float,
+        fulltext_weight: float,
+        ef_search: int,
+        iterative_scan: str,
+        limit: int,
+        offset: int,
+        min_score: float,
+        context_window_size: int,
+    ) -> list[RetrievedChunkDTO]:
+        """Run each channel on its own pooled connection, fuse in Python, then load the page.
+
+        Retrieval latency becomes the slower channel instead of their sum, plus
+        one short statement for the page context. A channel with a zero
+        weight is not queried.
+        """
+        vector_rows, fulltext_rows = await asyncio.gather(
+            self._fetch_vector_candidates(vector_sql, params, ef_search, iterative_scan)
+            if vector_weight > 0
+            else _no_rows(),
+            self._fetch_rows(fulltext_sql, params) if fulltext_weight > 0 else _no_rows(),
+        )
+        fused = fuse_scores(
+            self._fusion,
+            {row["chunk_id"]: float(row["vector_score"]) for row in vector_rows},
+            {row["chunk_id"]: float(row["fulltext_score"]) for row in fulltext_rows},
+            vector_weight,
+            fulltext_weight,
+            self._rrf_k,
+        )
+        page = select_page(fused, min_score=min_score, limit=limit, offset=offset)
+        if not page:
+            return []
+
+        rows = await self._fetch_rows(
+            retrieval_statement(_PAGE_FROM_SCORES_SQL),
+            {
+                "page_chunk_ids": [chunk_id for chunk_id, *_ in page],
+                "page_final_scores": [score for _, score, _, _ in page],
+                "page_vector_scores": [vector_score for _, _, vector_score, _ in page],
+                "page_fulltext_scores": [fulltext_score for *_, fulltext_score in page],
+                "context_window_size": max(0, context_window_size),
+            },
+        )
+        position = {chunk_id: index for index, (chunk_id, *_) in enumerate(page)}
+        rows.sort(key=lambda row: position[row["chunk_id"]])
+        return [_to_retrieved_chunk(row, context_window_size) for row in rows]
+
+    async def _fetch_vector_candidates(
+        self, sql: TextClause, params: dict[str, object], ef_search: int, iterative_scan: str
+    ) -> list[RowMapping]:
+        async with self._session_factory() as session:
+            await _set_hnsw_search_settings(session, ef_search, iterative_scan)
+            return list((await session.execute(sql, params)).mappings())
+
+    async def _fetch_rows(self, sql: TextClause, params: dict[str, object]) -> list[RowMapping]:
+        async with self._session_factory() as session:
+            return list((await session.execute(sql, params)).mappings())
+
+    def _hnsw_search_settings(
+        self,
+        candidate_limit: int,
+        has_metadata_filters: bool,
+        ef_search: int | None,
+        iterative_scan: str | None,
+    ) -> tuple[int, str]:
+        """Derive pgvector HNSW search settings for one retrieval call.
+
+        ``ef_search`` bounds the candidates returned by one HNSW scan, so it never
+        goes below ``candidate_limit``. Metadata filters discard part of those
+        candidates: the scan is widened and iterative scanning is forced on so
+        filtered queries keep their recall.
+        """
+        resolved_ef_search = max(ef_search or self._hnsw_ef_search, candidate_limit)
+        resolved_iterative_scan = iterative_scan or self._hnsw_iterative_scan
+        if has_metadata_filters:
+            resolved_ef_search *= self._hnsw_filtered_ef_search_multiplier
+            if resolved_iterative_scan == "off":
+                resolved_iterative_scan = "relaxed_order"
+        return min(resolved_ef_search, MAX_HNSW_EF_SEARCH), resolved_iterative_scan
 
     def _weights_for_strategy(self, strategy: str) -> tuple[float, float]:
         if strategy == "vector":
@@ -222,8 +283,427 @@ class SQLAlchemyChunkRetrievalService:
         return self._vector_weight, self._fulltext_weight
 
 
-def _to_pgvector_literal(values: list[float]) -> str:
-    return "[" + ",".join(str(value) for value in values) + "]"
+_FULLTEXT_QUERY_SQL = """
+fulltext_query AS (
+    SELECT CAST(
+        regexp_replace(
+            CAST(
+                plainto_tsquery(
+                    CAST(:fulltext_language AS regconfig),
+                    :query_text
+                ) AS text
+            ),
+            ' & ', ' | ', 'g'
+        ) AS tsquery
+    ) AS q
+),
+"""
+
+_FULLTEXT_SEARCH_SQL = """
+fulltext_search AS (
+    SELECT
+        c.id AS chunk_id,
+        c.document_id AS document_id,
+        c.content AS content,
+        c.chunk_index AS chunk_index,
+        c.chunk_level AS chunk_level,
+        c.parent_chunk_id AS parent_chunk_id,
+        ts_rank_cd(c.content_tsv, fq.q) AS fulltext_score
+    FROM document_chunks c
+    CROSS JOIN fulltext_query fq
+    WHERE c.project_id = :project_id
+      AND (c.chunk_level IS NULL OR c.chunk_level IN ('standard', 'child'))
+      {metadata_where}
+      AND c.content_tsv @@ fq.q
+    ORDER BY fulltext_score DESC
+    LIMIT :candidate_limit
+),
+"""
+
+_CANDIDATES_SQL = "WITH" + _FULLTEXT_QUERY_SQL + "{vector_search}" + _FULLTEXT_SEARCH_SQL
+
+_WEIGHTED_FUSION_SQL = """
+combined AS (
+    SELECT
+        v.chunk_id,
+        v.document_id,
+        v.content,
+        v.chunk_index,
+        v.chunk_level,
+        v.parent_chunk_id,
+        v.vector_score,
+        COALESCE(f.fulltext_score, 0.0) AS fulltext_score
+    FROM vector_search v
+    LEFT JOIN fulltext_search f ON f.chunk_id = v.chunk_id
+    UNION ALL
+    SELECT
+        f.chunk_id,
+        f.document_id,
+        f.content,
+        f.chunk_index,
+        f.chunk_level,
+        f.parent_chunk_id,
+        0.0 AS vector_score,
+        f.fulltext_score
+    FROM fulltext_search f
+    LEFT JOIN vector_search v ON v.chunk_id = f.chunk_id
+    WHERE v.chunk_id IS NULL
+),
+maxima AS (
+    SELECT
+        MAX(vector_score) AS max_vector_score,
+        MAX(fulltext_score) AS max_fulltext_score
+    FROM combined
+),
+scored AS (
+    SELECT
+        c.chunk_id,
+        c.document_id,
+        c.content,
+        c.chunk_index,
+        c.chunk_level,
+        c.parent_chunk_id,
+        COALESCE(
+            c.vector_score / NULLIF(m.max_vector_score, 0),
+            0.0
+        ) AS normalized_vector_score,
+        COALESCE(
+            c.fulltext_score / NULLIF(m.max_fulltext_score, 0),
+            0.0
+        ) AS normalized_fulltext_score
+    FROM combined c
+    CROSS JOIN maxima m
+),
+page AS (
+    SELECT
+        s.chunk_id,
+        s.document_id,
+        d.file_name AS document_file_name,
+        s.content,
+        s.chunk_index,
+        s.chunk_level,
+        s.parent_chunk_id,
+        s.normalized_vector_score AS vector_score,
+        s.normalized_fulltext_score AS fulltext_score,
+        (
+            (s.normalized_vector_score * :vector_weight)
+            + (s.normalized_fulltext_score * :fulltext_weight)
+        ) AS final_score
+    FROM scored s
+    JOIN documents d ON d.id = s.document_id
+    WHERE (
+        (s.normalized_vector_score * :vector_weight)
+        + (s.normalized_fulltext_score * :fulltext_weight)
+    ) >= :min_score
+    ORDER BY final_score DESC
+    LIMIT :limit
+    OFFSET :offset
+)
+"""
+
+# Ranks are taken over the (at most candidate_limit) rows of each channel, so the
+# window functions never touch more than the HNSW / GIN scans already returned.
+_RRF_FUSION_SQL = """
+vector_ranked AS (
+    SELECT
+        v.*,
+        ROW_NUMBER() OVER (ORDER BY v.vector_score DESC, v.chunk_id) AS vector_rank
+    FROM vector_search v
+),
+fulltext_ranked AS (
+    SELECT
+        f.*,
+        ROW_NUMBER() OVER (ORDER BY f.fulltext_score DESC, f.chunk_id) AS fulltext_rank
+    FROM fulltext_search f
+),
+fused AS (
+    SELECT
+        COALESCE(v.chunk_id, f.chunk_id) AS chunk_id,
+        COALESCE(v.document_id, f.document_id) AS document_id,
+        COALESCE(v.content, f.content) AS content,
+        COALESCE(v.chunk_index, f.chunk_index) AS chunk_index,
+        COALESCE(v.chunk_level, f.chunk_level) AS chunk_level,
+        COALESCE(v.parent_chunk_id, f.parent_chunk_id) AS parent_chunk_id,
+        COALESCE(v.vector_score, 0.0) AS vector_score,
+        COALESCE(f.fulltext_score, 0.0) AS fulltext_score,
+        (
+            COALESCE(
+                CAST(:vector_weight AS double precision)
+                / (CAST(:rrf_k AS double precision) + v.vector_rank),
+                0.0
+            )
+            + COALESCE(
+                CAST(:fulltext_weight AS double precision)
+                / (CAST(:rrf_k AS double precision) + f.fulltext_rank),
+                0.0
+            )
+        ) * CAST(:rrf_scale AS double precision) AS final_score
+    FROM vector_ranked v
+    FULL OUTER JOIN fulltext_ranked f ON f.chunk_id = v.chunk_id
+),
+page AS (
+    SELECT
+        s.chunk_id,
+        s.document_id,
+        d.file_name AS document_file_name,
+        s.content,
+        s.chunk_index,
+        s.chunk_level,
+        s.parent_chunk_id,
+        s.vector_score,
+        s.fulltext_score,
+        s.final_score
+    FROM fused s
+    JOIN documents d ON d.id = s.document_id
+    WHERE s.final_score >= :min_score
+    ORDER BY s.final_score DESC
+    LIMIT :limit
+    OFFSET :offset
+)
+"""
+
+# Context of the returned page only: the parent of child chunks and, for the
+# other chunks, their neighbors within :context_window_size indices (resolved
+# through ix_document_chunks_document_id_chunk_index). Mirrors the fallback
+# path of QueryRelevantChunks, which queries DocumentChunkRepository instead.
+_PAGE_WITH_CONTEXT_SQL = """
+SELECT
+    p.*,
+    parent.content AS parent_content,
+    neighbors.items AS context_neighbors
+FROM page p
+LEFT JOIN document_chunks parent
+    ON p.chunk_level = 'child' AND parent.id = p.parent_chunk_id
+LEFT JOIN LATERAL (
+    SELECT json_agg(
+        json_build_object('chunk_id', n.id, 'chunk_index', n.chunk_index, 'content', n.content)
+        ORDER BY n.chunk_index
+    ) AS items
+    FROM document_chunks n
+    WHERE CAST(:context_window_size AS integer) > 0
+      AND p.chunk_level IS DISTINCT FROM 'child'
+      AND n.document_id = p.document_id
+      AND n.chunk_index BETWEEN p.chunk_index - CAST(:context_window_size AS integer)
+                            AND p.chunk_index + CAST(:context_window_size AS integer)
+      AND n.chunk_index <> p.chunk_index
+) neighbors ON true
+ORDER BY p.final_score DESC
+"""
+
+# Concurrent channel execution: the page is fused in Python and passed back as
+# arrays, then completed with the same context as the single statement.
+_PAGE_FROM_SCORES_SQL = (
+    """
+WITH page AS (
+    SELECT
+        c.id AS chunk_id,
+        c.document_id AS document_id,
+        d.file_name AS document_file_name,
+        c.content AS content,
+        c.chunk_index AS chunk_index,
+        c.chunk_level AS chunk_level,
+        c.parent_chunk_id AS parent_chunk_id,
+        s.vector_score,
+        s.fulltext_score,
+        s.final_score
+    FROM unnest(
+        CAST(:page_chunk_ids AS uuid[]),
+        CAST(:page_vector_scores AS double precision[]),
+        CAST(:page_fulltext_scores AS double precision[]),
+        CAST(:page_final_scores AS double precision[])
+    ) AS s(chunk_id, vector_score, fulltext_score, final_score)
+    JOIN document_chunks c ON c.id = s.chunk_id
+    JOIN documents d ON d.id = c.document_id
+)
+"""
+    + _PAGE_WITH_CONTEXT_SQL
+)
+
+
+_EXACT_VECTOR_SEARCH_SQL = """
+vector_search AS (
+    SELECT
+        c.id AS chunk_id,
+        c.document_id AS document_id,
+        c.content AS content,
+        c.chunk_index AS chunk_index,
+        c.chunk_level AS chunk_level,
+        c.parent_chunk_id AS parent_chunk_id,
+        1 - (c.embedding <=> CAST(:query_embedding AS vector))
+            AS vector_score
+    FROM document_chunks c
+    WHERE c.project_id = :project_id
+      AND (c.chunk_level IS NULL OR c.chunk_level IN ('standard', 'child'))
+      {metadata_where}
+    ORDER BY c.embedding <=> CAST(:query_embedding AS vector) ASC
+    LIMIT :candidate_limit
+),
+"""
+
+# Metadata filters: filtered_ids stops one row past the threshold and is served
+# by the metadata expression indexes. filter_probe is evaluated once (an
+# InitPlan), and as a condition without column references it gates each branch
+# as a whole, so only one of them runs: the exact ranking of the filtered rows
+# when they are few, otherwise the ANN scan, which would discard most of its
+# candidates on a selective filter.
+_FILTER_PROBE_SQL = """
+filtered_ids AS MATERIALIZED (
+    SELECT c.id AS chunk_id
+    FROM document_chunks c
+    WHERE c.project_id = :project_id
+      AND (c.chunk_level IS NULL OR c.chunk_level IN ('standard', 'child'))
+      {metadata_where}
+    LIMIT :exact_scan_row_limit
+),
+filter_probe AS MATERIALIZED (
+    SELECT count(*) <= :exact_scan_threshold AS selective
+    FROM filtered_ids
+),
+exact_vector_search AS (
+    SELECT
+        c.id AS chunk_id,
+        c.document_id AS document_id,
+        c.content AS content,
+        c.chunk_index AS chunk_index,
+        c.chunk_level AS chunk_level,
+        c.parent_chunk_id AS parent_chunk_id,
+        1 - (c.embedding <=> CAST(:query_embedding AS vector))
+            AS vector_score
+    FROM filtered_ids f
+    JOIN document_chunks c ON c.id = f.chunk_id
+    WHERE (SELECT p.selective FROM filter_probe p)
+    ORDER BY c.embedding <=> CAST(:query_embedding AS vector) ASC
+    LIMIT :candidate_limit
+),
+"""
+
+_PROBED_VECTOR_SEARCH_SQL = """
+vector_search AS (
+    SELECT * FROM exact_vector_search
+    UNION ALL
+    SELECT * FROM ann_vector_search
+),
+"""
+
+_UNLESS_FILTER_IS_SELECTIVE_SQL = "\n          AND NOT (SELECT p.selective FROM filter_probe p)"
+
+_RESCORED_VECTOR_SEARCH_SQL = """
+vector_search AS (
+    SELECT
+        a.chunk_id,
+        a.document_id,
+        a.content,
+        a.chunk_index,
+        a.chunk_level,
+        a.parent_chunk_id,
+        1 - (a.embedding <=> CAST(:query_embedding AS vector))
+            AS vector_score
+    FROM (
+        SELECT
+            c.id AS chunk_id,
+            c.document_id AS document_id,
+            c.content AS content,
+            c.chunk_index AS chunk_index,
+            c.chunk_level AS chunk_level,
+            c.parent_chunk_id AS parent_chunk_id,
+            c.embedding AS embedding
+        FROM document_chunks c
+        WHERE c.project_id = :project_id
+          AND (c.chunk_level IS NULL OR c.chunk_level IN ('standard', 'child'))
+          {metadata_where}
+        ORDER BY {ann_distance} ASC
+        LIMIT :ann_candidate_limit
+    ) a
+    ORDER BY a.embedding <=> CAST(:query_embedding AS vector) ASC
+    LIMIT :candidate_limit
+),
+"""
+
+# Must match the index expressions created by the 20261017_50 migration. The
+# query vector is always bound as ``vector`` so it uses the binary codec.
+_ANN_DISTANCE_SQL = {
+    "halfvec": (
+        "CAST(c.embedding AS halfvec({dimension})) "
+        "<=> CAST(CAST(:query_embedding AS vector) AS halfvec({dimension}))"
+    ),
+    "bit": (
+        "CAST(binary_quantize(c.embedding) AS bit({dimension})) "
+        "<~> binary_quantize(CAST(:query_embedding AS vector))"
+    ),
+}
+
+
+def _vector_search_sql(vector_index: str, dimension: int, filter_probe: bool = False) -> str:
+    """``vector_search`` CTE for a vector index, preceded by the filter probe when asked."""
+    if vector_index in _ANN_DISTANCE_SQL:
+        ann_distance = _ANN_DISTANCE_SQL[vector_index].replace("{dimension}", str(int(dimension)))
+        ann_sql = _RESCORED_VECTOR_SEARCH_SQL.replace("{ann_distance}", ann_distance)
+    else:
+        ann_sql = _EXACT_VECTOR_SEARCH_SQL
+    if not filter_probe:
+        return ann_sql
+    gated_ann_sql = ann_sql.replace("vector_search AS (", "ann_vector_search AS (", 1).replace(
+        "{metadata_where}", "{metadata_where}" + _UNLESS_FILTER_IS_SELECTIVE_SQL, 1
+    )
+    return _FILTER_PROBE_SQL + gated_ann_sql + _PROBED_VECTOR_SEARCH_SQL
+
+
+def _context_neighbors(row: Mapping[Any, Any], context_window_size: int) -> list[RetrievedChunkDTO] | None:
+    if context_window_size <= 0 or row["chunk_level"] == "child" or row["chunk_index"] is None:
+        return None
+    items = row["context_neighbors"]
+    if isinstance(items, str):
+        items = json.loads(items)
+    return [
+        RetrievedChunkDTO(
+            chunk_id=UUID(str(item["chunk_id"])),
+            document_id=row["document_id"],
+            content=item["content"],
+            score=0.0,
+            chunk_index=item["chunk_index"],
+            document_file_name=row["document_file_name"],
+        )
+        for item in items or []
+    ]
+
+
+def _to_retrieved_chunk(row: Mapping[Any, Any], context_window_size: int) -> RetrievedChunkDTO:
+    return RetrievedChunkDTO(
+        chunk_id=row["chunk_id"],
+        document_id=row["document_id"],
+        content=row["content"],
+        score=float(row["final_score"]),
+        chunk_index=row["chunk_index"],
+        document_file_name=row["document_file_name"],
+        vector_score=float(row["vector_score"]),
+        fulltext_score=float(row["fulltext_score"]),
+        chunk_level=row["chunk_level"],
+        parent_chunk_id=row["parent_chunk_id"],
+        parent_content=row["parent_content"],
+        context_neighbors=_context_neighbors(row, context_window_size),
+    )
+
+
+# Transaction-scoped equivalent of SET LOCAL that accepts bind parameters.
+_SET_HNSW_SEARCH_SETTINGS = text(
+    "SELECT set_config('hnsw.ef_search', :ef_search, true), "
+    "set_config('hnsw.iterative_scan', :iterative_scan, true)"
+)
+
+
+async def _set_hnsw_search_settings(session: AsyncSession, ef_search: int, iterative_scan: str) -> None:
+    await session.execute(
+        _SET_HNSW_SEARCH_SETTINGS, {"ef_search": str(ef_search), "iterative_scan": iterative_scan}
+    )
+
+
+def _channel_sql(candidate_ctes: str, channel: str) -> str:
+    """Standalone statement returning the rows of one candidate CTE."""
+    return f"WITH {candidate_ctes.rstrip().removesuffix(',')}\nSELECT * FROM {channel}"
+
+
+async def _no_rows() -> list[RowMapping]:
+    return []
 
 
 def _resolve_strategy(strategy: str, query_text: str) -> str:
@@ -0,0 +1,134 @@
+from datetime import timedelta
+from typing import Any
+from uuid import UUID, uuid4
+
+from sqlalchemy import and_, func, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from raggae.application.dto.ingestion_job_dto import IngestionJobDTO
+from raggae.infrastructure.database.models.ingestion_job_model import IngestionJobModel
+
+
+class SQLAlchemyDocumentIngestionQueue:
+    """Ingestion queue persisted in PostgreSQL and shared by every worker process.
+
+    :meth:`claim` picks the oldest available row — queued and due, or running
+    with an expired lease — under ``FOR UPDATE SKIP LOCKED``, so concurrent
+    workers never block on nor double-claim the same job. Lease times use the
+    database clock. Settling a job only applies while the caller still holds
+    its lease.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+
+    async def enqueue(self, document_id: UUID, project_id: UUID, user_id: UUID) -> UUID:
+        job_id = uuid4()
+        now = func.now()
+        stmt = insert(IngestionJobModel).values(
+            id=job_id,
+            document_id=document_id,
+            project_id=project_id,
+            user_id=user_id,
+            status="queued",
+            attempts=0,
+            available_at=now,
+            created_at=now,
+            updated_at=now,
+        )
+        async with self._session_factory() as session:
+            await session.execute(stmt)
+            await session.commit()
+        return job_id
+
+    async def claim(self, worker_id: str, lease_seconds: float) -> IngestionJobDTO | None:
+        now = func.now()
+        candidate = (
+            select(IngestionJobModel.id)
+            .where(
+                or_(
+                    and_(IngestionJobModel.status == "queued", IngestionJobModel.available_at <= now),
+                    and_(IngestionJobModel.status == "running", IngestionJobModel.locked_until < now),
+                )
+            )
+            .order_by(IngestionJobModel.available_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(IngestionJobModel)
+            .where(IngestionJobModel.id == candidate)
+            .values(
+                status="running",
+                attempts=IngestionJobModel.attempts + 1,
+                locked_by=worker_id,
+                locked_until=now + timedelta(seconds=lease_seconds),
+                updated_at=now,
+            )
+            .returning(
+                IngestionJobModel.id,
+                IngestionJobModel.document_id,
+                IngestionJobModel.project_id,
+                IngestionJobModel.user_id,
+                IngestionJobModel.attempts,
+            )
+        )
+        async with self._session_factory() as session:
+            row = (await session.execute(stmt)).one_or_none()
+            await session.commit()
+        if row is None:
+            return None
+        return IngestionJobDTO(
+            id=row.id,
+            document_id=row.document_id,
+            project_id=row.project_id,
+            user_id=row.user_id,
+            attempts=row.attempts,
+        )
+
+    async def heartbeat(self, job_id: UUID, worker_id: str, lease_seconds: float) -> bool:
+        return await self._update_held(
+            job_id,
+            worker_id,
+            locked_until=func.now() + timedelta(seconds=lease_seconds),
+        )
+
+    async def complete(self, job_id: UUID, worker_id: str) -> None:
+        await self._update_held(job_id, worker_id, status="done", locked_by=None, locked_until=None)
+
+    async def retry(self, job_id: UUID, worker_id: str, error: str, delay_seconds: float) -> None:
+        await self._update_held(
+            job_id,
+            worker_id,
+            status="queued",
+            available_at=func.now() + timedelta(seconds=delay_seconds),
+            locked_by=None,
+            locked_until=None,
+            last_error=error,
+        )
+
+    async def fail(self, job_id: UUID, worker_id: str, error: str) -> None:
+        await self._update_held(
+            job_id,
+            worker_id,
+            status="failed",
+            locked_by=None,
+            locked_until=None,
+            last_error=error,
+        )
+
+    async def _update_held(self, job_id: UUID, worker_id: str, **values: Any) -> bool:
+        stmt = (
+            update(IngestionJobModel)
+            .where(
+                IngestionJobModel.id == job_id,
+                IngestionJobModel.status == "running",
+                IngestionJobModel.locked_by == worker_id,
+            )
+            .values(updated_at=func.now(), **values)
+        )
+        async with self._session_factory() as session:
+            result = await session.execute(stmt)
+            await session.commit()
+        return bool(getattr(result, "rowcount", 0))
@@ -0,0 +1,171 @@
+"""PostgreSQL reads backing :class:`LocalIndexChunkRetrievalService`."""
+
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from raggae.application.dto.retrieved_chunk_dto import RetrievedChunkDTO
+from raggae.infrastructure.database.models.document_chunk_model import DocumentChunkModel
+from raggae.infrastructure.database.models.document_model import DocumentModel
+
+_SEARCHABLE = or_(
+    DocumentChunkModel.chunk_level.is_(None),
+    DocumentChunkModel.chunk_level.in_(("standard", "child")),
+)
+
+_CHUNK_COLUMNS = (
+    DocumentChunkModel.id,
+    DocumentChunkModel.document_id,
+    DocumentChunkModel.content,
+    DocumentChunkModel.chunk_index,
+    DocumentChunkModel.chunk_level,
+    DocumentChunkModel.parent_chunk_id,
+    DocumentModel.file_name,
+)
+
+_FULLTEXT_SQL = """
+WITH fulltext_query AS (
+    SELECT CAST(
+        regexp_replace(
+            CAST(
+                plainto_tsquery(
+                    CAST(:fulltext_language AS regconfig),
+                    :query_text
+                ) AS text
+            ),
+            ' & ', ' | ', 'g'
+        ) AS tsquery
+    ) AS q
+)
+SELECT
+    c.id AS chunk_id,
+    c.document_id AS document_id,
+    d.file_name AS document_file_name,
+    c.content AS content,
+    c.chunk_index AS chunk_index,
+    c.chunk_level AS chunk_level,
+    c.parent_chunk_id AS parent_chunk_id,
+    ts_rank_cd(c.content_tsv, fq.q) AS fulltext_score
+FROM document_chunks c
+CROSS JOIN fulltext_query fq
+JOIN documents d ON d.id = c.document_id
+WHERE c.project_id = :project_id
+  AND (c.chunk_level IS NULL OR c.chunk_level IN ('standard', 'child'))
+  AND c.content_tsv @@ fq.q
+ORDER BY fulltext_score DESC
+LIMIT :candidate_limit
+"""
+
+
+class SQLAlchemyLocalIndexSource:
+    """Reads the searchable chunks of a project from the system of record.
+
+    Embeddings are only loaded to (re)build local ANN indexes; query-time reads
+    are the full-text candidates and the chunks of the returned page.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        embedding_dimension: int,
+        fulltext_language: str = "french",
+        batch_size: int = 5000,
+    ) -> None:
+        self._session_factory = session_factory
+        self._embedding_dimension = embedding_dimension
+        self._fulltext_language = fulltext_language
+        self._batch_size = max(1, batch_size)
+
+    async def list_chunk_ids(self, project_id: UUID) -> list[UUID]:
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(DocumentChunkModel.id).where(DocumentChunkModel.project_id == project_id, _SEARCHABLE)
+            )
+            return list(result.scalars().all())
+
+    async def load_embeddings(
+        self, project_id: UUID, chunk_ids: list[UUID] | None = None
+    ) -> tuple[list[UUID], np.ndarray]:
+        """Return searchable chunk ids with their embeddings as a ``(n, dimension)`` array.
+
+        Loads every searchable chunk of the project when ``chunk_ids`` is None.
+        """
+        ids: list[UUID] = []
+        embeddings: list[np.ndarray] = []
+        statement = select(DocumentChunkModel.id, DocumentChunkModel.embedding).where(
+            DocumentChunkModel.project_id == project_id, _SEARCHABLE
+        )
+        async with self._session_factory() as session:
+            if chunk_ids is None:
+                result = await session.stream(statement.execution_options(yield_per=self._batch_size))
+                async for partition in result.partitions():
+                    for chunk_id, embedding in partition:
+                        ids.append(chunk_id)
+                        embeddings.append(np.asarray(embedding, dtype=np.float32))
+            else:
+                for start in range(0, len(chunk_ids), self._batch_size):
+                    batch = chunk_ids[start : start + self._batch_size]
+                    rows = await session.execute(statement.where(DocumentChunkModel.id.in_(batch)))
+                    for chunk_id, embedding in rows.all():
+                        ids.append(chunk_id)
+                        embeddings.append(np.asarray(embedding, dtype=np.float32))
+        if not embeddings:
+            return ids, np.zeros((0, self._embedding_dimension), dtype=np.float32)
+        return ids, np.vstack(embeddings)
+
+    async def load_chunks(self, chunk_ids: list[UUID]) -> list[RetrievedChunkDTO]:
+        """Return the chunks with their document file name; ``score`` is left at 0."""
+        if not chunk_ids:
+            return []
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(*_CHUNK_COLUMNS)
+                .join(DocumentModel, DocumentModel.id == DocumentChunkModel.document_id)
+                .where(DocumentChunkModel.id.in_(chunk_ids))
+            )
+            return [
+                RetrievedChunkDTO(
+                    chunk_id=row.id,
+                    document_id=row.document_id,
+                    content=row.content,
+                    score=0.0,
+                    chunk_index=row.chunk_index,
+                    document_file_name=row.file_name,
+                    chunk_level=row.chunk_level,
+                    parent_chunk_id=row.parent_chunk_id,
+                )
+                for row in result.all()
+            ]
+
+    async def fulltext_candidates(
+        self, project_id: UUID, query_text: str, candidate_limit: int
+    ) -> list[RetrievedChunkDTO]:
+        """Return the best ``ts_rank_cd`` matches, with the raw rank in ``fulltext_score``."""
+        async with self._session_factory() as session:
+            rows = (
+                await session.execute(
+                    text(_FULLTEXT_SQL),
+                    {
+                        "project_id": project_id,
+                        "query_text": query_text,
+                        "fulltext_language": self._fulltext_language,
+                        "candidate_limit": candidate_limit,
+                    },
+                )
+            ).mappings()
+            return [
+                RetrievedChunkDTO(
+                    chunk_id=row["chunk_id"],
+                    document_id=row["document_id"],
+                    content=row["content"],
+                    score=0.0,
+                    chunk_index=row["chunk_index"],
+                    document_file_name=row["document_file_name"],
+                    fulltext_score=float(row["fulltext_score"]),
+                    chunk_level=row["chunk_level"],
+                    parent_chunk_id=row["parent_chunk_id"],
+                )
+                for row in rows
+            ]
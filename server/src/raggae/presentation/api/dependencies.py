@@ -33,6 +33,9 @@ from raggae.application.interfaces.repositories.organization_member_repository i
 from raggae.application.interfaces.repositories.organization_repository import (
     OrganizationRepository,
 )
+from raggae.application.interfaces.repositories.project_index_generation_repository import (
+    ProjectIndexGenerationRepository,
+)
 from raggae.application.interfaces.repositories.project_mcp_activation_repository import (
     ProjectMcpActivationRepository,
 )
@@ -51,12 +54,14 @@ from raggae.application.interfaces.services.chunk_retrieval_service import (
 from raggae.application.interfaces.services.conversation_title_generator import (
     ConversationTitleGenerator,
 )
+from raggae.application.interfaces.services.document_ingestion_queue import DocumentIngestionQueue
 from raggae.application.interfaces.services.document_structure_analyzer import (
     DocumentStructureAnalyzer,
 )
 from raggae.application.interfaces.services.document_text_extractor import (
     DocumentTextExtractor,
 )
+from raggae.application.interfaces.services.embedding_cache import EmbeddingCache
 from raggae.application.interfaces.services.embedding_service import EmbeddingService
 from raggae.application.interfaces.services.file_metadata_extractor import (
     FileMetadataExtractor,
@@ -85,7 +90,9 @@ from raggae.application.interfaces.services.provider_api_key_crypto_service impo
 from raggae.application.interfaces.services.provider_api_key_validator import (
     ProviderApiKeyValidator,
 )
+from raggae.application.interfaces.services.query_embedding_cache import QueryEmbeddingCache
 from raggae.application.interfaces.services.reranker_service import RerankerService
+from raggae.application.interfaces.services.retrieval_result_cache import RetrievalResultCache
 from raggae.application.interfaces.services.text_chunker_service import TextChunkerService
 from raggae.application.interfaces.services.text_sanitizer_service import (
     TextSanitizerService,
@@ -98,6 +105,7 @@ from raggae.application.services.chunking_strategy_selector import (
     DeterministicChunkingStrategySelector,
 )
 from raggae.application.services.document_indexing_service import DocumentIndexingService
+from raggae.application.services.document_ingestion_worker import DocumentIngestionWorker
 from raggae.application.services.mcp_tool_executor import McpToolExecutor
 from raggae.application.services.mcp_tool_resolver import McpToolResolver
 from raggae.application.services.parent_child_chunking_service import (
@@ -117,6 +125,7 @@ from raggae.application.use_cases.chat.toggle_favorite_conversation import Toggl
 from raggae.application.use_cases.chat.update_conversation import UpdateConversation
 from raggae.application.use_cases.document.delete_document import DeleteDocument
 from raggae.application.use_cases.document.get_document_file import GetDocumentFile
+from raggae.application.use_cases.document.index_queued_document import IndexQueuedDocument
 from raggae.application.use_cases.document.list_document_chunks import ListDocumentChunks
 from raggae.application.use_cases.document.list_project_documents import ListProjectDocuments
 from raggae.application.use_cases.document.reindex_document import ReindexDocument
@@ -257,7 +266,12 @@ from raggae.application.use_cases.user.register_user import RegisterUser
 from raggae.application.use_cases.user.update_user_full_name import UpdateUserFullName
 from raggae.application.use_cases.user.update_user_locale import UpdateUserLocale
 from raggae.application.use_cases.user.upsert_user_agent_configuration import UpsertUserAgentConfiguration
+from raggae.infrastructure.cache.in_memory_embedding_cache import InMemoryEmbeddingCache
+from raggae.infrastructure.cache.in_memory_query_embedding_cache import InMemoryQueryEmbeddingCache
+from raggae.infrastructure.cache.in_memory_retrieval_result_cache import InMemoryRetrievalResultCache
 from raggae.infrastructure.cache.oauth_code_store import InMemoryOAuthCodeStore
+from raggae.infrastructure.cache.sqlalchemy_embedding_cache import SQLAlchemyEmbeddingCache
+from raggae.infrastructure.cache.sqlalchemy_query_embedding_cache import SQLAlchemyQueryEmbeddingCache
 from raggae.infrastructure.config.settings import settings
 from raggae.infrastructure.database.repositories.in_memory_agent_configuration_repository import (
     InMemoryAgentConfigurationRepository,
@@ -289,6 +303,9 @@ from raggae.infrastructure.database.repositories.in_memory_organization_member_r
 from raggae.infrastructure.database.repositories.in_memory_organization_repository import (
     InMemoryOrganizationRepository,
 )
+from raggae.infrastructure.database.repositories.in_memory_project_index_generation_repository import (
+    InMemoryProjectIndexGenerationRepository,
+)
 from raggae.infrastructure.database.repositories.in_memory_project_mcp_activation_repository import (
     InMemoryProjectMcpActivationRepository,
 )
@@ -337,6 +354,9 @@ from raggae.infrastructure.database.repositories.sqlalchemy_organization_member_
 from raggae.infrastructure.database.repositories.sqlalchemy_organization_repository import (
     SQLAlchemyOrganizationRepository,
 )
+from raggae.infrastructure.database.repositories.sqlalchemy_project_index_generation_repository import (
+    SQLAlchemyProjectIndexGenerationRepository,
+)
 from raggae.infrastructure.database.repositories.sqlalchemy_project_mcp_activation_repository import (
     SQLAlchemyProjectMcpActivationRepository,
 )
@@ -355,7 +375,7 @@ from raggae.infrastructure.database.repositories.sqlalchemy_stats_repository imp
 from raggae.infrastructure.database.repositories.sqlalchemy_user_repository import (
     SQLAlchemyUserRepository,
 )
-from raggae.infrastructure.database.session import SessionFactory
+from raggae.infrastructure.database.session import SessionFactory, engine
 from raggae.infrastructure.services.adaptive_text_chunker_service import (
     AdaptiveTextChunkerService,
 )
@@ -385,6 +405,9 @@ from raggae.infrastructure.services.http_mcp_client import HttpMcpClient
 from raggae.infrastructure.services.in_memory_chunk_retrieval_service import (
     InMemoryChunkRetrievalService,
 )
+from raggae.infrastructure.services.in_memory_document_ingestion_queue import (
+    InMemoryDocumentIngestionQueue,
+)
 from raggae.infrastructure.services.in_memory_embedding_service import (
     InMemoryEmbeddingService,
 )
@@ -401,6 +424,7 @@ from raggae.infrastructure.services.in_memory_language_detector import (
     InMemoryLanguageDetector,
 )
 from raggae.infrastructure.services.in_memory_llm_service import InMemoryLLMService
+from raggae.infrastructure.services.in_memory_vector_index import InMemoryVectorIndex
 from raggae.infrastructure.services.jwt_token_service import JwtTokenService
 from raggae.infrastructure.services.keybert_keyword_extractor import (
     KeybertKeywordExtractor,
@@ -414,6 +438,11 @@ from raggae.infrastructure.services.llamaindex_text_chunker_service import (
 from raggae.infrastructure.services.llm_conversation_title_generator import (
     LLMConversationTitleGenerator,
 )
+from raggae.infrastructure.services.local_ann_index import LocalAnnIndexStore
+from raggae.infrastructure.services.local_index_chunk_retrieval_service import (
+    LocalIndexChunkRetrievalService,
+    RefreshingProjectIndexGenerationRepository,
+)
 from raggae.infrastructure.services.mailgun_invitation_email_service import (
     MailgunInvitationEmailService,
 )
@@ -443,6 +472,8 @@ from raggae.infrastructure.services.project_llm_service_resolver import (
 from raggae.infrastructure.services.project_reranker_service_resolver import (
     ProjectRerankerServiceResolver as RuntimeProjectRerankerServiceResolver,
 )
+from raggae.infrastructure.services.provider_client_pool import ProviderClientPool
+from raggae.infrastructure.services.retrieval_statement_metrics import RetrievalStatementMetrics
 from raggae.infrastructure.services.semantic_text_chunker_service import (
     SemanticTextChunkerService,
 )
@@ -458,6 +489,12 @@ from raggae.infrastructure.services.simple_text_sanitizer_service import (
 from raggae.infrastructure.services.sqlalchemy_chunk_retrieval_service import (
     SQLAlchemyChunkRetrievalService,
 )
+from raggae.infrastructure.services.sqlalchemy_document_ingestion_queue import (
+    SQLAlchemyDocumentIngestionQueue,
+)
+from raggae.infrastructure.services.sqlalchemy_local_index_source import (
+    SQLAlchemyLocalIndexSource,
+)
 from raggae.infrastructure.services.tabular_text_chunker_service import TabularTextChunkerService
 from raggae.infrastructure.services.url_safety_validator_impl import (
     UrlSafetyValidatorImpl,
@@ -470,12 +507,17 @@ def _build_embedding_service() -> EmbeddingService:
             api_key=settings.default_embedding_api_key,
             model=settings.default_embedding_model,
             expected_dimension=settings.embedding_dimension,
+            batch_size=settings.openai_embedding_batch_size,
+            max_batch_tokens=settings.openai_embedding_max_batch_tokens,
+            max_concurrency=settings.openai_embedding_max_concurrency,
         )
     if settings.default_embedding_provider == "ollama":
         ollama_service = OllamaEmbeddingService(
             base_url=settings.ollama_base_url,
             model=settings.ollama_embedding_model,
             expected_dimension=settings.embedding_dimension,
+            batch_size=settings.ollama_embedding_batch_size,
+            max_concurrency=settings.ollama_embedding_max_concurrency,
         )
         return ContextualEmbeddingService(delegate=ollama_service)
     if settings.default_embedding_provider == "gemini":
@@ -483,17 +525,26 @@ def _build_embedding_service() -> EmbeddingService:
             api_key=settings.default_embedding_api_key,
             model=settings.default_embedding_model,
             expected_dimension=settings.embedding_dimension,
+            batch_size=settings.gemini_embedding_batch_size,
+            max_concurrency=settings.gemini_embedding_max_concurrency,
         )
     return InMemoryEmbeddingService(dimension=settings.embedding_dimension)
 
 
-if settings.persistence_backend == "postgres":
+# local_index keeps PostgreSQL as the system of record and only moves the vector channel to local disk.
+_uses_postgres = settings.persistence_backend in ("postgres", "local_index")
+_local_ann_index_store: LocalAnnIndexStore | None = None
+_retrieval_statement_metrics: RetrievalStatementMetrics | None = None
+if _uses_postgres:
     _stats_repository: StatsRepository = SQLAlchemyStatsRepository(session_factory=SessionFactory)
     _user_repository: UserRepository = SQLAlchemyUserRepository(session_factory=SessionFactory)
     _project_repository: ProjectRepository = SQLAlchemyProjectRepository(session_factory=SessionFactory)
     _project_snapshot_repository: ProjectSnapshotRepository = SQLAlchemyProjectSnapshotRepository(
         session_factory=SessionFactory
     )
+    _project_index_generation_repository: ProjectIndexGenerationRepository = (
+        SQLAlchemyProjectIndexGenerationRepository(session_factory=SessionFactory)
+    )
     _document_repository: DocumentRepository = SQLAlchemyDocumentRepository(session_factory=SessionFactory)
     _document_chunk_repository: DocumentChunkRepository = SQLAlchemyDocumentChunkRepository(
         session_factory=SessionFactory
@@ -526,20 +577,60 @@ if settings.persistence_backend == "postgres":
     _organization_invitation_repository: OrganizationInvitationRepository = (
         SQLAlchemyOrganizationInvitationRepository(session_factory=SessionFactory)
     )
+    _retrieval_statement_metrics = RetrievalStatementMetrics()
+    _retrieval_statement_metrics.instrument(engine.sync_engine)
     _chunk_retrieval_service: ChunkRetrievalService = SQLAlchemyChunkRetrievalService(
         session_factory=SessionFactory,
         vector_weight=settings.retrieval_vector_weight,
         fulltext_weight=settings.retrieval_fulltext_weight,
         candidate_multiplier=settings.retrieval_candidate_multiplier,
         fulltext_language=settings.retrieval_fulltext_language,
-    )
+        hnsw_ef_search=settings.retrieval_hnsw_ef_search,
+        hnsw_iterative_scan=settings.retrieval_hnsw_iterative_scan,
+        hnsw_filtered_ef_search_multiplier=settings.retrieval_hnsw_filtered_ef_search_multiplier,
+        fusion=settings.retrieval_fusion,
+        rrf_k=settings.retrieval_rrf_k,
+        vector_index=settings.retrieval_vector_index,
+        quantized_rescore_multiplier=settings.retrieval_quantized_rescore_multiplier,
+        channel_execution=settings.retrieval_channel_execution,
+        filtered_exact_scan_threshold=settings.retrieval_filtered_exact_scan_threshold,
+    )
+    if settings.persistence_backend == "local_index":
+        _local_ann_index_store = LocalAnnIndexStore(
+            root=settings.local_index_dir, nlist=settings.local_index_nlist or None
+        )
+        _local_index_retrieval_service = LocalIndexChunkRetrievalService(
+            source=SQLAlchemyLocalIndexSource(
+                session_factory=SessionFactory,
+                embedding_dimension=settings.embedding_dimension,
+                fulltext_language=settings.retrieval_fulltext_language,
+            ),
+            store=_local_ann_index_store,
+            project_index_generation_repository=_project_index_generation_repository,
+            fallback=_chunk_retrieval_service,
+            vector_weight=settings.retrieval_vector_weight,
+            fulltext_weight=settings.retrieval_fulltext_weight,
+            candidate_multiplier=settings.retrieval_candidate_multiplier,
+            fusion=settings.retrieval_fusion,
+            rrf_k=settings.retrieval_rrf_k,
+            nprobe=settings.local_index_nprobe,
+            rebuild_ratio=settings.local_index_rebuild_ratio,
+        )
+        _chunk_retrieval_service = _local_index_retrieval_service
+        # Chunk writers bump through this wrapper, which refreshes the index in the background.
+        _project_index_generation_repository = RefreshingProjectIndexGenerationRepository(
+            inner=_project_index_generation_repository,
+            retrieval_service=_local_index_retrieval_service,
+        )
 else:
     _stats_repository = InMemoryStatsRepository()
     _user_repository = InMemoryUserRepository()
     _project_repository = InMemoryProjectRepository()
     _project_snapshot_repository = InMemoryProjectSnapshotRepository()
+    _project_index_generation_repository = InMemoryProjectIndexGenerationRepository()
     _document_repository = InMemoryDocumentRepository()
-    _document_chunk_repository = InMemoryDocumentChunkRepository()
+    _in_memory_vector_index = InMemoryVectorIndex()
+    _document_chunk_repository = InMemoryDocumentChunkRepository(vector_index=_in_memory_vector_index)
     _conversation_repository = InMemoryConversationRepository()
     _message_repository = InMemoryMessageRepository()
     _provider_credential_repository = InMemoryProviderCredentialRepository()
@@ -555,6 +646,9 @@ else:
         document_chunk_repository=_document_chunk_repository,
         vector_weight=settings.retrieval_vector_weight,
         fulltext_weight=settings.retrieval_fulltext_weight,
+        fusion=settings.retrieval_fusion,
+        rrf_k=settings.retrieval_rrf_k,
+        vector_index=_in_memory_vector_index,
     )
 _password_hasher = BcryptPasswordHasher()
 _provider_api_key_crypto_service: ProviderApiKeyCryptoService = FernetProviderApiKeyCryptoService(
@@ -596,7 +690,7 @@ _document_structure_analyzer: DocumentStructureAnalyzer = HeuristicDocumentStruc
 _file_metadata_extractor: FileMetadataExtractor = DocumentFileMetadataExtractor()
 _language_detector: LanguageDetector = LangdetectLanguageDetector()
 _keyword_extractor: KeywordExtractor = KeybertKeywordExtractor()
-if settings.persistence_backend != "postgres":
+if not _uses_postgres:
     _file_metadata_extractor = InMemoryFileMetadataExtractor()
     _language_detector = InMemoryLanguageDetector(language="en")
     _keyword_extractor = InMemoryKeywordExtractor()
@@ -645,6 +739,8 @@ _document_indexing_service = DocumentIndexingService(
     parent_child_chunking_service=_parent_child_chunking_service,
     slide_chunker=_slide_chunker,
     tabular_chunker=_tabular_chunker,
+    project_index_generation_repository=_project_index_generation_repository,
+    diff_chunks=settings.indexing_chunk_diff_enabled,
 )
 _token_service = JwtTokenService(secret_key="dev-secret-key", algorithm="HS256")
 _bearer = HTTPBearer(auto_error=False)
@@ -667,15 +763,40 @@ elif settings.default_llm_provider == "ollama":
     )
 else:
     _llm_service = InMemoryLLMService()
+_document_ingestion_queue: DocumentIngestionQueue = (
+    SQLAlchemyDocumentIngestionQueue(session_factory=SessionFactory)
+    if _uses_postgres
+    else InMemoryDocumentIngestionQueue()
+)
+_embedding_cache: EmbeddingCache | None = None
+if settings.embedding_cache_max_entries > 0:
+    _embedding_cache = (
+        SQLAlchemyEmbeddingCache(
+            session_factory=SessionFactory,
+            ttl_seconds=settings.embedding_cache_ttl_seconds,
+        )
+        if _uses_postgres
+        else InMemoryEmbeddingCache(
+            max_entries=settings.embedding_cache_max_entries,
+            ttl_seconds=settings.embedding_cache_ttl_seconds,
+        )
+    )
+_provider_client_pool = ProviderClientPool(
+    max_entries=settings.provider_client_pool_max_entries,
+    close_delay_seconds=settings.provider_client_pool_close_delay_seconds,
+)
 _project_embedding_service_resolver: ProjectEmbeddingServiceResolver = RuntimeProjectEmbeddingServiceResolver(
     settings=settings,
     provider_api_key_crypto_service=_provider_api_key_crypto_service,
     default_embedding_service=_embedding_service,
+    embedding_cache=_embedding_cache,
+    client_pool=_provider_client_pool,
 )
 _project_llm_service_resolver: ProjectLLMServiceResolver = RuntimeProjectLLMServiceResolver(
     settings=settings,
     provider_api_key_crypto_service=_provider_api_key_crypto_service,
     default_llm_service=_llm_service,
+    client_pool=_provider_client_pool,
 )
 _agent_configuration_resolver = AgentConfigurationResolver(
     agent_configuration_repository=_agent_configuration_repository,
@@ -707,6 +828,24 @@ _conversation_title_generator: ConversationTitleGenerator = LLMConversationTitle
 )
 _entra_oauth_provider = EntraOAuthProvider()
 _oauth_code_store = InMemoryOAuthCodeStore()
+_query_embedding_cache: QueryEmbeddingCache | None = None
+if settings.query_embedding_cache_max_entries > 0:
+    _query_embedding_cache = InMemoryQueryEmbeddingCache(
+        max_entries=settings.query_embedding_cache_max_entries,
+        ttl_seconds=settings.query_embedding_cache_ttl_seconds,
+        shared_cache=SQLAlchemyQueryEmbeddingCache(
+            session_factory=SessionFactory,
+            ttl_seconds=settings.query_embedding_cache_ttl_seconds,
+        )
+        if settings.query_embedding_cache_shared and _uses_postgres
+        else None,
+    )
+_retrieval_result_cache: RetrievalResultCache | None = None
+if settings.retrieval_result_cache_max_entries > 0:
+    _retrieval_result_cache = InMemoryRetrievalResultCache(
+        max_entries=settings.retrieval_result_cache_max_entries,
+        ttl_seconds=settings.retrieval_result_cache_ttl_seconds,
+    )
 _invitation_email_service: InvitationEmailService
 if settings.email_backend == "mailgun":
     _invitation_email_service = MailgunInvitationEmailService(
@@ -748,6 +887,18 @@ def get_handle_oauth_callback_use_case() -> HandleOAuthCallback:
     )
 
 
+def get_local_ann_index_store() -> LocalAnnIndexStore | None:
+    return _local_ann_index_store
+
+
+def get_provider_client_pool() -> ProviderClientPool:
+    return _provider_client_pool
+
+
+def get_retrieval_statement_metrics() -> RetrievalStatementMetrics | None:
+    return _retrieval_statement_metrics
+
+
 def get_oauth_code_store() -> InMemoryOAuthCodeStore:
     return _oauth_code_store
 
@@ -844,6 +995,11 @@ def get_reindex_project_use_case() -> ReindexProject:
         document_indexing_service=_document_indexing_service,
         project_embedding_service_resolver=_project_embedding_service_resolver,
         agent_configuration_resolver=_agent_configuration_resolver,
+        project_index_generation_repository=_project_index_generation_repository,
+        max_documents_in_flight=settings.reindex_max_documents_in_flight,
+        max_concurrent_downloads=settings.reindex_max_concurrent_downloads,
+        max_concurrent_extractions=settings.reindex_max_concurrent_extractions,
+        progress_batch_size=settings.reindex_progress_batch_size,
     )
 
 
@@ -860,9 +1016,42 @@ def get_upload_document_use_case() -> UploadDocument:
         max_documents_per_project=settings.max_documents_per_project,
         organization_member_repository=_organization_member_repository,
         agent_configuration_resolver=_agent_configuration_resolver,
+        document_ingestion_queue=_document_ingestion_queue,
     )
 
 
+def get_index_queued_document_use_case() -> IndexQueuedDocument:
+    return IndexQueuedDocument(
+        document_repository=_document_repository,
+        project_repository=_project_repository,
+        file_storage_service=_file_storage_service,
+        document_indexing_service=_document_indexing_service,
+        project_embedding_service_resolver=_project_embedding_service_resolver,
+        agent_configuration_resolver=_agent_configuration_resolver,
+    )
+
+
+def get_document_ingestion_worker() -> DocumentIngestionWorker:
+    return DocumentIngestionWorker(
+        queue=_document_ingestion_queue,
+        index_queued_document=get_index_queued_document_use_case(),
+        lease_seconds=settings.ingestion_worker_lease_seconds,
+        poll_interval_seconds=settings.ingestion_worker_poll_interval_seconds,
+        max_attempts=settings.ingestion_worker_max_attempts,
+        retry_base_delay_seconds=settings.ingestion_worker_retry_base_delay_seconds,
+        retry_max_delay_seconds=settings.ingestion_worker_retry_max_delay_seconds,
+    )
+
+
+def get_embedded_ingestion_worker() -> DocumentIngestionWorker | None:
+    """Worker to run inside the API process: the in-memory queue is not visible to other processes."""
+    if settings.processing_mode != "async":
+        return None
+    if _uses_postgres and not settings.ingestion_worker_embedded:
+        return None
+    return get_document_ingestion_worker()
+
+
 def get_reindex_document_use_case() -> ReindexDocument:
     return ReindexDocument(
         document_repository=_document_repository,
@@ -899,6 +1088,7 @@ def get_delete_document_use_case() -> DeleteDocument:
         project_repository=_project_repository,
         file_storage_service=_file_storage_service,
         organization_member_repository=_organization_member_repository,
+        project_index_generation_repository=_project_index_generation_repository,
     )
 
 
@@ -923,6 +1113,11 @@ def get_query_relevant_chunks_use_case() -> QueryRelevantChunks:
         document_chunk_repository=_document_chunk_repository,
         context_window_size=settings.retrieval_context_window_size,
         organization_member_repository=_organization_member_repository,
+        query_embedding_cache=_query_embedding_cache,
+        embedding_backend=settings.default_embedding_provider,
+        embedding_model=settings.default_embedding_model,
+        retrieval_result_cache=_retrieval_result_cache,
+        project_index_generation_repository=_project_index_generation_repository,
     )
 
 
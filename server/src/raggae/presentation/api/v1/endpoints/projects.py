@@ -18,6 +18,7 @@ from raggae.application.use_cases.project.update_project_configuration import Up
 from raggae.domain.exceptions.organization_exceptions import OrganizationAccessDeniedError
 from raggae.domain.exceptions.project_exceptions import (
     InvalidProjectEmbeddingBackendError,
+    InvalidProjectHnswSearchSettingsError,
     InvalidProjectLLMBackendError,
     InvalidProjectRerankerBackendError,
     InvalidProjectRetrievalStrategyError,
@@ -204,6 +205,7 @@ async def update_project_configuration(
         InvalidProjectLLMBackendError,
         InvalidProjectRetrievalStrategyError,
         InvalidProjectRerankerBackendError,
+        InvalidProjectHnswSearchSettingsError,
     ) as exc:
         _config_error_handler(exc)
     return AgentConfigurationResponse.from_dto(result)
@@ -249,9 +251,10 @@ async def reindex_project(
     project_id: UUID,
     user_id: Annotated[UUID, Depends(get_current_user_id)],
     use_case: Annotated[ReindexProject, Depends(get_reindex_project_use_case)],
+    force: bool = False,
 ) -> ReindexProjectResponse:
     try:
-        result = await use_case.execute(project_id=project_id, user_id=user_id)
+        result = await use_case.execute(project_id=project_id, user_id=user_id, force=force)
     except ProjectNotFoundError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found") from None
     except ProjectReindexInProgressError:
@@ -265,6 +268,7 @@ async def reindex_project(
         total_documents=result.total_documents,
         indexed_documents=result.indexed_documents,
         failed_documents=result.failed_documents,
+        skipped_documents=result.skipped_documents,
     )
 
 
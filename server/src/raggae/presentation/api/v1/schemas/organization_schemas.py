@@ -102,6 +102,8 @@ class OrgAgentConfigurationResponse(BaseModel):
     retrieval_strategy: str | None
     retrieval_top_k: int | None
     retrieval_min_score: float | None
+    retrieval_hnsw_ef_search: int | None
+    retrieval_hnsw_iterative_scan: str | None
     # Reranking
     reranking_enabled: bool | None
     reranker_backend: str | None
@@ -126,6 +128,8 @@ class OrgAgentConfigurationResponse(BaseModel):
             retrieval_strategy=dto.retrieval_strategy,
             retrieval_top_k=dto.retrieval_top_k,
             retrieval_min_score=dto.retrieval_min_score,
+            retrieval_hnsw_ef_search=dto.retrieval_hnsw_ef_search,
+            retrieval_hnsw_iterative_scan=dto.retrieval_hnsw_iterative_scan,
             reranking_enabled=dto.reranking_enabled,
             reranker_backend=dto.reranker_backend,
             reranker_model=dto.reranker_model,
@@ -150,6 +154,8 @@ class UpsertOrgAgentConfigurationRequest(BaseModel):
     retrieval_strategy: str | None = None
     retrieval_top_k: int | None = None
     retrieval_min_score: float | None = None
+    retrieval_hnsw_ef_search: int | None = None
+    retrieval_hnsw_iterative_scan: str | None = None
     # Reranking
     reranking_enabled: bool | None = None
     reranker_backend: str | None = None
@@ -37,6 +37,8 @@ class AgentConfigurationResponse(BaseModel):
     retrieval_strategy: str | None
     retrieval_top_k: int | None
     retrieval_min_score: float | None
+    retrieval_hnsw_ef_search: int | None
+    retrieval_hnsw_iterative_scan: str | None
     # Reranking
     reranking_enabled: bool | None
     reranker_backend: str | None
@@ -61,6 +63,8 @@ class AgentConfigurationResponse(BaseModel):
             retrieval_strategy=dto.retrieval_strategy,
             retrieval_top_k=dto.retrieval_top_k,
             retrieval_min_score=dto.retrieval_min_score,
+            retrieval_hnsw_ef_search=dto.retrieval_hnsw_ef_search,
+            retrieval_hnsw_iterative_scan=dto.retrieval_hnsw_iterative_scan,
             reranking_enabled=dto.reranking_enabled,
             reranker_backend=dto.reranker_backend,
             reranker_model=dto.reranker_model,
@@ -82,6 +86,8 @@ class UpdateAgentConfigurationRequest(BaseModel):
     retrieval_strategy: str | None = None
     retrieval_top_k: int | None = None
     retrieval_min_score: float | None = None
+    retrieval_hnsw_ef_search: int | None = None
+    retrieval_hnsw_iterative_scan: str | None = None
     reranking_enabled: bool | None = None
     reranker_backend: str | None = None
     reranker_model: str | None = None
@@ -125,6 +131,7 @@ class ReindexProjectResponse(BaseModel):
     total_documents: int
     indexed_documents: int
     failed_documents: int
+    skipped_documents: int = 0
 
 
 class OrganizationSectionResponse(BaseModel):
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
@@ -7,7 +8,13 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from raggae.infrastructure.config.settings import settings
-from raggae.presentation.api.dependencies import get_query_relevant_chunks_use_case
+from raggae.presentation.api.dependencies import (
+    get_embedded_ingestion_worker,
+    get_local_ann_index_store,
+    get_provider_client_pool,
+    get_query_relevant_chunks_use_case,
+    get_retrieval_statement_metrics,
+)
 from raggae.presentation.api.v1.endpoints.auth import router as auth_router
 from raggae.presentation.api.v1.endpoints.chat import router as chat_router
 from raggae.presentation.api.v1.endpoints.documents import router as documents_router
@@ -40,10 +47,38 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(_: FastAPI) -> AsyncIterator[None]:
-    """Warm up heavy retrieval dependencies at startup."""
+    """Warm up heavy retrieval dependencies and start the embedded ingestion worker, if any.
+
+    Provider clients are closed at shutdown, after logging the pool and the
+    retrieval statement cache counters.
+    """
     get_query_relevant_chunks_use_case()
+    local_ann_index_store = get_local_ann_index_store()
+    if local_ann_index_store is not None:
+        # Drop what a crash left behind; missing indexes are rebuilt from the database on first query.
+        local_ann_index_store.recover()
     _warn_if_entra_secret_expiring()
+    ingestion_worker = get_embedded_ingestion_worker()
+    ingestion_stop = asyncio.Event()
+    ingestion_task = (
+        asyncio.create_task(ingestion_worker.run(ingestion_stop)) if ingestion_worker is not None else None
+    )
     yield
+    if ingestion_task is not None:
+        ingestion_stop.set()
+        await ingestion_task
+    retrieval_statement_metrics = get_retrieval_statement_metrics()
+    if retrieval_statement_metrics is not None:
+        logger.info(
+            "retrieval_statement_stats",
+            extra={"event": "retrieval_statement_stats", **retrieval_statement_metrics.stats()},
+        )
+    provider_client_pool = get_provider_client_pool()
+    logger.info(
+        "provider_client_pool_closing",
+        extra={"event": "provider_client_pool_closing", **provider_client_pool.stats()},
+    )
+    await provider_client_pool.aclose()
 
 
 def _warn_if_entra_secret_expiring() -> None:
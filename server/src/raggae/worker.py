@@ -0,0 +1,47 @@
+"""Document ingestion worker process: ``python -m raggae.worker``.
+
+Indexes the documents uploaded with ``PROCESSING_MODE=async`` from the
+PostgreSQL ingestion queue. Run as many processes as needed; they share the
+queue without coordination. SIGINT/SIGTERM let the current job finish.
+"""
+
+import asyncio
+import logging
+import signal
+
+from raggae.presentation.api.dependencies import (
+    get_document_ingestion_worker,
+    get_provider_client_pool,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def run_worker() -> None:
+    worker = get_document_ingestion_worker()
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for stop_signal in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(stop_signal, stop.set)
+    try:
+        await worker.run(stop)
+    finally:
+        logger.info(
+            "ingestion_worker_summary",
+            extra={
+                "worker_id": worker.worker_id,
+                "processed": worker.processed,
+                "retried": worker.retried,
+                "failed": worker.failed,
+            },
+        )
+        await get_provider_client_pool().aclose()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run_worker())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import hashlib
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock
 from uuid import uuid4
@@ -7,10 +8,18 @@ import pytest
 from raggae.application.dto.document_structure_analysis_dto import DocumentStructureAnalysisDTO
 from raggae.application.interfaces.services.file_metadata_extractor import FileMetadata
 from raggae.application.services.document_indexing_service import DocumentIndexingService
+from raggae.application.services.parent_child_chunking_service import ParentChildChunkingService
 from raggae.application.services.slide_chunker import SlideChunker
 from raggae.domain.entities.document import Document
 from raggae.domain.entities.project import Project
+from raggae.domain.value_objects.chunk_level import ChunkLevel
 from raggae.domain.value_objects.chunking_strategy import ChunkingStrategy
+from raggae.infrastructure.database.repositories.in_memory_document_chunk_repository import (
+    InMemoryDocumentChunkRepository,
+)
+from raggae.infrastructure.database.repositories.in_memory_project_index_generation_repository import (
+    InMemoryProjectIndexGenerationRepository,
+)
 
 
 class TestDocumentIndexingService:
@@ -142,6 +151,36 @@ class TestDocumentIndexingService:
         assert saved_chunks[1].content == "from raggae"
         assert result.processing_strategy == ChunkingStrategy.PARAGRAPH
 
+    async def test_run_pipeline_stamps_content_hash_and_pipeline_fingerprint(
+        self,
+        mock_document_chunk_repository: AsyncMock,
+        mock_document_text_extractor: AsyncMock,
+        mock_text_sanitizer_service: AsyncMock,
+        mock_document_structure_analyzer: AsyncMock,
+        mock_text_chunker_service: AsyncMock,
+        mock_embedding_service: AsyncMock,
+        document: Document,
+        project: Project,
+    ) -> None:
+        # Given
+        service = DocumentIndexingService(
+            document_chunk_repository=mock_document_chunk_repository,
+            document_text_extractor=mock_document_text_extractor,
+            text_sanitizer_service=mock_text_sanitizer_service,
+            document_structure_analyzer=mock_document_structure_analyzer,
+            text_chunker_service=mock_text_chunker_service,
+            embedding_service=mock_embedding_service,
+        )
+
+        # When
+        result = await service.run_pipeline(
+            document, project, b"hello world from raggae", pipeline_fingerprint="fingerprint"
+        )
+
+        # Then
+        assert result.content_hash == hashlib.sha256(b"hello world from raggae").hexdigest()
+        assert result.pipeline_fingerprint == "fingerprint"
+
     async def test_run_pipeline_with_llamaindex_backend(
         self,
         mock_document_chunk_repository: AsyncMock,
@@ -210,6 +249,35 @@ class TestDocumentIndexingService:
         mock_document_chunk_repository.replace_document_chunks.assert_called_once_with(document.id, [])
         assert result.processing_strategy is not None
 
+    async def test_run_pipeline_bumps_project_index_generation(
+        self,
+        mock_document_chunk_repository: AsyncMock,
+        mock_document_text_extractor: AsyncMock,
+        mock_text_sanitizer_service: AsyncMock,
+        mock_document_structure_analyzer: AsyncMock,
+        mock_text_chunker_service: AsyncMock,
+        mock_embedding_service: AsyncMock,
+        document: Document,
+        project: Project,
+    ) -> None:
+        # Given
+        generation_repository = InMemoryProjectIndexGenerationRepository()
+        service = DocumentIndexingService(
+            document_chunk_repository=mock_document_chunk_repository,
+            document_text_extractor=mock_document_text_extractor,
+            text_sanitizer_service=mock_text_sanitizer_service,
+            document_structure_analyzer=mock_document_structure_analyzer,
+            text_chunker_service=mock_text_chunker_service,
+            embedding_service=mock_embedding_service,
+            project_index_generation_repository=generation_repository,
+        )
+
+        # When
+        await service.run_pipeline(document, project, b"hello world from raggae")
+
+        # Then
+        assert await generation_repository.get_generation(document.project_id) == 1
+
     async def test_run_pipeline_metadata_fields(
         self,
         mock_document_chunk_repository: AsyncMock,
@@ -515,3 +583,171 @@ class TestDocumentIndexingService:
         # Then — aucun chunk stocké
         saved_chunks = mock_document_chunk_repository.replace_document_chunks.call_args.args[1]
         assert saved_chunks == []
+
+
+class _RecordingEmbeddingService:
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    async def embed_texts(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(texts)
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+class TestDocumentIndexingServiceChunkDiff:
+    @pytest.fixture
+    def chunk_repository(self) -> InMemoryDocumentChunkRepository:
+        return InMemoryDocumentChunkRepository()
+
+    @pytest.fixture
+    def text_chunker_service(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def embedding_service(self) -> _RecordingEmbeddingService:
+        return _RecordingEmbeddingService()
+
+    @pytest.fixture
+    def service(
+        self,
+        chunk_repository: InMemoryDocumentChunkRepository,
+        text_chunker_service: AsyncMock,
+        embedding_service: _RecordingEmbeddingService,
+    ) -> DocumentIndexingService:
+        extractor = AsyncMock()
+        extractor.extract_text.return_value = "text"
+        sanitizer = AsyncMock()
+        sanitizer.sanitize_text.return_value = "text"
+        return DocumentIndexingService(
+            document_chunk_repository=chunk_repository,
+            document_text_extractor=extractor,
+            text_sanitizer_service=sanitizer,
+            document_structure_analyzer=AsyncMock(),
+            text_chunker_service=text_chunker_service,
+            embedding_service=embedding_service,
+            parent_child_chunking_service=ParentChildChunkingService(),
+            diff_chunks=True,
+        )
+
+    @pytest.fixture
+    def document(self) -> Document:
+        return Document(
+            id=uuid4(),
+            project_id=uuid4(),
+            file_name="doc.txt",
+            content_type="text/plain",
+            file_size=23,
+            storage_key="projects/p1/documents/d1-doc.txt",
+            created_at=datetime.now(UTC),
+        )
+
+    @pytest.fixture
+    def project(self) -> Project:
+        return Project(
+            id=uuid4(),
+            user_id=uuid4(),
+            name="Project",
+            description="",
+            system_prompt="",
+            is_published=False,
+            created_at=datetime.now(UTC),
+        )
+
+    async def test_reindex_reuses_unchanged_chunks_and_embeds_only_new_ones(
+        self,
+        service: DocumentIndexingService,
+        chunk_repository: InMemoryDocumentChunkRepository,
+        text_chunker_service: AsyncMock,
+        embedding_service: _RecordingEmbeddingService,
+        document: Document,
+        project: Project,
+    ) -> None:
+        # Given
+        text_chunker_service.chunk_text.return_value = ["intro", "body", "outro"]
+        document = await service.run_pipeline(
+            document, project, b"v1", chunking_strategy=ChunkingStrategy.PARAGRAPH, pipeline_fingerprint="fp"
+        )
+        before = {chunk.content: chunk for chunk in await chunk_repository.find_by_document_id(document.id)}
+        text_chunker_service.chunk_text.return_value = ["new intro", "intro", "body"]
+
+        # When
+        await service.run_pipeline(
+            document, project, b"v2", chunking_strategy=ChunkingStrategy.PARAGRAPH, pipeline_fingerprint="fp"
+        )
+
+        # Then
+        after = sorted(await chunk_repository.find_by_document_id(document.id), key=lambda c: c.chunk_index)
+        assert embedding_service.calls[-1] == ["new intro"]
+        assert [chunk.content for chunk in after] == ["new intro", "intro", "body"]
+        assert [chunk.chunk_index for chunk in after] == [0, 1, 2]
+        assert after[1].id == before["intro"].id
+        assert after[2].id == before["body"].id
+        assert after[2].embedding == before["body"].embedding
+        assert after[0].embedding == [9.0, 1.0]
+
+    async def test_reindex_under_new_fingerprint_replaces_every_chunk(
+        self,
+        service: DocumentIndexingService,
+        chunk_repository: InMemoryDocumentChunkRepository,
+        text_chunker_service: AsyncMock,
+        embedding_service: _RecordingEmbeddingService,
+        document: Document,
+        project: Project,
+    ) -> None:
+        # Given
+        text_chunker_service.chunk_text.return_value = ["intro", "body"]
+        document = await service.run_pipeline(
+            document, project, b"v1", chunking_strategy=ChunkingStrategy.PARAGRAPH, pipeline_fingerprint="fp1"
+        )
+        before_ids = {chunk.id for chunk in await chunk_repository.find_by_document_id(document.id)}
+
+        # When
+        await service.run_pipeline(
+            document, project, b"v1", chunking_strategy=ChunkingStrategy.PARAGRAPH, pipeline_fingerprint="fp2"
+        )
+
+        # Then
+        after_ids = {chunk.id for chunk in await chunk_repository.find_by_document_id(document.id)}
+        assert embedding_service.calls[-1] == ["intro", "body"]
+        assert after_ids.isdisjoint(before_ids)
+
+    async def test_reindex_keeps_parent_child_links_of_reused_chunks(
+        self,
+        service: DocumentIndexingService,
+        chunk_repository: InMemoryDocumentChunkRepository,
+        text_chunker_service: AsyncMock,
+        embedding_service: _RecordingEmbeddingService,
+        document: Document,
+        project: Project,
+    ) -> None:
+        # Given
+        text_chunker_service.chunk_text.return_value = ["first child", "second child"]
+        document = await service.run_pipeline(
+            document,
+            project,
+            b"v1",
+            parent_child_chunking=True,
+            chunking_strategy=ChunkingStrategy.PARAGRAPH,
+            pipeline_fingerprint="fp",
+        )
+        before = await chunk_repository.find_by_document_id(document.id)
+
+        # When
+        await service.run_pipeline(
+            document,
+            project,
+            b"v1",
+            parent_child_chunking=True,
+            chunking_strategy=ChunkingStrategy.PARAGRAPH,
+            pipeline_fingerprint="fp",
+        )
+
+        # Then
+        after = await chunk_repository.find_by_document_id(document.id)
+        assert len(embedding_service.calls) == 1
+        assert {chunk.id for chunk in after} == {chunk.id for chunk in before}
+        parent = next(chunk for chunk in after if chunk.chunk_level == ChunkLevel.PARENT)
+        assert parent.embedding == [0.0, 0.0]
+        assert all(
+            chunk.parent_chunk_id == parent.id for chunk in after if chunk.chunk_level == ChunkLevel.CHILD
+        )
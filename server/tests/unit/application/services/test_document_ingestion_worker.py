@@ -0,0 +1,160 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from raggae.application.dto.ingestion_job_dto import IngestionJobDTO
+from raggae.application.services.document_ingestion_worker import DocumentIngestionWorker
+from raggae.domain.exceptions.document_exceptions import (
+    DocumentExtractionError,
+    EmbeddingGenerationError,
+)
+
+
+def _job(attempts: int = 1) -> IngestionJobDTO:
+    return IngestionJobDTO(
+        id=uuid4(), document_id=uuid4(), project_id=uuid4(), user_id=uuid4(), attempts=attempts
+    )
+
+
+class TestDocumentIngestionWorker:
+    @pytest.fixture
+    def queue(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def use_case(self) -> AsyncMock:
+        return AsyncMock()
+
+    def _worker(self, queue: AsyncMock, use_case: AsyncMock, **kwargs: float) -> DocumentIngestionWorker:
+        return DocumentIngestionWorker(
+            queue=queue, index_queued_document=use_case, worker_id="worker-1", **kwargs
+        )
+
+    async def test_run_once_returns_false_when_queue_is_empty(
+        self, queue: AsyncMock, use_case: AsyncMock
+    ) -> None:
+        # Given
+        queue.claim.return_value = None
+
+        # When
+        claimed = await self._worker(queue, use_case).run_once()
+
+        # Then
+        assert claimed is False
+        use_case.execute.assert_not_awaited()
+
+    async def test_run_once_completes_indexed_job(self, queue: AsyncMock, use_case: AsyncMock) -> None:
+        # Given
+        job = _job()
+        queue.claim.return_value = job
+        worker = self._worker(queue, use_case)
+
+        # When
+        claimed = await worker.run_once()
+
+        # Then
+        assert claimed is True
+        use_case.execute.assert_awaited_once_with(job, final_attempt=False)
+        queue.complete.assert_awaited_once_with(job.id, "worker-1")
+        assert worker.processed == 1
+
+    async def test_run_once_schedules_retry_with_backoff_on_transient_failure(
+        self, queue: AsyncMock, use_case: AsyncMock
+    ) -> None:
+        # Given
+        job = _job(attempts=2)
+        queue.claim.return_value = job
+        use_case.execute.side_effect = EmbeddingGenerationError("rate limited")
+        worker = self._worker(queue, use_case, retry_base_delay_seconds=10.0)
+
+        # When
+        with patch(
+            "raggae.application.services.document_ingestion_worker.backoff_delay", return_value=7.5
+        ) as backoff:
+            await worker.run_once()
+
+        # Then
+        backoff.assert_called_once_with(1, 10.0, 600.0)
+        queue.retry.assert_awaited_once_with(job.id, "worker-1", "rate limited", 7.5)
+        queue.fail.assert_not_awaited()
+        assert worker.retried == 1
+
+    async def test_run_once_fails_job_on_permanent_failure(
+        self, queue: AsyncMock, use_case: AsyncMock
+    ) -> None:
+        # Given
+        job = _job()
+        queue.claim.return_value = job
+        use_case.execute.side_effect = DocumentExtractionError("corrupted")
+        worker = self._worker(queue, use_case)
+
+        # When
+        await worker.run_once()
+
+        # Then
+        queue.fail.assert_awaited_once_with(job.id, "worker-1", "corrupted")
+        queue.retry.assert_not_awaited()
+        assert worker.failed == 1
+
+    async def test_run_once_runs_last_attempt_as_final(self, queue: AsyncMock, use_case: AsyncMock) -> None:
+        # Given
+        job = _job(attempts=3)
+        queue.claim.return_value = job
+        use_case.execute.side_effect = EmbeddingGenerationError("rate limited")
+
+        # When
+        await self._worker(queue, use_case, max_attempts=3).run_once()
+
+        # Then
+        use_case.execute.assert_awaited_once_with(job, final_attempt=True)
+        queue.fail.assert_awaited_once()
+
+    async def test_run_once_abandons_job_past_max_attempts_without_running_it(
+        self, queue: AsyncMock, use_case: AsyncMock
+    ) -> None:
+        # Given
+        job = _job(attempts=4)
+        queue.claim.return_value = job
+
+        # When
+        await self._worker(queue, use_case, max_attempts=3).run_once()
+
+        # Then
+        use_case.execute.assert_not_awaited()
+        use_case.fail.assert_awaited_once()
+        queue.fail.assert_awaited_once()
+
+    async def test_run_once_renews_lease_while_job_runs(self, queue: AsyncMock, use_case: AsyncMock) -> None:
+        # Given
+        job = _job()
+        queue.claim.return_value = job
+        queue.heartbeat.return_value = True
+
+        async def slow_execute(*_args: object, **_kwargs: object) -> None:
+            await asyncio.sleep(0.05)
+
+        use_case.execute.side_effect = slow_execute
+
+        # When
+        await self._worker(queue, use_case, lease_seconds=0.03).run_once()
+
+        # Then
+        assert queue.heartbeat.await_count >= 2
+        queue.heartbeat.assert_awaited_with(job.id, "worker-1", 0.03)
+
+    async def test_run_stops_when_event_is_set(self, queue: AsyncMock, use_case: AsyncMock) -> None:
+        # Given
+        queue.claim.return_value = None
+        stop = asyncio.Event()
+        worker = self._worker(queue, use_case, poll_interval_seconds=0.01)
+
+        # When
+        task = asyncio.create_task(worker.run(stop))
+        await asyncio.sleep(0.03)
+        stop.set()
+        await asyncio.wait_for(task, timeout=1.0)
+
+        # Then
+        assert queue.claim.await_count >= 1
@@ -0,0 +1,15 @@
+from raggae.application.services.retry_backoff import backoff_delay
+
+
+class TestBackoffDelay:
+    def test_delay_is_jittered_below_exponential_cap(self) -> None:
+        delays = [backoff_delay(3, base_delay=0.5, max_delay=30.0) for _ in range(50)]
+
+        assert all(0.0 <= delay <= 4.0 for delay in delays)
+
+    def test_delay_never_exceeds_max_delay(self) -> None:
+        assert backoff_delay(20, base_delay=1.0, max_delay=2.0) <= 2.0
+
+    def test_retry_after_takes_precedence_up_to_max_delay(self) -> None:
+        assert backoff_delay(0, base_delay=0.0, max_delay=30.0, retry_after=5.0) == 5.0
+        assert backoff_delay(0, base_delay=0.0, max_delay=3.0, retry_after=5.0) == 3.0
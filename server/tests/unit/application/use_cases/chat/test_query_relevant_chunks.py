@@ -4,14 +4,18 @@ from uuid import UUID, uuid4
 
 import pytest
 
+from raggae.application.dto.document_chunk_view_dto import DocumentChunkViewDTO
 from raggae.application.dto.retrieved_chunk_dto import RetrievedChunkDTO
 from raggae.application.use_cases.chat.query_relevant_chunks import QueryRelevantChunks
-from raggae.domain.entities.document_chunk import DocumentChunk
 from raggae.domain.entities.organization_member import OrganizationMember
 from raggae.domain.entities.project import Project
 from raggae.domain.exceptions.project_exceptions import ProjectNotFoundError
-from raggae.domain.value_objects.chunk_level import ChunkLevel
 from raggae.domain.value_objects.organization_member_role import OrganizationMemberRole
+from raggae.infrastructure.cache.in_memory_query_embedding_cache import InMemoryQueryEmbeddingCache
+from raggae.infrastructure.cache.in_memory_retrieval_result_cache import InMemoryRetrievalResultCache
+from raggae.infrastructure.database.repositories.in_memory_project_index_generation_repository import (
+    InMemoryProjectIndexGenerationRepository,
+)
 
 
 def _make_project(project_id=None, user_id=None, organization_id=None):
@@ -111,6 +115,9 @@ class TestQueryRelevantChunks:
             min_score=0.0,
             strategy="hybrid",
             metadata_filters=None,
+            hnsw_ef_search=None,
+            hnsw_iterative_scan=None,
+            context_window_size=0,
         )
         assert len(result.chunks) == 2
         assert result.chunks[0].content == "first chunk"
@@ -131,7 +138,7 @@ class TestQueryRelevantChunks:
         resolver_embedding_service = AsyncMock()
         resolver_embedding_service.embed_texts.return_value = [[9.0, 9.0]]
         resolver = Mock()
-        resolver.resolve.return_value = resolver_embedding_service
+        resolver.resolve_query_service.return_value = resolver_embedding_service
         use_case = QueryRelevantChunks(
             project_repository=mock_project_repository,
             embedding_service=mock_embedding_service,
@@ -148,7 +155,10 @@ class TestQueryRelevantChunks:
         )
 
         # Then — resolver called with null config (config lives in AgentConfiguration now)
-        resolver.resolve.assert_called_once_with(backend=None, model=None, encrypted_api_key=None)
+        resolver.resolve_query_service.assert_called_once_with(
+            backend=None, model=None, encrypted_api_key=None
+        )
+        resolver.resolve.assert_not_called()
         resolver_embedding_service.embed_texts.assert_awaited_once_with(["resolved embedding"])
         mock_embedding_service.embed_texts.assert_not_called()
 
@@ -248,6 +258,9 @@ class TestQueryRelevantChunks:
             min_score=0.0,
             strategy="fulltext",
             metadata_filters={"source_type": "paragraph"},
+            hnsw_ef_search=None,
+            hnsw_iterative_scan=None,
+            context_window_size=0,
         )
 
     async def test_query_relevant_chunks_auto_strategy_resolves_to_fulltext(self) -> None:
@@ -277,6 +290,103 @@ class TestQueryRelevantChunks:
         # Then
         assert result.strategy_used == "fulltext"
 
+    async def test_query_reuses_cached_query_embedding(
+        self,
+        mock_project_repository: AsyncMock,
+        mock_embedding_service: AsyncMock,
+        mock_chunk_retrieval_service: AsyncMock,
+    ) -> None:
+        # Given
+        user_id = uuid4()
+        project_id = uuid4()
+        mock_project_repository.find_by_id.return_value = _make_project(project_id, user_id)
+        cache = InMemoryQueryEmbeddingCache()
+        use_case = QueryRelevantChunks(
+            project_repository=mock_project_repository,
+            embedding_service=mock_embedding_service,
+            chunk_retrieval_service=mock_chunk_retrieval_service,
+            query_embedding_cache=cache,
+            embedding_backend="openai",
+            embedding_model="text-embedding-3-small",
+        )
+
+        # When
+        await use_case.execute(project_id=project_id, user_id=user_id, query="What is Raggae?")
+        await use_case.execute(project_id=project_id, user_id=user_id, query="what is  Raggae?")
+
+        # Then
+        mock_embedding_service.embed_texts.assert_awaited_once_with(["What is Raggae?"])
+        assert cache.misses == 1
+        assert cache.hits == 1
+        assert mock_chunk_retrieval_service.retrieve_chunks.await_args.kwargs["query_embedding"] == [
+            0.1,
+            0.2,
+            0.3,
+        ]
+
+    async def test_query_serves_cached_result_until_index_generation_changes(
+        self,
+        mock_project_repository: AsyncMock,
+        mock_embedding_service: AsyncMock,
+        mock_chunk_retrieval_service: AsyncMock,
+    ) -> None:
+        # Given
+        user_id = uuid4()
+        project_id = uuid4()
+        mock_project_repository.find_by_id.return_value = _make_project(project_id, user_id)
+        cache = InMemoryRetrievalResultCache()
+        generation_repository = InMemoryProjectIndexGenerationRepository()
+        use_case = QueryRelevantChunks(
+            project_repository=mock_project_repository,
+            embedding_service=mock_embedding_service,
+            chunk_retrieval_service=mock_chunk_retrieval_service,
+            retrieval_result_cache=cache,
+            project_index_generation_repository=generation_repository,
+        )
+
+        # When
+        first = await use_case.execute(project_id=project_id, user_id=user_id, query="What is Raggae?")
+        second = await use_case.execute(project_id=project_id, user_id=user_id, query="What is Raggae?")
+        await generation_repository.bump(project_id)
+        third = await use_case.execute(project_id=project_id, user_id=user_id, query="What is Raggae?")
+
+        # Then
+        assert [chunk.chunk_id for chunk in second.chunks] == [chunk.chunk_id for chunk in first.chunks]
+        assert [chunk.chunk_id for chunk in third.chunks] == [chunk.chunk_id for chunk in first.chunks]
+        assert mock_embedding_service.embed_texts.await_count == 2
+        assert mock_chunk_retrieval_service.retrieve_chunks.await_count == 2
+        assert cache.hits == 1
+        assert cache.misses == 2
+
+    async def test_query_result_cache_is_scoped_by_retrieval_parameters(
+        self,
+        mock_project_repository: AsyncMock,
+        mock_embedding_service: AsyncMock,
+        mock_chunk_retrieval_service: AsyncMock,
+    ) -> None:
+        # Given
+        user_id = uuid4()
+        project_id = uuid4()
+        mock_project_repository.find_by_id.return_value = _make_project(project_id, user_id)
+        use_case = QueryRelevantChunks(
+            project_repository=mock_project_repository,
+            embedding_service=mock_embedding_service,
+            chunk_retrieval_service=mock_chunk_retrieval_service,
+            retrieval_result_cache=InMemoryRetrievalResultCache(),
+            project_index_generation_repository=InMemoryProjectIndexGenerationRepository(),
+        )
+
+        # When
+        await use_case.execute(project_id=project_id, user_id=user_id, query="q", limit=5)
+        await use_case.execute(project_id=project_id, user_id=user_id, query="q", limit=10)
+        await use_case.execute(project_id=project_id, user_id=user_id, query="q", limit=5, strategy="vector")
+        await use_case.execute(
+            project_id=project_id, user_id=user_id, query="q", limit=5, metadata_filters={"doc_type": "pdf"}
+        )
+
+        # Then
+        assert mock_chunk_retrieval_service.retrieve_chunks.await_count == 4
+
     async def test_query_with_reranker_overfetches_and_reranks(
         self,
         mock_project_repository: AsyncMock,
@@ -447,18 +557,17 @@ class TestQueryRelevantChunks:
         mock_retrieval.retrieve_chunks.return_value = retrieved
 
         neighbor_chunks = [
-            DocumentChunk(
+            DocumentChunkViewDTO(
                 id=uuid4(),
                 document_id=doc_id,
                 chunk_index=i,
                 content=f"chunk {i}",
-                embedding=[],
                 created_at=datetime.now(UTC),
             )
             for i in [1, 3, 4, 6]
         ]
         mock_chunk_repo = AsyncMock()
-        mock_chunk_repo.find_by_document_id_and_indices.return_value = neighbor_chunks
+        mock_chunk_repo.find_views_by_document_indices.return_value = neighbor_chunks
 
         use_case = QueryRelevantChunks(
             project_repository=mock_project_repository,
@@ -509,9 +618,66 @@ class TestQueryRelevantChunks:
         )
 
         # Then — no expansion, repository not called
-        mock_chunk_repo.find_by_document_id_and_indices.assert_not_awaited()
+        mock_chunk_repo.find_views_by_document_indices.assert_not_awaited()
         assert len(result.chunks) == 2
 
+    async def test_query_uses_context_prefetched_by_retrieval_service(
+        self,
+        mock_project_repository: AsyncMock,
+        mock_embedding_service: AsyncMock,
+    ) -> None:
+        # Given — the retrieval service returned neighbors and parent content with the hits
+        user_id = uuid4()
+        project_id = uuid4()
+        doc_id = uuid4()
+        parent_id = uuid4()
+        mock_project_repository.find_by_id.return_value = _make_project(project_id, user_id)
+
+        mock_retrieval = AsyncMock()
+        mock_retrieval.retrieve_chunks.return_value = [
+            RetrievedChunkDTO(
+                chunk_id=uuid4(),
+                document_id=doc_id,
+                content="chunk 2",
+                score=0.9,
+                chunk_index=2,
+                context_neighbors=[
+                    RetrievedChunkDTO(
+                        chunk_id=uuid4(), document_id=doc_id, content=f"chunk {i}", score=0.0, chunk_index=i
+                    )
+                    for i in (1, 3)
+                ],
+            ),
+            RetrievedChunkDTO(
+                chunk_id=uuid4(),
+                document_id=uuid4(),
+                content="child",
+                score=0.8,
+                chunk_index=0,
+                chunk_level="child",
+                parent_chunk_id=parent_id,
+                parent_content="parent content",
+            ),
+        ]
+        mock_chunk_repo = AsyncMock()
+        use_case = QueryRelevantChunks(
+            project_repository=mock_project_repository,
+            embedding_service=mock_embedding_service,
+            chunk_retrieval_service=mock_retrieval,
+            document_chunk_repository=mock_chunk_repo,
+            context_window_size=1,
+        )
+
+        # When
+        result = await use_case.execute(project_id=project_id, user_id=user_id, query="test", limit=5)
+
+        # Then — no extra repository round trip
+        assert mock_retrieval.retrieve_chunks.await_args.kwargs["context_window_size"] == 1
+        mock_chunk_repo.find_views_by_document_indices.assert_not_awaited()
+        mock_chunk_repo.find_views_by_ids.assert_not_awaited()
+        contents = {chunk.content for chunk in result.chunks}
+        assert contents == {"chunk 1", "chunk 2", "chunk 3", "parent content"}
+
     async def test_query_deduplicates_overlapping_windows(
         self,
         mock_project_repository: AsyncMock,
@@ -544,18 +710,17 @@ class TestQueryRelevantChunks:
 
         # Only indices 2 and 5 are missing (3 and 4 already present)
         neighbor_chunks = [
-            DocumentChunk(
+            DocumentChunkViewDTO(
                 id=uuid4(),
                 document_id=doc_id,
                 chunk_index=i,
                 content=f"chunk {i}",
-                embedding=[],
                 created_at=datetime.now(UTC),
             )
             for i in [2, 5]
         ]
         mock_chunk_repo = AsyncMock()
-        mock_chunk_repo.find_by_document_id_and_indices.return_value = neighbor_chunks
+        mock_chunk_repo.find_views_by_document_indices.return_value = neighbor_chunks
 
         use_case = QueryRelevantChunks(
             project_repository=mock_project_repository,
@@ -578,8 +743,8 @@ class TestQueryRelevantChunks:
         assert indices == [2, 3, 4, 5]
 
         # Repository called with only the missing indices {2, 5}
-        call_args = mock_chunk_repo.find_by_document_id_and_indices.call_args
-        assert call_args.kwargs["indices"] == {2, 5}
+        call_args = mock_chunk_repo.find_views_by_document_indices.call_args
+        assert call_args.args[0] == {doc_id: {2, 5}}
 
     async def test_query_expansion_clamps_index_to_zero(
         self,
@@ -605,17 +770,16 @@ class TestQueryRelevantChunks:
         mock_retrieval.retrieve_chunks.return_value = retrieved
 
         neighbor_chunks = [
-            DocumentChunk(
+            DocumentChunkViewDTO(
                 id=uuid4(),
                 document_id=doc_id,
                 chunk_index=1,
                 content="chunk 1",
-                embedding=[],
                 created_at=datetime.now(UTC),
             ),
         ]
         mock_chunk_repo = AsyncMock()
-        mock_chunk_repo.find_by_document_id_and_indices.return_value = neighbor_chunks
+        mock_chunk_repo.find_views_by_document_indices.return_value = neighbor_chunks
 
         use_case = QueryRelevantChunks(
             project_repository=mock_project_repository,
@@ -638,8 +802,8 @@ class TestQueryRelevantChunks:
         assert indices == [0, 1]
 
         # Only index 1 requested (0 already present, no negative indices)
-        call_args = mock_chunk_repo.find_by_document_id_and_indices.call_args
-        assert call_args.kwargs["indices"] == {1}
+        call_args = mock_chunk_repo.find_views_by_document_indices.call_args
+        assert call_args.args[0] == {doc_id: {1}}
 
     async def test_query_expansion_preserves_original_scores(
         self,
@@ -665,18 +829,17 @@ class TestQueryRelevantChunks:
         mock_retrieval.retrieve_chunks.return_value = retrieved
 
         neighbor_chunks = [
-            DocumentChunk(
+            DocumentChunkViewDTO(
                 id=uuid4(),
                 document_id=doc_id,
                 chunk_index=i,
                 content=f"chunk {i}",
-                embedding=[],
                 created_at=datetime.now(UTC),
             )
             for i in [1, 3]
         ]
         mock_chunk_repo = AsyncMock()
-        mock_chunk_repo.find_by_document_id_and_indices.return_value = neighbor_chunks
+        mock_chunk_repo.find_views_by_document_indices.return_value = neighbor_chunks
 
         use_case = QueryRelevantChunks(
             project_repository=mock_project_repository,
@@ -725,18 +888,17 @@ class TestQueryRelevantChunks:
         mock_retrieval.retrieve_chunks.return_value = retrieved
 
         neighbor_chunks = [
-            DocumentChunk(
+            DocumentChunkViewDTO(
                 id=uuid4(),
                 document_id=doc_id,
                 chunk_index=i,
                 content=f"chunk {i}",
-                embedding=[],
                 created_at=datetime.now(UTC),
             )
             for i in [1, 3]
         ]
         mock_chunk_repo = AsyncMock()
-        mock_chunk_repo.find_by_document_id_and_indices.return_value = neighbor_chunks
+        mock_chunk_repo.find_views_by_document_indices.return_value = neighbor_chunks
 
         use_case = QueryRelevantChunks(
             project_repository=mock_project_repository,
@@ -792,17 +954,16 @@ class TestQueryRelevantChunks:
         mock_retrieval = AsyncMock()
         mock_retrieval.retrieve_chunks.return_value = retrieved
 
-        parent_chunk = DocumentChunk(
+        parent_chunk = DocumentChunkViewDTO(
             id=parent_id,
             document_id=doc_id,
             chunk_index=0,
             content="full parent context with more details",
-            embedding=[],
             created_at=datetime.now(UTC),
-            chunk_level=ChunkLevel.PARENT,
+            chunk_level="parent",
         )
         mock_chunk_repo = AsyncMock()
-        mock_chunk_repo.find_by_id.return_value = parent_chunk
+        mock_chunk_repo.find_views_by_ids.return_value = [parent_chunk]
 
         use_case = QueryRelevantChunks(
             project_repository=mock_project_repository,
@@ -823,8 +984,8 @@ class TestQueryRelevantChunks:
         assert result.chunks[0].content == "full parent context with more details"
         # Standard chunk remains unchanged
         assert result.chunks[1].content == "standard content"
-        # find_by_id called for the parent
-        mock_chunk_repo.find_by_id.assert_awaited_once_with(parent_id)
+        # Parent loaded through the embedding-free view query
+        mock_chunk_repo.find_views_by_ids.assert_awaited_once_with({parent_id})
 
     async def test_query_expansion_skips_child_chunks(
         self,
@@ -861,27 +1022,27 @@ class TestQueryRelevantChunks:
         mock_retrieval.retrieve_chunks.return_value = retrieved
 
         neighbor_chunks = [
-            DocumentChunk(
+            DocumentChunkViewDTO(
                 id=uuid4(),
                 document_id=doc_id,
                 chunk_index=i,
                 content=f"neighbor {i}",
-                embedding=[],
                 created_at=datetime.now(UTC),
             )
             for i in [9, 11]
         ]
         mock_chunk_repo = AsyncMock()
-        mock_chunk_repo.find_by_id.return_value = DocumentChunk(
-            id=parent_id,
-            document_id=doc_id,
-            chunk_index=0,
-            content="parent content",
-            embedding=[],
-            created_at=datetime.now(UTC),
-            chunk_level=ChunkLevel.PARENT,
-        )
-        mock_chunk_repo.find_by_document_id_and_indices.return_value = neighbor_chunks
+        mock_chunk_repo.find_views_by_ids.return_value = [
+            DocumentChunkViewDTO(
+                id=parent_id,
+                document_id=doc_id,
+                chunk_index=0,
+                content="parent content",
+                created_at=datetime.now(UTC),
+                chunk_level="parent",
+            )
+        ]
+        mock_chunk_repo.find_views_by_document_indices.return_value = neighbor_chunks
 
         use_case = QueryRelevantChunks(
             project_repository=mock_project_repository,
@@ -900,8 +1061,8 @@ class TestQueryRelevantChunks:
         )
 
         # Then — expansion only for standard chunk (indices 9, 11), NOT for child (indices 2, 4)
-        call_args = mock_chunk_repo.find_by_document_id_and_indices.call_args
-        assert call_args.kwargs["indices"] == {9, 11}
+        call_args = mock_chunk_repo.find_views_by_document_indices.call_args
+        assert call_args.args[0] == {doc_id: {9, 11}}
 
         # Child chunk got parent content, standard + neighbors present
         contents = {c.content for c in result.chunks}
@@ -953,17 +1114,16 @@ class TestQueryRelevantChunks:
         mock_retrieval = AsyncMock()
         mock_retrieval.retrieve_chunks.return_value = retrieved
 
-        parent_chunk = DocumentChunk(
+        parent_chunk = DocumentChunkViewDTO(
             id=parent_id,
             document_id=doc_id,
             chunk_index=0,
             content="full parent with A and B details",
-            embedding=[],
             created_at=datetime.now(UTC),
-            chunk_level=ChunkLevel.PARENT,
+            chunk_level="parent",
         )
         mock_chunk_repo = AsyncMock()
-        mock_chunk_repo.find_by_id.return_value = parent_chunk
+        mock_chunk_repo.find_views_by_ids.return_value = [parent_chunk]
 
         use_case = QueryRelevantChunks(
             project_repository=mock_project_repository,
@@ -985,7 +1145,7 @@ class TestQueryRelevantChunks:
         assert result.chunks[0].content == "full parent with A and B details"
         assert result.chunks[1].content == "standard chunk"
         # Parent fetched only once
-        mock_chunk_repo.find_by_id.assert_awaited_once_with(parent_id)
+        mock_chunk_repo.find_views_by_ids.assert_awaited_once_with({parent_id})
 
 
 class TestQueryRelevantChunksOrgAccess:
@@ -131,6 +131,8 @@ class TestSendMessage:
             reranker_service=None,
             reranker_candidate_multiplier=None,
             metadata_filters=None,
+            hnsw_ef_search=None,
+            hnsw_iterative_scan=None,
         )
         use_case._provider_api_key_resolver.resolve.assert_awaited_once_with(
             user_id=user_id,
@@ -174,6 +176,8 @@ class TestSendMessage:
             reranker_service=None,
             reranker_candidate_multiplier=None,
             metadata_filters=None,
+            hnsw_ef_search=None,
+            hnsw_iterative_scan=None,
         )
 
     async def test_send_message_uses_project_llm_service_resolver(
@@ -404,6 +408,8 @@ class TestSendMessage:
             reranker_service=None,
             reranker_candidate_multiplier=None,
             metadata_filters={"source_type": "paragraph"},
+            hnsw_ef_search=None,
+            hnsw_iterative_scan=None,
         )
 
     async def test_send_message_uses_project_default_limit_when_missing(
@@ -432,6 +438,8 @@ class TestSendMessage:
             reranker_service=None,
             reranker_candidate_multiplier=None,
             metadata_filters=None,
+            hnsw_ef_search=None,
+            hnsw_iterative_scan=None,
         )
 
     async def test_send_message_diversifies_chunks_by_document(self) -> None:
@@ -573,6 +581,8 @@ class TestSendMessage:
             reranker_service=None,
             reranker_candidate_multiplier=None,
             metadata_filters=None,
+            hnsw_ef_search=None,
+            hnsw_iterative_scan=None,
         )
 
     async def test_send_message_can_force_new_conversation(self) -> None:
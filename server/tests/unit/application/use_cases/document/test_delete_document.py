@@ -11,6 +11,9 @@ from raggae.domain.entities.project import Project
 from raggae.domain.exceptions.document_exceptions import DocumentNotFoundError
 from raggae.domain.exceptions.project_exceptions import ProjectNotFoundError
 from raggae.domain.value_objects.organization_member_role import OrganizationMemberRole
+from raggae.infrastructure.database.repositories.in_memory_project_index_generation_repository import (
+    InMemoryProjectIndexGenerationRepository,
+)
 
 
 class TestDeleteDocument:
@@ -90,6 +93,50 @@ class TestDeleteDocument:
         mock_document_chunk_repository.delete_by_document_id.assert_called_once_with(document_id)
         mock_document_repository.delete.assert_called_once_with(document_id)
 
+    async def test_delete_document_bumps_project_index_generation(
+        self,
+        mock_document_repository: AsyncMock,
+        mock_document_chunk_repository: AsyncMock,
+        mock_project_repository: AsyncMock,
+        mock_file_storage_service: AsyncMock,
+    ) -> None:
+        # Given
+        user_id = uuid4()
+        project_id = uuid4()
+        document_id = uuid4()
+        mock_project_repository.find_by_id.return_value = Project(
+            id=project_id,
+            user_id=user_id,
+            name="Test",
+            description="",
+            system_prompt="",
+            is_published=False,
+            created_at=datetime.now(UTC),
+        )
+        mock_document_repository.find_by_id.return_value = Document(
+            id=document_id,
+            project_id=project_id,
+            file_name="doc.pdf",
+            content_type="application/pdf",
+            file_size=100,
+            storage_key="key-1",
+            created_at=datetime.now(UTC),
+        )
+        generation_repository = InMemoryProjectIndexGenerationRepository()
+        use_case = DeleteDocument(
+            document_repository=mock_document_repository,
+            document_chunk_repository=mock_document_chunk_repository,
+            project_repository=mock_project_repository,
+            file_storage_service=mock_file_storage_service,
+            project_index_generation_repository=generation_repository,
+        )
+
+        # When
+        await use_case.execute(project_id=project_id, document_id=document_id, user_id=user_id)
+
+        # Then
+        assert await generation_repository.get_generation(project_id) == 1
+
     async def test_delete_document_missing_project_raises_error(
         self,
         use_case: DeleteDocument,
@@ -0,0 +1,156 @@
+from dataclasses import replace
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from raggae.application.dto.ingestion_job_dto import IngestionJobDTO
+from raggae.application.use_cases.document.index_queued_document import IndexQueuedDocument
+from raggae.domain.entities.document import Document
+from raggae.domain.entities.project import Project
+from raggae.domain.exceptions.document_exceptions import (
+    DocumentExtractionError,
+    EmbeddingGenerationError,
+)
+from raggae.domain.value_objects.document_status import DocumentStatus
+
+
+class TestIndexQueuedDocument:
+    @pytest.fixture
+    def project(self) -> Project:
+        return Project(
+            id=uuid4(),
+            user_id=uuid4(),
+            name="Test",
+            description="",
+            system_prompt="",
+            is_published=False,
+            created_at=datetime.now(UTC),
+        )
+
+    @pytest.fixture
+    def document(self, project: Project) -> Document:
+        document_id = uuid4()
+        return Document(
+            id=document_id,
+            project_id=project.id,
+            file_name="doc.txt",
+            content_type="text/plain",
+            file_size=23,
+            storage_key=f"projects/{project.id}/documents/{document_id}-doc.txt",
+            created_at=datetime.now(UTC),
+            status=DocumentStatus.UPLOADED,
+        )
+
+    @pytest.fixture
+    def job(self, project: Project, document: Document) -> IngestionJobDTO:
+        return IngestionJobDTO(
+            id=uuid4(),
+            document_id=document.id,
+            project_id=project.id,
+            user_id=project.user_id,
+            attempts=1,
+        )
+
+    @pytest.fixture
+    def repositories(self, project: Project, document: Document) -> tuple[AsyncMock, AsyncMock]:
+        document_repository = AsyncMock()
+        document_repository.find_by_id.return_value = document
+        project_repository = AsyncMock()
+        project_repository.find_by_id.return_value = project
+        return document_repository, project_repository
+
+    @pytest.fixture
+    def indexing_service(self) -> AsyncMock:
+        service = AsyncMock()
+        service.run_pipeline.side_effect = lambda document, **_: replace(document, language="en")
+        return service
+
+    @pytest.fixture
+    def use_case(
+        self, repositories: tuple[AsyncMock, AsyncMock], indexing_service: AsyncMock
+    ) -> IndexQueuedDocument:
+        file_storage_service = AsyncMock()
+        file_storage_service.download_file.return_value = (b"hello world from raggae", "text/plain")
+        document_repository, project_repository = repositories
+        return IndexQueuedDocument(
+            document_repository=document_repository,
+            project_repository=project_repository,
+            file_storage_service=file_storage_service,
+            document_indexing_service=indexing_service,
+        )
+
+    async def test_execute_indexes_document_through_processing(
+        self,
+        use_case: IndexQueuedDocument,
+        repositories: tuple[AsyncMock, AsyncMock],
+        job: IngestionJobDTO,
+    ) -> None:
+        # When
+        result = await use_case.execute(job)
+
+        # Then
+        assert result is not None
+        assert result.status == DocumentStatus.INDEXED
+        saved = [call.args[0].status for call in repositories[0].save.await_args_list]
+        assert saved == [DocumentStatus.PROCESSING, DocumentStatus.INDEXED]
+
+    async def test_execute_returns_none_when_document_was_deleted(
+        self,
+        use_case: IndexQueuedDocument,
+        repositories: tuple[AsyncMock, AsyncMock],
+        indexing_service: AsyncMock,
+        job: IngestionJobDTO,
+    ) -> None:
+        # Given
+        repositories[0].find_by_id.return_value = None
+
+        # When
+        result = await use_case.execute(job)
+
+        # Then
+        assert result is None
+        indexing_service.run_pipeline.assert_not_awaited()
+
+    async def test_execute_keeps_document_processing_on_transient_failure(
+        self,
+        use_case: IndexQueuedDocument,
+        repositories: tuple[AsyncMock, AsyncMock],
+        indexing_service: AsyncMock,
+        job: IngestionJobDTO,
+    ) -> None:
+        # Given
+        indexing_service.run_pipeline.side_effect = EmbeddingGenerationError("rate limited")
+
+        # When / Then
+        with pytest.raises(EmbeddingGenerationError):
+            await use_case.execute(job)
+        saved = [call.args[0].status for call in repositories[0].save.await_args_list]
+        assert saved == [DocumentStatus.PROCESSING]
+
+    @pytest.mark.parametrize(
+        ("error", "final_attempt"),
+        [
+            (DocumentExtractionError("corrupted"), False),
+            (EmbeddingGenerationError("rate limited"), True),
+        ],
+    )
+    async def test_execute_marks_document_error_on_permanent_or_final_failure(
+        self,
+        use_case: IndexQueuedDocument,
+        repositories: tuple[AsyncMock, AsyncMock],
+        indexing_service: AsyncMock,
+        job: IngestionJobDTO,
+        error: Exception,
+        final_attempt: bool,
+    ) -> None:
+        # Given
+        indexing_service.run_pipeline.side_effect = error
+
+        # When / Then
+        with pytest.raises(type(error)):
+            await use_case.execute(job, final_attempt=final_attempt)
+        last_saved = repositories[0].save.await_args_list[-1].args[0]
+        assert last_saved.status == DocumentStatus.ERROR
+        assert last_saved.error_message == str(error)
@@ -4,9 +4,9 @@ from uuid import uuid4
 
 import pytest
 
+from raggae.application.dto.document_chunk_view_dto import DocumentChunkViewDTO
 from raggae.application.use_cases.document.list_document_chunks import ListDocumentChunks
 from raggae.domain.entities.document import Document
-from raggae.domain.entities.document_chunk import DocumentChunk
 from raggae.domain.entities.organization_member import OrganizationMember
 from raggae.domain.entities.project import Project
 from raggae.domain.exceptions.document_exceptions import DocumentNotFoundError
@@ -77,22 +77,20 @@ class TestListDocumentChunks:
             created_at=datetime.now(UTC),
             processing_strategy=ChunkingStrategy.FIXED_WINDOW,
         )
-        mock_document_chunk_repository.find_by_document_id.return_value = [
-            DocumentChunk(
+        mock_document_chunk_repository.find_views_by_document_id.return_value = [
+            DocumentChunkViewDTO(
                 id=uuid4(),
                 document_id=document_id,
                 chunk_index=0,
                 content="chunk-0",
-                embedding=[0.1, 0.2],
                 created_at=datetime.now(UTC),
                 metadata_json={"source_type": "paragraph"},
             ),
-            DocumentChunk(
+            DocumentChunkViewDTO(
                 id=uuid4(),
                 document_id=document_id,
                 chunk_index=1,
                 content="chunk-1",
-                embedding=[0.3, 0.4],
                 created_at=datetime.now(UTC),
                 metadata_json={"source_type": "paragraph"},
             ),
@@ -215,7 +213,7 @@ class TestListDocumentChunks:
             storage_key="documents/doc.txt",
             created_at=datetime.now(UTC),
         )
-        mock_document_chunk_repository.find_by_document_id.return_value = []
+        mock_document_chunk_repository.find_views_by_document_id.return_value = []
 
         # When
         result = await use_case.execute(project_id=project_id, document_id=document_id, user_id=requester_id)
@@ -223,6 +223,104 @@ class TestUploadDocumentProcessing:
         mock_text_chunker_service.chunk_text.assert_not_called()
         mock_embedding_service.embed_texts.assert_not_called()
 
+    async def test_upload_document_async_processing_enqueues_ingestion_job(
+        self,
+        mock_document_repository: AsyncMock,
+        mock_project_repository: AsyncMock,
+        mock_file_storage_service: AsyncMock,
+        mock_document_chunk_repository: AsyncMock,
+        mock_document_text_extractor: AsyncMock,
+        document_indexing_service: DocumentIndexingService,
+    ) -> None:
+        # Given
+        user_id = uuid4()
+        project_id = uuid4()
+        mock_project_repository.find_by_id.return_value = Project(
+            id=project_id,
+            user_id=user_id,
+            name="Project",
+            description="",
+            system_prompt="",
+            is_published=False,
+            created_at=datetime.now(UTC),
+        )
+        queue = AsyncMock()
+        use_case = UploadDocument(
+            document_repository=mock_document_repository,
+            project_repository=mock_project_repository,
+            file_storage_service=mock_file_storage_service,
+            max_file_size=104857600,
+            processing_mode="async",
+            document_chunk_repository=mock_document_chunk_repository,
+            document_indexing_service=document_indexing_service,
+            document_ingestion_queue=queue,
+        )
+
+        # When
+        result = await use_case.execute(
+            project_id=project_id,
+            user_id=user_id,
+            file_name="doc.txt",
+            file_content=b"hello world from raggae",
+            content_type="text/plain",
+        )
+
+        # Then
+        assert result.status.value == "uploaded"
+        queue.enqueue.assert_awaited_once_with(document_id=result.id, project_id=project_id, user_id=user_id)
+        mock_document_repository.save.assert_called_once()
+        mock_document_text_extractor.extract_text.assert_not_called()
+        mock_document_chunk_repository.replace_document_chunks.assert_not_called()
+
+    async def test_upload_document_async_processing_marks_document_error_when_enqueue_fails(
+        self,
+        mock_document_repository: AsyncMock,
+        mock_project_repository: AsyncMock,
+        mock_file_storage_service: AsyncMock,
+        mock_document_chunk_repository: AsyncMock,
+        document_indexing_service: DocumentIndexingService,
+    ) -> None:
+        # Given
+        user_id = uuid4()
+        project_id = uuid4()
+        mock_project_repository.find_by_id.return_value = Project(
+            id=project_id,
+            user_id=user_id,
+            name="Project",
+            description="",
+            system_prompt="",
+            is_published=False,
+            created_at=datetime.now(UTC),
+        )
+        queue = AsyncMock()
+        queue.enqueue.side_effect = ConnectionError("queue unavailable")
+        use_case = UploadDocument(
+            document_repository=mock_document_repository,
+            project_repository=mock_project_repository,
+            file_storage_service=mock_file_storage_service,
+            max_file_size=104857600,
+            processing_mode="async",
+            document_chunk_repository=mock_document_chunk_repository,
+            document_indexing_service=document_indexing_service,
+            document_ingestion_queue=queue,
+        )
+
+        # When
+        result = await use_case.execute(
+            project_id=project_id,
+            user_id=user_id,
+            file_name="doc.txt",
+            file_content=b"hello world from raggae",
+            content_type="text/plain",
+        )
+
+        # Then
+        assert result.status.value == "error"
+        assert mock_document_repository.save.await_count == 2
+        saved = mock_document_repository.save.await_args_list[-1].args[0]
+        assert saved.status.value == "error"
+        assert "queue unavailable" in saved.error_message
+
     async def test_upload_document_sync_processing_selects_heading_strategy(
         self,
         mock_document_repository: AsyncMock,
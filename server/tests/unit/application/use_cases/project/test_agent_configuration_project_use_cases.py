@@ -14,6 +14,7 @@ from raggae.domain.entities.project import Project
 from raggae.domain.exceptions.project_exceptions import (
     InvalidProjectChunkingStrategyError,
     InvalidProjectEmbeddingBackendError,
+    InvalidProjectHnswSearchSettingsError,
     InvalidProjectLLMBackendError,
     InvalidProjectRerankerBackendError,
     InvalidProjectRetrievalStrategyError,
@@ -206,6 +207,27 @@ class TestUpdateProjectConfiguration:
                 project_id=project.id, user_id=user_id, chunking_strategy="invalid_strategy"
             )
 
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"retrieval_hnsw_ef_search": 0},
+            {"retrieval_hnsw_ef_search": 5000},
+            {"retrieval_hnsw_iterative_scan": "unordered"},
+        ],
+    )
+    async def test_raises_invalid_hnsw_search_settings_error(self, kwargs: dict) -> None:
+        # Given
+        project_repo = InMemoryProjectRepository()
+        config_repo = InMemoryAgentConfigurationRepository()
+        user_id = uuid4()
+        project = _make_project(user_id=user_id)
+        await project_repo.save(project)
+        use_case = UpdateProjectConfiguration(project_repo, config_repo)
+
+        # When / Then
+        with pytest.raises(InvalidProjectHnswSearchSettingsError):
+            await use_case.execute(project_id=project.id, user_id=user_id, **kwargs)
+
     async def test_creates_config_when_none_exists(self) -> None:
         # Given
         project_repo = InMemoryProjectRepository()
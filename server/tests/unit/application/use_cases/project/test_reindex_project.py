@@ -1,10 +1,15 @@
+import asyncio
 from dataclasses import replace
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
 
+from raggae.application.services.pipeline_fingerprint import (
+    compute_content_hash,
+    compute_pipeline_fingerprint,
+)
 from raggae.application.use_cases.project.reindex_project import ReindexProject
 from raggae.domain.entities.document import Document
 from raggae.domain.entities.project import Project
@@ -14,6 +19,10 @@ from raggae.domain.exceptions.project_exceptions import (
     ProjectReindexInProgressError,
 )
 from raggae.domain.value_objects.document_status import DocumentStatus
+from raggae.infrastructure.config.settings import settings
+from raggae.infrastructure.database.repositories.in_memory_project_index_generation_repository import (
+    InMemoryProjectIndexGenerationRepository,
+)
 
 
 class TestReindexProject:
@@ -82,6 +91,35 @@ class TestReindexProject:
         assert result.failed_documents == 0
         assert project_repository.save.await_count == 3
 
+    async def test_reindex_project_bumps_project_index_generation(
+        self,
+        project_id,
+        user_id,
+        project,
+        document,
+    ) -> None:
+        project_repository = AsyncMock()
+        project_repository.find_by_id.return_value = project
+        document_repository = AsyncMock()
+        document_repository.find_by_project_id.return_value = [document]
+        file_storage_service = AsyncMock()
+        file_storage_service.download_file.return_value = (b"hello", "text/plain")
+        indexing_service = AsyncMock()
+        indexing_service.run_pipeline.return_value = replace(document, status=DocumentStatus.PROCESSING)
+        generation_repository = InMemoryProjectIndexGenerationRepository()
+
+        use_case = ReindexProject(
+            project_repository=project_repository,
+            document_repository=document_repository,
+            file_storage_service=file_storage_service,
+            document_indexing_service=indexing_service,
+            project_index_generation_repository=generation_repository,
+        )
+
+        await use_case.execute(project_id=project_id, user_id=user_id)
+
+        assert await generation_repository.get_generation(project_id) == 1
+
     async def test_reindex_project_partial_failure(
         self,
         project_id,
@@ -178,9 +216,9 @@ class TestReindexProject:
         file_storage_service.download_file.return_value = (b"hello", "text/plain")
         indexing_service = AsyncMock()
         indexing_service.run_pipeline.return_value = replace(document, status=DocumentStatus.PROCESSING)
-        resolver = Mock()
+        resolver = MagicMock()
         embedding_service = AsyncMock()
-        resolver.resolve.return_value = embedding_service
+        resolver.lease.return_value.__aenter__.return_value = embedding_service
 
         use_case = ReindexProject(
             project_repository=project_repository,
@@ -192,7 +230,8 @@ class TestReindexProject:
 
         await use_case.execute(project_id=project_id, user_id=user_id)
 
-        resolver.resolve.assert_called_once()
+        resolver.lease.assert_called_once()
+        resolver.lease.return_value.__aexit__.assert_awaited_once()
         kwargs = indexing_service.run_pipeline.await_args.kwargs
         assert kwargs["embedding_service"] is embedding_service
 
@@ -217,3 +256,268 @@ class TestReindexProject:
 
         with pytest.raises(RuntimeError, match="unexpected"):
             await use_case.execute(project_id=project_id, user_id=user_id)
+
+        finished = project_repository.save.await_args.args[0]
+        assert finished.is_reindexing() is False
+        assert finished.reindex_progress == 0
+
+
+class TestReindexProjectIncremental:
+    @pytest.fixture
+    def project(self) -> Project:
+        return Project(
+            id=uuid4(),
+            user_id=uuid4(),
+            name="Test",
+            description="",
+            system_prompt="",
+            is_published=False,
+            created_at=datetime.now(UTC),
+        )
+
+    @pytest.fixture
+    def fingerprint(self) -> str:
+        return compute_pipeline_fingerprint(
+            chunking_strategy=None,
+            parent_child_chunking=settings.default_parent_child_chunking,
+            embedding_backend=None,
+            embedding_model=None,
+        )
+
+    def _document(self, project: Project, content_hash: str | None, fingerprint: str | None) -> Document:
+        doc_id = uuid4()
+        return Document(
+            id=doc_id,
+            project_id=project.id,
+            file_name="doc.txt",
+            content_type="text/plain",
+            file_size=5,
+            storage_key=f"projects/{project.id}/documents/{doc_id}-doc.txt",
+            created_at=datetime.now(UTC),
+            status=DocumentStatus.INDEXED,
+            content_hash=content_hash,
+            pipeline_fingerprint=fingerprint,
+        )
+
+    def _use_case(
+        self, project: Project, documents: list[Document], indexing_service: AsyncMock
+    ) -> tuple[ReindexProject, InMemoryProjectIndexGenerationRepository]:
+        project_repository = AsyncMock()
+        project_repository.find_by_id.return_value = project
+        document_repository = AsyncMock()
+        document_repository.find_by_project_id.return_value = documents
+        file_storage_service = AsyncMock()
+        file_storage_service.download_file.return_value = (b"hello", "text/plain")
+        indexing_service.run_pipeline.side_effect = lambda document, **_: document
+        generation_repository = InMemoryProjectIndexGenerationRepository()
+        use_case = ReindexProject(
+            project_repository=project_repository,
+            document_repository=document_repository,
+            file_storage_service=file_storage_service,
+            document_indexing_service=indexing_service,
+            project_index_generation_repository=generation_repository,
+        )
+        return use_case, generation_repository
+
+    async def test_reindex_project_skips_unchanged_documents(
+        self, project: Project, fingerprint: str
+    ) -> None:
+        # Given
+        unchanged = self._document(project, compute_content_hash(b"hello"), fingerprint)
+        edited = self._document(project, compute_content_hash(b"previous"), fingerprint)
+        reconfigured = self._document(project, compute_content_hash(b"hello"), "old-fingerprint")
+        indexing_service = AsyncMock()
+        use_case, _ = self._use_case(project, [unchanged, edited, reconfigured], indexing_service)
+
+        # When
+        result = await use_case.execute(project_id=project.id, user_id=project.user_id)
+
+        # Then
+        assert result.skipped_documents == 1
+        assert result.indexed_documents == 2
+        reindexed = [call.kwargs["document"].id for call in indexing_service.run_pipeline.await_args_list]
+        assert reindexed == [edited.id, reconfigured.id]
+        assert indexing_service.run_pipeline.await_args.kwargs["pipeline_fingerprint"] == fingerprint
+
+    @pytest.mark.parametrize("setting", ["chunk_size", "chunk_overlap"])
+    async def test_reindex_project_reindexes_documents_after_chunker_settings_change(
+        self, project: Project, fingerprint: str, setting: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Given
+        unchanged = self._document(project, compute_content_hash(b"hello"), fingerprint)
+        indexing_service = AsyncMock()
+        use_case, _ = self._use_case(project, [unchanged], indexing_service)
+        monkeypatch.setattr(settings, setting, getattr(settings, setting) + 50)
+
+        # When
+        result = await use_case.execute(project_id=project.id, user_id=project.user_id)
+
+        # Then
+        assert result.skipped_documents == 0
+        assert result.indexed_documents == 1
+        assert indexing_service.run_pipeline.await_args.kwargs["pipeline_fingerprint"] != fingerprint
+
+    async def test_reindex_project_force_reindexes_unchanged_documents(
+        self, project: Project, fingerprint: str
+    ) -> None:
+        # Given
+        unchanged = self._document(project, compute_content_hash(b"hello"), fingerprint)
+        indexing_service = AsyncMock()
+        use_case, _ = self._use_case(project, [unchanged], indexing_service)
+
+        # When
+        result = await use_case.execute(project_id=project.id, user_id=project.user_id, force=True)
+
+        # Then
+        assert result.skipped_documents == 0
+        assert result.indexed_documents == 1
+        indexing_service.run_pipeline.assert_awaited_once()
+
+    async def test_reindex_project_keeps_generation_when_everything_is_skipped(
+        self, project: Project, fingerprint: str
+    ) -> None:
+        # Given
+        unchanged = self._document(project, compute_content_hash(b"hello"), fingerprint)
+        use_case, generation_repository = self._use_case(project, [unchanged], AsyncMock())
+
+        # When
+        await use_case.execute(project_id=project.id, user_id=project.user_id)
+
+        # Then
+        assert await generation_repository.get_generation(project.id) == 0
+
+
+class TestReindexProjectPipelined:
+    @pytest.fixture
+    def project(self) -> Project:
+        return Project(
+            id=uuid4(),
+            user_id=uuid4(),
+            name="Test",
+            description="",
+            system_prompt="",
+            is_published=False,
+            created_at=datetime.now(UTC),
+        )
+
+    def _documents(self, project: Project, count: int) -> list[Document]:
+        return [
+            Document(
+                id=uuid4(),
+                project_id=project.id,
+                file_name="doc.txt",
+                content_type="text/plain",
+                file_size=5,
+                storage_key=f"projects/{project.id}/documents/{index}-doc.txt",
+                created_at=datetime.now(UTC),
+                status=DocumentStatus.INDEXED,
+            )
+            for index in range(count)
+        ]
+
+    async def test_reindex_project_bounds_documents_and_downloads_in_flight(self, project: Project) -> None:
+        # Given
+        in_flight = {"documents": 0, "downloads": 0}
+        peaks = {"documents": 0, "downloads": 0}
+
+        async def track(stage: str) -> None:
+            in_flight[stage] += 1
+            peaks[stage] = max(peaks[stage], in_flight[stage])
+            await asyncio.sleep(0.01)
+            in_flight[stage] -= 1
+
+        async def download_file(_: str) -> tuple[bytes, str]:
+            await track("downloads")
+            return b"hello", "text/plain"
+
+        async def run_pipeline(document: Document, **_: object) -> Document:
+            await track("documents")
+            return document
+
+        project_repository = AsyncMock()
+        project_repository.find_by_id.return_value = project
+        document_repository = AsyncMock()
+        document_repository.find_by_project_id.return_value = self._documents(project, 8)
+        file_storage_service = AsyncMock()
+        file_storage_service.download_file.side_effect = download_file
+        indexing_service = AsyncMock()
+        indexing_service.run_pipeline.side_effect = run_pipeline
+        use_case = ReindexProject(
+            project_repository=project_repository,
+            document_repository=document_repository,
+            file_storage_service=file_storage_service,
+            document_indexing_service=indexing_service,
+            max_documents_in_flight=4,
+            max_concurrent_downloads=2,
+            max_concurrent_extractions=1,
+        )
+
+        # When
+        result = await use_case.execute(project_id=project.id, user_id=project.user_id)
+
+        # Then
+        assert result.indexed_documents == 8
+        assert peaks == {"documents": 4, "downloads": 2}
+        limiters = {
+            call.kwargs["extraction_limiter"] for call in indexing_service.run_pipeline.await_args_list
+        }
+        assert len(limiters) == 1
+        assert isinstance(limiters.pop(), asyncio.Semaphore)
+
+    async def test_reindex_project_saves_progress_in_batches(self, project: Project) -> None:
+        # Given
+        project_repository = AsyncMock()
+        project_repository.find_by_id.return_value = project
+        document_repository = AsyncMock()
+        document_repository.find_by_project_id.return_value = self._documents(project, 5)
+        file_storage_service = AsyncMock()
+        file_storage_service.download_file.return_value = (b"hello", "text/plain")
+        indexing_service = AsyncMock()
+        indexing_service.run_pipeline.side_effect = lambda document, **_: document
+        use_case = ReindexProject(
+            project_repository=project_repository,
+            document_repository=document_repository,
+            file_storage_service=file_storage_service,
+            document_indexing_service=indexing_service,
+            max_documents_in_flight=2,
+            progress_batch_size=2,
+        )
+
+        # When
+        await use_case.execute(project_id=project.id, user_id=project.user_id)
+
+        # Then — start, two batches of two documents, finish
+        saved = [call.args[0] for call in project_repository.save.await_args_list]
+        assert [(p.reindex_status, p.reindex_progress) for p in saved] == [
+            ("in_progress", 0),
+            ("in_progress", 2),
+            ("in_progress", 4),
+            ("idle", 5),
+        ]
+
+    async def test_reindex_project_resolves_embedding_service_once(self, project: Project) -> None:
+        # Given
+        project_repository = AsyncMock()
+        project_repository.find_by_id.return_value = project
+        document_repository = AsyncMock()
+        document_repository.find_by_project_id.return_value = self._documents(project, 3)
+        file_storage_service = AsyncMock()
+        file_storage_service.download_file.return_value = (b"hello", "text/plain")
+        indexing_service = AsyncMock()
+        indexing_service.run_pipeline.side_effect = lambda document, **_: document
+        resolver = MagicMock()
+        use_case = ReindexProject(
+            project_repository=project_repository,
+            document_repository=document_repository,
+            file_storage_service=file_storage_service,
+            document_indexing_service=indexing_service,
+            project_embedding_service_resolver=resolver,
+            max_documents_in_flight=3,
+        )
+
+        # When
+        await use_case.execute(project_id=project.id, user_id=project.user_id)
+
+        # Then
+        resolver.lease.assert_called_once()
+        assert indexing_service.run_pipeline.await_count == 3
@@ -222,3 +222,17 @@ class TestProject:
         assert finished.reindex_progress == 2
         assert finished.reindex_total == 2
         assert finished.is_reindexing() is False
+
+    def test_advance_reindex_by_several_documents(self) -> None:
+        project = Project(
+            id=uuid4(),
+            user_id=uuid4(),
+            name="Test",
+            description="",
+            system_prompt="prompt",
+            is_published=False,
+            created_at=datetime.now(UTC),
+        ).start_reindex(total_documents=5)
+
+        assert project.advance_reindex(3).reindex_progress == 3
+        assert project.advance_reindex(3).advance_reindex(3).reindex_progress == 5
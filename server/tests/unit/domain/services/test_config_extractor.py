@@ -108,6 +108,16 @@ class TestConfigExtractor:
         assert result.llm_model == "mistral"
         assert result.retrieval_top_k == 5
 
+    def test_hnsw_search_settings_cascade_independently(self) -> None:
+        result = ConfigExtractor.resolve(
+            project=_project(retrieval_hnsw_ef_search=200),
+            parent=_parent(retrieval_hnsw_iterative_scan="strict_order"),
+            app=_app(retrieval_hnsw_ef_search=40, retrieval_hnsw_iterative_scan="relaxed_order"),
+        )
+
+        assert result.retrieval_hnsw_ef_search == 200
+        assert result.retrieval_hnsw_iterative_scan == "strict_order"
+
     def test_returns_resolved_agent_configuration(self) -> None:
         result = ConfigExtractor.resolve(
             project=_project(),
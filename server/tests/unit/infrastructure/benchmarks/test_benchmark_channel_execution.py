@@ -0,0 +1,177 @@
+"""Latency model: Hybrid retrieval – single statement (baseline) vs concurrent channels (optimized).
+
+Drives ``SQLAlchemyChunkRetrievalService`` in both ``channel_execution`` modes
+against a simulated database whose statements sleep for sampled latencies:
+the single statement costs the vector plus the full-text channel (PostgreSQL
+runs the CTEs one after the other), the concurrent mode costs each channel on
+its own connection plus the short page statement. Channel latencies are
+log-normal, with a heavy tail on full-text scans (broad ``tsquery`` matches).
+Each query replays the same sampled latencies in both modes.
+
+This is a model, not a measurement: the statement costs are assumed, so
+only the orchestration is exercised (``asyncio.gather``, Python fusion, the
+extra round trip). The rows are labelled ``model``; measured p50 / p95 on
+PostgreSQL come from
+``tests/integration/test_benchmark_channel_execution_postgres.py``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from uuid import UUID, uuid4
+
+import numpy as np
+import pytest
+
+from raggae.infrastructure.services.sqlalchemy_chunk_retrieval_service import (
+    SQLAlchemyChunkRetrievalService,
+)
+
+from .conftest import make_row, write_benchmark_csv
+
+QUERY_COUNT = 60
+LIMIT = 8
+CANDIDATES = 40
+VECTOR_MEDIAN_MS = 2.0
+FULLTEXT_MEDIAN_MS = 3.0
+FULLTEXT_TAIL_PROBABILITY = 0.1
+FULLTEXT_TAIL_FACTOR = 5.0
+PAGE_MS = 0.4
+
+
+class _Latencies:
+    def __init__(self, vector_ms: float, fulltext_ms: float) -> None:
+        self.vector_s = vector_ms / 1000
+        self.fulltext_s = fulltext_ms / 1000
+
+
+class _SimulatedDatabase:
+    def __init__(self) -> None:
+        self.document_id = uuid4()
+        self.chunk_ids = [uuid4() for _ in range(CANDIDATES * 2)]
+        self.latencies = _Latencies(0.0, 0.0)
+        self.channel_sessions: dict[str, list[_SimulatedSession]] = {"vector": [], "fulltext": []}
+
+    def session_factory(self) -> _SimulatedSession:
+        return _SimulatedSession(self)
+
+    def _row(self, chunk_id: UUID, position: int) -> dict:
+        return {
+            "chunk_id": chunk_id,
+            "document_id": self.document_id,
+            "document_file_name": "doc.txt",
+            "content": "content",
+            "chunk_index": position,
+            "chunk_level": "standard",
+            "parent_chunk_id": None,
+            "vector_score": 1.0 - position / 100,
+            "fulltext_score": 0.5 - position / 200,
+            "final_score": 1.0 - position / 100,
+            "parent_content": None,
+            "context_neighbors": None,
+        }
+
+    async def execute(self, session: _SimulatedSession, sql: str, params: dict) -> list[dict]:
+        if "set_config" in sql:
+            return []
+        if "SELECT * FROM vector_search" in sql:
+            self.channel_sessions["vector"].append(session)
+            await asyncio.sleep(self.latencies.vector_s)
+            return [self._row(chunk_id, i) for i, chunk_id in enumerate(self.chunk_ids[:CANDIDATES])]
+        if "SELECT * FROM fulltext_search" in sql:
+            self.channel_sessions["fulltext"].append(session)
+            await asyncio.sleep(self.latencies.fulltext_s)
+            return [self._row(chunk_id, i) for i, chunk_id in enumerate(self.chunk_ids[CANDIDATES // 2 :])]
+        if "unnest" in sql:
+            await asyncio.sleep(PAGE_MS / 1000)
+            return [self._row(chunk_id, i) for i, chunk_id in enumerate(params["page_chunk_ids"])]
+        await asyncio.sleep(self.latencies.vector_s + self.latencies.fulltext_s)
+        return [self._row(chunk_id, i) for i, chunk_id in enumerate(self.chunk_ids[:LIMIT])]
+
+
+class _SimulatedResult:
+    def __init__(self, rows: list[dict]) -> None:
+        self._rows = rows
+
+    def mappings(self) -> list[dict]:
+        return self._rows
+
+
+class _SimulatedSession:
+    def __init__(self, database: _SimulatedDatabase) -> None:
+        self._database = database
+
+    async def __aenter__(self) -> _SimulatedSession:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        return None
+
+    async def execute(self, statement: object, params: dict | None = None) -> _SimulatedResult:
+        return _SimulatedResult(await self._database.execute(self, str(statement), params or {}))
+
+
+def _sample_latencies(rng: np.random.Generator) -> list[_Latencies]:
+    vector = VECTOR_MEDIAN_MS * rng.lognormal(0.0, 0.4, size=QUERY_COUNT)
+    fulltext = FULLTEXT_MEDIAN_MS * rng.lognormal(0.0, 0.6, size=QUERY_COUNT)
+    fulltext *= np.where(rng.random(QUERY_COUNT) < FULLTEXT_TAIL_PROBABILITY, FULLTEXT_TAIL_FACTOR, 1.0)
+    return [_Latencies(float(v), float(f)) for v, f in zip(vector, fulltext, strict=True)]
+
+
+async def _measure(
+    database: _SimulatedDatabase, service: SQLAlchemyChunkRetrievalService, latencies: list[_Latencies]
+) -> list[float]:
+    timings: list[float] = []
+    for sample in latencies:
+        database.latencies = sample
+        start = time.perf_counter()
+        results = await service.retrieve_chunks(
+            project_id=uuid4(), query_text="query", query_embedding=[1.0, 0.0], limit=LIMIT
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+        assert len(results) == LIMIT
+    return timings
+
+
+@pytest.mark.unit
+class TestBenchmarkChannelExecution:
+    """Compare single-statement and concurrent channel execution latency."""
+
+    async def test_single_statement_vs_concurrent_channels(self) -> None:
+        latencies = _sample_latencies(np.random.default_rng(11))
+        database = _SimulatedDatabase()
+        single = SQLAlchemyChunkRetrievalService(
+            session_factory=database.session_factory,  # type: ignore[arg-type]
+        )
+        concurrent = SQLAlchemyChunkRetrievalService(
+            session_factory=database.session_factory,  # type: ignore[arg-type]
+            channel_execution="concurrent",
+        )
+
+        baseline_ms = await _measure(database, single, latencies)
+        optimized_ms = await _measure(database, concurrent, latencies)
+
+        benchmark_name = "Hybrid retrieval latency model: single statement vs concurrent channels"
+        rows = [
+            make_row(
+                benchmark_name,
+                "model",
+                f"p{percentile} latency_ms",
+                float(np.percentile(baseline_ms, percentile)),
+                float(np.percentile(optimized_ms, percentile)),
+                higher_is_better=False,
+            )
+            for percentile in (50, 95)
+        ]
+
+        filepath = write_benchmark_csv("retrieval_single_statement_vs_concurrent.csv", rows)
+        assert filepath.exists()
+        # Latencies are only compared on PostgreSQL; the model checks that the
+        # concurrent mode runs each channel on its own session.
+        vector_sessions = database.channel_sessions["vector"]
+        fulltext_sessions = database.channel_sessions["fulltext"]
+        assert len(vector_sessions) == len(fulltext_sessions) == QUERY_COUNT
+        assert not {id(session) for session in vector_sessions} & {
+            id(session) for session in fulltext_sessions
+        }
@@ -0,0 +1,204 @@
+"""Benchmark: In-memory retrieval – per-chunk Python scan (baseline) vs NumPy index (optimized).
+
+The baseline replays the former ``InMemoryChunkRetrievalService`` loop: pure-Python
+cosine similarity and re-tokenization of every chunk on every query. The optimized
+side queries the service backed by an :class:`InMemoryVectorIndex` (one
+matrix-vector product, BM25 over the postings of the query terms and
+``argpartition``). Latency is measured for the hybrid and fulltext strategies;
+as the lexical scores differ (BM25 with IDF vs the former overlap score),
+ranking agreement is only checked on the vector strategy.
+
+Corpus sizes are 10k, 100k and 1M synthetic chunks. Only 10k runs by default;
+set ``RAGGAE_BENCHMARK_MAX_CHUNKS`` (e.g. ``1000000``) to include larger ones.
+The Python scan is measured on at most ``BASELINE_SAMPLE_SIZE`` chunks and scaled
+linearly to the corpus size, since it is a plain loop over every chunk.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
+
+import numpy as np
+import pytest
+
+from raggae.domain.entities.document import Document
+from raggae.domain.entities.document_chunk import DocumentChunk
+from raggae.infrastructure.database.repositories.in_memory_document_chunk_repository import (
+    InMemoryDocumentChunkRepository,
+)
+from raggae.infrastructure.database.repositories.in_memory_document_repository import (
+    InMemoryDocumentRepository,
+)
+from raggae.infrastructure.services.in_memory_chunk_retrieval_service import (
+    InMemoryChunkRetrievalService,
+)
+from raggae.infrastructure.services.in_memory_vector_index import InMemoryVectorIndex
+from raggae.infrastructure.services.math_utils import cosine_similarity
+
+from .conftest import make_row, write_benchmark_csv
+
+CORPUS_SIZES = (10_000, 100_000, 1_000_000)
+MAX_CHUNKS = int(os.environ.get("RAGGAE_BENCHMARK_MAX_CHUNKS") or "10000")
+BASELINE_SAMPLE_SIZE = 20_000
+CHUNKS_PER_DOCUMENT = 100
+DIMENSION = 32
+VOCABULARY_SIZE = 5_000
+TOKENS_PER_CHUNK = 12
+QUERY_COUNT = 5
+TOP_K = 10
+VECTOR_WEIGHT = 0.6
+FULLTEXT_WEIGHT = 0.4
+
+
+def _python_scan(
+    chunks: list[DocumentChunk],
+    query_text: str,
+    query_embedding: list[float],
+    vector_weight: float,
+    fulltext_weight: float,
+) -> list[UUID]:
+    query_terms = {term.lower() for term in query_text.split()}
+    scored: list[tuple[float, UUID]] = []
+    for chunk in chunks:
+        fulltext_score = 0.0
+        if fulltext_weight:
+            tf_map: dict[str, int] = {}
+            content_tokens = chunk.content.lower().split()
+            for token in content_tokens:
+                tf_map[token] = tf_map.get(token, 0) + 1
+            for term in query_terms:
+                tf = tf_map.get(term, 0)
+                if tf:
+                    fulltext_score += tf * 2.2 / (tf + 1.2 * (0.25 + 0.75 * len(content_tokens) / 200.0))
+            fulltext_score /= len(query_terms)
+        vector_score = cosine_similarity(query_embedding, chunk.embedding) if vector_weight else 0.0
+        scored.append((vector_weight * vector_score + fulltext_weight * fulltext_score, chunk.id))
+    scored.sort(key=lambda item: item[0], reverse=True)
+    return [chunk_id for _, chunk_id in scored[:TOP_K]]
+
+
+async def _build_corpus(
+    size: int, rng: np.random.Generator
+) -> tuple[UUID, InMemoryDocumentRepository, InMemoryVectorIndex, list[DocumentChunk]]:
+    project_id = uuid4()
+    document_repository = InMemoryDocumentRepository()
+    vector_index = InMemoryVectorIndex()
+    chunk_repository = InMemoryDocumentChunkRepository(vector_index=vector_index)
+    embeddings = rng.normal(size=(size, DIMENSION)).astype(np.float32).tolist()
+    tokens = rng.integers(0, VOCABULARY_SIZE, size=(size, TOKENS_PER_CHUNK))
+    now = datetime.now(UTC)
+
+    chunks: list[DocumentChunk] = []
+    for start in range(0, size, CHUNKS_PER_DOCUMENT):
+        document = Document(
+            id=uuid4(),
+            project_id=project_id,
+            file_name=f"doc-{start}.txt",
+            content_type="text/plain",
+            file_size=0,
+            storage_key=f"doc-{start}",
+            created_at=now,
+        )
+        await document_repository.save(document)
+        for row in range(start, min(start + CHUNKS_PER_DOCUMENT, size)):
+            chunks.append(
+                DocumentChunk(
+                    id=uuid4(),
+                    document_id=document.id,
+                    chunk_index=row - start,
+                    content=" ".join(f"term{token}" for token in tokens[row]),
+                    embedding=embeddings[row],
+                    created_at=now,
+                )
+            )
+
+    await chunk_repository.save_many(chunks)
+    return project_id, document_repository, vector_index, chunks
+
+
+@pytest.mark.unit
+class TestBenchmarkInMemoryVectorIndex:
+    """Compare the per-chunk Python scan with the NumPy-backed in-memory index."""
+
+    async def test_python_scan_vs_numpy_index(self) -> None:
+        rng = np.random.default_rng(7)
+        rows: list[dict] = []
+        benchmark_name = "In-memory retrieval: Python scan vs NumPy index"
+
+        for size in (size for size in CORPUS_SIZES if size <= MAX_CHUNKS):
+            project_id, document_repository, vector_index, chunks = await _build_corpus(size, rng)
+            service = InMemoryChunkRetrievalService(
+                document_repository=document_repository,
+                document_chunk_repository=InMemoryDocumentChunkRepository(),
+                vector_weight=VECTOR_WEIGHT,
+                fulltext_weight=FULLTEXT_WEIGHT,
+                vector_index=vector_index,
+            )
+            sample = chunks[:BASELINE_SAMPLE_SIZE]
+            label = f"{size // 1_000_000}M chunks" if size >= 1_000_000 else f"{size // 1000}k chunks"
+
+            # First query stacks the project matrix; keep it out of the per-query latency.
+            await service.retrieve_chunks(
+                project_id=project_id, query_text="term0", query_embedding=chunks[0].embedding, limit=TOP_K
+            )
+
+            baseline_ms: dict[str, list[float]] = {"hybrid": [], "fulltext": []}
+            optimized_ms: dict[str, list[float]] = {"hybrid": [], "fulltext": []}
+            overlaps: list[float] = []
+            for query_row in rng.integers(0, size, size=QUERY_COUNT):
+                query_chunk = chunks[int(query_row)]
+                query_text = " ".join(query_chunk.content.split()[:3])
+
+                for strategy, vector_weight, fulltext_weight in (
+                    ("hybrid", VECTOR_WEIGHT, FULLTEXT_WEIGHT),
+                    ("fulltext", 0.0, 1.0),
+                ):
+                    start = time.perf_counter()
+                    _python_scan(sample, query_text, query_chunk.embedding, vector_weight, fulltext_weight)
+                    baseline_ms[strategy].append((time.perf_counter() - start) * 1000 * size / len(sample))
+
+                    start = time.perf_counter()
+                    await service.retrieve_chunks(
+                        project_id=project_id,
+                        query_text=query_text,
+                        query_embedding=query_chunk.embedding,
+                        limit=TOP_K,
+                        strategy=strategy,
+                    )
+                    optimized_ms[strategy].append((time.perf_counter() - start) * 1000)
+
+                if len(sample) == size:
+                    expected = _python_scan(sample, query_text, query_chunk.embedding, 1.0, 0.0)
+                    results = await service.retrieve_chunks(
+                        project_id=project_id,
+                        query_text=query_text,
+                        query_embedding=query_chunk.embedding,
+                        limit=TOP_K,
+                        strategy="vector",
+                    )
+                    actual = {result.chunk_id for result in results}
+                    overlaps.append(len(actual & set(expected)) / TOP_K)
+
+            for strategy in ("hybrid", "fulltext"):
+                rows.append(
+                    make_row(
+                        benchmark_name,
+                        label,
+                        f"{strategy} latency_ms",
+                        float(np.mean(baseline_ms[strategy])),
+                        float(np.mean(optimized_ms[strategy])),
+                        higher_is_better=False,
+                    )
+                )
+            if overlaps:
+                rows.append(
+                    make_row(benchmark_name, label, f"vector overlap@{TOP_K}", 1.0, float(np.mean(overlaps)))
+                )
+
+        filepath = write_benchmark_csv("in_memory_scan_vs_numpy_index.csv", rows)
+        assert filepath.exists()
+        first_overlap = next(r for r in rows if r["Metric"] == f"[10k chunks] vector overlap@{TOP_K}")
+        assert first_overlap["Optimized"] >= 0.9
@@ -0,0 +1,101 @@
+"""Benchmark: Ollama embeddings – one request per text (baseline) vs batched concurrent requests (optimized).
+
+Both sides run :class:`OllamaEmbeddingService` against a local HTTP stand-in
+of ``/api/embed`` (an ``httpx.MockTransport``). Each request costs a fixed
+round trip plus a per-text encoding time, and at most ``SERVER_PARALLEL``
+requests are served at once (``OLLAMA_NUM_PARALLEL``). The baseline
+replays the former behaviour (``batch_size=1``, ``max_concurrency=1``: 300
+serial round trips for a 300-chunk document); the optimized side uses the
+default batch size and concurrency.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from raggae.infrastructure.services.ollama_embedding_service import OllamaEmbeddingService
+
+from .conftest import make_row, write_benchmark_csv
+
+TEXT_COUNT = 300
+ROUND_TRIP_MS = 1.0
+PER_TEXT_MS = 0.05
+SERVER_PARALLEL = 4
+DIMENSION = 8
+
+
+def _stand_in_client() -> tuple[httpx.AsyncClient, list[int]]:
+    server_slots = asyncio.Semaphore(SERVER_PARALLEL)
+    batch_sizes: list[int] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        texts = json.loads(request.content)["input"]
+        batch_sizes.append(len(texts))
+        async with server_slots:
+            await asyncio.sleep((ROUND_TRIP_MS + PER_TEXT_MS * len(texts)) / 1000)
+        return httpx.Response(200, json={"embeddings": [[float(len(text))] * DIMENSION for text in texts]})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), batch_sizes
+
+
+async def _measure(service: OllamaEmbeddingService, texts: list[str]) -> tuple[float, int, list[list[float]]]:
+    client, batch_sizes = _stand_in_client()
+    service._client = client
+    start = time.perf_counter()
+    embeddings = await service.embed_texts(texts)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    await client.aclose()
+    return elapsed_ms, len(batch_sizes), embeddings
+
+
+@pytest.mark.unit
+class TestBenchmarkOllamaEmbedding:
+    """Compare serial per-text requests with batched concurrent requests."""
+
+    async def test_serial_vs_batched_requests(self) -> None:
+        texts = [f"chunk {index} " * (1 + index % 7) for index in range(TEXT_COUNT)]
+        baseline = OllamaEmbeddingService(
+            base_url="http://ollama.test",
+            model="nomic-embed-text",
+            expected_dimension=DIMENSION,
+            batch_size=1,
+            max_concurrency=1,
+        )
+        optimized = OllamaEmbeddingService(
+            base_url="http://ollama.test", model="nomic-embed-text", expected_dimension=DIMENSION
+        )
+
+        baseline_ms, baseline_requests, baseline_embeddings = await _measure(baseline, texts)
+        optimized_ms, optimized_requests, optimized_embeddings = await _measure(optimized, texts)
+
+        benchmark_name = "Ollama embeddings: per-text requests vs batched concurrent requests"
+        label = f"{TEXT_COUNT} texts"
+        rows = [
+            make_row(benchmark_name, label, "wall_ms", baseline_ms, optimized_ms, higher_is_better=False),
+            make_row(
+                benchmark_name,
+                label,
+                "http_requests",
+                float(baseline_requests),
+                float(optimized_requests),
+                higher_is_better=False,
+            ),
+            make_row(
+                benchmark_name,
+                label,
+                "texts_per_second",
+                TEXT_COUNT / (baseline_ms / 1000),
+                TEXT_COUNT / (optimized_ms / 1000),
+            ),
+        ]
+
+        filepath = write_benchmark_csv("ollama_embedding_serial_vs_batched.csv", rows)
+        assert filepath.exists()
+        assert optimized_embeddings == baseline_embeddings
+        assert optimized_requests < baseline_requests
+        assert optimized_ms < baseline_ms
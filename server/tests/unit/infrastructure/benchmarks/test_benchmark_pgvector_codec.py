@@ -0,0 +1,81 @@
+"""Benchmark: pgvector transport – text literal (baseline) vs binary codec (optimized).
+
+Measures the client-side cost of one 1536-dimension embedding per call: the
+baseline formats the former ``"[0.1,0.2,...]"`` literal and parses the text
+form of a result row, the optimized side encodes and decodes the binary
+format of ``pgvector.asyncpg.register_vector`` (what :class:`BinaryVector`
+and the retrieval query now send). The payload size is the number of bytes
+on the wire per vector; PostgreSQL's own text parsing is not measured.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+from pgvector import Vector
+
+from raggae.infrastructure.database.pgvector_codec import to_pgvector
+
+from .conftest import make_row, write_benchmark_csv
+
+DIMENSION = 1536
+CALLS = 200
+
+
+def _text_literal(values: list[float]) -> str:
+    return "[" + ",".join(str(value) for value in values) + "]"
+
+
+def _per_call_us(operation: Callable[[], object]) -> float:
+    operation()
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        operation()
+    return (time.perf_counter() - start) / CALLS * 1_000_000
+
+
+@pytest.mark.unit
+class TestBenchmarkPgvectorCodec:
+    """Compare text literal and binary codec encode/decode cost per vector."""
+
+    def test_text_literal_vs_binary_codec(self) -> None:
+        embedding = np.random.default_rng(15).standard_normal(DIMENSION).astype(np.float32).tolist()
+        text_value = _text_literal(embedding)
+        binary_value = to_pgvector(embedding).to_binary()
+
+        benchmark_name = "pgvector transport: text literal vs binary codec"
+        rows = [
+            make_row(
+                benchmark_name,
+                f"dim={DIMENSION}",
+                "encode_us_per_call",
+                _per_call_us(lambda: _text_literal(embedding)),
+                _per_call_us(lambda: to_pgvector(embedding).to_binary()),
+                higher_is_better=False,
+            ),
+            make_row(
+                benchmark_name,
+                f"dim={DIMENSION}",
+                "decode_us_per_call",
+                _per_call_us(lambda: Vector.from_text(text_value).to_list()),
+                _per_call_us(lambda: Vector.from_binary(binary_value).to_list()),
+                higher_is_better=False,
+            ),
+            make_row(
+                benchmark_name,
+                f"dim={DIMENSION}",
+                "payload_bytes",
+                float(len(text_value.encode())),
+                float(len(binary_value)),
+                higher_is_better=False,
+            ),
+        ]
+
+        filepath = write_benchmark_csv("pgvector_text_vs_binary.csv", rows)
+        assert filepath.exists()
+        assert Vector.from_binary(binary_value).to_list() == embedding
+        for row in rows:
+            assert row["Optimized"] < row["Baseline"]
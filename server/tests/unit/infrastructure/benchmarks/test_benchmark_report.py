@@ -19,6 +19,14 @@ CSV_FILES = [
     "chunking_fixed_vs_paragraph.csv",
     "embedding_plain_vs_contextual.csv",
     "retrieval_hybrid_vs_diversity.csv",
+    "retrieval_weighted_vs_rrf.csv",
+    "in_memory_scan_vs_numpy_index.csv",
+    "vector_index_full_vs_quantized.csv",
+    "vector_index_full_vs_quantized_postgres.csv",
+    "retrieval_single_statement_vs_concurrent.csv",
+    "retrieval_single_statement_vs_concurrent_postgres.csv",
+    "pgvector_text_vs_binary.csv",
+    "ollama_embedding_serial_vs_batched.csv",
     "context_old_vs_enhanced_prompt.csv",
     "end_to_end_pipeline.csv",
 ]
@@ -125,6 +133,18 @@ def _generate_report() -> str:
             "🔍 Retrieval: Hybrid vs Hybrid+MMR Diversity",
             "Compares standard hybrid search (vector + lexical) against hybrid search enhanced with MMR diversity reranking to reduce redundancy.",  # noqa: E501
         ),
+        "retrieval_single_statement_vs_concurrent.csv": (
+            "🔍 Retrieval: Single Statement vs Concurrent Channels (latency model)",
+            "Models the orchestration cost of both channel execution modes with assumed statement latencies. These figures are a model, not a PostgreSQL measurement.",  # noqa: E501
+        ),
+        "retrieval_single_statement_vs_concurrent_postgres.csv": (
+            "🔍 Retrieval: Single Statement vs Concurrent Channels (PostgreSQL)",
+            "Measured p50 / p95 retrieval latency of both channel execution modes against the integration PostgreSQL database (written by the integration benchmark).",  # noqa: E501
+        ),
+        "vector_index_full_vs_quantized_postgres.csv": (
+            "🔢 Vector Index: Full Precision vs Quantized HNSW (PostgreSQL)",
+            "Measured latency, recall and index / table size per vector of the halfvec and bit HNSW indexes against the full-precision one on the integration PostgreSQL database (written by the integration benchmark). The table does not shrink: only the index is quantized.",  # noqa: E501
+        ),
         "context_old_vs_enhanced_prompt.csv": (
             "📝 Context: Old Prompt vs Enhanced Prompt",
             "Compares the original RAG prompt against an enhanced prompt with source attribution, structured sections, and numbered excerpts.",  # noqa: E501
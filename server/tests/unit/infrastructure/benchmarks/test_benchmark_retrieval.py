@@ -1,17 +1,31 @@
 """Benchmark: Retrieval – Hybrid (baseline) vs Hybrid + MMR diversity (optimized).
 
-Evaluates retrieval quality and context diversity on the test PDFs.
+Evaluates retrieval quality and context diversity on the test PDFs, and compares
+weighted max-normalized fusion (baseline) with Reciprocal Rank Fusion (optimized).
 """
 
 from __future__ import annotations
 
+import time
+from datetime import UTC, datetime
 from typing import Any
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 
 from raggae.application.dto.retrieved_chunk_dto import RetrievedChunkDTO
+from raggae.domain.entities.document import Document
+from raggae.domain.entities.document_chunk import DocumentChunk
 from raggae.domain.value_objects.chunking_strategy import ChunkingStrategy
+from raggae.infrastructure.database.repositories.in_memory_document_chunk_repository import (
+    InMemoryDocumentChunkRepository,
+)
+from raggae.infrastructure.database.repositories.in_memory_document_repository import (
+    InMemoryDocumentRepository,
+)
+from raggae.infrastructure.services.in_memory_chunk_retrieval_service import (
+    InMemoryChunkRetrievalService,
+)
 from raggae.infrastructure.services.in_memory_embedding_service import InMemoryEmbeddingService
 from raggae.infrastructure.services.mmr_diversity_reranker_service import (
     MmrDiversityRerankerService,
@@ -136,6 +150,49 @@ def _hybrid_retrieve(
     return scored[:limit]
 
 
+async def _build_repositories(
+    chunk_texts: list[str],
+    embeddings: list[list[float]],
+    chunk_sources: list[str],
+) -> tuple[UUID, InMemoryDocumentRepository, InMemoryDocumentChunkRepository, dict[UUID, str]]:
+    """Load the flat index into in-memory repositories.
+
+    Returns (project_id, document_repository, chunk_repository, source_filename_by_chunk_id).
+    """
+    project_id = uuid4()
+    document_repository = InMemoryDocumentRepository()
+    chunk_repository = InMemoryDocumentChunkRepository()
+    documents: dict[str, Document] = {}
+    chunks: list[DocumentChunk] = []
+    sources_by_chunk_id: dict[UUID, str] = {}
+
+    for i, (text, emb, source) in enumerate(zip(chunk_texts, embeddings, chunk_sources, strict=True)):
+        if source not in documents:
+            documents[source] = Document(
+                id=uuid4(),
+                project_id=project_id,
+                file_name=source,
+                content_type="application/pdf",
+                file_size=len(text),
+                storage_key=source,
+                created_at=datetime.now(UTC),
+            )
+            await document_repository.save(documents[source])
+        chunk = DocumentChunk(
+            id=uuid4(),
+            document_id=documents[source].id,
+            chunk_index=i,
+            content=text,
+            embedding=emb,
+            created_at=datetime.now(UTC),
+        )
+        chunks.append(chunk)
+        sources_by_chunk_id[chunk.id] = source
+
+    await chunk_repository.save_many(chunks)
+    return project_id, document_repository, chunk_repository, sources_by_chunk_id
+
+
 # ---------------------------------------------------------------------------
 # Test
 # ---------------------------------------------------------------------------
@@ -244,3 +301,69 @@ class TestBenchmarkRetrieval:
         filepath = write_benchmark_csv("retrieval_hybrid_vs_diversity.csv", rows)
         assert filepath.exists()
         assert len(rows) > 0
+
+    @pytest.mark.asyncio
+    async def test_weighted_vs_rrf_fusion(self, sanitized_texts: dict[str, str]) -> None:
+        assert sanitized_texts, "No test documents found"
+
+        embedding_svc = InMemoryEmbeddingService(dimension=32)
+        chunk_texts, _, embeddings, chunk_sources = await _build_index(sanitized_texts, embedding_svc)
+        project_id, document_repository, chunk_repository, sources_by_chunk_id = await _build_repositories(
+            chunk_texts, embeddings, chunk_sources
+        )
+        weighted_service = InMemoryChunkRetrievalService(
+            document_repository=document_repository,
+            document_chunk_repository=chunk_repository,
+            fusion="weighted",
+        )
+        rrf_service = InMemoryChunkRetrievalService(
+            document_repository=document_repository,
+            document_chunk_repository=chunk_repository,
+            fusion="rrf",
+        )
+
+        rows: list[dict] = []
+        benchmark_name = "Retrieval: Weighted fusion vs RRF"
+
+        for q_info in QUERIES:
+            query = q_info["query"]
+            expected_kw = q_info["expected_doc"]
+            label = query[:30]
+
+            relevant_ids = {
+                str(chunk_id)
+                for chunk_id, src in sources_by_chunk_id.items()
+                if _doc_matches(src, expected_kw)
+            }
+            q_emb = (await embedding_svc.embed_texts([query]))[0]
+
+            measurements: dict[str, tuple[float, list[str]]] = {}
+            for name, service in (("weighted", weighted_service), ("rrf", rrf_service)):
+                start = time.perf_counter()
+                results = await service.retrieve_chunks(
+                    project_id=project_id,
+                    query_text=query,
+                    query_embedding=q_emb,
+                    limit=TOP_K,
+                )
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                measurements[name] = (elapsed_ms, [str(result.chunk_id) for result in results])
+
+            base_ms, base_retrieved = measurements["weighted"]
+            opt_ms, opt_retrieved = measurements["rrf"]
+
+            n_base = ndcg_at_k(base_retrieved, relevant_ids, TOP_K)
+            n_opt = ndcg_at_k(opt_retrieved, relevant_ids, TOP_K)
+            rows.append(make_row(benchmark_name, label, "ndcg@5", n_base, n_opt))
+
+            m_base = mrr(base_retrieved, relevant_ids)
+            m_opt = mrr(opt_retrieved, relevant_ids)
+            rows.append(make_row(benchmark_name, label, "mrr", m_base, m_opt))
+
+            rows.append(
+                make_row(benchmark_name, label, "latency_ms", base_ms, opt_ms, higher_is_better=False)
+            )
+
+        filepath = write_benchmark_csv("retrieval_weighted_vs_rrf.csv", rows)
+        assert filepath.exists()
+        assert len(rows) > 0
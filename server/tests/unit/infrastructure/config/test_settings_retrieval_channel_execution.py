@@ -0,0 +1,34 @@
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from raggae.infrastructure.config.settings import Settings
+
+
+class TestRetrievalChannelExecution:
+    def test_retrieval_channel_execution_defaults_to_single_statement(self) -> None:
+        # Given / When
+        s = Settings()
+
+        # Then
+        assert s.retrieval_channel_execution == "single_statement"
+
+    def test_retrieval_channel_execution_when_env_set_uses_env_value(self) -> None:
+        # Given
+        env = {"RETRIEVAL_CHANNEL_EXECUTION": "concurrent"}
+
+        # When
+        with patch.dict("os.environ", env):
+            s = Settings()
+
+        # Then
+        assert s.retrieval_channel_execution == "concurrent"
+
+    def test_retrieval_channel_execution_rejects_unknown_mode(self) -> None:
+        # Given
+        env = {"RETRIEVAL_CHANNEL_EXECUTION": "parallel_query"}
+
+        # When / Then
+        with patch.dict("os.environ", env), pytest.raises(ValidationError):
+            Settings()
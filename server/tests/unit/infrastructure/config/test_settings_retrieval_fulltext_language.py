@@ -0,0 +1,34 @@
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from raggae.infrastructure.config.settings import Settings
+
+
+class TestRetrievalFulltextLanguage:
+    def test_retrieval_fulltext_language_defaults_to_french(self) -> None:
+        # Given / When
+        s = Settings()
+
+        # Then
+        assert s.retrieval_fulltext_language == "french"
+
+    def test_retrieval_fulltext_language_when_env_set_uses_env_value(self) -> None:
+        # Given
+        env = {"RETRIEVAL_FULLTEXT_LANGUAGE": "english"}
+
+        # When
+        with patch.dict("os.environ", env):
+            s = Settings()
+
+        # Then
+        assert s.retrieval_fulltext_language == "english"
+
+    def test_retrieval_fulltext_language_rejects_non_identifier(self) -> None:
+        # Given
+        env = {"RETRIEVAL_FULLTEXT_LANGUAGE": "french'); DROP TABLE documents; --"}
+
+        # When / Then
+        with patch.dict("os.environ", env), pytest.raises(ValidationError):
+            Settings()
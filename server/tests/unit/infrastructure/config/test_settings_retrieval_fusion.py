@@ -0,0 +1,36 @@
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from raggae.infrastructure.config.settings import Settings
+
+
+class TestRetrievalFusion:
+    def test_retrieval_fusion_defaults_to_weighted(self) -> None:
+        # Given / When
+        s = Settings()
+
+        # Then
+        assert s.retrieval_fusion == "weighted"
+        assert s.retrieval_rrf_k == 60
+
+    def test_retrieval_fusion_when_env_set_uses_env_value(self) -> None:
+        # Given
+        env = {"RETRIEVAL_FUSION": "rrf", "RETRIEVAL_RRF_K": "20"}
+
+        # When
+        with patch.dict("os.environ", env):
+            s = Settings()
+
+        # Then
+        assert s.retrieval_fusion == "rrf"
+        assert s.retrieval_rrf_k == 20
+
+    def test_retrieval_fusion_rejects_unknown_mode(self) -> None:
+        # Given
+        env = {"RETRIEVAL_FUSION": "borda"}
+
+        # When / Then
+        with patch.dict("os.environ", env), pytest.raises(ValidationError):
+            Settings()
@@ -0,0 +1,35 @@
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from raggae.infrastructure.config.settings import Settings
+
+
+class TestRetrievalVectorIndex:
+    def test_retrieval_vector_index_defaults_to_full_precision(self) -> None:
+        # Given / When
+        s = Settings()
+
+        # Then
+        assert s.retrieval_vector_index == "vector"
+        assert s.retrieval_quantized_rescore_multiplier == 4
+
+    def test_retrieval_vector_index_when_env_set_uses_env_value(self) -> None:
+        # Given
+        env = {"RETRIEVAL_VECTOR_INDEX": "halfvec"}
+
+        # When
+        with patch.dict("os.environ", env):
+            s = Settings()
+
+        # Then
+        assert s.retrieval_vector_index == "halfvec"
+
+    def test_retrieval_vector_index_rejects_unknown_mode(self) -> None:
+        # Given
+        env = {"RETRIEVAL_VECTOR_INDEX": "sparsevec"}
+
+        # When / Then
+        with patch.dict("os.environ", env), pytest.raises(ValidationError):
+            Settings()
@@ -0,0 +1,113 @@
+from unittest.mock import AsyncMock, MagicMock
+
+from raggae.infrastructure.cache.in_memory_embedding_cache import InMemoryEmbeddingCache
+from raggae.infrastructure.config.settings import Settings
+from raggae.infrastructure.services.caching_embedding_service import CachingEmbeddingService
+from raggae.infrastructure.services.contextual_embedding_service import ContextualEmbeddingService
+from raggae.infrastructure.services.in_memory_embedding_service import InMemoryEmbeddingService
+from raggae.infrastructure.services.openai_embedding_service import OpenAIEmbeddingService
+from raggae.infrastructure.services.project_embedding_service_resolver import (
+    ProjectEmbeddingServiceResolver,
+)
+
+
+def _delegate() -> AsyncMock:
+    delegate = AsyncMock()
+    delegate.embed_texts.side_effect = lambda texts: [[float(len(text))] for text in texts]
+    return delegate
+
+
+class TestCachingEmbeddingService:
+    async def test_embed_texts_only_sends_unseen_texts_to_delegate(self) -> None:
+        # Given
+        delegate = _delegate()
+        service = CachingEmbeddingService(delegate=delegate, cache=InMemoryEmbeddingCache(), namespace="ns")
+        await service.embed_texts(["a", "bb"])
+
+        # When
+        embeddings = await service.embed_texts(["bb", "ccc", "a"])
+
+        # Then
+        assert embeddings == [[2.0], [3.0], [1.0]]
+        assert delegate.embed_texts.await_args_list[-1].args == (["ccc"],)
+
+    async def test_embed_texts_deduplicates_repeated_texts(self) -> None:
+        # Given
+        delegate = _delegate()
+        service = CachingEmbeddingService(delegate=delegate, cache=InMemoryEmbeddingCache(), namespace="ns")
+
+        # When
+        embeddings = await service.embed_texts(["a", "bb", "a"])
+
+        # Then
+        assert embeddings == [[1.0], [2.0], [1.0]]
+        delegate.embed_texts.assert_awaited_once_with(["a", "bb"])
+
+    async def test_embed_texts_skips_delegate_when_everything_is_cached(self) -> None:
+        # Given
+        delegate = _delegate()
+        cache = InMemoryEmbeddingCache()
+        service = CachingEmbeddingService(delegate=delegate, cache=cache, namespace="ns")
+        await service.embed_texts(["a"])
+
+        # When
+        embeddings = await service.embed_texts(["a"])
+
+        # Then
+        assert embeddings == [[1.0]]
+        assert delegate.embed_texts.await_count == 1
+        assert cache.hits == 1
+
+
+class TestProjectEmbeddingServiceResolverCache:
+    def _resolver(self, cache: InMemoryEmbeddingCache | None) -> ProjectEmbeddingServiceResolver:
+        return ProjectEmbeddingServiceResolver(
+            settings=Settings(default_embedding_provider="openai", default_embedding_api_key="sk-test"),
+            provider_api_key_crypto_service=MagicMock(),
+            embedding_cache=cache,
+        )
+
+    def test_resolve_wraps_provider_service_when_cache_is_configured(self) -> None:
+        # When
+        service = self._resolver(InMemoryEmbeddingCache()).resolve(
+            backend="openai", model="text-embedding-3-small", encrypted_api_key=None
+        )
+
+        # Then
+        assert isinstance(service, CachingEmbeddingService)
+        assert isinstance(service.delegate, OpenAIEmbeddingService)
+
+    def test_resolve_wraps_ollama_service_around_its_document_prefix(self) -> None:
+        # When
+        service = self._resolver(InMemoryEmbeddingCache()).resolve(
+            backend="ollama", model="nomic-embed-text", encrypted_api_key=None
+        )
+
+        # Then
+        assert isinstance(service, CachingEmbeddingService)
+        assert isinstance(service.delegate, ContextualEmbeddingService)
+
+    def test_resolve_query_service_skips_document_cache(self) -> None:
+        # When
+        service = self._resolver(InMemoryEmbeddingCache()).resolve_query_service(
+            backend="openai", model="text-embedding-3-small", encrypted_api_key=None
+        )
+
+        # Then
+        assert isinstance(service, OpenAIEmbeddingService)
+
+    def test_resolve_returns_bare_service_without_cache(self) -> None:
+        # When
+        service = self._resolver(None).resolve(backend="openai", model="m", encrypted_api_key=None)
+
+        # Then
+        assert isinstance(service, OpenAIEmbeddingService)
+
+    def test_resolve_does_not_wrap_in_memory_fallback(self) -> None:
+        # When
+        service = self._resolver(InMemoryEmbeddingCache()).resolve(
+            backend="inmemory", model=None, encrypted_api_key=None
+        )
+
+        # Then
+        assert isinstance(service, InMemoryEmbeddingService)
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import httpx
@@ -21,10 +22,7 @@ class TestOllamaEmbeddingService:
         mock_response = AsyncMock(spec=httpx.Response)
         mock_response.status_code = 200
         mock_response.raise_for_status = lambda: None
-        mock_response.json.side_effect = [
-            {"embeddings": [[0.1, 0.2, 0.3]]},
-            {"embeddings": [[0.4, 0.5, 0.6]]},
-        ]
+        mock_response.json.return_value = {"embeddings": [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]}
 
         with patch.object(service._client, "post", return_value=mock_response) as mock_post:
             # When
@@ -32,7 +30,8 @@ class TestOllamaEmbeddingService:
 
             # Then
             assert result == [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
-            assert mock_post.call_count == 2
+            mock_post.assert_called_once()
+            assert mock_post.call_args.kwargs["json"]["input"] == ["hello", "world"]
 
     async def test_embed_texts_empty_list_returns_empty(self, service: OllamaEmbeddingService) -> None:
         # When
@@ -56,24 +55,86 @@ class TestOllamaEmbeddingService:
             with pytest.raises(EmbeddingGenerationError):
                 await service.embed_texts(["hello"])
 
-    async def test_embed_texts_sends_one_request_per_text(self, service: OllamaEmbeddingService) -> None:
+    async def test_embed_texts_splits_batches_and_preserves_order(self) -> None:
         # Given
-        mock_response = AsyncMock(spec=httpx.Response)
-        mock_response.status_code = 200
-        mock_response.raise_for_status = lambda: None
-        mock_response.json.side_effect = [
-            {"embeddings": [[0.1, 0.2, 0.3]]},
-            {"embeddings": [[0.3, 0.4, 0.5]]},
-            {"embeddings": [[0.5, 0.6, 0.7]]},
-        ]
+        service = OllamaEmbeddingService(
+            base_url="http://localhost:11434",
+            model="nomic-embed-text",
+            batch_size=2,
+            max_concurrency=2,
+        )
+        in_flight = 0
+        max_in_flight = 0
+
+        async def post(url: str, json: dict) -> httpx.Response:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # Later batches answer first.
+            await asyncio.sleep(0.01 / (1 + float(json["input"][0])))
+            in_flight -= 1
+            return httpx.Response(
+                200,
+                json={"embeddings": [[float(text)] for text in json["input"]]},
+                request=httpx.Request("POST", url),
+            )
 
-        with patch.object(service._client, "post", return_value=mock_response) as mock_post:
+        with patch.object(service._client, "post", side_effect=post) as mock_post:
             # When
-            result = await service.embed_texts(["a", "b", "c"])
+            result = await service.embed_texts([str(index) for index in range(5)])
 
             # Then
-            assert len(result) == 3
-            assert mock_post.call_count == 3
+            assert result == [[0.0], [1.0], [2.0], [3.0], [4.0]]
+            assert [call.kwargs["json"]["input"] for call in mock_post.call_args_list] == [
+                ["0", "1"],
+                ["2", "3"],
+                ["4"],
+            ]
+            assert max_in_flight == 2
+
+    async def test_concurrent_calls_share_the_concurrency_limit(self) -> None:
+        # Given
+        service = OllamaEmbeddingService(
+            base_url="http://localhost:11434",
+            model="nomic-embed-text",
+            batch_size=1,
+            max_concurrency=2,
+        )
+        in_flight = 0
+        max_in_flight = 0
+
+        async def post(url: str, json: dict) -> httpx.Response:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(
+                200,
+                json={"embeddings": [[float(text)] for text in json["input"]]},
+                request=httpx.Request("POST", url),
+            )
+
+        with patch.object(service._client, "post", side_effect=post):
+            # When
+            await asyncio.gather(*(service.embed_texts(["1", "2"]) for _ in range(3)))
+
+        # Then
+        assert max_in_flight == 2
+
+    async def test_embed_texts_missing_embeddings_raises_embedding_error(
+        self, service: OllamaEmbeddingService
+    ) -> None:
+        # Given
+        mock_response = AsyncMock(spec=httpx.Response)
+        mock_response.status_code = 200
+        mock_response.raise_for_status = lambda: None
+        mock_response.json.return_value = {"embeddings": [[0.1, 0.2, 0.3]]}
+
+        with patch.object(service._client, "post", return_value=mock_response):
+            # When / Then
+            with pytest.raises(EmbeddingGenerationError, match="2 texts"):
+                await service.embed_texts(["a", "b"])
 
     async def test_embed_texts_truncates_long_input(self) -> None:
         # Given
@@ -96,7 +157,7 @@ class TestOllamaEmbeddingService:
 
             # Then
             sent_input = mock_post.call_args.kwargs["json"]["input"]
-            assert len(sent_input) == max_chars
+            assert [len(text) for text in sent_input] == [max_chars]
 
     async def test_embed_texts_strips_trailing_slash_from_base_url(self) -> None:
         # Given
@@ -116,7 +177,7 @@ class TestOllamaEmbeddingService:
             # Then
             mock_post.assert_called_once_with(
                 "http://localhost:11434/api/embed",
-                json={"model": "nomic-embed-text", "input": "test"},
+                json={"model": "nomic-embed-text", "input": ["test"]},
             )
 
     async def test_embed_texts_wrong_dimension_raises_embedding_error(self) -> None:
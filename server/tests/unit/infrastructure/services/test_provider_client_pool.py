@@ -0,0 +1,164 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from raggae.infrastructure.config.settings import Settings
+from raggae.infrastructure.services.openai_embedding_service import OpenAIEmbeddingService
+from raggae.infrastructure.services.openai_llm_service import OpenAILLMService
+from raggae.infrastructure.services.project_embedding_service_resolver import (
+    ProjectEmbeddingServiceResolver,
+)
+from raggae.infrastructure.services.project_llm_service_resolver import ProjectLLMServiceResolver
+from raggae.infrastructure.services.provider_client_pool import ProviderClientPool
+
+
+def _service() -> MagicMock:
+    service = MagicMock()
+    service.aclose = AsyncMock()
+    return service
+
+
+class TestProviderClientPool:
+    def test_get_reuses_service_for_same_key(self) -> None:
+        # Given
+        pool = ProviderClientPool()
+        factory = MagicMock(side_effect=_service)
+
+        # When
+        first = pool.get("llm", "openai", "gpt-4o-mini", "sk-a", factory)
+        second = pool.get("llm", "openai", "gpt-4o-mini", "sk-a", factory)
+
+        # Then
+        assert first is second
+        factory.assert_called_once()
+        assert pool.stats() == {"size": 1, "hits": 1, "misses": 1, "evictions": 0, "closed": 0}
+
+    def test_get_separates_kind_model_and_api_key(self) -> None:
+        # Given
+        pool = ProviderClientPool()
+
+        # When
+        services = {
+            id(pool.get("llm", "openai", "m", "sk-a", _service)),
+            id(pool.get("embedding", "openai", "m", "sk-a", _service)),
+            id(pool.get("llm", "openai", "m2", "sk-a", _service)),
+            id(pool.get("llm", "openai", "m", "sk-b", _service)),
+        }
+
+        # Then
+        assert len(services) == 4
+        assert pool.size == 4
+
+    async def test_get_closes_evicted_service_after_delay(self) -> None:
+        # Given
+        pool = ProviderClientPool(max_entries=1, close_delay_seconds=0.0)
+        evicted = pool.get("llm", "openai", "m", "sk-a", _service)
+
+        # When
+        pool.get("llm", "openai", "m", "sk-b", _service)
+        await asyncio.sleep(0)
+
+        # Then
+        evicted.aclose.assert_awaited_once()
+        assert pool.evictions == 1
+        assert pool.closed == 1
+
+    async def test_evicted_service_stays_open_while_leased(self) -> None:
+        # Given
+        pool = ProviderClientPool(max_entries=1, close_delay_seconds=0.0)
+        leased = pool.get("embedding", "openai", "m", "sk-a", _service)
+
+        with pool.leased(leased):
+            # When
+            pool.get("embedding", "openai", "m", "sk-b", _service)
+            await asyncio.sleep(0)
+
+            # Then
+            leased.aclose.assert_not_awaited()
+            assert pool.evictions == 1
+
+        await asyncio.sleep(0)
+        leased.aclose.assert_awaited_once()
+        assert pool.closed == 1
+
+    async def test_aclose_closes_leased_evicted_services(self) -> None:
+        # Given
+        pool = ProviderClientPool(max_entries=1, close_delay_seconds=0.0)
+        leased = pool.get("embedding", "openai", "m", "sk-a", _service)
+
+        with pool.leased(leased):
+            pool.get("embedding", "openai", "m", "sk-b", _service)
+            await asyncio.sleep(0)
+
+            # When
+            await pool.aclose()
+
+        # Then
+        leased.aclose.assert_awaited_once()
+
+    async def test_aclose_closes_pooled_and_pending_services(self) -> None:
+        # Given
+        pool = ProviderClientPool(max_entries=1, close_delay_seconds=3600.0)
+        evicted = pool.get("llm", "openai", "m", "sk-a", _service)
+        pooled = pool.get("llm", "openai", "m", "sk-b", _service)
+
+        # When
+        await pool.aclose()
+
+        # Then
+        evicted.aclose.assert_awaited_once()
+        pooled.aclose.assert_awaited_once()
+        assert pool.size == 0
+
+    def test_decrypt_memoizes_ciphertext(self) -> None:
+        # Given
+        pool = ProviderClientPool()
+        decrypt = MagicMock(return_value="sk-plain")
+
+        # When
+        keys = [pool.decrypt("gAAAA-token", decrypt) for _ in range(3)]
+
+        # Then
+        assert keys == ["sk-plain"] * 3
+        decrypt.assert_called_once_with("gAAAA-token")
+
+
+class TestProjectLLMServiceResolverPool:
+    def test_resolve_reuses_service_for_same_credentials(self) -> None:
+        # Given
+        crypto = MagicMock()
+        crypto.decrypt.return_value = "sk-user"
+        resolver = ProjectLLMServiceResolver(settings=Settings(), provider_api_key_crypto_service=crypto)
+
+        # When
+        first = resolver.resolve(backend="openai", model="gpt-4o-mini", encrypted_api_key="token")
+        second = resolver.resolve(backend="openai", model="gpt-4o-mini", encrypted_api_key="token")
+
+        # Then
+        assert isinstance(first, OpenAILLMService)
+        assert first is second
+        crypto.decrypt.assert_called_once_with("token")
+
+
+class TestProjectEmbeddingServiceResolverLease:
+    async def test_lease_keeps_evicted_client_open_until_released(self) -> None:
+        # Given
+        pool = ProviderClientPool(max_entries=1, close_delay_seconds=0.0)
+        crypto = MagicMock()
+        crypto.decrypt.side_effect = lambda token: f"sk-{token}"
+        resolver = ProjectEmbeddingServiceResolver(
+            settings=Settings(), provider_api_key_crypto_service=crypto, client_pool=pool
+        )
+
+        async with resolver.lease(backend="openai", model="m", encrypted_api_key="a") as service:
+            assert isinstance(service, OpenAIEmbeddingService)
+            service._client = AsyncMock()  # type: ignore[attr-defined]
+
+            # When — another credential evicts the leased service
+            resolver.resolve(backend="openai", model="m", encrypted_api_key="b")
+            await asyncio.sleep(0)
+
+            # Then
+            service._client.close.assert_not_awaited()
+
+        await asyncio.sleep(0)
+        service._client.close.assert_awaited_once()
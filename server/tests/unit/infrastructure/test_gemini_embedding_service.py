@@ -1,10 +1,38 @@
+import asyncio
 from unittest.mock import AsyncMock, Mock
 
+import httpx
 import pytest
 
 from raggae.domain.exceptions.document_exceptions import EmbeddingGenerationError
 from raggae.infrastructure.services.gemini_embedding_service import GeminiEmbeddingService
 
+_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-embedding-001:batchEmbedContents"
+
+
+def _response(
+    status_code: int, json: dict | None = None, text: str = "", headers: dict | None = None
+) -> httpx.Response:
+    request = httpx.Request("POST", _URL)
+    if json is not None:
+        return httpx.Response(status_code, json=json, headers=headers, request=request)
+    return httpx.Response(status_code, text=text, headers=headers, request=request)
+
+
+def _echo(*args: object, json: dict, **kwargs: object) -> httpx.Response:
+    """Embed each text as ``[float(text)]``."""
+    texts = [request["content"]["parts"][0]["text"] for request in json["requests"]]
+    return _response(200, json={"embeddings": [{"values": [float(text)]} for text in texts]})
+
+
+def _service(**kwargs) -> GeminiEmbeddingService:
+    return GeminiEmbeddingService(
+        api_key="test-key",
+        model="gemini-embedding-001",
+        retry_base_delay_seconds=0.0,
+        **kwargs,
+    )
+
 
 class TestGeminiEmbeddingService:
     async def test_embed_texts_success(self) -> None:
@@ -16,10 +44,9 @@ class TestGeminiEmbeddingService:
         )
         response = Mock()
         response.raise_for_status.return_value = None
-        response.json.side_effect = [
-            {"embedding": {"values": [0.1, 0.2, 0.3]}},
-            {"embedding": {"values": [0.4, 0.5, 0.6]}},
-        ]
+        response.json.return_value = {
+            "embeddings": [{"values": [0.1, 0.2, 0.3]}, {"values": [0.4, 0.5, 0.6]}]
+        }
         service._client = AsyncMock()  # type: ignore[attr-defined]
         service._client.post.return_value = response
 
@@ -28,7 +55,15 @@ class TestGeminiEmbeddingService:
 
         # Then
         assert result == [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
-        assert service._client.post.call_count == 2
+        service._client.post.assert_awaited_once()
+        url = service._client.post.call_args.args[0]
+        requests = service._client.post.call_args.kwargs["json"]["requests"]
+        assert url.endswith("models/gemini-embedding-001:batchEmbedContents?key=test-key")
+        assert requests[1] == {
+            "model": "models/gemini-embedding-001",
+            "content": {"parts": [{"text": "world"}]},
+            "outputDimensionality": 3,
+        }
 
     async def test_embed_texts_empty_list_returns_empty(self) -> None:
         # Given
@@ -67,10 +102,119 @@ class TestGeminiEmbeddingService:
         )
         response = Mock()
         response.raise_for_status.return_value = None
-        response.json.return_value = {"embedding": {"values": [0.1, 0.2]}}
+        response.json.return_value = {"embeddings": [{"values": [0.1, 0.2]}]}
         service._client = AsyncMock()  # type: ignore[attr-defined]
         service._client.post.return_value = response
 
         # When / Then
         with pytest.raises(EmbeddingGenerationError, match="dimension"):
             await service.embed_texts(["hello"])
+
+    async def test_embed_texts_splits_batches_and_preserves_order(self) -> None:
+        # Given
+        service = _service(batch_size=2, max_concurrency=3)
+        service._client = AsyncMock()  # type: ignore[attr-defined]
+        service._client.post.side_effect = _echo
+
+        # When
+        result = await service.embed_texts(["1", "2", "3", "4", "5"])
+
+        # Then
+        assert result == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+        assert service._client.post.await_count == 3
+
+    async def test_concurrent_calls_share_the_concurrency_limit(self) -> None:
+        # Given
+        service = _service(batch_size=1, max_concurrency=2)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def post(*args: object, json: dict, **kwargs: object) -> httpx.Response:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _echo(json=json)
+
+        service._client = AsyncMock()  # type: ignore[attr-defined]
+        service._client.post.side_effect = post
+
+        # When
+        await asyncio.gather(*(service.embed_texts(["1", "2"]) for _ in range(3)))
+
+        # Then
+        assert max_in_flight == 2
+
+    async def test_batch_size_is_capped_at_provider_limit(self) -> None:
+        # Given
+        service = _service(batch_size=500)
+        service._client = AsyncMock()  # type: ignore[attr-defined]
+        service._client.post.side_effect = _echo
+
+        # When
+        result = await service.embed_texts([str(index) for index in range(150)])
+
+        # Then
+        assert len(result) == 150
+        sizes = [len(call.kwargs["json"]["requests"]) for call in service._client.post.call_args_list]
+        assert sizes == [100, 50]
+
+    async def test_rate_limited_batch_is_retried(self) -> None:
+        # Given
+        service = _service()
+        service._client = AsyncMock()  # type: ignore[attr-defined]
+        service._client.post.side_effect = [
+            _response(429, text="quota", headers={"retry-after": "0"}),
+            _response(503, text="unavailable"),
+            _response(200, json={"embeddings": [{"values": [1.0]}]}),
+        ]
+
+        # When
+        result = await service.embed_texts(["1"])
+
+        # Then
+        assert result == [[1.0]]
+        assert service._client.post.await_count == 3
+
+    async def test_retries_are_bounded(self) -> None:
+        # Given
+        service = _service(max_retries=2)
+        service._client = AsyncMock()  # type: ignore[attr-defined]
+        service._client.post.return_value = _response(429, text="quota")
+
+        # When / Then
+        with pytest.raises(EmbeddingGenerationError, match="status=429"):
+            await service.embed_texts(["1"])
+        assert service._client.post.await_count == 3
+
+    async def test_payload_error_shrinks_the_batch(self) -> None:
+        # Given
+        service = _service()
+        service._client = AsyncMock()  # type: ignore[attr-defined]
+
+        def post(*args: object, json: dict, **kwargs: object) -> httpx.Response:
+            if len(json["requests"]) > 2:
+                return _response(400, text="Request payload size exceeds the limit")
+            return _echo(json=json)
+
+        service._client.post.side_effect = post
+
+        # When
+        result = await service.embed_texts(["1", "2", "3", "4", "5"])
+
+        # Then
+        assert result == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+        sizes = [len(call.kwargs["json"]["requests"]) for call in service._client.post.call_args_list]
+        assert sizes == [5, 2, 3, 1, 2]
+
+    async def test_other_client_errors_are_not_retried(self) -> None:
+        # Given
+        service = _service()
+        service._client = AsyncMock()  # type: ignore[attr-defined]
+        service._client.post.return_value = _response(400, text="API key not valid")
+
+        # When / Then
+        with pytest.raises(EmbeddingGenerationError, match="status=400"):
+            await service.embed_texts(["1", "2"])
+        service._client.post.assert_awaited_once()
@@ -1,6 +1,8 @@
 from datetime import UTC, datetime
 from uuid import uuid4
 
+import pytest
+
 from raggae.domain.entities.document import Document
 from raggae.domain.entities.document_chunk import DocumentChunk
 from raggae.domain.value_objects.chunk_level import ChunkLevel
@@ -13,6 +15,7 @@ from raggae.infrastructure.database.repositories.in_memory_document_repository i
 from raggae.infrastructure.services.in_memory_chunk_retrieval_service import (
     InMemoryChunkRetrievalService,
 )
+from raggae.infrastructure.services.in_memory_vector_index import InMemoryVectorIndex
 
 
 class TestInMemoryChunkRetrievalService:
@@ -402,3 +405,179 @@ class TestInMemoryChunkRetrievalService:
         assert "parent content" not in contents
         assert "child content" in contents
         assert "standard content" in contents
+
+    async def test_retrieve_chunks_rrf_fusion_merges_rankings(self) -> None:
+        # Given
+        project_id = uuid4()
+        document_repository = InMemoryDocumentRepository()
+        chunk_repository = InMemoryDocumentChunkRepository()
+        service = InMemoryChunkRetrievalService(
+            document_repository=document_repository,
+            document_chunk_repository=chunk_repository,
+            vector_weight=0.5,
+            fulltext_weight=0.5,
+            fusion="rrf",
+            rrf_k=60,
+        )
+        doc = Document(
+            id=uuid4(),
+            project_id=project_id,
+            file_name="doc.txt",
+            content_type="text/plain",
+            file_size=10,
+            storage_key="doc",
+            created_at=datetime.now(UTC),
+        )
+        await document_repository.save(doc)
+        await chunk_repository.save_many(
+            [
+                DocumentChunk(
+                    id=uuid4(),
+                    document_id=doc.id,
+                    chunk_index=0,
+                    content="vector only",
+                    embedding=[1.0, 0.0],
+                    created_at=datetime.now(UTC),
+                ),
+                DocumentChunk(
+                    id=uuid4(),
+                    document_id=doc.id,
+                    chunk_index=1,
+                    content="kubernetes deployment",
+                    embedding=[0.8, 0.2],
+                    created_at=datetime.now(UTC),
+                ),
+                DocumentChunk(
+                    id=uuid4(),
+                    document_id=doc.id,
+                    chunk_index=2,
+                    content="unrelated",
+                    embedding=[0.0, 1.0],
+                    created_at=datetime.now(UTC),
+                ),
+            ]
+        )
+
+        # When
+        result = await service.retrieve_chunks(
+            project_id=project_id,
+            query_text="kubernetes",
+            query_embedding=[1.0, 0.0],
+            limit=3,
+        )
+
+        # Then — ranked 2nd by vector and 1st by fulltext beats ranked 1st by vector only
+        assert [r.chunk_index for r in result] == [1, 0, 2]
+        assert result[0].score == pytest.approx((0.5 / 62 + 0.5 / 61) * 61)
+        assert result[0].fulltext_score is not None and result[0].fulltext_score > 0.0
+        assert result[1].vector_score == 1.0
+
+    async def test_retrieve_chunks_with_shared_index_sees_replaced_chunks(self) -> None:
+        # Given
+        project_id = uuid4()
+        vector_index = InMemoryVectorIndex()
+        document_repository = InMemoryDocumentRepository()
+        chunk_repository = InMemoryDocumentChunkRepository(vector_index=vector_index)
+        service = InMemoryChunkRetrievalService(
+            document_repository=document_repository,
+            document_chunk_repository=chunk_repository,
+            vector_index=vector_index,
+        )
+        doc = Document(
+            id=uuid4(),
+            project_id=project_id,
+            file_name="doc.txt",
+            content_type="text/plain",
+            file_size=10,
+            storage_key="doc",
+            created_at=datetime.now(UTC),
+        )
+        await document_repository.save(doc)
+        await chunk_repository.save_many(
+            [
+                DocumentChunk(
+                    id=uuid4(),
+                    document_id=doc.id,
+                    chunk_index=0,
+                    content="old content",
+                    embedding=[1.0, 0.0],
+                    created_at=datetime.now(UTC),
+                )
+            ]
+        )
+        await service.retrieve_chunks(
+            project_id=project_id, query_text="content", query_embedding=[1.0, 0.0], limit=5
+        )
+
+        # When
+        await chunk_repository.replace_document_chunks(
+            doc.id,
+            [
+                DocumentChunk(
+                    id=uuid4(),
+                    document_id=doc.id,
+                    chunk_index=0,
+                    content="new content",
+                    embedding=[0.0, 1.0],
+                    created_at=datetime.now(UTC),
+                )
+            ],
+        )
+        result = await service.retrieve_chunks(
+            project_id=project_id, query_text="content", query_embedding=[1.0, 0.0], limit=5
+        )
+
+        # Then
+        assert [chunk.content for chunk in result] == ["new content"]
+        assert result[0].vector_score == 0.0
+        assert result[0].document_file_name == "doc.txt"
+
+    async def test_retrieve_chunks_scales_bm25_by_best_candidate(self) -> None:
+        # Given
+        project_id = uuid4()
+        document_repository = InMemoryDocumentRepository()
+        chunk_repository = InMemoryDocumentChunkRepository()
+        service = InMemoryChunkRetrievalService(
+            document_repository=document_repository,
+            document_chunk_repository=chunk_repository,
+        )
+        doc = Document(
+            id=uuid4(),
+            project_id=project_id,
+            file_name="doc.txt",
+            content_type="text/plain",
+            file_size=10,
+            storage_key="doc",
+            created_at=datetime.now(UTC),
+        )
+        await document_repository.save(doc)
+        await chunk_repository.save_many(
+            [
+                DocumentChunk(
+                    id=uuid4(),
+                    document_id=doc.id,
+                    chunk_index=index,
+                    content=content,
+                    embedding=[1.0, 0.0],
+                    created_at=datetime.now(UTC),
+                )
+                for index, content in enumerate(
+                    ["pgvector index", "pgvector index tuning guide for large tables", "unrelated"]
+                )
+            ]
+        )
+
+        # When
+        result = await service.retrieve_chunks(
+            project_id=project_id,
+            query_text="pgvector",
+            query_embedding=[1.0, 0.0],
+            limit=3,
+            strategy="fulltext",
+        )
+
+        # Then — the shorter chunk wins, and the best lexical match scores 1.0
+        assert [r.chunk_index for r in result] == [0, 1, 2]
+        assert result[0].fulltext_score == 1.0
+        assert 0.0 < (result[1].fulltext_score or 0.0) < 1.0
+        assert result[2].fulltext_score == 0.0
@@ -0,0 +1,69 @@
+from dataclasses import replace
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from raggae.domain.entities.document_chunk import DocumentChunk
+from raggae.infrastructure.database.repositories.in_memory_document_chunk_repository import (
+    InMemoryDocumentChunkRepository,
+)
+from raggae.infrastructure.services.in_memory_vector_index import InMemoryVectorIndex
+
+
+def _chunk(document_id, chunk_index: int) -> DocumentChunk:
+    return DocumentChunk(
+        id=uuid4(),
+        document_id=document_id,
+        chunk_index=chunk_index,
+        content=f"chunk {chunk_index}",
+        embedding=[1.0],
+        created_at=datetime.now(UTC),
+    )
+
+
+class TestInMemoryDocumentChunkRepository:
+    async def test_find_by_document_id_returns_chunks_in_insertion_order(self) -> None:
+        # Given
+        repo = InMemoryDocumentChunkRepository()
+        doc_a, doc_b = uuid4(), uuid4()
+        first, second = _chunk(doc_a, 1), _chunk(doc_a, 0)
+        await repo.save_many([first, _chunk(doc_b, 0), second])
+
+        # When
+        await repo.save_many([replace(first, content="updated")])
+        chunks = await repo.find_by_document_id(doc_a)
+
+        # Then
+        assert [chunk.id for chunk in chunks] == [first.id, second.id]
+        assert chunks[0].content == "updated"
+        assert len(await repo.find_by_document_id(doc_b)) == 1
+
+    async def test_chunk_moved_to_another_document_is_reindexed_in_both(self) -> None:
+        # Given
+        index = InMemoryVectorIndex()
+        repo = InMemoryDocumentChunkRepository(vector_index=index)
+        doc_a, doc_b = uuid4(), uuid4()
+        moved, kept = _chunk(doc_a, 0), _chunk(doc_a, 1)
+        await repo.save_many([moved, kept])
+
+        # When
+        await repo.save_many([replace(moved, document_id=doc_b)])
+
+        # Then
+        assert [chunk.id for chunk in await repo.find_by_document_id(doc_a)] == [kept.id]
+        assert [chunk.id for chunk in await repo.find_by_document_id(doc_b)] == [moved.id]
+        segment_a, segment_b = index.segment(doc_a), index.segment(doc_b)
+        assert segment_a is not None and [chunk.id for chunk in segment_a.chunks] == [kept.id]
+        assert segment_b is not None and [chunk.id for chunk in segment_b.chunks] == [moved.id]
+
+    async def test_delete_by_document_id_keeps_other_documents(self) -> None:
+        # Given
+        repo = InMemoryDocumentChunkRepository()
+        doc_a, doc_b = uuid4(), uuid4()
+        await repo.save_many([_chunk(doc_a, 0), _chunk(doc_b, 0)])
+
+        # When
+        await repo.delete_by_document_id(doc_a)
+
+        # Then
+        assert await repo.find_by_document_id(doc_a) == []
+        assert len(await repo.find_by_document_id(doc_b)) == 1
@@ -0,0 +1,84 @@
+from uuid import uuid4
+
+from raggae.infrastructure.services.in_memory_document_ingestion_queue import (
+    InMemoryDocumentIngestionQueue,
+)
+
+
+class TestInMemoryDocumentIngestionQueue:
+    async def test_claim_leases_job_once_and_counts_attempt(self) -> None:
+        # Given
+        queue = InMemoryDocumentIngestionQueue()
+        document_id = uuid4()
+        job_id = await queue.enqueue(document_id=document_id, project_id=uuid4(), user_id=uuid4())
+
+        # When
+        first = await queue.claim("worker-1", lease_seconds=60)
+        second = await queue.claim("worker-2", lease_seconds=60)
+
+        # Then
+        assert first is not None
+        assert first.id == job_id
+        assert first.document_id == document_id
+        assert first.attempts == 1
+        assert second is None
+
+    async def test_claim_takes_over_expired_lease(self) -> None:
+        # Given
+        queue = InMemoryDocumentIngestionQueue()
+        await queue.enqueue(document_id=uuid4(), project_id=uuid4(), user_id=uuid4())
+        await queue.claim("worker-1", lease_seconds=-1)
+
+        # When
+        job = await queue.claim("worker-2", lease_seconds=60)
+
+        # Then
+        assert job is not None
+        assert job.attempts == 2
+        assert await queue.heartbeat(job.id, "worker-1", lease_seconds=60) is False
+
+    async def test_retry_makes_job_claimable_after_delay(self) -> None:
+        # Given
+        queue = InMemoryDocumentIngestionQueue()
+        await queue.enqueue(document_id=uuid4(), project_id=uuid4(), user_id=uuid4())
+        job = await queue.claim("worker-1", lease_seconds=60)
+        assert job is not None
+
+        # When
+        await queue.retry(job.id, "worker-1", "rate limited", delay_seconds=3600)
+        delayed = await queue.claim("worker-1", lease_seconds=60)
+
+        # Then
+        assert delayed is None
+        assert queue.status_of(job.id) == "queued"
+
+    async def test_complete_and_fail_drop_settled_jobs(self) -> None:
+        # Given
+        queue = InMemoryDocumentIngestionQueue()
+        for _ in range(2):
+            await queue.enqueue(document_id=uuid4(), project_id=uuid4(), user_id=uuid4())
+        done = await queue.claim("worker-1", lease_seconds=60)
+        failed = await queue.claim("worker-1", lease_seconds=60)
+        assert done is not None and failed is not None
+
+        # When
+        await queue.complete(done.id, "worker-1")
+        await queue.fail(failed.id, "worker-1", "corrupted")
+
+        # Then
+        assert queue.status_of(done.id) is None
+        assert queue.status_of(failed.id) is None
+        assert await queue.claim("worker-1", lease_seconds=60) is None
+
+    async def test_settling_a_job_held_by_another_worker_keeps_it(self) -> None:
+        # Given
+        queue = InMemoryDocumentIngestionQueue()
+        await queue.enqueue(document_id=uuid4(), project_id=uuid4(), user_id=uuid4())
+        job = await queue.claim("worker-1", lease_seconds=60)
+        assert job is not None
+
+        # When
+        await queue.complete(job.id, "worker-2")
+
+        # Then
+        assert queue.status_of(job.id) == "running"
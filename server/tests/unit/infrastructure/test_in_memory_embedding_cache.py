@@ -0,0 +1,79 @@
+from unittest.mock import patch
+
+from raggae.infrastructure.cache.embedding_cache_key import embedding_cache_namespace, text_hash
+from raggae.infrastructure.cache.in_memory_embedding_cache import InMemoryEmbeddingCache
+
+_MONOTONIC = "raggae.infrastructure.cache.in_memory_embedding_cache.monotonic"
+
+
+class TestInMemoryEmbeddingCache:
+    async def test_get_many_returns_stored_embeddings_and_counts_hits(self) -> None:
+        # Given
+        cache = InMemoryEmbeddingCache()
+        await cache.set_many("ns", {"h1": [0.1], "h2": [0.2]})
+
+        # When
+        embeddings = await cache.get_many("ns", ["h1", "h2", "h3"])
+
+        # Then
+        assert embeddings == {"h1": [0.1], "h2": [0.2]}
+        assert cache.hits == 2
+        assert cache.misses == 1
+
+    async def test_get_many_is_scoped_by_namespace(self) -> None:
+        # Given
+        cache = InMemoryEmbeddingCache()
+        await cache.set_many("ns-a", {"h1": [0.1]})
+
+        # When
+        embeddings = await cache.get_many("ns-b", ["h1"])
+
+        # Then
+        assert embeddings == {}
+
+    async def test_set_many_evicts_least_recently_used_entry(self) -> None:
+        # Given
+        cache = InMemoryEmbeddingCache(max_entries=2)
+        await cache.set_many("ns", {"first": [1.0], "second": [2.0]})
+        await cache.get_many("ns", ["first"])
+
+        # When
+        await cache.set_many("ns", {"third": [3.0]})
+
+        # Then
+        assert await cache.get_many("ns", ["first", "second", "third"]) == {"first": [1.0], "third": [3.0]}
+
+    async def test_get_many_drops_expired_entries(self) -> None:
+        # Given
+        cache = InMemoryEmbeddingCache(ttl_seconds=10.0)
+        with patch(_MONOTONIC, return_value=100.0):
+            await cache.set_many("ns", {"h1": [1.0]})
+
+        # When
+        with patch(_MONOTONIC, return_value=111.0):
+            embeddings = await cache.get_many("ns", ["h1"])
+
+        # Then
+        assert embeddings == {}
+        assert cache.misses == 1
+
+
+class TestEmbeddingCacheKey:
+    def test_namespace_changes_with_every_component(self) -> None:
+        # Given
+        base = embedding_cache_namespace("openai", "m", 1536, "")
+
+        # When
+        variants = {
+            embedding_cache_namespace("gemini", "m", 1536, ""),
+            embedding_cache_namespace("openai", "m2", 1536, ""),
+            embedding_cache_namespace("openai", "m", 768, ""),
+            embedding_cache_namespace("openai", "m", 1536, "search_document: "),
+        }
+
+        # Then
+        assert base not in variants
+        assert len(variants) == 4
+
+    def test_text_hash_is_sha256_of_content(self) -> None:
+        assert text_hash("abc") == "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
@@ -0,0 +1,100 @@
+from unittest.mock import patch
+
+from raggae.infrastructure.cache.in_memory_query_embedding_cache import InMemoryQueryEmbeddingCache
+
+_MONOTONIC = "raggae.infrastructure.cache.in_memory_query_embedding_cache.monotonic"
+
+
+class TestInMemoryQueryEmbeddingCache:
+    async def test_get_returns_stored_embedding_and_counts_hit(self) -> None:
+        # Given
+        cache = InMemoryQueryEmbeddingCache()
+        await cache.set("openai", "text-embedding-3-small", "What is Raggae?", [0.1, 0.2])
+
+        # When
+        embedding = await cache.get("openai", "text-embedding-3-small", "What is Raggae?")
+
+        # Then
+        assert embedding == [0.1, 0.2]
+        assert cache.hits == 1
+        assert cache.misses == 0
+
+    async def test_get_normalizes_whitespace_and_case(self) -> None:
+        # Given
+        cache = InMemoryQueryEmbeddingCache()
+        await cache.set("openai", "m", "What is  Raggae?", [0.1])
+
+        # When
+        embedding = await cache.get("openai", "m", "  what is raggae? ")
+
+        # Then
+        assert embedding == [0.1]
+
+    async def test_get_is_scoped_by_backend_and_model(self) -> None:
+        # Given
+        cache = InMemoryQueryEmbeddingCache()
+        await cache.set("openai", "m1", "question", [0.1])
+
+        # When
+        other_model = await cache.get("openai", "m2", "question")
+        other_backend = await cache.get("gemini", "m1", "question")
+
+        # Then
+        assert other_model is None
+        assert other_backend is None
+        assert cache.misses == 2
+
+    async def test_get_evicts_least_recently_used_entry(self) -> None:
+        # Given
+        cache = InMemoryQueryEmbeddingCache(max_entries=2)
+        await cache.set("b", "m", "first", [1.0])
+        await cache.set("b", "m", "second", [2.0])
+        await cache.get("b", "m", "first")
+
+        # When
+        await cache.set("b", "m", "third", [3.0])
+
+        # Then — "second" was the least recently used
+        assert await cache.get("b", "m", "second") is None
+        assert await cache.get("b", "m", "first") == [1.0]
+        assert await cache.get("b", "m", "third") == [3.0]
+
+    async def test_get_ignores_expired_entry(self) -> None:
+        # Given
+        cache = InMemoryQueryEmbeddingCache(ttl_seconds=60)
+        with patch(_MONOTONIC, return_value=1000.0):
+            await cache.set("b", "m", "question", [1.0])
+
+        # When
+        with patch(_MONOTONIC, return_value=1061.0):
+            embedding = await cache.get("b", "m", "question")
+
+        # Then
+        assert embedding is None
+        assert cache.misses == 1
+
+    async def test_get_falls_back_to_shared_cache_and_promotes_hit(self) -> None:
+        # Given
+        shared = InMemoryQueryEmbeddingCache()
+        await shared.set("b", "m", "question", [1.0])
+        cache = InMemoryQueryEmbeddingCache(shared_cache=shared)
+
+        # When
+        first = await cache.get("b", "m", "question")
+        second = await cache.get("b", "m", "question")
+
+        # Then
+        assert first == second == [1.0]
+        assert cache.shared_hits == 1
+        assert cache.hits == 1
+
+    async def test_set_writes_through_to_shared_cache(self) -> None:
+        # Given
+        shared = InMemoryQueryEmbeddingCache()
+        cache = InMemoryQueryEmbeddingCache(shared_cache=shared)
+
+        # When
+        await cache.set("b", "m", "question", [1.0])
+
+        # Then
+        assert await shared.get("b", "m", "question") == [1.0]
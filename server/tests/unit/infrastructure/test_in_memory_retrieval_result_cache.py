@@ -0,0 +1,67 @@
+from unittest.mock import patch
+
+from raggae.application.dto.query_relevant_chunks_result_dto import (
+    QueryRelevantChunksResultDTO,
+)
+from raggae.infrastructure.cache.in_memory_retrieval_result_cache import InMemoryRetrievalResultCache
+
+_MONOTONIC = "raggae.infrastructure.cache.in_memory_retrieval_result_cache.monotonic"
+
+
+def _result(strategy: str = "hybrid") -> QueryRelevantChunksResultDTO:
+    return QueryRelevantChunksResultDTO(chunks=[], strategy_used=strategy, execution_time_ms=1.0)
+
+
+class TestInMemoryRetrievalResultCache:
+    async def test_get_returns_stored_result_and_counts_hit(self) -> None:
+        # Given
+        cache = InMemoryRetrievalResultCache()
+        result = _result()
+        await cache.set("key", result)
+
+        # When
+        cached = await cache.get("key")
+
+        # Then
+        assert cached is result
+        assert cache.hits == 1
+        assert cache.misses == 0
+
+    async def test_get_unknown_key_counts_miss(self) -> None:
+        # Given
+        cache = InMemoryRetrievalResultCache()
+
+        # When
+        cached = await cache.get("missing")
+
+        # Then
+        assert cached is None
+        assert cache.misses == 1
+
+    async def test_expired_entries_are_not_served(self) -> None:
+        # Given
+        cache = InMemoryRetrievalResultCache(ttl_seconds=10.0)
+        with patch(_MONOTONIC, return_value=100.0):
+            await cache.set("key", _result())
+
+        # When
+        with patch(_MONOTONIC, return_value=111.0):
+            cached = await cache.get("key")
+
+        # Then
+        assert cached is None
+
+    async def test_least_recently_used_entry_is_evicted(self) -> None:
+        # Given
+        cache = InMemoryRetrievalResultCache(max_entries=2)
+        await cache.set("a", _result("a"))
+        await cache.set("b", _result("b"))
+        await cache.get("a")
+
+        # When
+        await cache.set("c", _result("c"))
+
+        # Then
+        assert await cache.get("b") is None
+        assert await cache.get("a") is not None
+        assert await cache.get("c") is not None
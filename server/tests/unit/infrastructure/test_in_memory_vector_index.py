@@ -0,0 +1,291 @@
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from raggae.domain.entities.document_chunk import DocumentChunk
+from raggae.domain.value_objects.chunk_level import ChunkLevel
+from raggae.infrastructure.services.in_memory_vector_index import (
+    DocumentSegment,
+    InMemoryVectorIndex,
+    ProjectMatrix,
+    matches_metadata_value,
+)
+
+
+def _chunk(document_id, content: str, embedding: list[float], **kwargs) -> DocumentChunk:
+    return DocumentChunk(
+        id=uuid4(),
+        document_id=document_id,
+        chunk_index=kwargs.pop("chunk_index", 0),
+        content=content,
+        embedding=embedding,
+        created_at=datetime.now(UTC),
+        **kwargs,
+    )
+
+
+class TestDocumentSegment:
+    def test_build_normalizes_embeddings_and_counts_terms(self) -> None:
+        # Given
+        document_id = uuid4()
+        chunks = [
+            _chunk(document_id, "Alpha beta alpha", [3.0, 4.0]),
+            _chunk(document_id, "gamma", [0.0, 0.0]),
+            _chunk(document_id, "parent", [1.0, 0.0], chunk_level=ChunkLevel.PARENT),
+        ]
+
+        # When
+        segment = DocumentSegment.build(chunks)
+
+        # Then
+        assert segment.embeddings.dtype == np.float32
+        np.testing.assert_allclose(segment.embeddings[0], [0.6, 0.8], rtol=1e-6)
+        np.testing.assert_array_equal(segment.embeddings[1], [0.0, 0.0])
+        rows, frequencies = segment.postings["alpha"]
+        assert rows.tolist() == [0]
+        assert frequencies.tolist() == [2.0]
+        assert "parent" not in segment.postings
+        assert segment.lengths.tolist() == [3.0, 1.0, 1.0]
+        assert segment.searchable.tolist() == [True, True, False]
+
+    def test_build_zeroes_embeddings_of_another_dimension(self) -> None:
+        # Given
+        document_id = uuid4()
+        chunks = [
+            _chunk(document_id, "a", [1.0, 0.0]),
+            _chunk(document_id, "b", [0.0, 1.0]),
+            _chunk(document_id, "c", [1.0, 0.0, 0.0]),
+        ]
+
+        # When
+        segment = DocumentSegment.build(chunks)
+
+        # Then
+        assert segment.dimension == 2
+        np.testing.assert_array_equal(segment.embeddings[2], [0.0, 0.0])
+
+
+class TestInMemoryVectorIndex:
+    def test_project_matrix_scores_all_documents_in_one_product(self) -> None:
+        # Given
+        project_id = uuid4()
+        doc_a = uuid4()
+        doc_b = uuid4()
+        index = InMemoryVectorIndex()
+        index.index_document(doc_a, [_chunk(doc_a, "a", [1.0, 0.0])])
+        index.index_document(doc_b, [_chunk(doc_b, "b", [0.0, 2.0], chunk_index=0)])
+
+        # When
+        matrix = index.project_matrix(project_id, [doc_a, doc_b], dimension=2)
+
+        # Then
+        assert matrix.embeddings.shape == (2, 2)
+        np.testing.assert_allclose(matrix.vector_scores([0.0, 5.0]), [0.0, 1.0])
+        assert matrix.vector_scores([1.0, 0.0, 0.0]).tolist() == [0.0, 0.0]
+        rows, frequencies = matrix.postings("b")
+        assert rows.tolist() == [1]
+        assert frequencies.tolist() == [1.0]
+
+    def test_project_matrix_appends_changed_documents_and_masks_their_old_rows(self) -> None:
+        # Given
+        project_id = uuid4()
+        doc_a = uuid4()
+        doc_b = uuid4()
+        index = InMemoryVectorIndex()
+        index.index_document(doc_a, [_chunk(doc_a, "a", [1.0, 0.0])])
+        index.index_document(doc_b, [_chunk(doc_b, "b", [0.0, 1.0]), _chunk(doc_b, "c", [0.0, 1.0])])
+        first = index.project_matrix(project_id, [doc_a, doc_b], dimension=2)
+
+        # When
+        index.index_document(doc_a, [_chunk(doc_a, "z", [0.0, 1.0])])
+        updated = index.project_matrix(project_id, [doc_a, doc_b], dimension=2)
+
+        # Then
+        assert updated is first
+        assert [chunk.content for chunk in updated.chunks] == ["a", "b", "c", "z"]
+        assert updated.searchable.tolist() == [False, True, True, True]
+        assert updated.postings("a")[0].tolist() == [0]
+        assert updated.bm25_scores(["a"]).tolist() == [0.0, 0.0, 0.0, 0.0]
+        assert updated.postings("z")[0].tolist() == [3]
+
+    def test_project_matrix_is_compacted_once_most_rows_are_masked(self) -> None:
+        # Given
+        project_id = uuid4()
+        doc_a = uuid4()
+        doc_b = uuid4()
+        index = InMemoryVectorIndex()
+        index.index_document(doc_a, [_chunk(doc_a, "a", [1.0])])
+        index.index_document(doc_b, [_chunk(doc_b, "b", [1.0])])
+        index.project_matrix(project_id, [doc_a, doc_b], dimension=1)
+        index.index_document(doc_a, [_chunk(doc_a, "x", [1.0])])
+        index.project_matrix(project_id, [doc_a, doc_b], dimension=1)
+
+        # When
+        index.index_document(doc_a, [_chunk(doc_a, "y", [1.0])])
+        matrix = index.project_matrix(project_id, [doc_a, doc_b], dimension=1)
+
+        # Then
+        assert [chunk.content for chunk in matrix.chunks] == ["b", "y"]
+        assert matrix.searchable.tolist() == [True, True]
+        assert matrix.postings("y")[0].tolist() == [1]
+        assert matrix.average_length == pytest.approx(1.0)
+
+    def test_remove_document_drops_its_segment(self) -> None:
+        # Given
+        document_id = uuid4()
+        index = InMemoryVectorIndex()
+        index.index_document(document_id, [_chunk(document_id, "a", [1.0])])
+
+        # When
+        index.remove_document(document_id)
+
+        # Then
+        assert index.segment(document_id) is None
+        assert len(index.project_matrix(uuid4(), [document_id], dimension=1)) == 0
+
+    def test_index_document_without_chunks_removes_segment(self) -> None:
+        # Given
+        document_id = uuid4()
+        index = InMemoryVectorIndex()
+        index.index_document(document_id, [_chunk(document_id, "a", [1.0])])
+
+        # When
+        index.index_document(document_id, [])
+
+        # Then
+        assert index.segment(document_id) is None
+
+
+class TestBm25Scores:
+    def test_rare_terms_weigh_more_than_common_ones(self) -> None:
+        # Given
+        document_id = uuid4()
+        index = InMemoryVectorIndex()
+        index.index_document(
+            document_id,
+            [
+                _chunk(document_id, "common rare", [1.0], chunk_index=0),
+                _chunk(document_id, "common filler", [1.0], chunk_index=1),
+                _chunk(document_id, "common filler", [1.0], chunk_index=2),
+            ],
+        )
+        matrix = index.project_matrix(uuid4(), [document_id], dimension=1)
+
+        # When
+        common = matrix.bm25_scores(["common"])
+        rare = matrix.bm25_scores(["rare"])
+
+        # Then
+        assert rare[0] > common[0] > 0.0
+        assert rare[1:].tolist() == [0.0, 0.0]
+
+    def test_shorter_chunks_score_higher_for_same_frequency(self) -> None:
+        # Given
+        document_id = uuid4()
+        index = InMemoryVectorIndex()
+        index.index_document(
+            document_id,
+            [
+                _chunk(document_id, "term", [1.0], chunk_index=0),
+                _chunk(document_id, "term a b c d e f", [1.0], chunk_index=1),
+                _chunk(document_id, "other", [1.0], chunk_index=2),
+            ],
+        )
+        matrix = index.project_matrix(uuid4(), [document_id], dimension=1)
+
+        # When
+        scores = matrix.bm25_scores(["term"])
+
+        # Then
+        assert matrix.average_length == pytest.approx(3.0)
+        assert scores[0] > scores[1] > 0.0
+        assert scores[2] == 0.0
+
+    def test_postings_are_merged_across_documents_with_row_offsets(self) -> None:
+        # Given
+        doc_a = uuid4()
+        doc_b = uuid4()
+        index = InMemoryVectorIndex()
+        index.index_document(doc_a, [_chunk(doc_a, "x", [1.0]), _chunk(doc_a, "y", [1.0], chunk_index=1)])
+        index.index_document(doc_b, [_chunk(doc_b, "y x", [1.0])])
+        matrix = index.project_matrix(uuid4(), [doc_a, doc_b], dimension=1)
+
+        # When
+        rows, frequencies = matrix.postings("x")
+
+        # Then
+        assert rows.tolist() == [0, 2]
+        assert frequencies.tolist() == [1.0, 1.0]
+        assert matrix.postings("missing")[0].tolist() == []
+
+
+class TestMetadataMask:
+    @pytest.fixture
+    def matrix(self) -> ProjectMatrix:
+        doc_a = uuid4()
+        doc_b = uuid4()
+        index = InMemoryVectorIndex()
+        index.index_document(
+            doc_a,
+            [
+                _chunk(doc_a, "0", [1.0], metadata_json={"lang": "fr", "tags": ["rh", "paie"]}),
+                _chunk(doc_a, "1", [1.0], metadata_json={"lang": "en", "tags": ["it"]}),
+                _chunk(doc_a, "2", [1.0], metadata_json={"lang": None}),
+            ],
+        )
+        index.index_document(
+            doc_b,
+            [
+                _chunk(doc_b, "3", [1.0]),
+                _chunk(doc_b, "4", [1.0], metadata_json={"lang": "fr", "tags": [{"code": "rh"}]}),
+            ],
+        )
+        return index.project_matrix(uuid4(), [doc_a, doc_b], dimension=1)
+
+    @pytest.mark.parametrize(
+        ("filters", "expected"),
+        [
+            ({"lang": "fr"}, [True, False, False, False, True]),
+            ({"lang": ["en", "de"]}, [False, True, False, False, False]),
+            ({"lang": None}, [False, False, True, True, False]),
+            ({"tags": ["paie", "it"]}, [True, True, False, False, False]),
+            ({"tags": [None]}, [False, False, True, True, False]),
+            ({"tags": [{"code": "rh"}]}, [False, False, False, False, True]),
+            ({"lang": "fr", "tags": ["rh"]}, [True, False, False, False, False]),
+            ({"lang": {"code": "fr"}}, [False, False, False, False, False]),
+        ],
+    )
+    def test_metadata_mask_matches_like_a_per_chunk_comparison(
+        self, matrix: ProjectMatrix, filters: dict[str, object], expected: list[bool]
+    ) -> None:
+        # When
+        mask = matrix.metadata_mask(filters)
+
+        # Then
+        assert mask.tolist() == expected
+        assert expected == [
+            all(
+                matches_metadata_value((chunk.metadata_json or {}).get(key), value)
+                for key, value in filters.items()
+            )
+            for chunk in matrix.chunks
+        ]
+
+    def test_metadata_mask_covers_documents_appended_after_first_use(self) -> None:
+        # Given
+        project_id = uuid4()
+        doc_a = uuid4()
+        doc_b = uuid4()
+        index = InMemoryVectorIndex()
+        index.index_document(doc_a, [_chunk(doc_a, "a", [1.0], metadata_json={"lang": "fr"})])
+        first = index.project_matrix(project_id, [doc_a], dimension=1)
+        assert first.metadata_mask({"lang": "fr"}).tolist() == [True]
+
+        # When
+        index.index_document(doc_b, [_chunk(doc_b, "b", [1.0], metadata_json={"lang": "fr"})])
+        matrix = index.project_matrix(project_id, [doc_a, doc_b], dimension=1)
+
+        # Then
+        assert matrix.metadata_mask({"lang": "fr"}).tolist() == [True, True]
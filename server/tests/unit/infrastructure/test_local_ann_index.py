@@ -0,0 +1,181 @@
+import json
+from uuid import UUID, uuid4
+
+import numpy as np
+import pytest
+
+from raggae.infrastructure.services.local_ann_index import (
+    LocalAnnIndexStore,
+    keys_to_uuids,
+    uuids_to_keys,
+)
+
+
+def _corpus(size: int, dimension: int = 16, seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    keys = uuids_to_keys([uuid4() for _ in range(size)])
+    return keys, rng.normal(size=(size, dimension)).astype(np.float32)
+
+
+class TestLocalAnnIndexStore:
+    def test_build_then_search_with_all_lists_probed_is_exact(self, tmp_path) -> None:
+        # Given
+        project_id = uuid4()
+        keys, vectors = _corpus(400)
+        store = LocalAnnIndexStore(tmp_path)
+        index = store.build(project_id, 3, keys, vectors)
+
+        # When
+        found_keys, scores = index.search(vectors[7].tolist(), 5, nprobe=len(index.centroids))
+
+        # Then
+        normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        expected = np.argsort(-(normalized @ normalized[7]))[:5]
+        assert found_keys.tolist() == keys[expected].tolist()
+        assert float(scores[0]) == pytest.approx(1.0, abs=1e-5)
+        assert index.generation == 3
+        assert len(index.centroids) == 20
+
+    def test_load_reopens_snapshot_memory_mapped(self, tmp_path) -> None:
+        # Given
+        project_id = uuid4()
+        keys, vectors = _corpus(50)
+        LocalAnnIndexStore(tmp_path).build(project_id, 1, keys, vectors)
+
+        # When
+        index = LocalAnnIndexStore(tmp_path).load(project_id)
+
+        # Then
+        assert index is not None
+        assert isinstance(index.vectors, np.memmap)
+        assert index.live_count == 50
+        assert sorted(index.live_keys().tolist()) == sorted(keys.tolist())
+
+    def test_load_reads_the_manifest_only_after_it_is_replaced(self, tmp_path, monkeypatch) -> None:
+        # Given
+        project_id = uuid4()
+        keys, vectors = _corpus(50)
+        reader = LocalAnnIndexStore(tmp_path)
+        LocalAnnIndexStore(tmp_path).build(project_id, 1, keys, vectors)
+        first = reader.load(project_id)
+        reads: list[object] = []
+        read_manifest = reader._read_manifest
+        monkeypatch.setattr(reader, "_read_manifest", lambda path: reads.append(path) or read_manifest(path))
+
+        # When
+        unchanged = reader.load(project_id)
+        LocalAnnIndexStore(tmp_path).build(project_id, 2, keys, vectors)
+        replaced = reader.load(project_id)
+
+        # Then
+        assert unchanged is first
+        assert len(reads) == 1
+        assert replaced is not None
+        assert replaced.generation == 2
+
+    def test_load_returns_none_without_snapshot(self, tmp_path) -> None:
+        assert LocalAnnIndexStore(tmp_path).load(uuid4()) is None
+
+    def test_append_adds_and_deletes_without_rebuilding_lists(self, tmp_path) -> None:
+        # Given
+        project_id = uuid4()
+        keys, vectors = _corpus(100)
+        store = LocalAnnIndexStore(tmp_path)
+        index = store.build(project_id, 1, keys, vectors)
+        added_keys, added_vectors = _corpus(3, seed=1)
+
+        # When
+        appended = store.append(project_id, index, 2, added_keys, added_vectors, keys[:2])
+
+        # Then
+        assert appended.generation == 2
+        assert appended.delta_count == 5
+        assert appended.live_count == 101
+        np.testing.assert_array_equal(appended.centroids, index.centroids)
+        found_keys, _ = appended.search(added_vectors[0].tolist(), 1, nprobe=1)
+        assert found_keys.tolist() == [added_keys[0]]
+        deleted_hits, _ = appended.search(vectors[0].tolist(), 100, nprobe=len(appended.centroids))
+        assert keys[0] not in deleted_hits.tolist()
+        assert len(deleted_hits) == 100
+
+    def test_append_deleting_tail_chunk_drops_it_from_tail(self, tmp_path) -> None:
+        # Given
+        project_id = uuid4()
+        keys, vectors = _corpus(20)
+        store = LocalAnnIndexStore(tmp_path)
+        index = store.build(project_id, 1, keys, vectors)
+        added_keys, added_vectors = _corpus(2, seed=1)
+        index = store.append(project_id, index, 2, added_keys, added_vectors, keys[:0])
+
+        # When
+        index = store.append(project_id, index, 3, keys[:0], np.zeros((0, 16)), added_keys[:1])
+
+        # Then
+        assert index.tail_keys.tolist() == [added_keys[1]]
+        assert len(index.deleted_keys) == 0
+
+    def test_append_on_stale_index_raises(self, tmp_path) -> None:
+        # Given
+        project_id = uuid4()
+        keys, vectors = _corpus(20)
+        store = LocalAnnIndexStore(tmp_path)
+        stale = store.build(project_id, 1, keys, vectors)
+        store.build(project_id, 2, keys, vectors)
+
+        # When / Then
+        with pytest.raises(FileNotFoundError):
+            store.append(project_id, stale, 3, keys[:0], np.zeros((0, 16)), keys[:1])
+
+    def test_build_keeps_only_the_current_snapshot_on_disk(self, tmp_path) -> None:
+        # Given
+        project_id = uuid4()
+        keys, vectors = _corpus(20)
+        store = LocalAnnIndexStore(tmp_path)
+
+        # When
+        store.build(project_id, 1, keys, vectors)
+        store.build(project_id, 2, keys, vectors)
+
+        # Then
+        directories = [entry.name for entry in (tmp_path / str(project_id)).iterdir() if entry.is_dir()]
+        assert len(directories) == 1
+        assert directories[0].startswith("base-")
+
+    def test_build_empty_project(self, tmp_path) -> None:
+        # Given
+        store = LocalAnnIndexStore(tmp_path)
+
+        # When
+        index = store.build(uuid4(), 1, uuids_to_keys([]), np.zeros((0, 4), dtype=np.float32))
+
+        # Then
+        assert index.live_count == 0
+        found_keys, _ = index.search([1.0, 0.0, 0.0, 0.0], 3, nprobe=4)
+        assert len(found_keys) == 0
+
+    def test_recover_removes_partial_writes_and_corrupt_manifest(self, tmp_path) -> None:
+        # Given
+        healthy_id, corrupt_id = uuid4(), uuid4()
+        keys, vectors = _corpus(20)
+        store = LocalAnnIndexStore(tmp_path)
+        store.build(healthy_id, 1, keys, vectors)
+        store.build(corrupt_id, 1, keys, vectors)
+        (tmp_path / str(healthy_id) / "base-partial.tmp").mkdir()
+        manifest_path = tmp_path / str(corrupt_id) / "manifest.json"
+        manifest = json.loads(manifest_path.read_text())
+        manifest["base"] = "base-missing"
+        manifest_path.write_text(json.dumps(manifest))
+
+        # When
+        store.recover()
+
+        # Then
+        assert not (tmp_path / str(healthy_id) / "base-partial.tmp").exists()
+        assert store.load(healthy_id) is not None
+        assert store.load(corrupt_id) is None
+        assert not any(entry.is_dir() for entry in (tmp_path / str(corrupt_id)).iterdir())
+
+
+def test_keys_round_trip_uuids_with_trailing_zero_bytes() -> None:
+    ids = [uuid4() for _ in range(3)] + [UUID(bytes=b"\x01" + b"\0" * 15)]
+    assert keys_to_uuids(uuids_to_keys(ids)) == ids
@@ -0,0 +1,347 @@
+import asyncio
+from unittest.mock import AsyncMock
+from uuid import UUID, uuid4
+
+import numpy as np
+import pytest
+
+from raggae.application.dto.retrieved_chunk_dto import RetrievedChunkDTO
+from raggae.infrastructure.database.repositories.in_memory_project_index_generation_repository import (
+    InMemoryProjectIndexGenerationRepository,
+)
+from raggae.infrastructure.services.local_ann_index import LocalAnnIndexStore
+from raggae.infrastructure.services.local_index_chunk_retrieval_service import (
+    LocalIndexChunkRetrievalService,
+    RefreshingProjectIndexGenerationRepository,
+)
+
+
+class FakeLocalIndexSource:
+    """System of record for one document: chunk id -> (content, embedding)."""
+
+    def __init__(self) -> None:
+        self.document_id = uuid4()
+        self.chunks: dict[UUID, tuple[str, list[float]]] = {}
+        self.full_loads = 0
+        self.partial_loads: list[list[UUID]] = []
+
+    def add(self, content: str, embedding: list[float]) -> UUID:
+        chunk_id = uuid4()
+        self.chunks[chunk_id] = (content, embedding)
+        return chunk_id
+
+    async def list_chunk_ids(self, project_id: UUID) -> list[UUID]:
+        return list(self.chunks)
+
+    async def load_embeddings(
+        self, project_id: UUID, chunk_ids: list[UUID] | None = None
+    ) -> tuple[list[UUID], np.ndarray]:
+        if chunk_ids is None:
+            self.full_loads += 1
+            ids = list(self.chunks)
+        else:
+            self.partial_loads.append(chunk_ids)
+            ids = [chunk_id for chunk_id in chunk_ids if chunk_id in self.chunks]
+        vectors = np.array([self.chunks[chunk_id][1] for chunk_id in ids], dtype=np.float32)
+        return ids, vectors.reshape(len(ids), 2)
+
+    async def load_chunks(self, chunk_ids: list[UUID]) -> list[RetrievedChunkDTO]:
+        return [self._dto(chunk_id) for chunk_id in chunk_ids if chunk_id in self.chunks]
+
+    async def fulltext_candidates(
+        self, project_id: UUID, query_text: str, candidate_limit: int
+    ) -> list[RetrievedChunkDTO]:
+        terms = set(query_text.lower().split())
+        matches = []
+        for chunk_id, (content, _) in self.chunks.items():
+            overlap = len(terms & set(content.lower().split()))
+            if overlap:
+                chunk = self._dto(chunk_id)
+                chunk.fulltext_score = overlap / 10
+                matches.append(chunk)
+        matches.sort(key=lambda chunk: chunk.fulltext_score or 0.0, reverse=True)
+        return matches[:candidate_limit]
+
+    def _dto(self, chunk_id: UUID) -> RetrievedChunkDTO:
+        return RetrievedChunkDTO(
+            chunk_id=chunk_id,
+            document_id=self.document_id,
+            content=self.chunks[chunk_id][0],
+            score=0.0,
+            document_file_name="doc.txt",
+        )
+
+
+@pytest.fixture
+def source() -> FakeLocalIndexSource:
+    return FakeLocalIndexSource()
+
+
+@pytest.fixture
+def generations() -> InMemoryProjectIndexGenerationRepository:
+    return InMemoryProjectIndexGenerationRepository()
+
+
+@pytest.fixture
+def fallback() -> AsyncMock:
+    service = AsyncMock()
+    service.retrieve_chunks.return_value = []
+    return service
+
+
+def _service(source, generations, fallback, tmp_path, **kwargs) -> LocalIndexChunkRetrievalService:
+    return LocalIndexChunkRetrievalService(
+        source=source,
+        store=LocalAnnIndexStore(tmp_path),
+        project_index_generation_repository=generations,
+        fallback=fallback,
+        **kwargs,
+    )
+
+
+class TestLocalIndexChunkRetrievalService:
+    async def test_hybrid_retrieval_fuses_ann_and_fulltext_channels(
+        self, source, generations, fallback, tmp_path
+    ) -> None:
+        # Given
+        project_id = uuid4()
+        close_id = source.add("unrelated words", [1.0, 0.0])
+        lexical_id = source.add("python tips", [0.0, 1.0])
+        service = _service(source, generations, fallback, tmp_path)
+        await service.refresh(project_id)
+
+        # When
+        results = await service.retrieve_chunks(
+            project_id=project_id, query_text="python", query_embedding=[1.0, 0.0], limit=2
+        )
+
+        # Then
+        assert [result.chunk_id for result in results] == [close_id, lexical_id]
+        assert results[0].vector_score == pytest.approx(1.0)
+        assert results[0].fulltext_score == 0.0
+        assert results[1].fulltext_score == pytest.approx(1.0)
+        assert results[1].document_file_name == "doc.txt"
+        fallback.retrieve_chunks.assert_not_awaited()
+
+    async def test_rrf_keeps_raw_channel_scores(self, source, generations, fallback, tmp_path) -> None:
+        # Given
+        project_id = uuid4()
+        chunk_id = source.add("python tips", [1.0, 0.0])
+        service = _service(source, generations, fallback, tmp_path, fusion="rrf")
+        await service.refresh(project_id)
+
+        # When
+        results = await service.retrieve_chunks(
+            project_id=project_id, query_text="python", query_embedding=[1.0, 0.0], limit=1
+        )
+
+        # Then
+        assert results[0].chunk_id == chunk_id
+        assert results[0].score == pytest.approx(1.0)
+        assert results[0].fulltext_score == pytest.approx(0.1)
+
+    async def test_index_is_reused_until_generation_changes(
+        self, source, generations, fallback, tmp_path
+    ) -> None:
+        # Given
+        project_id = uuid4()
+        source.add("a", [1.0, 0.0])
+        service = _service(source, generations, fallback, tmp_path)
+        await service.refresh(project_id)
+
+        # When
+        for _ in range(2):
+            await service.retrieve_chunks(
+                project_id=project_id, query_text="x", query_embedding=[1.0, 0.0], limit=1
+            )
+
+        # Then
+        assert source.full_loads == 1
+        assert source.partial_loads == []
+        fallback.retrieve_chunks.assert_not_awaited()
+
+    async def test_new_generation_appends_added_and_removed_chunks(
+        self, source, generations, fallback, tmp_path
+    ) -> None:
+        # Given
+        project_id = uuid4()
+        removed_id = source.add("a", [1.0, 0.0])
+        for _ in range(20):
+            source.add("b", [0.0, 1.0])
+        service = _service(source, generations, fallback, tmp_path, rebuild_ratio=0.5)
+        await service.refresh(project_id)
+        del source.chunks[removed_id]
+        added_id = source.add("c", [1.0, 0.1])
+        await generations.bump(project_id)
+
+        # When
+        await service.refresh(project_id)
+        results = await service.retrieve_chunks(
+            project_id=project_id, query_text="x", query_embedding=[1.0, 0.0], limit=1, strategy="vector"
+        )
+
+        # Then
+        assert [result.chunk_id for result in results] == [added_id]
+        assert source.full_loads == 1
+        assert source.partial_loads == [[added_id]]
+        index = await service.current_index(project_id)
+        assert index is not None
+        assert index.generation == 1
+        assert index.delta_count == 2
+
+    async def test_rebuilds_when_pending_changes_exceed_ratio(
+        self, source, generations, fallback, tmp_path
+    ) -> None:
+        # Given
+        project_id = uuid4()
+        source.add("a", [1.0, 0.0])
+        service = _service(source, generations, fallback, tmp_path, rebuild_ratio=0.2)
+        await service.refresh(project_id)
+        source.add("b", [0.0, 1.0])
+        await generations.bump(project_id)
+
+        # When
+        index = await service.refresh(project_id)
+
+        # Then
+        assert source.full_loads == 2
+        assert index.delta_count == 0
+        assert index.live_count == 2
+
+    async def test_rebuilds_from_database_after_index_files_are_lost(
+        self, source, generations, fallback, tmp_path
+    ) -> None:
+        # Given
+        project_id = uuid4()
+        chunk_id = source.add("a", [1.0, 0.0])
+        await _service(source, generations, fallback, tmp_path).refresh(project_id)
+        (tmp_path / str(project_id) / "manifest.json").unlink()
+        service = _service(source, generations, fallback, tmp_path)
+
+        # When
+        await service.retrieve_chunks(
+            project_id=project_id, query_text="x", query_embedding=[1.0, 0.0], limit=1, strategy="vector"
+        )
+        await service.schedule_refresh(project_id)
+        results = await service.retrieve_chunks(
+            project_id=project_id, query_text="x", query_embedding=[1.0, 0.0], limit=1, strategy="vector"
+        )
+
+        # Then
+        fallback.retrieve_chunks.assert_awaited_once()
+        assert [result.chunk_id for result in results] == [chunk_id]
+        assert source.full_loads == 2
+
+    async def test_metadata_filters_are_delegated_to_fallback(
+        self, source, generations, fallback, tmp_path
+    ) -> None:
+        # Given
+        project_id = uuid4()
+        service = _service(source, generations, fallback, tmp_path)
+
+        # When
+        await service.retrieve_chunks(
+            project_id=project_id,
+            query_text="x",
+            query_embedding=[1.0, 0.0],
+            limit=3,
+            metadata_filters={"lang": "fr"},
+        )
+
+        # Then
+        fallback.retrieve_chunks.assert_awaited_once()
+        assert fallback.retrieve_chunks.call_args.kwargs["metadata_filters"] == {"lang": "fr"}
+        assert source.full_loads == 0
+
+    async def test_query_of_another_dimension_is_delegated_to_fallback(
+        self, source, generations, fallback, tmp_path
+    ) -> None:
+        # Given
+        project_id = uuid4()
+        source.add("a", [1.0, 0.0])
+        service = _service(source, generations, fallback, tmp_path)
+        await service.refresh(project_id)
+
+        # When
+        await service.retrieve_chunks(
+            project_id=project_id, query_text="x", query_embedding=[1.0, 0.0, 0.0], limit=3
+        )
+
+        # Then
+        fallback.retrieve_chunks.assert_awaited_once()
+
+    async def test_fulltext_strategy_skips_the_vector_index(
+        self, source, generations, fallback, tmp_path
+    ) -> None:
+        # Given
+        project_id = uuid4()
+        chunk_id = source.add("python tips", [1.0, 0.0])
+        service = _service(source, generations, fallback, tmp_path)
+
+        # When
+        results = await service.retrieve_chunks(
+            project_id=project_id,
+            query_text="python",
+            query_embedding=[1.0, 0.0],
+            limit=3,
+            strategy="fulltext",
+        )
+
+        # Then
+        assert [result.chunk_id for result in results] == [chunk_id]
+        assert source.full_loads == 0
+
+    async def test_queries_search_the_previous_snapshot_while_a_refresh_runs(
+        self, source, generations, fallback, tmp_path
+    ) -> None:
+        # Given
+        project_id = uuid4()
+        old_id = source.add("a", [1.0, 0.0])
+        service = _service(source, generations, fallback, tmp_path, rebuild_ratio=0.0)
+        await service.refresh(project_id)
+        new_id = source.add("b", [1.0, 0.0])
+        await generations.bump(project_id)
+        release = asyncio.Event()
+        load_embeddings = source.load_embeddings
+
+        async def slow_load_embeddings(*args, **kwargs):
+            await release.wait()
+            return await load_embeddings(*args, **kwargs)
+
+        source.load_embeddings = slow_load_embeddings
+
+        # When
+        stale = await service.retrieve_chunks(
+            project_id=project_id, query_text="x", query_embedding=[1.0, 0.0], limit=2, strategy="vector"
+        )
+        release.set()
+        await service.schedule_refresh(project_id)
+        fresh = await service.retrieve_chunks(
+            project_id=project_id, query_text="x", query_embedding=[1.0, 0.0], limit=2, strategy="vector"
+        )
+
+        # Then
+        assert [result.chunk_id for result in stale] == [old_id]
+        assert {result.chunk_id for result in fresh} == {old_id, new_id}
+        fallback.retrieve_chunks.assert_not_awaited()
+
+    async def test_generation_bump_refreshes_the_index_in_the_background(
+        self, source, generations, fallback, tmp_path
+    ) -> None:
+        # Given
+        project_id = uuid4()
+        source.add("a", [1.0, 0.0])
+        service = _service(source, generations, fallback, tmp_path)
+        await service.refresh(project_id)
+        source.add("b", [0.0, 1.0])
+        repository = RefreshingProjectIndexGenerationRepository(inner=generations, retrieval_service=service)
+
+        # When
+        generation = await repository.bump(project_id)
+        await service.schedule_refresh(project_id)
+
+        # Then
+        index = await service.current_index(project_id)
+        assert index is not None
+        assert index.generation == generation == 1
+        assert index.live_count == 2
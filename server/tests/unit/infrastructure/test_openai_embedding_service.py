@@ -1,12 +1,42 @@
+import asyncio
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
+import httpx
+import openai
 import pytest
 
 from raggae.domain.exceptions.document_exceptions import EmbeddingGenerationError
 from raggae.infrastructure.services.openai_embedding_service import OpenAIEmbeddingService
 
 
+def _echo(*, model: str, input: list[str]) -> SimpleNamespace:
+    """Embed each text as ``[float(text)]`` and report one token per text."""
+    return SimpleNamespace(
+        data=[SimpleNamespace(embedding=[float(text)]) for text in input],
+        usage=SimpleNamespace(prompt_tokens=len(input)),
+    )
+
+
+def _status_error(status_code: int, headers: dict | None = None) -> openai.APIStatusError:
+    response = httpx.Response(
+        status_code, headers=headers, request=httpx.Request("POST", "https://api.openai.com/v1/embeddings")
+    )
+    error_class = openai.RateLimitError if status_code == 429 else openai.APIStatusError
+    return error_class("error", response=response, body=None)
+
+
+def _service(**kwargs) -> OpenAIEmbeddingService:
+    service = OpenAIEmbeddingService(
+        api_key="test-key",
+        model="text-embedding-3-small",
+        retry_base_delay_seconds=0.0,
+        **kwargs,
+    )
+    service._client = AsyncMock()  # type: ignore[attr-defined]
+    return service
+
+
 class TestOpenAIEmbeddingService:
     async def test_embed_texts_success(self) -> None:
         # Given
@@ -58,3 +88,127 @@ class TestOpenAIEmbeddingService:
         # When / Then
         with pytest.raises(EmbeddingGenerationError, match="dimension"):
             await service.embed_texts(["hello"])
+
+    async def test_batches_are_split_by_count_and_estimated_tokens(self) -> None:
+        # Given
+        service = _service(batch_size=3, max_batch_tokens=10)
+        service._client.embeddings.create.side_effect = _echo
+        texts = ["1", "2", "3", "4", "5" + " " * 40, "6"]
+
+        # When
+        result = await service.embed_texts(texts)
+
+        # Then
+        assert result == [[1.0], [2.0], [3.0], [4.0], [5.0], [6.0]]
+        batches = [call.kwargs["input"] for call in service._client.embeddings.create.call_args_list]
+        assert batches == [["1", "2", "3"], ["4"], ["5" + " " * 40], ["6"]]
+        assert service.requests == 4
+        assert service.prompt_tokens == 6
+
+    async def test_batches_run_with_bounded_concurrency(self) -> None:
+        # Given
+        service = _service(batch_size=1, max_concurrency=2)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def create(*, model: str, input: list[str]) -> SimpleNamespace:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _echo(model=model, input=input)
+
+        service._client.embeddings.create.side_effect = create
+
+        # When
+        result = await service.embed_texts(["1", "2", "3", "4", "5"])
+
+        # Then
+        assert result == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+        assert max_in_flight == 2
+
+    async def test_concurrent_calls_share_the_concurrency_limit(self) -> None:
+        # Given
+        service = _service(batch_size=1, max_concurrency=2)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def create(*, model: str, input: list[str]) -> SimpleNamespace:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _echo(model=model, input=input)
+
+        service._client.embeddings.create.side_effect = create
+
+        # When
+        await asyncio.gather(*(service.embed_texts(["1", "2"]) for _ in range(3)))
+
+        # Then
+        assert max_in_flight == 2
+
+    async def test_rate_limit_and_server_errors_are_retried(self) -> None:
+        # Given
+        service = _service()
+        service._client.embeddings.create.side_effect = [
+            _status_error(429, headers={"retry-after": "0"}),
+            _status_error(500),
+            openai.APIConnectionError(request=httpx.Request("POST", "https://api.openai.com/v1/embeddings")),
+            _echo(model="text-embedding-3-small", input=["1"]),
+        ]
+
+        # When
+        result = await service.embed_texts(["1"])
+
+        # Then
+        assert result == [[1.0]]
+        assert service.retries == 3
+        assert service.requests == 1
+
+    async def test_retries_are_bounded(self) -> None:
+        # Given
+        service = _service(max_retries=2)
+        service._client.embeddings.create.side_effect = _status_error(429)
+
+        # When / Then
+        with pytest.raises(EmbeddingGenerationError):
+            await service.embed_texts(["1"])
+        assert service._client.embeddings.create.await_count == 3
+
+    async def test_client_errors_are_not_retried(self) -> None:
+        # Given
+        service = _service()
+        service._client.embeddings.create.side_effect = _status_error(400)
+
+        # When / Then
+        with pytest.raises(EmbeddingGenerationError):
+            await service.embed_texts(["1"])
+        service._client.embeddings.create.assert_awaited_once()
+
+    async def test_rate_limit_pauses_the_other_batches(self) -> None:
+        # Given
+        service = _service(batch_size=1, max_concurrency=2, retry_max_delay_seconds=0.05)
+        started: list[tuple[str, float]] = []
+        rate_limited = False
+
+        async def create(*, model: str, input: list[str]) -> SimpleNamespace:
+            nonlocal rate_limited
+            started.append((input[0], asyncio.get_running_loop().time()))
+            if not rate_limited:
+                rate_limited = True
+                raise _status_error(429, headers={"retry-after": "0.05"})
+            return _echo(model=model, input=input)
+
+        service._client.embeddings.create.side_effect = create
+
+        # When
+        result = await service.embed_texts(["1", "2", "3"])
+
+        # Then
+        assert result == [[1.0], [2.0], [3.0]]
+        first_attempt = started[0][1]
+        later_batches = [at for text, at in started[2:] if text == "3"]
+        assert later_batches and later_batches[0] - first_attempt >= 0.04
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from pgvector import Vector
+from sqlalchemy.dialects import postgresql
+
+from raggae.infrastructure.database.pgvector_codec import BinaryVector, _register_vector, to_pgvector
+
+
+class _UnknownTypeConnection:
+    async def set_type_codec(self, typename: str, **kwargs: object) -> None:
+        raise ValueError(f"unknown type: public.{typename}")
+
+
+class TestToPgvector:
+    def test_list_round_trips_through_binary_format(self) -> None:
+        # Given
+        values = [0.25, -1.5, 3.0]
+
+        # When
+        encoded = to_pgvector(values).to_binary()
+
+        # Then
+        assert len(encoded) == 4 + 4 * len(values)
+        assert Vector.from_binary(encoded).to_list() == values
+
+    def test_numpy_array_and_vector_are_accepted(self) -> None:
+        vector = Vector([1.0, 2.0])
+
+        assert to_pgvector(vector) is vector
+        assert to_pgvector(np.array([1.0, 2.0])) == vector
+        assert to_pgvector(None) is None
+
+
+class TestBinaryVector:
+    def test_bind_processor_passes_vectors_instead_of_text(self) -> None:
+        # Given
+        process = BinaryVector(3).bind_processor(postgresql.dialect())
+
+        # When
+        bound = process([1.0, 2.0, 3.0])
+
+        # Then
+        assert isinstance(bound, Vector)
+        assert bound.to_list() == [1.0, 2.0, 3.0]
+
+    def test_result_processor_returns_lists_from_codec_values(self) -> None:
+        process = BinaryVector(2).result_processor(postgresql.dialect(), None)
+
+        assert process(Vector([0.5, 1.0])) == [0.5, 1.0]
+        assert process(None) is None
+
+
+class TestRegisterVector:
+    async def test_missing_extension_discards_the_connection(self, caplog: pytest.LogCaptureFixture) -> None:
+        with pytest.raises(ValueError, match="unknown type"):
+            await _register_vector(_UnknownTypeConnection())
+
+        assert "pgvector codec not registered" in caplog.text
@@ -1,4 +1,4 @@
-"""Tests for _resolve_strategy across all three copies."""
+"""Tests for _resolve_strategy across all copies."""
 
 import pytest
 
@@ -8,6 +8,9 @@ from raggae.application.use_cases.chat.query_relevant_chunks import (
 from raggae.infrastructure.services.in_memory_chunk_retrieval_service import (
     _resolve_strategy as resolve_strategy_inmemory,
 )
+from raggae.infrastructure.services.local_index_chunk_retrieval_service import (
+    _resolve_strategy as resolve_strategy_local_index,
+)
 from raggae.infrastructure.services.sqlalchemy_chunk_retrieval_service import (
     _resolve_strategy as resolve_strategy_sqlalchemy,
 )
@@ -16,6 +19,7 @@ _ALL_RESOLVE_STRATEGIES = [
     resolve_strategy_use_case,
     resolve_strategy_inmemory,
     resolve_strategy_sqlalchemy,
+    resolve_strategy_local_index,
 ]
 
 
@@ -0,0 +1,100 @@
+from uuid import uuid4
+
+from sqlalchemy import create_engine, text
+
+from raggae.infrastructure.services.retrieval_statement_metrics import (
+    RetrievalStatementMetrics,
+    retrieval_statement,
+)
+from raggae.infrastructure.services.sqlalchemy_chunk_retrieval_service import (
+    SQLAlchemyChunkRetrievalService,
+)
+
+
+class _FakeResult:
+    def mappings(self) -> list[dict]:
+        return []
+
+
+class _FakeSession:
+    def __init__(self, statements: list[object]) -> None:
+        self._statements = statements
+
+    async def __aenter__(self) -> "_FakeSession":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        return None
+
+    async def execute(self, statement: object, params: dict | None = None) -> _FakeResult:
+        self._statements.append(statement)
+        return _FakeResult()
+
+
+class TestRetrievalStatementMetrics:
+    def test_instrumented_engine_reports_compile_and_execute_time(self) -> None:
+        # Given
+        metrics = RetrievalStatementMetrics()
+        engine = create_engine("sqlite://")
+        metrics.instrument(engine)
+
+        # When
+        with engine.connect() as connection:
+            connection.execute(retrieval_statement("SELECT :value"), {"value": 1})
+            connection.execute(retrieval_statement("SELECT :value"), {"value": 2})
+            connection.execute(text("SELECT 3"))
+
+        # Then
+        assert (metrics.compiled_cache_misses, metrics.compiled_cache_hits) == (1, 1)
+        assert metrics.compile_seconds > 0.0
+        assert metrics.execute_seconds > 0.0
+        assert metrics.stats()["compiled_cache_hits"] == 1
+
+    def test_untagged_statements_are_not_counted(self) -> None:
+        # Given
+        metrics = RetrievalStatementMetrics()
+        engine = create_engine("sqlite://")
+        metrics.instrument(engine)
+
+        # When
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+        # Then
+        assert (metrics.compiled_cache_misses, metrics.compiled_cache_hits) == (0, 0)
+        assert (metrics.compile_seconds, metrics.execute_seconds) == (0.0, 0.0)
+
+
+class TestRetrievalStatementReuse:
+    async def test_repeated_retrievals_send_the_same_sql_text_per_variant(self) -> None:
+        # Given
+        statements: list[object] = []
+        service = SQLAlchemyChunkRetrievalService(
+            session_factory=lambda: _FakeSession(statements),  # type: ignore[arg-type,return-value]
+        )
+
+        async def retrieve(metadata_filters: dict[str, object] | None = None) -> None:
+            await service.retrieve_chunks(
+                project_id=uuid4(),
+                query_text="query",
+                query_embedding=[1.0, 0.0],
+                limit=5,
+                metadata_filters=metadata_filters,
+            )
+
+        # When
+        await retrieve()
+        await retrieve()
+        await retrieve({"language": "fr"})
+        await retrieve({"language": "en"})
+
+        # Then
+        retrieval_sql = [str(statement) for statement in statements if "combined AS" in str(statement)]
+        assert retrieval_sql[0] == retrieval_sql[1]
+        assert retrieval_sql[2] == retrieval_sql[3]
+        assert retrieval_sql[0] != retrieval_sql[2]
+        assert all(
+            statement.get_execution_options()["retrieval_statement"]  # type: ignore[attr-defined]
+            for statement in statements
+            if "combined AS" in str(statement)
+        )
@@ -0,0 +1,21 @@
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+from raggae.infrastructure.services.retry_backoff import parse_retry_after
+
+
+class TestParseRetryAfter:
+    def test_seconds(self) -> None:
+        assert parse_retry_after("7") == 7.0
+
+    def test_http_date(self) -> None:
+        value = format_datetime(datetime.now(UTC) + timedelta(seconds=60), usegmt=True)
+
+        delay = parse_retry_after(value)
+
+        assert delay is not None
+        assert 55.0 <= delay <= 60.0
+
+    def test_missing_or_invalid(self) -> None:
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
@@ -0,0 +1,185 @@
+import asyncio
+from uuid import UUID, uuid4
+
+import pytest
+
+from raggae.infrastructure.services.sqlalchemy_chunk_retrieval_service import (
+    SQLAlchemyChunkRetrievalService,
+)
+
+
+class _FakeResult:
+    def __init__(self, rows: list[dict]) -> None:
+        self._rows = rows
+
+    def mappings(self) -> list[dict]:
+        return self._rows
+
+
+class _FakeDatabase:
+    """Answers the channel and page statements; each channel waits until the other one started."""
+
+    def __init__(self, vector_rows: list[dict], fulltext_rows: list[dict]) -> None:
+        self.vector_rows = vector_rows
+        self.fulltext_rows = fulltext_rows
+        self.document_id = uuid4()
+        self.statements: list[str] = []
+        self.page_params: dict | None = None
+        self.started = {"vector": asyncio.Event(), "fulltext": asyncio.Event()}
+
+    def session_factory(self) -> "_FakeSession":
+        return _FakeSession(self)
+
+    async def execute(self, sql: str, params: dict) -> list[dict]:
+        self.statements.append(sql)
+        if "set_config" in sql:
+            return []
+        if "SELECT * FROM vector_search" in sql:
+            self.started["vector"].set()
+            await asyncio.wait_for(self.started["fulltext"].wait(), timeout=1)
+            return self.vector_rows
+        if "SELECT * FROM fulltext_search" in sql:
+            self.started["fulltext"].set()
+            await asyncio.wait_for(self.started["vector"].wait(), timeout=1)
+            return self.fulltext_rows
+        assert "unnest" in sql
+        self.page_params = params
+        rows = [
+            {
+                "chunk_id": chunk_id,
+                "document_id": self.document_id,
+                "document_file_name": "doc.txt",
+                "content": f"content {chunk_id}",
+                "chunk_index": 0,
+                "chunk_level": "standard",
+                "parent_chunk_id": None,
+                "vector_score": vector_score,
+                "fulltext_score": fulltext_score,
+                "final_score": final_score,
+                "parent_content": None,
+                "context_neighbors": None,
+            }
+            for chunk_id, final_score, vector_score, fulltext_score in zip(
+                params["page_chunk_ids"],
+                params["page_final_scores"],
+                params["page_vector_scores"],
+                params["page_fulltext_scores"],
+                strict=True,
+            )
+        ]
+        return list(reversed(rows))
+
+
+class _FakeSession:
+    def __init__(self, database: _FakeDatabase) -> None:
+        self._database = database
+
+    async def __aenter__(self) -> "_FakeSession":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        return None
+
+    async def execute(self, statement: object, params: dict | None = None) -> _FakeResult:
+        return _FakeResult(await self._database.execute(str(statement), params or {}))
+
+
+def _vector_row(chunk_id: UUID, score: float) -> dict:
+    return {"chunk_id": chunk_id, "vector_score": score}
+
+
+def _fulltext_row(chunk_id: UUID, score: float) -> dict:
+    return {"chunk_id": chunk_id, "fulltext_score": score}
+
+
+class TestConcurrentChannelExecution:
+    async def test_channels_run_concurrently_and_are_fused_in_python(self) -> None:
+        # Given
+        both, vector_only, fulltext_only = uuid4(), uuid4(), uuid4()
+        database = _FakeDatabase(
+            vector_rows=[_vector_row(both, 0.8), _vector_row(vector_only, 0.4)],
+            fulltext_rows=[_fulltext_row(both, 0.2), _fulltext_row(fulltext_only, 0.1)],
+        )
+        service = SQLAlchemyChunkRetrievalService(
+            session_factory=database.session_factory,  # type: ignore[arg-type]
+            channel_execution="concurrent",
+        )
+
+        # When
+        results = await service.retrieve_chunks(
+            project_id=uuid4(), query_text="query", query_embedding=[1.0, 0.0], limit=2
+        )
+
+        # Then
+        assert [result.chunk_id for result in results] == [both, vector_only]
+        assert results[0].score == pytest.approx(1.0)
+        assert results[1].score == pytest.approx(0.6 * 0.5)
+        assert results[1].fulltext_score == 0.0
+        assert results[0].document_file_name == "doc.txt"
+        assert database.page_params is not None
+        assert database.page_params["page_chunk_ids"] == [both, vector_only]
+
+    async def test_rrf_fusion_matches_sql_scale(self) -> None:
+        # Given
+        first, second = uuid4(), uuid4()
+        database = _FakeDatabase(
+            vector_rows=[_vector_row(first, 0.9), _vector_row(second, 0.5)],
+            fulltext_rows=[_fulltext_row(second, 0.3)],
+        )
+        service = SQLAlchemyChunkRetrievalService(
+            session_factory=database.session_factory,  # type: ignore[arg-type]
+            vector_weight=0.5,
+            fulltext_weight=0.5,
+            fusion="rrf",
+            channel_execution="concurrent",
+        )
+
+        # When
+        results = await service.retrieve_chunks(
+            project_id=uuid4(), query_text="query", query_embedding=[1.0, 0.0], limit=10
+        )
+
+        # Then
+        assert [result.chunk_id for result in results] == [second, first]
+        assert results[0].score == pytest.approx((0.5 / 62 + 0.5 / 61) * 61)
+        assert results[0].fulltext_score == pytest.approx(0.3)
+
+    async def test_zero_weight_channel_is_not_queried(self) -> None:
+        # Given
+        chunk_id = uuid4()
+        database = _FakeDatabase(vector_rows=[], fulltext_rows=[_fulltext_row(chunk_id, 0.2)])
+        database.started["vector"].set()
+        service = SQLAlchemyChunkRetrievalService(
+            session_factory=database.session_factory,  # type: ignore[arg-type]
+            channel_execution="concurrent",
+        )
+
+        # When
+        results = await service.retrieve_chunks(
+            project_id=uuid4(),
+            query_text="query",
+            query_embedding=[1.0, 0.0],
+            limit=3,
+            strategy="fulltext",
+        )
+
+        # Then
+        assert [result.chunk_id for result in results] == [chunk_id]
+        assert not any("vector_search" in statement for statement in database.statements)
+
+    async def test_no_candidates_skips_page_statement(self) -> None:
+        # Given
+        database = _FakeDatabase(vector_rows=[], fulltext_rows=[])
+        service = SQLAlchemyChunkRetrievalService(
+            session_factory=database.session_factory,  # type: ignore[arg-type]
+            channel_execution="concurrent",
+        )
+
+        # When
+        results = await service.retrieve_chunks(
+            project_id=uuid4(), query_text="query", query_embedding=[1.0, 0.0], limit=3
+        )
+
+        # Then
+        assert results == []
+        assert database.page_params is None
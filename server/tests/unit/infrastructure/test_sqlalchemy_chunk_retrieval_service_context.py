@@ -0,0 +1,43 @@
+from uuid import uuid4
+
+from raggae.infrastructure.services.sqlalchemy_chunk_retrieval_service import _context_neighbors
+
+
+def _row(**overrides) -> dict:
+    row = {
+        "document_id": uuid4(),
+        "document_file_name": "doc.txt",
+        "chunk_index": 2,
+        "chunk_level": "standard",
+        "context_neighbors": None,
+    }
+    row.update(overrides)
+    return row
+
+
+class TestContextNeighbors:
+    def test_not_prefetched_when_window_is_zero(self) -> None:
+        assert _context_neighbors(_row(), context_window_size=0) is None
+
+    def test_not_prefetched_for_child_chunks(self) -> None:
+        assert _context_neighbors(_row(chunk_level="child"), context_window_size=1) is None
+
+    def test_no_neighbors_is_an_empty_list(self) -> None:
+        assert _context_neighbors(_row(), context_window_size=1) == []
+
+    def test_neighbors_inherit_document_of_the_hit(self) -> None:
+        neighbor_id = uuid4()
+        row = _row(
+            context_neighbors=f'[{{"chunk_id": "{neighbor_id}", "chunk_index": 1, "content": "before"}}]'
+        )
+
+        neighbors = _context_neighbors(row, context_window_size=1)
+
+        assert neighbors is not None
+        assert len(neighbors) == 1
+        assert neighbors[0].chunk_id == neighbor_id
+        assert neighbors[0].document_id == row["document_id"]
+        assert neighbors[0].document_file_name == "doc.txt"
+        assert neighbors[0].chunk_index == 1
+        assert neighbors[0].content == "before"
+        assert neighbors[0].score == 0.0
@@ -0,0 +1,152 @@
+from uuid import uuid4
+
+from raggae.infrastructure.services.sqlalchemy_chunk_retrieval_service import (
+    SQLAlchemyChunkRetrievalService,
+    _build_metadata_filters,
+)
+
+
+class _FakeResult:
+    def mappings(self) -> list[dict]:
+        return []
+
+
+class _FakeDatabase:
+    """Records every statement executed, with its parameters."""
+
+    def __init__(self) -> None:
+        self.statements: list[tuple[str, dict]] = []
+
+    def session_factory(self) -> "_FakeSession":
+        return _FakeSession(self)
+
+
+class _FakeSession:
+    def __init__(self, database: _FakeDatabase) -> None:
+        self._database = database
+
+    async def __aenter__(self) -> "_FakeSession":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        return None
+
+    async def execute(self, statement: object, params: dict | None = None) -> _FakeResult:
+        self._database.statements.append((str(statement), params or {}))
+        return _FakeResult()
+
+
+def _chunk_statements(database: _FakeDatabase) -> list[tuple[str, dict]]:
+    return [(sql, params) for sql, params in database.statements if "document_chunks" in sql]
+
+
+async def _retrieve(service: SQLAlchemyChunkRetrievalService, **kwargs) -> None:
+    await service.retrieve_chunks(
+        project_id=uuid4(), query_text="query", query_embedding=[1.0, 0.0], limit=5, **kwargs
+    )
+
+
+class TestBuildMetadataFilters:
+    def test_clauses_match_the_indexed_expressions(self) -> None:
+        where, params = _build_metadata_filters(
+            {"document_type": ["pdf"], "language": "fr", "tags": ["hr"], "unknown": "ignored"}
+        )
+
+        assert "(c.metadata_json->>'document_type') = ANY(:document_type)" in where
+        assert "(c.metadata_json->>'language') = :language" in where
+        assert "(c.metadata_json->'tags') ?| :tags" in where
+        assert params == {"document_type": ["pdf"], "language": "fr", "tags": ["hr"]}
+
+    def test_no_supported_filter_returns_empty_clause(self) -> None:
+        assert _build_metadata_filters({"unknown": "x"}) == ("", {})
+
+
+class TestSelectiveFilterPlanning:
+    async def test_filter_selectivity_is_probed_inside_the_retrieval_statement(self) -> None:
+        # Given
+        database = _FakeDatabase()
+        service = SQLAlchemyChunkRetrievalService(
+            session_factory=database.session_factory,  # type: ignore[arg-type]
+            filtered_exact_scan_threshold=100,
+        )
+
+        # When
+        await _retrieve(service, metadata_filters={"language": "fr"})
+
+        # Then
+        [(sql, params)] = _chunk_statements(database)
+        assert "filtered_ids AS MATERIALIZED" in sql
+        assert "LIMIT :exact_scan_row_limit" in sql
+        assert "WHERE (SELECT p.selective FROM filter_probe p)" in sql
+        assert "AND NOT (SELECT p.selective FROM filter_probe p)" in sql
+        assert sql.count("(c.metadata_json->>'language') = :language") == 3
+        assert params["exact_scan_row_limit"] == 101
+        assert params["exact_scan_threshold"] == 100
+
+    async def test_quantized_index_scan_is_gated_by_the_probe(self) -> None:
+        # Given
+        database = _FakeDatabase()
+        service = SQLAlchemyChunkRetrievalService(
+            session_factory=database.session_factory,  # type: ignore[arg-type]
+            vector_index="halfvec",
+            filtered_exact_scan_threshold=100,
+        )
+
+        # When
+        await _retrieve(service, metadata_filters={"tags": ["hr"]})
+
+        # Then
+        [(sql, _)] = _chunk_statements(database)
+        assert "ann_vector_search AS (" in sql
+        gate = sql.index("AND NOT (SELECT p.selective FROM filter_probe p)")
+        assert sql.index("ORDER BY CAST(c.embedding AS halfvec(2))") > gate
+
+    async def test_concurrent_vector_channel_carries_the_probe(self) -> None:
+        # Given
+        database = _FakeDatabase()
+        service = SQLAlchemyChunkRetrievalService(
+            session_factory=database.session_factory,  # type: ignore[arg-type]
+            channel_execution="concurrent",
+            filtered_exact_scan_threshold=100,
+        )
+
+        # When
+        await _retrieve(service, metadata_filters={"language": "fr"})
+
+        # Then
+        statements = _chunk_statements(database)
+        assert len(statements) == 2
+        vector_sql = next(sql for sql, _ in statements if "SELECT * FROM vector_search" in sql)
+        assert "filter_probe" in vector_sql
+        assert not any("filter_probe" in sql for sql, _ in statements if sql != vector_sql)
+
+    async def test_unfiltered_query_skips_the_probe(self) -> None:
+        # Given
+        database = _FakeDatabase()
+        service = SQLAlchemyChunkRetrievalService(
+            session_factory=database.session_factory,  # type: ignore[arg-type]
+        )
+
+        # When
+        await _retrieve(service)
+
+        # Then
+        [(sql, params)] = _chunk_statements(database)
+        assert "filter_probe" not in sql
+        assert "exact_scan_row_limit" not in params
+
+    async def test_zero_threshold_disables_the_probe(self) -> None:
+        # Given
+        database = _FakeDatabase()
+        service = SQLAlchemyChunkRetrievalService(
+            session_factory=database.session_factory,  # type: ignore[arg-type]
+            filtered_exact_scan_threshold=0,
+        )
+
+        # When
+        await _retrieve(service, metadata_filters={"tags": ["hr"]})
+
+        # Then
+        [(sql, params)] = _chunk_statements(database)
+        assert "filter_probe" not in sql
+        assert "exact_scan_row_limit" not in params
@@ -0,0 +1,47 @@
+from unittest.mock import MagicMock
+
+from raggae.infrastructure.services.sqlalchemy_chunk_retrieval_service import (
+    SQLAlchemyChunkRetrievalService,
+)
+
+
+def _service(**kwargs) -> SQLAlchemyChunkRetrievalService:
+    return SQLAlchemyChunkRetrievalService(session_factory=MagicMock(), **kwargs)
+
+
+class TestHnswSearchSettings:
+    def test_defaults_used_when_no_override(self) -> None:
+        service = _service(hnsw_ef_search=40, hnsw_iterative_scan="relaxed_order")
+
+        result = service._hnsw_search_settings(
+            candidate_limit=10, has_metadata_filters=False, ef_search=None, iterative_scan=None
+        )
+
+        assert result == (40, "relaxed_order")
+
+    def test_ef_search_never_below_candidate_limit(self) -> None:
+        service = _service(hnsw_ef_search=40)
+
+        ef_search, _ = service._hnsw_search_settings(
+            candidate_limit=100, has_metadata_filters=False, ef_search=20, iterative_scan=None
+        )
+
+        assert ef_search == 100
+
+    def test_metadata_filters_widen_scan_and_force_iterative_scan(self) -> None:
+        service = _service(hnsw_ef_search=40, hnsw_filtered_ef_search_multiplier=3)
+
+        result = service._hnsw_search_settings(
+            candidate_limit=10, has_metadata_filters=True, ef_search=None, iterative_scan="off"
+        )
+
+        assert result == (120, "relaxed_order")
+
+    def test_ef_search_is_capped(self) -> None:
+        service = _service(hnsw_filtered_ef_search_multiplier=4)
+
+        ef_search, _ = service._hnsw_search_settings(
+            candidate_limit=500, has_metadata_filters=True, ef_search=None, iterative_scan="strict_order"
+        )
+
+        assert ef_search == 1000